@@ -0,0 +1,160 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Memory-aware admission control of the analyzer processes.
+
+A few template-heavy translation units analyzed at the same time may use
+more memory than available, and then the whole analysis is killed. Before an
+analyzer process is started, its worker reserves the expected peak memory
+usage of the analysis. The analyzer is started only if the reservation fits
+in the memory budget together with the reservations of the running analyses,
+and the expected peak memory is available in the system at the moment.
+Otherwise the worker waits until other analyses finish.
+
+An analysis is always admitted if no other analysis is running, so a
+translation unit which needs more memory than the budget is analyzed alone.
+
+The expected peak memory usage of a translation unit comes from the analysis
+history (see analysis_schedule). The admission control and the measurement of
+the memory usage of the analyzers are enabled only if a memory budget is
+given.
+"""
+
+
+import contextlib
+
+from typing import Dict, Optional, Tuple
+
+import multiprocess
+import psutil
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+# Expected peak memory usage of an analysis if there is no analysis history at
+# all.
+DEFAULT_PEAK_RSS = 512 * 1024 * 1024
+
+# Seconds between checking the available memory of the system while waiting
+# for admission.
+WAIT_INTERVAL = 1.0
+
+
+def __average_peak_rss(entries) -> Optional[int]:
+    peaks = [e['peak_rss'] for e in entries if e.get('peak_rss')]
+    return sum(peaks) // len(peaks) if peaks else None
+
+
+def estimate_peak_rss(actions, history) -> Dict[Tuple[str, str], int]:
+    """
+    Return the expected peak memory usage of the given actions in bytes by
+    analyzer type and source file.
+
+    The last measured peak is used for the translation units which are in the
+    history. The others are estimated by the average peak of the analyzer in
+    the history.
+    """
+    all_entries = [e for entries in history.values()
+                   for e in entries.values()]
+    default_peak = __average_peak_rss(all_entries) or DEFAULT_PEAK_RSS
+
+    averages = {}
+    estimates = {}
+    for action in actions:
+        entries = history.get(action.analyzer_type, {})
+        entry = entries.get(action.source)
+        if entry and entry.get('peak_rss'):
+            estimates[action.analyzer_type, action.source] = \
+                entry['peak_rss']
+            continue
+
+        if action.analyzer_type not in averages:
+            averages[action.analyzer_type] = \
+                __average_peak_rss(entries.values()) or default_peak
+
+        estimates[action.analyzer_type, action.source] = \
+            averages[action.analyzer_type]
+
+    return estimates
+
+
+class MemoryAdmission:
+    """
+    Memory reservations of the analyses which are shared between the worker
+    processes of a host.
+    """
+
+    def __init__(self, budget: int):
+        """
+        budget -- The maximum total expected peak memory usage of the running
+                  analyses in bytes.
+        """
+        self.budget = budget
+        self.__condition = multiprocess.Condition()
+        self.__reserved = multiprocess.Value('q', 0, lock=False)
+        self.__running = multiprocess.Value('i', 0, lock=False)
+
+    def __fits(self, peak_rss: int) -> bool:
+        if self.__running.value == 0:
+            return True
+
+        if self.__reserved.value + peak_rss > self.budget:
+            return False
+
+        return peak_rss <= psutil.virtual_memory().available
+
+    def acquire(self, peak_rss: int):
+        """
+        Wait until an analysis with the given expected peak memory usage
+        fits, and reserve its memory.
+        """
+        with self.__condition:
+            waiting = False
+            while not self.__fits(peak_rss):
+                if not waiting:
+                    LOG.debug_analyzer("Waiting for %d MiB memory ...",
+                                       peak_rss // 1024 // 1024)
+                    waiting = True
+                self.__condition.wait(WAIT_INTERVAL)
+
+            self.__reserved.value += peak_rss
+            self.__running.value += 1
+
+    def release(self, peak_rss: int):
+        """ Release the memory reserved by acquire(). """
+        with self.__condition:
+            self.__reserved.value -= peak_rss
+            self.__running.value -= 1
+            self.__condition.notify_all()
+
+    @contextlib.contextmanager
+    def admit(self, peak_rss: int):
+        """ Reserve the given memory while the context is active. """
+        self.acquire(peak_rss)
+        try:
+            yield
+        finally:
+            self.release(peak_rss)
+
+
+def create_memory_admission(
+    max_memory: Optional[int]
+) -> Optional[MemoryAdmission]:
+    """
+    Create the admission control of the analyses with the given memory budget
+    in bytes. None is returned if no budget is given, then the analyses are
+    started without admission control.
+    """
+    if not max_memory:
+        return None
+
+    LOG.info("Memory budget of the analyzers: %d MiB",
+             max_memory // 1024 // 1024)
+
+    return MemoryAdmission(max_memory)
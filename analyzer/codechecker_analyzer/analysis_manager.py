@@ -7,6 +7,8 @@
 # -------------------------------------------------------------------------
 
 
+import collections
+import contextlib
 import glob
 import os
 import shlex
@@ -17,7 +19,7 @@ import time
 import traceback
 import zipfile
 
-from threading import Timer
+from threading import Event, Thread, Timer
 
 import multiprocess
 import psutil
@@ -28,11 +30,14 @@ from codechecker_common.review_status_handler import ReviewStatusHandler
 from codechecker_statistics_collector.collectors.special_return_value import \
     SpecialReturnValueCollector
 
-from . import gcc_toolchain
+from . import analysis_admission, analysis_queue, analysis_schedule, \
+    dependency_index, gcc_toolchain
 
 from .analyzers import analyzer_types
 from .analyzers.config_handler import CheckerState
 from .analyzers.clangsa.analyzer import ClangSA
+from .analyzers.clangtidy import batch
+from .analyzers.clangtidy.analyzer import ClangTidy
 
 LOG = get_logger('analyzer')
 
@@ -57,13 +62,46 @@ def print_analyzer_statistic_summary(metadata_analyzers, status, msg=None):
             LOG.info("  %s: %s", analyzer_type, res)
 
 
-def worker_result_handler(results, metadata_tool, output_path):
-    """ Print the analysis summary. """
+def worker_result_handler(results, metadata_tool, output_path,
+                          analysis_history=None, dep_index=None):
+    """
+    Print the analysis summary. The statistics of the analyses are recorded
+    in the given analysis history, and their peak memory usage in the
+    metadata. The dependencies of the analyzed translation units are updated
+    in the given dependency index.
+    """
     skipped_num = 0
     reanalyzed_num = 0
     metadata_analyzers = metadata_tool['analyzers']
-    for res, skipped, reanalyzed, analyzer_type, _, sources in results:
+    for res, skipped, reanalyzed, analyzer_type, _, sources, cache_hit, \
+            analysis_stats, dependencies in results:
         statistics = metadata_analyzers[analyzer_type]['analyzer_statistics']
+
+        if dep_index is not None and dependencies is not None:
+            dep_index.update(sources, dependencies)
+
+        if analysis_stats:
+            # Peak memory usage of the analyzer in bytes by source file. It is
+            # measured only if the analyses are admitted by memory.
+            if analysis_stats['peak_rss']:
+                metadata_analyzers[analyzer_type].setdefault(
+                    'peak_rss', {})[sources] = analysis_stats['peak_rss']
+
+            if analysis_history is not None:
+                entries = analysis_history.setdefault(analyzer_type, {})
+
+                # Keep the last measured peak if it wasn't measured now.
+                if not analysis_stats['peak_rss'] and sources in entries:
+                    analysis_stats = dict(
+                        analysis_stats,
+                        peak_rss=entries[sources].get('peak_rss', 0))
+
+                entries[sources] = analysis_stats
+
+        if cache_hit is not None:
+            cache_stats = metadata_analyzers[analyzer_type]['result_cache']
+            cache_stats['hits' if cache_hit else 'misses'] += 1
+
         if skipped:
             skipped_num += 1
         else:
@@ -86,6 +124,13 @@ def worker_result_handler(results, metadata_tool, output_path):
                                      'failed',
                                      'Failed to analyze')
 
+    for analyzer_type, analyzer in metadata_analyzers.items():
+        cache_statistics = analyzer.get('result_cache')
+        if cache_statistics:
+            LOG.info("Result cache of %s: %d hits, %d misses",
+                     analyzer_type, cache_statistics['hits'],
+                     cache_statistics['misses'])
+
     if reanalyzed_num:
         LOG.info("Reanalyzed compilation commands: %d", reanalyzed_num)
     if skipped_num:
@@ -117,11 +162,48 @@ def worker_result_handler(results, metadata_tool, output_path):
 PROGRESS_CHECKED_NUM = None
 PROGRESS_ACTIONS = None
 
-
-def init_worker(checked_num, action_num):
-    global PROGRESS_CHECKED_NUM, PROGRESS_ACTIONS
+# Analysis data which is the same for every build action and is read-only
+# while the workers run. It is handed over to the workers once, when the
+# worker process is initialized, instead of sending it along with every build
+# action.
+CHECK_CONTEXT = None
+
+# Memory admission control of the analyzer processes shared by the workers of
+# this host. None if the analyzers are started without admission control.
+MEMORY_ADMISSION = None
+
+CheckContext = collections.namedtuple(
+    'CheckContext',
+    ['actions_map', 'analyzer_config_map', 'output_dir', 'skip_handlers',
+     'filter_handlers', 'rs_handler', 'quiet_output_on_stdout',
+     'capture_analysis_output', 'generate_reproducer', 'analysis_timeout',
+     'ctu_reanalyze_on_failure', 'output_dirs', 'statistics_data',
+     'result_cache', 'peak_rss_estimates', 'dependency_analyzer'])
+
+
+def init_worker(checked_num, action_num, check_context=None,
+                memory_admission=None):
+    global PROGRESS_CHECKED_NUM, PROGRESS_ACTIONS, CHECK_CONTEXT, \
+        MEMORY_ADMISSION
     PROGRESS_CHECKED_NUM = checked_num
     PROGRESS_ACTIONS = action_num
+    CHECK_CONTEXT = check_context
+    MEMORY_ADMISSION = memory_admission
+
+
+def admit_analysis(*actions):
+    """
+    Return a context which holds the memory reservation of the analysis of
+    the given actions while the analyzer process runs. The actions of a batch
+    are analyzed one after the other by the same process, so the largest
+    expected peak memory usage of them is reserved.
+    """
+    if MEMORY_ADMISSION is None:
+        return contextlib.nullcontext()
+
+    peak_rss = max(CHECK_CONTEXT.peak_rss_estimates.get(
+        (action.analyzer_type, action.source), 0) for action in actions)
+    return MEMORY_ADMISSION.admit(peak_rss)
 
 
 def save_output(base_file_name, out, err):
@@ -165,6 +247,20 @@ def is_ctu_active(source_analyzer):
         source_analyzer.is_ctu_enabled()
 
 
+def get_result_cache_key(result_cache, statistics_data, source_analyzer, rh,
+                         analyzer_cmd):
+    """
+    Return the result cache key of the analysis or None if its results can't
+    be cached. The results of CTU and statistics based analysis depend on
+    other translation units too, so these are not cached.
+    """
+    if not result_cache or statistics_data or \
+            is_ctu_active(source_analyzer):
+        return None
+
+    return result_cache.get_key(source_analyzer, rh, analyzer_cmd)
+
+
 def prepare_check(action, analyzer_config, output_dir,
                   skip_handlers, statistics_data, disable_ctu=False):
     """ Construct the source analyzer and result handler. """
@@ -455,6 +551,52 @@ def setup_process_timeout(proc, timeout,
     return __cleanup_timeout
 
 
+def setup_memory_watch(proc, interval=0.5):
+    """
+    Sample the resident set size of a process and its children in a
+    background thread until the process terminates.
+
+    :param proc: The subprocess.Process object representing the process to
+      watch.
+    :param interval: Time between two samples in seconds.
+
+    :return: A function is returned which stops the sampling and returns the
+      peak resident set size of the process tree in bytes (0 if it couldn't
+      be measured).
+    """
+    stop = Event()
+    watch = {'peak_rss': 0}
+
+    def __sample():
+        try:
+            process = psutil.Process(proc.pid)
+            while True:
+                rss = 0
+                for p in [process] + process.children(recursive=True):
+                    try:
+                        rss += p.memory_info().rss
+                    except psutil.Error:
+                        pass
+
+                watch['peak_rss'] = max(watch['peak_rss'], rss)
+
+                if stop.wait(interval):
+                    break
+        except psutil.Error:
+            # The process has terminated.
+            pass
+
+    thread = Thread(target=__sample, daemon=True)
+    thread.start()
+
+    def __stop_memory_watch():
+        stop.set()
+        thread.join()
+        return watch['peak_rss']
+
+    return __stop_memory_watch
+
+
 def collect_ctu_involved_files(result_handler, source_analyzer, output_dir):
     """
     This function collects the list of source files involved by CTU analysis.
@@ -479,29 +621,47 @@ def collect_ctu_involved_files(result_handler, source_analyzer, output_dir):
         os.remove(out)
 
 
-def check(check_data):
+def check(action):
     """
     Invoke clang with an action which called by processes.
     Different analyzer object belongs to for each build action.
 
-    skiplist handler is None if no skip file was configured.
+    The rest of the analysis data is taken from CHECK_CONTEXT which is set
+    by init_worker(). skiplist handler is None if no skip file was configured.
     """
-    actions_map, action, analyzer_config, \
+    actions_map, analyzer_config_map, \
         output_dir, skip_handlers, filter_handlers, \
         rs_handler, quiet_output_on_stdout, \
         capture_analysis_output, generate_reproducer, analysis_timeout, \
         ctu_reanalyze_on_failure, \
-        output_dirs, statistics_data = check_data
+        output_dirs, statistics_data, result_cache, _, \
+        dependency_analyzer = CHECK_CONTEXT
+
+    analyzer_config = analyzer_config_map.get(action.analyzer_type)
 
     failed_dir = output_dirs["failed"]
     success_dir = output_dirs["success"]
     reproducer_dir = output_dirs["reproducer"]
 
+    start_time = time.time()
+
     try:
         # If one analysis fails the check fails.
         return_codes = 0
         reanalyzed = False
 
+        # None if the result cache is not used for this analysis, otherwise
+        # it tells whether the result was restored from the cache.
+        cache_hit = None
+
+        # Wall time and peak memory usage of the analysis which are recorded
+        # in the analysis history. None if the analyzer wasn't executed.
+        analysis_stats = None
+
+        # Files of the translation unit for the dependency index. None if
+        # they are not collected by the analysis of this analyzer.
+        dependencies = None
+
         result_file = ''
 
         if analyzer_config is None:
@@ -528,36 +688,50 @@ def check(check_data):
         # "function pointer" is captured by reference.
         timeout_cleanup = [lambda: False]
 
-        if analysis_timeout and analysis_timeout > 0:
-            def __create_timeout(analyzer_process):
-                """
-                Once the analyzer process is started, this method is
-                called. Set up a timeout for the analysis.
-                """
+        # The peak memory usage of the analyzer is measured the same way if
+        # it is needed for the memory admission control.
+        memory_watch = [lambda: 0]
+
+        def __create_timeout(analyzer_process):
+            """
+            Once the analyzer process is started, this method is
+            called. Set up a timeout for the analysis if the client gave
+            one and start measuring the memory usage of the analyzer.
+            """
+            if MEMORY_ADMISSION is not None:
+                memory_watch[0] = setup_memory_watch(analyzer_process)
+
+            if analysis_timeout and analysis_timeout > 0:
                 timeout_cleanup[0] = setup_process_timeout(
                     analyzer_process, analysis_timeout)
-        else:
-            def __create_timeout(_):
-                # If no timeout is given by the client, this callback
-                # shouldn't do anything.
-                pass
 
         result_file_exists = os.path.exists(rh.analyzer_result_file)
 
-        # Fills up the result handler with the analyzer information.
-        source_analyzer.analyze(analyzer_cmd, rh, __create_timeout)
+        cache_key = get_result_cache_key(result_cache, statistics_data,
+                                         source_analyzer, rh, analyzer_cmd)
+
+        if cache_key:
+            cache_hit = result_cache.restore(cache_key, rh, analyzer_cmd)
+
+        if not cache_hit:
+            # Fills up the result handler with the analyzer information.
+            with admit_analysis(action):
+                source_analyzer.analyze(analyzer_cmd, rh, __create_timeout)
 
-        # If execution reaches this line, the analyzer process has quit.
-        if timeout_cleanup[0]():
-            LOG.warning("Analyzer ran too long, exceeding time limit "
-                        "of %d seconds.", analysis_timeout)
-            LOG.warning("Considering this analysis as failed...")
-            rh.analyzer_returncode = -1
-            rh.analyzer_stderr = \
-                ">>> CodeChecker: Analysis timed out after " \
-                f"{analysis_timeout} seconds. <<<\n{rh.analyzer_stderr}"
+            # If execution reaches this line, the analyzer process has quit.
+            if timeout_cleanup[0]():
+                LOG.warning("Analyzer ran too long, exceeding time limit "
+                            "of %d seconds.", analysis_timeout)
+                LOG.warning("Considering this analysis as failed...")
+                rh.analyzer_returncode = -1
+                rh.analyzer_stderr = \
+                    ">>> CodeChecker: Analysis timed out after " \
+                    f"{analysis_timeout} seconds. <<<\n{rh.analyzer_stderr}"
 
-        source_analyzer.post_analyze(rh)
+            source_analyzer.post_analyze(rh)
+
+            if cache_key and rh.analyzer_returncode == 0:
+                result_cache.store(cache_key, rh)
 
         # If source file contains escaped spaces ("\ " tokens), then
         # clangSA writes the plist file with removing this escape
@@ -650,7 +824,8 @@ def check(check_data):
 
                 # Fills up the result handler with
                 # the analyzer information.
-                source_analyzer.analyze(analyzer_cmd, rh)
+                with admit_analysis(action):
+                    source_analyzer.analyze(analyzer_cmd, rh)
 
                 return_codes = rh.analyzer_returncode
                 if rh.analyzer_returncode == 0:
@@ -688,14 +863,227 @@ def check(check_data):
 
         PROGRESS_CHECKED_NUM.value += 1
 
+        if not cache_hit:
+            analysis_stats = {
+                'duration': time.time() - start_time,
+                'peak_rss': memory_watch[0](),
+                'size': analysis_schedule.get_source_size(action.source)}
+
+        # The dependencies are the same for every analyzer, so they are
+        # collected by only one of them.
+        if action.analyzer_type == dependency_analyzer:
+            dependencies = dependency_index.collect_dependencies(action)
+
         return return_codes, False, reanalyzed, action.analyzer_type, \
-            result_file, action.source
+            result_file, action.source, cache_hit, analysis_stats, \
+            dependencies
 
     except Exception as e:
         LOG.debug_analyzer(str(e))
         traceback.print_exc(file=sys.stdout)
         return 1, False, reanalyzed, action.analyzer_type, None, \
-            action.source
+            action.source, cache_hit, analysis_stats, dependencies
+
+
+def __finish_batch_member(action, source_analyzer, rh, reanalyzed,
+                          cache_hit, analysis_stats):
+    """
+    Handle the successful analysis of a build action of a batch like check()
+    does, and return the result of check().
+    """
+    output_dirs = CHECK_CONTEXT.output_dirs
+
+    result_file = rh.analyzer_result_file.replace(r'\ ', ' ')
+    result_base = os.path.basename(result_file)
+    zip_file = result_base + '.zip'
+
+    # Remove the previously generated .zip files.
+    for zip_dir in (output_dirs['failed'], output_dirs['reproducer']):
+        if os.path.exists(os.path.join(zip_dir, zip_file)):
+            os.remove(os.path.join(zip_dir, zip_file))
+
+    if CHECK_CONTEXT.generate_reproducer:
+        handle_reproducer(source_analyzer, rh,
+                          os.path.join(output_dirs['reproducer'], zip_file),
+                          CHECK_CONTEXT.actions_map)
+
+    handle_success(rh, result_file, result_base,
+                   CHECK_CONTEXT.filter_handlers, CHECK_CONTEXT.rs_handler,
+                   CHECK_CONTEXT.capture_analysis_output,
+                   output_dirs['success'])
+
+    LOG.info("[%d/%d] %s analyzed %s successfully.",
+             PROGRESS_CHECKED_NUM.value, PROGRESS_ACTIONS.value,
+             action.analyzer_type, os.path.basename(action.source))
+
+    if not CHECK_CONTEXT.quiet_output_on_stdout:
+        LOG.debug_analyzer('\n%s', rh.analyzer_stdout)
+
+    PROGRESS_CHECKED_NUM.value += 1
+
+    dependencies = None
+    if action.analyzer_type == CHECK_CONTEXT.dependency_analyzer:
+        dependencies = dependency_index.collect_dependencies(action)
+
+    return 0, False, reanalyzed, action.analyzer_type, result_file, \
+        action.source, cache_hit, analysis_stats, dependencies
+
+
+def check_batch(actions):
+    """
+    Analyze a batch of clang-tidy build actions which differ only in their
+    source files in one clang-tidy process (see clangtidy.batch). The result
+    of check() is returned for every build action of the batch.
+
+    The timeout of the analysis is multiplied by the size of the batch. If the
+    batch fails, the source files which couldn't be compiled are analyzed
+    again one by one by check(), so they get the same failure handling as
+    without batching. If these source files can't be identified (e.g. the
+    batch timed out or clang-tidy crashed), every source file of the batch is
+    analyzed again one by one.
+    """
+    analyzer_config = \
+        CHECK_CONTEXT.analyzer_config_map.get(actions[0].analyzer_type)
+    result_cache = CHECK_CONTEXT.result_cache
+    analysis_timeout = CHECK_CONTEXT.analysis_timeout
+
+    results = []
+    finished = set()
+    try:
+        if analyzer_config is None:
+            raise ValueError("Analyzer configuration is missing.")
+
+        # Build actions which are not restored from the result cache by
+        # source file.
+        members = {}
+        for action in actions:
+            source_analyzer, rh = prepare_check(
+                action, analyzer_config, CHECK_CONTEXT.output_dir,
+                CHECK_CONTEXT.skip_handlers, CHECK_CONTEXT.statistics_data)
+
+            reanalyzed = os.path.exists(rh.analyzer_result_file)
+            analyzer_cmd = source_analyzer.construct_analyzer_cmd(rh)
+
+            cache_key = get_result_cache_key(
+                result_cache, CHECK_CONTEXT.statistics_data, source_analyzer,
+                rh, analyzer_cmd)
+
+            if cache_key and result_cache.restore(cache_key, rh,
+                                                  analyzer_cmd):
+                results.append(__finish_batch_member(
+                    action, source_analyzer, rh, reanalyzed, True, None))
+                finished.add(action.source)
+                continue
+
+            members[action.source] = (action, source_analyzer, rh,
+                                      reanalyzed, analyzer_cmd, cache_key)
+
+        if not members:
+            return results
+
+        sources = list(members)
+        _, batch_analyzer, batch_rh, _, _, _ = members[sources[0]]
+
+        # The fixits of the batch are exported to the fixit file of its first
+        # source file, the ones of the previous analyses are removed.
+        for source in sources[1:]:
+            fixit_file = members[source][2].fixit_file
+            if os.path.exists(fixit_file):
+                os.remove(fixit_file)
+        batch_cmd = batch_analyzer.construct_batch_analyzer_cmd(batch_rh,
+                                                                sources)
+
+        timeout_cleanup = [lambda: False]
+        memory_watch = [lambda: 0]
+
+        def __create_timeout(analyzer_process):
+            if MEMORY_ADMISSION is not None:
+                memory_watch[0] = setup_memory_watch(analyzer_process)
+
+            if analysis_timeout and analysis_timeout > 0:
+                timeout_cleanup[0] = setup_process_timeout(
+                    analyzer_process, analysis_timeout * len(sources))
+
+        start_time = time.time()
+        with admit_analysis(*(m[0] for m in members.values())):
+            batch_analyzer.analyze(batch_cmd, batch_rh, __create_timeout)
+
+        timed_out = timeout_cleanup[0]()
+        duration = time.time() - start_time
+        peak_rss = memory_watch[0]()
+
+        # The fixits of the batch are split like the output, so every source
+        # file has its own fixit file as if it was analyzed alone.
+        directory = actions[0].directory
+        batch.split_fixits(
+            batch_rh.fixit_file,
+            {source: members[source][2].fixit_file for source in sources},
+            directory)
+
+        failed = set()
+        if batch_rh.analyzer_returncode != 0:
+            failed = batch.get_failed_sources(batch_rh.analyzer_stderr,
+                                              sources, directory)
+            if timed_out or not failed:
+                failed = set(sources)
+
+            LOG.debug_analyzer("Analyzing a batch of %d source files with "
+                               "%s failed, %d of them are analyzed again "
+                               "one by one.", len(sources),
+                               actions[0].analyzer_type, len(failed))
+
+        outputs = batch.split_output(batch_rh.analyzer_stdout, sources,
+                                     directory)
+
+        for source in sources:
+            if source in failed:
+                continue
+
+            action, source_analyzer, rh, reanalyzed, analyzer_cmd, \
+                cache_key = members[source]
+
+            # The output of the batch is handled as if the source file was
+            # analyzed alone.
+            rh.analyzer_cmd = analyzer_cmd
+            rh.analyzer_returncode = 0
+            rh.analyzer_stdout = outputs[source]
+            rh.analyzer_stderr = ''
+            source_analyzer.post_analyze(rh)
+
+            if cache_key:
+                result_cache.store(cache_key, rh)
+
+            analysis_stats = {
+                'duration': duration / len(sources),
+                'peak_rss': peak_rss,
+                'size': analysis_schedule.get_source_size(source)}
+
+            results.append(__finish_batch_member(
+                action, source_analyzer, rh, reanalyzed, False if cache_key
+                else None, analysis_stats))
+            finished.add(source)
+
+    except Exception as e:
+        LOG.debug_analyzer(str(e))
+        traceback.print_exc(file=sys.stdout)
+
+    for action in actions:
+        if action.source not in finished:
+            results.append(check(action))
+
+    return results
+
+
+def check_work_item(item):
+    """
+    Analyze a work item of the analysis: a build action or a batch of build
+    actions (see check_batch()). The results of check() are returned in a
+    list.
+    """
+    if isinstance(item, list):
+        return check_batch(item)
+
+    return [check(item)]
 
 
 def skip_cpp(compile_actions, skip_handlers):
@@ -719,37 +1107,161 @@ def skip_cpp(compile_actions, skip_handlers):
     return analyze, skip
 
 
+def __serve_queue(check_context, actions, output_path,
+                  lease_timeout=analysis_queue.LEASE_TIMEOUT):
+    """
+    Publish the work items (see check_work_item()) in the work queue of the
+    report directory and wait until the queue workers analyze all of them.
+    The results of check() are returned in the order of the work items.
+    """
+    queue = analysis_queue.create_queue(output_path)
+    queue.publish(check_context, actions)
+
+    LOG.info("%d work items are published for analysis. Start workers "
+             "with 'CodeChecker analyze --queue-worker -o %s' on the hosts "
+             "which share the report directory.", len(actions), output_path)
+
+    results = {}
+    while len(results) < len(actions):
+        time.sleep(analysis_queue.POLL_INTERVAL)
+
+        collected = len(results)
+        queue.collect_results(results)
+        if len(results) != collected:
+            LOG.debug_analyzer("%d/%d work items are analyzed.",
+                               len(results), len(actions))
+
+        queue.expire_leases(lease_timeout, time.time())
+
+    queue.finish()
+
+    return [result for index in range(len(actions))
+            for result in results[index]]
+
+
+def __analyze_queue(queue_dir, checked_num, action_num, check_context,
+                    memory_admission, lease_timeout):
+    """
+    Claim and analyze build actions from the given work queue until it is
+    done. This is executed by the worker processes of a queue worker.
+    """
+    init_worker(checked_num, action_num, check_context, memory_admission)
+    queue = analysis_queue.ActionQueue(queue_dir)
+
+    while not queue.is_done():
+        name = queue.claim()
+        if name is None:
+            time.sleep(analysis_queue.POLL_INTERVAL)
+            continue
+
+        try:
+            action = queue.get_action(name)
+        except FileNotFoundError:
+            # The lease has expired before the action could be loaded.
+            continue
+
+        stop_renewal = Event()
+
+        def renew_lease(name=name, stop_renewal=stop_renewal):
+            while not stop_renewal.wait(lease_timeout / 4):
+                if not queue.renew(name):
+                    return
+
+        renewal = Thread(target=renew_lease, daemon=True)
+        renewal.start()
+        try:
+            result = check_work_item(action)
+        finally:
+            stop_renewal.set()
+            renewal.join()
+
+        queue.complete(name, result)
+
+
+def run_queue_worker(output_path, jobs, max_memory=None,
+                     lease_timeout=analysis_queue.LEASE_TIMEOUT):
+    """
+    Analyze the build actions which are published in the work queue of the
+    given report directory by 'CodeChecker analyze --serve-queue'. The given
+    number of worker processes are started. If no queue is published yet,
+    this waits for it. Returns when every build action of the queue is
+    analyzed.
+
+    The analyses of this host are admitted by the given memory budget in
+    bytes if it is given (see analysis_admission).
+    """
+    LOG.info("Waiting for build actions in '%s' ...", output_path)
+
+    while True:
+        queue = analysis_queue.get_current_queue(output_path)
+        if queue and not queue.is_done():
+            data = queue.load_context()
+            if data:
+                break
+        time.sleep(analysis_queue.POLL_INTERVAL)
+
+    LOG.info("Analyzing build actions of the queue with %d worker "
+             "processes.", jobs)
+
+    checked_var = multiprocess.Value('i', 1)
+    actions_num = multiprocess.Value('i', data['action_num'])
+    memory_admission = analysis_admission.create_memory_admission(max_memory)
+    workers = [multiprocess.Process(
+        target=__analyze_queue,
+        args=(queue.queue_dir, checked_var, actions_num, data['context'],
+              memory_admission, lease_timeout))
+        for _ in range(jobs)]
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    LOG.info("Every build action of the queue is analyzed.")
+
+
 def start_workers(actions_map, actions, analyzer_config_map,
                   jobs, output_path, skip_handlers, filter_handlers,
                   rs_handler: ReviewStatusHandler, metadata_tool,
                   quiet_analyze, capture_analysis_output, generate_reproducer,
-                  timeout, ctu_reanalyze_on_failure, statistics_data, manager,
-                  compile_cmd_count):
+                  timeout, ctu_reanalyze_on_failure, statistics_data,
+                  compile_cmd_count, result_cache=None,
+                  schedule=analysis_schedule.SCHEDULE_COMPILE_DB,
+                  serve_queue=False, max_memory=None, tidy_batch_size=1,
+                  update_dependency_index=False):
     """
     Start the workers in the process pool.
     For every build action there is worker which makes the analysis.
-    """
-    # Handle SIGINT to stop this script running.
-    def signal_handler(signum, _):
-        try:
-            pool.terminate()
-            pool.join()
-            manager.shutdown()
-        except Exception as e:
-            LOG.error("Failed to clean up after the pool!:\n")
-            LOG.error(e)
-            raise
-        finally:
-            sys.exit(128 + signum)
+    The build actions are started in the order given by the schedule.
+
+    If serve_queue is True, no workers are started here. The build actions are
+    published in the work queue of the report directory instead, and they are
+    analyzed by 'CodeChecker analyze --queue-worker' processes.
+
+    If a memory budget is given in bytes, an analyzer process is started only
+    if its expected peak memory usage fits in it (see analysis_admission).
+
+    If update_dependency_index is True, the header dependencies of the
+    analyzed translation units are updated in the dependency index of the
+    report directory (see dependency_index).
+
+    If tidy_batch_size is greater than 1, clang-tidy analyzes the build
+    actions which differ only in their source files in batches of this size
+    (see check_batch()).
 
+    The given maps and handlers must not be modified while the workers run:
+    every worker gets its own copy of them when it is started (the worker
+    process inherits them in case of forking).
+    """
     actions, skipped_actions = skip_cpp(actions, skip_handlers)
-    # Start checking parallel.
-    checked_var = multiprocess.Value('i', 1)
-    actions_num = multiprocess.Value('i', len(actions))
-    pool = multiprocess.Pool(jobs,
-                             initializer=init_worker,
-                             initargs=(checked_var, actions_num))
-    signal.signal(signal.SIGINT, signal_handler)
+
+    analysis_history = analysis_schedule.load_history(output_path)
+    dep_index = dependency_index.DependencyIndex(output_path) \
+        if update_dependency_index else None
+    actions, predicted_makespan, compile_db_makespan = \
+        analysis_schedule.schedule_actions(actions, schedule,
+                                           analysis_history, jobs)
 
     # If the analysis has failed, we help debugging.
     failed_dir = os.path.join(output_path, "failed")
@@ -781,23 +1293,61 @@ def start_workers(actions_map, actions, analyzer_config_map,
                    'reproducer': reproducer_dir,
                    'ctu_connections': ctu_connections_dir}
 
-    analyzed_actions = [(actions_map,
-                         build_action,
-                         analyzer_config_map.get(build_action.analyzer_type),
-                         output_path,
-                         skip_handlers,
-                         filter_handlers,
-                         rs_handler,
-                         quiet_analyze,
-                         capture_analysis_output,
-                         generate_reproducer,
-                         timeout,
-                         ctu_reanalyze_on_failure,
-                         output_dirs,
-                         statistics_data)
-                        for build_action in actions]
-
-    if analyzed_actions:
+    check_context = CheckContext(actions_map,
+                                 analyzer_config_map,
+                                 output_path,
+                                 skip_handlers,
+                                 filter_handlers,
+                                 rs_handler,
+                                 quiet_analyze,
+                                 capture_analysis_output,
+                                 generate_reproducer,
+                                 timeout,
+                                 ctu_reanalyze_on_failure,
+                                 output_dirs,
+                                 statistics_data,
+                                 result_cache,
+                                 analysis_admission.estimate_peak_rss(
+                                     actions, analysis_history)
+                                 if max_memory or serve_queue else {},
+                                 actions[0].analyzer_type
+                                 if actions and dep_index else None)
+
+    work_items = batch.create_batches(actions, ClangTidy.ANALYZER_NAME,
+                                      tidy_batch_size, jobs)
+
+    start_time = time.time()
+    if serve_queue and actions:
+        results = __serve_queue(check_context, work_items, output_path)
+        worker_result_handler(results, metadata_tool, output_path,
+                              analysis_history, dep_index)
+    elif actions:
+        # Start checking parallel. Only the progress counters are shared
+        # between the processes, the read-only analysis data is handed over
+        # to the workers once by the pool initializer.
+        checked_var = multiprocess.Value('i', 1)
+        actions_num = multiprocess.Value('i', len(actions))
+        memory_admission = \
+            analysis_admission.create_memory_admission(max_memory)
+        pool = multiprocess.Pool(jobs,
+                                 initializer=init_worker,
+                                 initargs=(checked_var, actions_num,
+                                           check_context, memory_admission))
+
+        # Handle SIGINT to stop this script running.
+        def signal_handler(signum, _):
+            try:
+                pool.terminate()
+                pool.join()
+            except Exception as e:
+                LOG.error("Failed to clean up after the pool!:\n")
+                LOG.error(e)
+                raise
+            finally:
+                sys.exit(128 + signum)
+
+        signal.signal(signal.SIGINT, signal_handler)
+
         try:
 
             # Workaround, equivalent of map.
@@ -805,17 +1355,15 @@ def start_workers(actions_map, actions, analyzer_config_map,
             # while map or map_async function is running.
             # It is a python bug, this does not happen if a timeout is
             # specified, then receive the interrupt immediately.
-
-            # FIXME: Ensure all shared data structures are wrapped in manager
-            #        proxy objects before passing them to other processes via
-            #        map_async.
-            #        Note that even deep-copying is known to be insufficient.
             timeout = 3155760 if sys.platform == 'win32' else 31557600
-            pool.map_async(check,
-                           analyzed_actions,
+            pool.map_async(check_work_item,
+                           work_items,
                            1,
                            callback=lambda results: worker_result_handler(
-                               results, metadata_tool, output_path)
+                               [r for item_results in results
+                                for r in item_results],
+                               metadata_tool, output_path,
+                               analysis_history, dep_index)
                            ).get(timeout)
 
             pool.close()
@@ -825,10 +1373,23 @@ def start_workers(actions_map, actions, analyzer_config_map,
         finally:
             pool.join()
     else:
-        pool.close()
-        pool.join()
         LOG.info("----==== Summary ====----")
 
+    if actions:
+        makespan = time.time() - start_time
+        analysis_schedule.save_history(output_path, analysis_history)
+        if dep_index:
+            dep_index.save()
+
+        if predicted_makespan is not None:
+            LOG.info("Predicted analysis time: %.2f sec with '%s' "
+                     "schedule, %.2f sec in compilation database order.",
+                     predicted_makespan, schedule, compile_db_makespan)
+            LOG.info("Actual analysis time: %.2f sec", makespan)
+
+    if result_cache:
+        result_cache.evict()
+
     for skp in skipped_actions:
         LOG.debug_analyzer("%s is skipped", skp.source)
 
@@ -0,0 +1,283 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Work queue of the analysis actions in the report directory.
+
+The coordinator ('CodeChecker analyze --serve-queue') publishes the build
+actions in the queue and any number of workers ('CodeChecker analyze
+--queue-worker') on the same or on other hosts analyze them. The report
+directory has to be on a filesystem which is shared by these hosts.
+
+Every analysis publishes a new queue in a new directory under
+'<report dir>/analysis_queue'. The name of the current one is in the 'current'
+file there. Layout of a queue directory:
+  context   - The analysis data which is the same for every build action.
+  pending/  - Build actions which are not claimed by any worker yet.
+  running/  - Build actions which are claimed by a worker. The modification
+              time of the file is the lease of the worker, which is renewed
+              periodically while the action is analyzed.
+  results/  - Results of the analyzed build actions.
+  done      - Created by the coordinator when every result is collected.
+
+A worker claims a build action by renaming it from pending/ to running/.
+Renaming is atomic, so only one worker can succeed. If a worker crashes, its
+lease expires and the coordinator puts the build action back to pending/. The
+coordinator measures the age of a lease by its own clock, so the clocks of
+the hosts don't have to be synchronized.
+"""
+
+
+import os
+import shutil
+import uuid
+
+from typing import Any, List, Optional
+
+from multiprocess.reduction import ForkingPickler
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+QUEUE_DIR = 'analysis_queue'
+
+# A worker which doesn't renew the lease of its build action for this many
+# seconds is considered dead.
+LEASE_TIMEOUT = 120
+
+# Seconds between checking the queue for new build actions and results.
+POLL_INTERVAL = 0.5
+
+
+class ActionQueue:
+    """ Build action queue in a directory. """
+
+    def __init__(self, queue_dir: str):
+        self.queue_dir = queue_dir
+        self.context_file = os.path.join(queue_dir, 'context')
+        self.done_file = os.path.join(queue_dir, 'done')
+        self.pending_dir = os.path.join(queue_dir, 'pending')
+        self.running_dir = os.path.join(queue_dir, 'running')
+        self.results_dir = os.path.join(queue_dir, 'results')
+
+        # Names of the pending build actions as seen by the last listing of
+        # the pending directory. Listing it for every claim would be slow if
+        # there are many build actions.
+        self.__pending = []
+
+        # Modification time of the claimed build actions and the time when
+        # the coordinator has seen it first.
+        self.__leases = {}
+
+    @staticmethod
+    def __dump(obj: Any, path: str):
+        """
+        Write the given object to the given file atomically, so a reader
+        never sees a partially written file.
+        """
+        tmp_file = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(ForkingPickler.dumps(obj))
+        os.replace(tmp_file, path)
+
+    @staticmethod
+    def __load(path: str) -> Any:
+        with open(path, 'rb') as f:
+            return ForkingPickler.loads(f.read())
+
+    def publish(self, context: Any, actions: List):
+        """
+        Publish the given build actions and the analysis context. Actions
+        are claimed by the workers in the given order.
+        """
+        for directory in (self.pending_dir, self.running_dir,
+                          self.results_dir):
+            os.makedirs(directory)
+
+        for index, action in enumerate(actions):
+            self.__dump(action,
+                        os.path.join(self.pending_dir, f"{index:08d}"))
+
+        # The context is written last, so the workers start claiming build
+        # actions only when all of them are published.
+        self.__dump({'context': context, 'action_num': len(actions)},
+                    self.context_file)
+
+    def load_context(self) -> Optional[dict]:
+        """
+        Return the published analysis context and the number of build
+        actions or None if nothing is published yet.
+        """
+        try:
+            return self.__load(self.context_file)
+        except FileNotFoundError:
+            return None
+
+    def is_done(self) -> bool:
+        """
+        True if the coordinator has collected every result or a new queue
+        was published since then.
+        """
+        return os.path.exists(self.done_file) or \
+            not os.path.isdir(self.queue_dir)
+
+    def claim(self) -> Optional[str]:
+        """
+        Claim a pending build action and return its name or None if there is
+        no pending build action.
+        """
+        listed = False
+        while True:
+            while self.__pending:
+                name = self.__pending.pop()
+                running_file = os.path.join(self.running_dir, name)
+                try:
+                    os.rename(os.path.join(self.pending_dir, name),
+                              running_file)
+                    # Renaming keeps the modification time of the file, so
+                    # the lease has to be started explicitly. If it has
+                    # expired in the meantime, the action was put back to
+                    # the pending ones.
+                    os.utime(running_file)
+                    return name
+                except FileNotFoundError:
+                    # Claimed by an other worker.
+                    continue
+
+            if listed:
+                return None
+
+            try:
+                self.__pending = sorted(os.listdir(self.pending_dir),
+                                        reverse=True)
+            except FileNotFoundError:
+                return None
+            listed = True
+
+    def get_action(self, name: str) -> Any:
+        """ Return the claimed build action of the given name. """
+        return self.__load(os.path.join(self.running_dir, name))
+
+    def renew(self, name: str) -> bool:
+        """
+        Renew the lease of the claimed build action. False is returned if
+        the lease has already expired.
+        """
+        try:
+            os.utime(os.path.join(self.running_dir, name))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def complete(self, name: str, result: Any):
+        """ Store the result of the claimed build action. """
+        try:
+            self.__dump(result, os.path.join(self.results_dir, name))
+            os.remove(os.path.join(self.running_dir, name))
+        except FileNotFoundError:
+            # The lease of this worker has expired and the action was queued
+            # again or the queue is already finished. The result of the
+            # action is collected only once by the coordinator.
+            pass
+
+    def expire_leases(self, lease_timeout: float, now: float) -> int:
+        """
+        Put the claimed build actions back to the pending ones if their lease
+        was not renewed for the given seconds. Return the number of expired
+        leases.
+        """
+        expired = 0
+        leases = {}
+        for name in os.listdir(self.running_dir):
+            running_file = os.path.join(self.running_dir, name)
+            try:
+                mtime = os.path.getmtime(running_file)
+            except FileNotFoundError:
+                # Completed in the meantime.
+                continue
+
+            lease = self.__leases.get(name)
+            if lease is None or lease[0] != mtime:
+                leases[name] = (mtime, now)
+                continue
+
+            if now - lease[1] < lease_timeout:
+                leases[name] = lease
+                continue
+
+            try:
+                os.rename(running_file, os.path.join(self.pending_dir, name))
+            except FileNotFoundError:
+                continue
+
+            LOG.warning("Lease of build action %s has expired, it is "
+                        "queued for analysis again.", name)
+            expired += 1
+
+        self.__leases = leases
+        return expired
+
+    def collect_results(self, results: dict):
+        """
+        Add the new results to the given dictionary which maps the index of
+        the build actions to their result.
+        """
+        for name in os.listdir(self.results_dir):
+            if name.endswith('.tmp'):
+                continue
+
+            index = int(name)
+            if index not in results:
+                results[index] = self.__load(
+                    os.path.join(self.results_dir, name))
+
+    def finish(self):
+        """
+        Mark the queue as done, so the workers stop, and remove the data which
+        is not needed anymore.
+        """
+        with open(self.done_file, 'w', encoding='utf-8', errors='ignore'):
+            pass
+
+        os.remove(self.context_file)
+        for path in (self.pending_dir, self.running_dir, self.results_dir):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def create_queue(output_path: str) -> ActionQueue:
+    """
+    Create a new queue in the given report directory. The previous queues
+    are removed, so their workers stop.
+    """
+    root = os.path.join(output_path, QUEUE_DIR)
+    shutil.rmtree(root, ignore_errors=True)
+
+    queue_dir = os.path.join(root, uuid.uuid4().hex)
+    os.makedirs(queue_dir)
+
+    current_file = os.path.join(root, 'current')
+    with open(current_file, 'w', encoding='utf-8', errors='ignore') as f:
+        f.write(os.path.basename(queue_dir))
+
+    return ActionQueue(queue_dir)
+
+
+def get_current_queue(output_path: str) -> Optional[ActionQueue]:
+    """
+    Return the last created queue in the given report directory or None if
+    there is no queue.
+    """
+    root = os.path.join(output_path, QUEUE_DIR)
+    try:
+        with open(os.path.join(root, 'current'),
+                  encoding='utf-8', errors='ignore') as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None
+
+    return ActionQueue(os.path.join(root, name)) if name else None
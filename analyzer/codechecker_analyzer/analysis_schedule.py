@@ -0,0 +1,190 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Scheduling of the analysis actions.
+
+The analysis of a few huge translation units may take much longer than the
+analysis of the others. If these are started last, most of the workers are
+idle while they are analyzed. The LPT (longest processing time first) schedule
+starts the analyses in the decreasing order of their expected duration. It is
+used only on request, by default the analyses are started in the order of the
+compilation database.
+
+The expected duration of an analysis comes from the analysis history which is
+stored in the report directory: the wall time and the peak memory usage of
+every analysis is recorded there. Translation units without history are
+estimated from the size of their source file.
+"""
+
+
+import heapq
+import json
+import os
+
+from typing import Dict, List, Optional
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+SCHEDULE_COMPILE_DB = 'compile-db'
+SCHEDULE_LPT = 'lpt'
+SCHEDULES = [SCHEDULE_COMPILE_DB, SCHEDULE_LPT]
+
+HISTORY_FILE = 'analysis_history.json'
+HISTORY_VERSION = 1
+
+
+def load_history(output_path: str) -> Dict[str, Dict[str, dict]]:
+    """
+    Load the analysis history from the given report directory.
+
+    The history contains the statistics of the last analysis of every
+    source file by analyzer name and source file path:
+        {analyzer: {source: {'duration': sec, 'peak_rss': bytes,
+                             'size': bytes}}}
+    """
+    history_file = os.path.join(output_path, HISTORY_FILE)
+    if not os.path.exists(history_file):
+        return {}
+
+    try:
+        with open(history_file, encoding='utf-8', errors='ignore') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as err:
+        LOG.warning("Failed to load analysis history from '%s': %s",
+                    history_file, err)
+        return {}
+
+    if not isinstance(data, dict) or \
+            data.get('version') != HISTORY_VERSION:
+        LOG.debug("Analysis history in '%s' has an unknown format.",
+                  history_file)
+        return {}
+
+    return data.get('analyzers', {})
+
+
+def save_history(output_path: str, history: Dict[str, Dict[str, dict]]):
+    """ Save the analysis history to the given report directory. """
+    history_file = os.path.join(output_path, HISTORY_FILE)
+    tmp_file = history_file + '.tmp'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8', errors='ignore') as f:
+            json.dump({'version': HISTORY_VERSION,
+                       'analyzers': history}, f)
+        os.replace(tmp_file, history_file)
+    except OSError as err:
+        LOG.warning("Failed to save analysis history to '%s': %s",
+                    history_file, err)
+
+
+def get_source_size(source: str) -> int:
+    """ Size of the given source file or 0 if it can't be determined. """
+    try:
+        return os.path.getsize(source)
+    except OSError:
+        return 0
+
+
+def __seconds_per_byte(entries) -> Optional[float]:
+    """
+    Average analysis time of one byte of source code in the given history
+    entries.
+    """
+    duration = sum(e['duration'] for e in entries if e.get('size'))
+    size = sum(e['size'] for e in entries if e.get('size'))
+    return duration / size if size else None
+
+
+def estimate_durations(actions, history) -> List[Optional[float]]:
+    """
+    Return the expected analysis duration of the given actions in seconds.
+
+    The last measured duration is used for the translation units which are
+    in the history. The others are estimated by the size of their source
+    file and the average analysis speed of the analyzer in the history.
+    None is returned for the actions which can't be estimated, because
+    there is no usable history at all.
+    """
+    all_entries = [e for entries in history.values()
+                   for e in entries.values()]
+    default_speed = __seconds_per_byte(all_entries)
+
+    speeds = {}
+    estimates = []
+    for action in actions:
+        entries = history.get(action.analyzer_type, {})
+        entry = entries.get(action.source)
+        if entry is not None:
+            estimates.append(entry['duration'])
+            continue
+
+        if action.analyzer_type not in speeds:
+            speeds[action.analyzer_type] = \
+                __seconds_per_byte(entries.values()) or default_speed
+
+        speed = speeds[action.analyzer_type]
+        estimates.append(get_source_size(action.source) * speed
+                         if speed is not None else None)
+
+    return estimates
+
+
+def order_lpt(actions, estimates: List[Optional[float]]):
+    """
+    Order the actions by their expected duration, the longest first. The
+    actions without estimation are ordered by the size of their source file
+    after the estimated ones.
+    """
+    def key(item):
+        action, estimate = item
+        if estimate is not None:
+            return (1, estimate)
+        return (0, get_source_size(action.source))
+
+    return [action for action, _ in sorted(zip(actions, estimates),
+                                           key=key, reverse=True)]
+
+
+def predict_makespan(estimates: List[Optional[float]],
+                     jobs: int) -> Optional[float]:
+    """
+    Predict the wall time of the analysis if the actions with the given
+    expected durations are started in the given order whenever one of the
+    workers becomes free. None is returned if some durations are unknown.
+    """
+    if any(e is None for e in estimates):
+        return None
+
+    workers = [0.0] * max(1, min(jobs, len(estimates)))
+    for estimate in estimates:
+        heapq.heapreplace(workers, workers[0] + estimate)
+
+    return max(workers)
+
+
+def schedule_actions(actions, schedule: str, history, jobs: int):
+    """
+    Order the actions by the given schedule.
+
+    Returns the ordered actions and the predicted makespan of the schedule
+    and of the compilation database order in seconds (None if these can't be
+    predicted).
+    """
+    estimates = estimate_durations(actions, history)
+    compile_db_makespan = predict_makespan(estimates, jobs)
+
+    if schedule != SCHEDULE_LPT:
+        return actions, compile_db_makespan, compile_db_makespan
+
+    estimate_map = {id(a): e for a, e in zip(actions, estimates)}
+    ordered = order_lpt(actions, estimates)
+    makespan = predict_makespan([estimate_map[id(a)] for a in ordered], jobs)
+
+    return ordered, makespan, compile_db_makespan
@@ -13,18 +13,16 @@ Prepare and start different analysis types
 from collections import defaultdict
 import os
 import shutil
-import signal
 import sys
 import time
 
-from multiprocess.managers import SyncManager
-
 from codechecker_common.logger import get_logger
 from codechecker_common.review_status_handler import ReviewStatusHandler
 
-from . import analyzer_context, analysis_manager, pre_analysis_manager, \
-    checkers
-from .analyzers import analyzer_types
+from . import analyzer_context, analysis_manager, analysis_schedule, \
+    dependency_index, pre_analysis_manager, checkers
+from .result_cache import ResultCache
+from .analyzers import analyzer_cache, analyzer_types
 from .analyzers.config_handler import AnalyzerConfigHandler, CheckerState
 from .analyzers.clangsa.analyzer import ClangSA
 
@@ -46,15 +44,15 @@ def prepare_actions(actions, enabled_analyzers):
     return res
 
 
-def create_actions_map(actions, manager):
+def create_actions_map(actions):
     """
-    Create a dict for the build actions which is shareable
-    safely between processes.
+    Create a dict for the build actions. The analysis workers get a copy of
+    it when they are started.
     Key: (source_file, target)
     Value: BuildAction
     """
 
-    result = manager.dict()
+    result = {}
 
     for act in actions:
         key = act.source, act.target
@@ -66,16 +64,6 @@ def create_actions_map(actions, manager):
     return result
 
 
-def __mgr_init():
-    """
-    This function is set for the SyncManager object which handles shared data
-    structures among the processes of the pool. Ignoring the SIGINT signal is
-    necessary in the manager object so it doesn't terminate before the
-    termination of the process pool.
-    """
-    signal.signal(signal.SIGINT, signal.SIG_IGN)
-
-
 def __get_statistics_data(args):
     """ Get statistics data. """
     statistics_data = None
@@ -143,9 +131,16 @@ def perform_analysis(args, skip_handlers, filter_handlers,
     ctu_reanalyze_on_failure = 'ctu_reanalyze_on_failure' in args and \
         args.ctu_reanalyze_on_failure
 
+    # Startup time of the analysis, which is mostly spent on querying the
+    # analyzer binaries.
+    phase_start = time.time()
+
     analyzers, errored = \
         analyzer_types.check_available_analyzers(args.analyzers)
 
+    LOG.debug("Detecting the analyzers took %.3f sec.",
+              time.time() - phase_start)
+
     ctu_collect = False
     ctu_analyze = False
     ctu_dir = ''
@@ -164,6 +159,7 @@ def perform_analysis(args, skip_handlers, filter_handlers,
                       "the Clang Static Analyzer.")
             return
 
+    phase_start = time.time()
     config_map = analyzer_types.build_config_handlers(args, analyzers)
 
     # Don't enable analyzers that have no checkers enabled. Some analyzers,
@@ -197,6 +193,9 @@ def perform_analysis(args, skip_handlers, filter_handlers,
 
     actions = prepare_actions(actions, analyzers)
 
+    LOG.debug("Building the analyzer configurations took %.3f sec.",
+              time.time() - phase_start)
+
     available_checkers = set()
     # Add profile names to the checkers list so we will not warn
     # if a profile is enabled but there is no checker with that name.
@@ -227,7 +226,9 @@ def perform_analysis(args, skip_handlers, filter_handlers,
                          "'--no-missing-checker-error'")
                 sys.exit(1)
 
+    phase_start = time.time()
     enabled_checkers = defaultdict(list)
+    analyzer_versions = {}
 
     # Save some metadata information.
     for analyzer in analyzers:
@@ -250,8 +251,17 @@ def perform_analysis(args, skip_handlers, filter_handlers,
         version = analyzer_types.supported_analyzers[analyzer] \
             .get_binary_version()
         metadata_info['analyzer_statistics']['version'] = version
+        analyzer_versions[analyzer] = version
+
+        if 'result_cache_dir' in args:
+            metadata_info['result_cache'] = {"hits": 0, "misses": 0}
 
         metadata_tool['analyzers'][analyzer] = metadata_info
+
+    LOG.debug("Querying the analyzer versions took %.3f sec.",
+              time.time() - phase_start)
+    analyzer_cache.log_query_times()
+
     LOG.info("Enabled checker list can be found in %s",
              os.path.join(args.output_path, "metadata.json"))
     LOG.debug("Enabled checkers:\n%s", '\n'.join(
@@ -279,23 +289,18 @@ def perform_analysis(args, skip_handlers, filter_handlers,
 
     start_time = time.time()
 
-    # Use Manager to create data objects which can be
-    # safely shared between processes.
-    manager = SyncManager()
-    manager.start(__mgr_init)
-
-    config_map = manager.dict(config_map)
-    actions_map = create_actions_map(actions, manager)
+    # These data structures are read-only during the analysis. The worker
+    # processes get their copy of them once when they are started, so there
+    # is no need for synchronizing them between processes.
+    actions_map = create_actions_map(actions)
 
     # Setting to not None value will enable statistical analysis features.
     statistics_data = __get_statistics_data(args)
-    if statistics_data:
-        statistics_data = manager.dict(statistics_data)
 
     if ctu_collect or statistics_data:
         ctu_data = None
         if ctu_collect or ctu_analyze:
-            ctu_data = manager.dict(__get_ctu_data(ctu_dir))
+            ctu_data = __get_ctu_data(ctu_dir)
 
         pre_analyze = [a for a in actions
                        if a.analyzer_type == ClangSA.ANALYZER_NAME]
@@ -315,8 +320,7 @@ def perform_analysis(args, skip_handlers, filter_handlers,
                                                   args.jobs,
                                                   pre_anal_skip_handlers,
                                                   ctu_data,
-                                                  statistics_data,
-                                                  manager)
+                                                  statistics_data)
         else:
             LOG.error("Can not run pre analysis without clang "
                       "static analyzer configuration.")
@@ -325,9 +329,19 @@ def perform_analysis(args, skip_handlers, filter_handlers,
         return
 
     if 'stats_dir' in args and args.stats_dir:
-        statistics_data = manager.dict({'stats_out_dir': args.stats_dir})
+        statistics_data = {'stats_out_dir': args.stats_dir}
 
     if ctu_analyze or statistics_data or (not ctu_analyze and not ctu_collect):
+        result_cache = None
+        if 'result_cache_dir' in args:
+            result_cache = ResultCache(args.result_cache_dir,
+                                       args.result_cache_size * 1024 * 1024,
+                                       analyzer_versions)
+            LOG.info("Using analysis result cache in '%s'.",
+                     result_cache.cache_dir)
+
+        schedule = args.schedule if 'schedule' in args \
+            else analysis_schedule.SCHEDULE_COMPILE_DB
 
         LOG.info("Starting static analysis ...")
         analysis_manager.start_workers(actions_map, actions,
@@ -344,8 +358,18 @@ def perform_analysis(args, skip_handlers, filter_handlers,
                                        else None,
                                        ctu_reanalyze_on_failure,
                                        statistics_data,
-                                       manager,
-                                       compile_cmd_count)
+                                       compile_cmd_count,
+                                       result_cache,
+                                       schedule,
+                                       'serve_queue' in args,
+                                       args.max_memory * 1024 * 1024
+                                       if 'max_memory' in args else None,
+                                       args.tidy_batch_size
+                                       if 'tidy_batch_size' in args else 1,
+                                       'dependency_index' in args or
+                                       'changed_files' in args or
+                                       dependency_index.has_index(
+                                           args.output_path))
         LOG.info("Analysis finished.")
         LOG.info("To view results in the terminal use the "
                  "\"CodeChecker parse\" command.")
@@ -365,5 +389,3 @@ def perform_analysis(args, skip_handlers, filter_handlers,
 
     if ctu_collect and ctu_analyze:
         shutil.rmtree(ctu_dir, ignore_errors=True)
-
-    manager.shutdown()
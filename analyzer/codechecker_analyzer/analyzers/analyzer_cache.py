@@ -0,0 +1,239 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Persistent cache of the analyzer capability queries.
+
+The checker lists, the configuration options and the versions of the
+analyzers are queried by running the analyzer binaries (and diagtool) before
+every analysis and by the 'checkers' and 'analyzers' commands. This cache
+stores the output of these commands between CodeChecker invocations.
+
+An entry is valid as long as the files of the command are not changed, i.e.
+the resolved path, size and modification time of the binary and of the files
+given as arguments (e.g. ClangSA checker plugins) are the same as at the time
+of the query. The environment variables which change the output of the
+commands (e.g. the include paths) are part of the key.
+
+The queries are run by worker processes too, so the new entries are written
+to the cache file only once, when the main process exits.
+"""
+
+
+import atexit
+import json
+import os
+import shlex
+import subprocess
+import time
+import uuid
+
+from typing import List, Mapping, Optional
+
+from codechecker_common.logger import get_logger
+from codechecker_common.util import get_cache_dir, load_json
+
+from codechecker_analyzer.buildlog.compiler_info_cache import \
+    INCLUDE_PATH_ENV_VARS, get_compiler_fingerprint, \
+    get_environment_fingerprint
+
+LOG = get_logger('analyzer')
+
+CACHE_FILE = 'analyzer_info.json'
+CACHE_VERSION = 2
+
+# Environment variables which change the output of the analyzer commands.
+ENV_VARS = ['PATH', 'LD_LIBRARY_PATH', *INCLUDE_PATH_ENV_VARS]
+
+# The cache can be turned off by the --no-analyzer-cache flag.
+ENABLED = True
+
+# Persistent cache of the current process, see get_cache().
+CACHE = None
+
+# (command, duration, cached) tuples of the queries of the current process.
+QUERY_TIMES = []
+
+
+def get_command_fingerprint(command: List[str]) -> Optional[List]:
+    """
+    Return the fingerprint of the binary of the given command and of the
+    files given as absolute path arguments. None is returned if the binary
+    can't be found.
+    """
+    fingerprint = get_compiler_fingerprint(command[0])
+    if fingerprint is None:
+        return None
+
+    fingerprint = [fingerprint]
+    for arg in command[1:]:
+        if os.path.isabs(arg) and os.path.isfile(arg):
+            stat = os.stat(arg)
+            fingerprint.append([arg, stat.st_size, stat.st_mtime_ns])
+
+    return fingerprint
+
+
+class AnalyzerInfoCache:
+    """
+    Output of analyzer commands stored in a JSON file. Keys are the commands.
+    """
+
+    def __init__(self, cache_file: str):
+        self.cache_file = cache_file
+        self.__entries = self.__load()
+        self.__new_entries = {}
+
+    def __load(self):
+        if not os.path.exists(self.cache_file):
+            return {}
+
+        content = load_json(self.cache_file, {})
+        if not isinstance(content, dict) or \
+                content.get('version') != CACHE_VERSION:
+            return {}
+
+        return content.get('entries', {})
+
+    @staticmethod
+    def __key(command: List[str],
+              environ: Optional[Mapping[str, str]]) -> str:
+        return json.dumps([command,
+                           get_environment_fingerprint(ENV_VARS, environ)])
+
+    def get(self, command: List[str],
+            environ: Optional[Mapping[str, str]] = None) -> Optional[str]:
+        """
+        Return the cached output of the given command run in the given
+        environment or None if it is not cached or one of its files has
+        changed since then.
+        """
+        entry = self.__entries.get(self.__key(command, environ))
+        if not entry:
+            return None
+
+        fingerprint = get_command_fingerprint(command)
+        if fingerprint is None or entry.get('fingerprint') != fingerprint:
+            return None
+
+        return entry.get('output')
+
+    def put(self, command: List[str], output: str,
+            environ: Optional[Mapping[str, str]] = None):
+        """ Cache the output of the given command and environment. """
+        fingerprint = get_command_fingerprint(command)
+        if fingerprint is None:
+            return
+
+        entry = {'fingerprint': fingerprint, 'output': output}
+        key = self.__key(command, environ)
+        self.__entries[key] = entry
+        self.__new_entries[key] = entry
+
+    def save(self):
+        """
+        Write the new entries to the cache file. Entries which were added to
+        the file by other CodeChecker processes in the meantime are kept.
+        """
+        if not self.__new_entries:
+            return
+
+        entries = self.__load()
+        entries.update(self.__new_entries)
+
+        tmp_file = f"{self.cache_file}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8', errors='ignore') as f:
+                json.dump({'version': CACHE_VERSION, 'entries': entries}, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as err:
+            LOG.warning("Failed to write analyzer info cache '%s': %s",
+                        self.cache_file, err)
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return
+
+        self.__new_entries = {}
+
+
+def disable():
+    """ Run every analyzer query instead of using the persistent cache. """
+    global ENABLED
+    ENABLED = False
+
+
+def get_cache() -> Optional[AnalyzerInfoCache]:
+    """
+    Return the persistent cache of the analyzer queries or None if it is
+    disabled.
+    """
+    global CACHE
+    if not ENABLED:
+        return None
+
+    if CACHE is None:
+        CACHE = AnalyzerInfoCache(
+            os.path.join(get_cache_dir(), CACHE_FILE))
+
+    return CACHE
+
+
+def save():
+    """ Write the new entries of the cache of the current process. """
+    if CACHE is not None:
+        CACHE.save()
+
+
+def save_at_exit():
+    """
+    Write the new entries of the cache when the current process exits. Only
+    the main process calls this, so the worker processes which query the
+    analyzers never write the cache file.
+    """
+    atexit.register(save)
+
+
+def check_output(command: List[str], environ, stderr=None) -> str:
+    """
+    Return the standard output of the given analyzer command, like
+    subprocess.check_output() in text mode. The output is taken from the
+    persistent cache if the command has been run before with the same files.
+    Only the output of successful commands is cached.
+    """
+    start = time.time()
+
+    cache = get_cache()
+    output = cache.get(command, environ) if cache else None
+    cached = output is not None
+    if not cached:
+        output = subprocess.check_output(
+            command,
+            env=environ,
+            stderr=stderr,
+            encoding="utf-8",
+            errors="ignore")
+
+        if cache:
+            cache.put(command, output, environ)
+
+    duration = time.time() - start
+    QUERY_TIMES.append((command, duration, cached))
+    LOG.debug("%s '%s' in %.3f sec.", "Cached" if cached else "Ran",
+              shlex.join(command), duration)
+
+    return output
+
+
+def log_query_times():
+    """ Log the time spent on the analyzer queries so far. """
+    if not QUERY_TIMES:
+        return
+
+    LOG.debug("%d analyzer queries (%d cached) took %.3f sec.",
+              len(QUERY_TIMES), sum(1 for q in QUERY_TIMES if q[2]),
+              sum(q[1] for q in QUERY_TIMES))
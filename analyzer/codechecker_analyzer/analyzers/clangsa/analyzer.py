@@ -25,7 +25,7 @@ from codechecker_statistics_collector.collectors.special_return_value import \
 from codechecker_statistics_collector.collectors.return_value import \
     ReturnValueCollector
 
-from .. import analyzer_base
+from .. import analyzer_base, analyzer_cache
 from ..config_handler import CheckerState
 from ..flag import has_flag
 from ..flag import prepend_all
@@ -48,14 +48,10 @@ def parse_clang_help_page(
     Returns a list of (flag, description) tuples.
     """
     try:
-        help_page = subprocess.check_output(
+        help_page = analyzer_cache.check_output(
             command,
-            stderr=subprocess.STDOUT,
-            env=analyzer_context.get_context()
-            .get_env_for_bin(command[0]),
-            universal_newlines=True,
-            encoding="utf-8",
-            errors="ignore")
+            analyzer_context.get_context().get_env_for_bin(command[0]),
+            stderr=subprocess.STDOUT)
     except (subprocess.CalledProcessError, OSError):
         LOG.debug("Failed to run '%s' command!", command)
         return []
@@ -185,11 +181,7 @@ class ClangSA(analyzer_base.SourceAnalyzer):
         else:
             ver = [cls.analyzer_binary(), '-dumpversion']
         try:
-            output = subprocess.check_output(ver,
-                                             env=environ,
-                                             universal_newlines=True,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = analyzer_cache.check_output(ver, environ)
             return output.strip()
         except (subprocess.CalledProcessError, OSError) as oerr:
             LOG.warning("Failed to get analyzer version: %s",
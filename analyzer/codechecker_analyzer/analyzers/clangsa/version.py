@@ -10,9 +10,9 @@
 import os
 import re
 import shutil
-import subprocess
 
 from codechecker_analyzer import analyzer_context
+from codechecker_analyzer.analyzers import analyzer_cache
 
 
 class ClangVersionInfo:
@@ -75,11 +75,9 @@ def get(clang_binary):
     Should return False for getting the version
     information not from a clang compiler.
     """
-    compiler_version = subprocess.check_output(
+    compiler_version = analyzer_cache.check_output(
         [clang_binary, '--version'],
-        env=analyzer_context.get_context().get_env_for_bin(clang_binary),
-        encoding="utf-8",
-        errors="ignore")
+        analyzer_context.get_context().get_env_for_bin(clang_binary))
     version_parser = ClangVersionInfoParser(clang_binary)
     version_info = version_parser.parse(compiler_version)
     return version_info
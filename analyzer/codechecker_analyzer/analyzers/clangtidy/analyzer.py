@@ -25,7 +25,7 @@ from codechecker_common.logger import get_logger
 from codechecker_analyzer import analyzer_context, env
 from codechecker_analyzer.analyzers.clangsa.analyzer import ClangSA
 
-from .. import analyzer_base
+from .. import analyzer_base, analyzer_cache
 from ..config_handler import CheckerState, CheckerType, \
     get_compiler_warning_name_and_type
 from ..flag import has_flag
@@ -154,12 +154,8 @@ def get_warnings():
         return []
 
     try:
-        result = subprocess.check_output(
-            [diagtool_bin, 'tree'],
-            env=environment,
-            universal_newlines=True,
-            encoding="utf-8",
-            errors="ignore")
+        result = analyzer_cache.check_output(
+            [diagtool_bin, 'tree'], environment)
         return [w[2:] for w in result.split()
                 if w.startswith("-W") and w != "-W"]
     except subprocess.CalledProcessError as exc:
@@ -247,11 +243,7 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
 
         version = [cls.analyzer_binary(), '--version']
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             universal_newlines=True,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = analyzer_cache.check_output(version, environ)
             if details:
                 return output.strip()
             return parse_version(output)
@@ -276,12 +268,9 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
 
             environ = analyzer_context\
                 .get_context().get_env_for_bin(cls.analyzer_binary())
-            result = subprocess.check_output(
+            result = analyzer_cache.check_output(
                 [cls.analyzer_binary(), "-list-checks", "-checks=*"],
-                env=environ,
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="ignore")
+                environ)
             checker_description = parse_checkers(result)
 
             checker_description.extend(
@@ -300,13 +289,10 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
         Return the checker configuration of the all of the supported checkers.
         """
         try:
-            result = subprocess.check_output(
+            result = analyzer_cache.check_output(
                 [cls.analyzer_binary(), "-dump-config", "-checks=*"],
-                env=analyzer_context.get_context()
-                .get_env_for_bin(cls.analyzer_binary()),
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="ignore")
+                analyzer_context.get_context()
+                .get_env_for_bin(cls.analyzer_binary()))
             return parse_checker_config(result)
         except (subprocess.CalledProcessError, OSError):
             return []
@@ -320,13 +306,10 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
             return []
 
         try:
-            result = subprocess.check_output(
+            result = analyzer_cache.check_output(
                 [cls.analyzer_binary(), "-dump-config", "-checks=*"],
-                env=analyzer_context.get_context()
-                .get_env_for_bin(cls.analyzer_binary()),
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="ignore")
+                analyzer_context.get_context()
+                .get_env_for_bin(cls.analyzer_binary()))
             return parse_analyzer_config(result)
         except (subprocess.CalledProcessError, OSError):
             return []
@@ -455,6 +438,19 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
 
     def construct_analyzer_cmd(self, result_handler):
         """ Contruct command which will be executed on analysis. """
+        return self.__construct_analyzer_cmd(result_handler,
+                                             [self.source_file])
+
+    def construct_batch_analyzer_cmd(self, result_handler, source_files):
+        """
+        Construct a command which analyzes the given source files in one
+        clang-tidy process. The source files are compiled with the flags of
+        the build action of this analyzer, so their build actions must differ
+        only in their source files (see batch.get_batch_key()).
+        """
+        return self.__construct_analyzer_cmd(result_handler, source_files)
+
+    def __construct_analyzer_cmd(self, result_handler, source_files):
         try:
             config = self.config_handler
 
@@ -473,7 +469,7 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
             if config.checker_config and config.checker_config != '{}':
                 analyzer_cmd.append("-config=" + config.checker_config)
 
-            analyzer_cmd.append(self.source_file)
+            analyzer_cmd.extend(source_files)
 
             analyzer_cmd.extend(['--export-fixes', result_handler.fixit_file])
 
@@ -0,0 +1,183 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Batched clang-tidy analysis of small translation units.
+
+Starting a clang-tidy process per translation unit dominates the analysis of
+projects with many tiny source files. Build actions which differ only in
+their source files are analyzed by one clang-tidy process in batches: the
+source files are given to clang-tidy together with the common compilation
+flags after '--'.
+
+Clang-tidy reports the diagnostics of all the source files of a batch on its
+standard output at the end, so the output is split by the location of the
+diagnostics to get the output of every source file. A diagnostic in a header
+is reported once by clang-tidy for the whole batch, so it is assigned to the
+first source file of the batch. The exported fixits of the batch are split
+the same way.
+"""
+
+
+import math
+import os
+import re
+
+from typing import Dict, Iterable, List, Set
+
+import yaml
+
+from codechecker_report_converter.analyzers.clang_tidy.parser import Parser
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+# Clang-tidy prints this line to the standard error for every source file
+# which couldn't be compiled.
+FAILED_SOURCE_RE = re.compile(r'^Error while processing (?P<path>.+)\.$')
+
+
+def get_batch_key(action):
+    """
+    Return the key of the given build action. Build actions with the same key
+    can be analyzed in the same clang-tidy process.
+    """
+    return (action.directory, action.lang, action.target, action.arch,
+            action.compiler_standard, tuple(action.analyzer_options),
+            tuple(action.compiler_includes))
+
+
+def create_batches(actions, analyzer_type: str, batch_size: int,
+                   jobs: int) -> List:
+    """
+    Group the build actions of the given analyzer into batches of at most
+    batch_size build actions with the same batch key. Returns the work items
+    of the analysis: the build actions which are not batched and the batches
+    (lists of build actions).
+
+    The batches are smaller if there are few build actions, so every job gets
+    at least one batch. The order of the build actions is kept: a batch takes
+    the place of its first build action.
+    """
+    batched = [a for a in actions if a.analyzer_type == analyzer_type]
+    batch_size = min(batch_size, math.ceil(len(batched) / jobs))
+    if batch_size <= 1:
+        return list(actions)
+
+    items = []
+    open_batches = {}
+    for action in actions:
+        if action.analyzer_type != analyzer_type:
+            items.append(action)
+            continue
+
+        # The same source file may be compiled with different output files,
+        # but the output of a batch is split by source files.
+        key = get_batch_key(action)
+        batch = open_batches.get(key)
+        if batch is None or len(batch) == batch_size or \
+                any(a.source == action.source for a in batch):
+            batch = []
+            open_batches[key] = batch
+            items.append(batch)
+
+        batch.append(action)
+
+    # A batch of one build action is analyzed as a single build action.
+    items = [item[0] if isinstance(item, list) and len(item) == 1 else item
+             for item in items]
+
+    LOG.debug("%d %s build actions are analyzed in %d batches.",
+              len(batched), analyzer_type,
+              sum(1 for item in items if isinstance(item, list)))
+
+    return items
+
+
+def __normalize(path: str, directory: str) -> str:
+    return os.path.normpath(os.path.join(directory, path))
+
+
+def split_output(stdout: str, sources: List[str],
+                 directory: str) -> Dict[str, str]:
+    """
+    Split the standard output of a clang-tidy process which analyzed the
+    given source files. A diagnostic and its notes belong to the source file
+    in which the diagnostic is located, or to the first source file if it is
+    located in another file (i.e. in a header).
+    """
+    parser = Parser()
+    sources_by_path = {__normalize(s, directory): s for s in sources}
+    lines = {source: [] for source in sources}
+
+    # Lines before the first diagnostic don't belong to any source file.
+    current = None
+    for line in stdout.splitlines():
+        match = parser.message_line_re.match(line)
+        if match:
+            current = sources_by_path.get(
+                __normalize(match.group('path'), directory), sources[0])
+
+        if current is not None:
+            lines[current].append(line)
+
+    return {source: '\n'.join(source_lines) + '\n' if source_lines else ''
+            for source, source_lines in lines.items()}
+
+
+def get_failed_sources(stderr: str, sources: Iterable[str],
+                       directory: str) -> Set[str]:
+    """
+    Return the given source files which clang-tidy couldn't compile according
+    to its standard error.
+    """
+    sources_by_path = {__normalize(s, directory): s for s in sources}
+
+    failed = set()
+    for line in stderr.splitlines():
+        match = FAILED_SOURCE_RE.match(line.strip())
+        if match:
+            path = __normalize(match.group('path'), directory)
+            if path in sources_by_path:
+                failed.add(sources_by_path[path])
+
+    return failed
+
+
+def split_fixits(fixit_file: str, fixit_files: Dict[str, str],
+                 directory: str):
+    """
+    Split the fixits which clang-tidy exported to the given file for a batch
+    into the fixit files of its source files. A diagnostic belongs to the
+    source file in which it is located, or to the first source file if it is
+    located in another file (i.e. in a header).
+    """
+    try:
+        with open(fixit_file, encoding='utf-8', errors='ignore') as f:
+            content = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError) as err:
+        LOG.debug("Failed to read fixits of a batch: %s", err)
+        return
+
+    sources = list(fixit_files)
+    sources_by_path = {__normalize(s, directory): s for s in sources}
+    diagnostics = {source: [] for source in sources}
+
+    for diagnostic in (content or {}).get('Diagnostics') or []:
+        path = diagnostic.get('DiagnosticMessage', {}).get('FilePath')
+        source = sources_by_path.get(__normalize(path, directory),
+                                     sources[0]) if path else sources[0]
+        diagnostics[source].append(diagnostic)
+
+    for source, source_diagnostics in diagnostics.items():
+        with open(fixit_files[source], 'w', encoding='utf-8',
+                  errors='ignore') as f:
+            yaml.safe_dump({'MainSourceFile': __normalize(source, directory),
+                            'Diagnostics': source_diagnostics},
+                           f, explicit_start=True, explicit_end=True,
+                           sort_keys=False)
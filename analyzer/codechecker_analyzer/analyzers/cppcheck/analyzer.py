@@ -24,7 +24,7 @@ from codechecker_common.logger import get_logger
 from codechecker_analyzer import analyzer_context, env
 from codechecker_analyzer.env import get_binary_in_path
 
-from .. import analyzer_base
+from .. import analyzer_base, analyzer_cache
 
 from .config_handler import CppcheckConfigHandler
 from .result_handler import CppcheckResultHandler
@@ -91,11 +91,7 @@ class Cppcheck(analyzer_base.SourceAnalyzer):
             cls.analyzer_binary())
         version = [cls.analyzer_binary(), '--version']
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             universal_newlines=True,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = analyzer_cache.check_output(version, environ)
             if details:
                 return output.strip()
             return parse_version(output)
@@ -250,7 +246,7 @@ class Cppcheck(analyzer_base.SourceAnalyzer):
         environ = analyzer_context.get_context().get_env_for_bin(
             command[0])
         try:
-            result = subprocess.check_output(command, env=environ)
+            result = analyzer_cache.check_output(command, environ)
             return parse_checkers(result)
         except (subprocess.CalledProcessError) as e:
             LOG.error(e.stderr)
@@ -14,7 +14,7 @@ from codechecker_common.logger import get_logger
 
 from codechecker_analyzer import analyzer_context
 
-from .. import analyzer_base
+from .. import analyzer_base, analyzer_cache
 from ..flag import has_flag
 from ..config_handler import CheckerState
 
@@ -100,10 +100,10 @@ class Gcc(analyzer_base.SourceAnalyzer):
         checker_list = []
 
         try:
-            output = subprocess.check_output(command, env=environ)
+            output = analyzer_cache.check_output(command, environ)
 
             # Still contains the help message we need to remove.
-            for entry in output.decode().split('\n'):
+            for entry in output.split('\n'):
                 warning_name, _, description = entry.strip().partition(' ')
                 # GCC Static Analyzer names start with -Wanalyzer.
                 if warning_name.startswith('-Wanalyzer'):
@@ -169,10 +169,7 @@ class Gcc(analyzer_base.SourceAnalyzer):
         else:
             version = [cls.analyzer_binary(), '-dumpfullversion']
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = analyzer_cache.check_output(version, environ)
             return output.strip()
         except (subprocess.CalledProcessError, OSError) as oerr:
             LOG.warning("Failed to get analyzer version: %s",
@@ -19,7 +19,7 @@ from codechecker_common.logger import get_logger
 
 from codechecker_analyzer import analyzer_context
 
-from .. import analyzer_base
+from .. import analyzer_base, analyzer_cache
 from ..config_handler import CheckerState
 
 from .config_handler import InferConfigHandler
@@ -109,10 +109,9 @@ class Infer(analyzer_base.SourceAnalyzer):
             env = analyzer_context.get_context().get_env_for_bin(
                 cls.analyzer_binary())
             env.update(TZ='UTC')
-            output = subprocess.check_output(command,
-                                             stderr=subprocess.DEVNULL,
-                                             env=env)
-            for entry in output.decode().split('\n'):
+            output = analyzer_cache.check_output(command, env,
+                                                 stderr=subprocess.DEVNULL)
+            for entry in output.split('\n'):
                 data = entry.strip().split(":")
                 if len(data) < 7:
                     continue
@@ -187,10 +186,7 @@ class Infer(analyzer_base.SourceAnalyzer):
             cls.analyzer_binary())
         environ.update(TZ='UTC')
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = analyzer_cache.check_output(version, environ)
             output = output.split('\n', maxsplit=1)[0]
             return output.strip().split(" ")[-1][1:]
         except (subprocess.CalledProcessError, OSError) as oerr:
@@ -0,0 +1,162 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Persistent cache of the implicit compiler information.
+
+Querying the implicit include paths, the default standard and the target of a
+compiler requires running the compiler a few times for every distinct
+compiler, language and compiler flag combination. This cache stores the
+results of these queries between CodeChecker invocations.
+
+An entry is valid as long as the compiler binary is not changed, i.e. its
+resolved path, size and modification time are the same as at the time of
+the query. The environment variables which add implicit include paths are
+part of the key, since they change the output of the queries.
+"""
+
+
+import json
+import os
+import uuid
+
+from shutil import which
+from typing import List, Mapping, Optional
+
+from codechecker_common.logger import get_logger
+from codechecker_common.util import load_json
+
+LOG = get_logger('buildlogger')
+
+CACHE_VERSION = 2
+
+# Environment variables which change the implicit include paths of the
+# compilers.
+INCLUDE_PATH_ENV_VARS = ['CPATH', 'C_INCLUDE_PATH', 'CPLUS_INCLUDE_PATH',
+                         'OBJC_INCLUDE_PATH']
+
+
+def get_compiler_fingerprint(compiler: str) -> Optional[List]:
+    """
+    Return the resolved path, the size and the modification time of the given
+    compiler binary. None is returned if the binary can't be found.
+    """
+    compiler_path = which(compiler)
+    if not compiler_path:
+        return None
+
+    real_path = os.path.realpath(compiler_path)
+    try:
+        stat = os.stat(real_path)
+    except OSError:
+        return None
+
+    return [compiler_path, real_path, stat.st_size, stat.st_mtime_ns]
+
+
+def get_environment_fingerprint(
+    env_vars: List[str],
+    environ: Optional[Mapping[str, str]] = None
+) -> List:
+    """
+    Return the values of the given environment variables in the given
+    environment (default: the environment of the current process). Unset
+    variables are represented by None.
+    """
+    if environ is None:
+        environ = os.environ
+    return [environ.get(env_var) for env_var in env_vars]
+
+
+class CompilerInfoCache:
+    """
+    Implicit compiler information stored in a JSON file. Keys are
+    ImplicitCompilerInfo.ImplicitInfoSpecifierKey objects.
+    """
+
+    def __init__(self, cache_file: str):
+        self.cache_file = cache_file
+        self.__entries = self.__load()
+        self.__new_entries = {}
+        self.__fingerprints = {}
+
+    def __load(self):
+        if not os.path.exists(self.cache_file):
+            return {}
+
+        content = load_json(self.cache_file, {})
+        if not isinstance(content, dict) or \
+                content.get('version') != CACHE_VERSION:
+            return {}
+
+        return content.get('entries', {})
+
+    def __fingerprint(self, compiler: str) -> Optional[List]:
+        if compiler not in self.__fingerprints:
+            self.__fingerprints[compiler] = \
+                get_compiler_fingerprint(compiler)
+        return self.__fingerprints[compiler]
+
+    @staticmethod
+    def __key(iisk) -> str:
+        return json.dumps([iisk.compiler, iisk.language,
+                           list(iisk.compiler_flags),
+                           get_environment_fingerprint(
+                               INCLUDE_PATH_ENV_VARS)])
+
+    def get(self, iisk) -> Optional[dict]:
+        """
+        Return the cached compiler information of the given key or None if it
+        is not cached or the compiler binary has changed since then.
+        """
+        entry = self.__entries.get(self.__key(iisk))
+        if not entry:
+            return None
+
+        fingerprint = self.__fingerprint(iisk.compiler)
+        if fingerprint is None or entry.get('fingerprint') != fingerprint:
+            return None
+
+        return entry.get('info')
+
+    def put(self, iisk, info: dict):
+        """ Cache the compiler information of the given key. """
+        fingerprint = self.__fingerprint(iisk.compiler)
+        if fingerprint is None:
+            return
+
+        entry = {'fingerprint': fingerprint, 'info': info}
+        key = self.__key(iisk)
+        self.__entries[key] = entry
+        self.__new_entries[key] = entry
+
+    def save(self):
+        """
+        Write the new entries to the cache file. Entries which were added to
+        the file by other CodeChecker processes in the meantime are kept.
+        """
+        if not self.__new_entries:
+            return
+
+        entries = self.__load()
+        entries.update(self.__new_entries)
+
+        tmp_file = f"{self.cache_file}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8', errors='ignore') as f:
+                json.dump({'version': CACHE_VERSION, 'entries': entries}, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as err:
+            LOG.warning("Failed to write compiler info cache '%s': %s",
+                        self.cache_file, err)
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return
+
+        self.__new_entries = {}
+        LOG.debug("Compiler info cache written into: %s", self.cache_file)
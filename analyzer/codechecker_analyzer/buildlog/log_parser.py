@@ -7,12 +7,15 @@
 # -------------------------------------------------------------------------
 
 
-from collections import namedtuple
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from shutil import which
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 import glob
+import itertools
 import json
 import os
 import re
@@ -23,19 +26,26 @@ import tempfile
 import traceback
 from typing import Dict, List, Optional
 
-from codechecker_analyzer.analyzers import clangsa
+import multiprocess
+
+from codechecker_analyzer.analyzers.clangsa import version as clangsa_version
 
 from codechecker_common.logger import get_logger
-from codechecker_common.util import load_json
+from codechecker_common.util import chunks, load_json
 
 from .. import gcc_toolchain
 from .build_action import BuildAction
+from .compiler_info_cache import CompilerInfoCache
 
 LOG = get_logger('buildlogger')
 
 SOURCE_EXTENSIONS = {".c", ".cc", ".cp", ".cpp", ".cxx", ".c++", ".o", ".so",
                      ".a"}
 
+# Number of compilation database entries which are parsed together by a
+# worker process in parse_unique_log().
+PARSE_CHUNK_SIZE = 1024
+
 # Replace gcc/g++ build target options with values accepted by Clang.
 REPLACE_OPTIONS_MAP = {
     '-mips32': ['-target', 'mips', '-mips32'],
@@ -562,6 +572,67 @@ class ImplicitCompilerInfo:
             ICI.compiler_info[
                 ICI.ImplicitInfoSpecifierKey(k[0], k[1], tuple(k[2]))] = v
 
+    @staticmethod
+    def compiler_info_key(details):
+        """
+        Return the key of the implicit compiler information which belongs to
+        the given build action details.
+        """
+        extra_opts = tuple(sorted(filter_compiler_includes_extra_args(
+            details['analyzer_options'])))
+
+        return ImplicitCompilerInfo.ImplicitInfoSpecifierKey(
+            details['compiler'], details['lang'], extra_opts)
+
+    @staticmethod
+    def query_compiler_info(iisk):
+        """
+        Run the compiler to detect the implicit compiler information which
+        belongs to the given key.
+        """
+        ICI = ImplicitCompilerInfo
+        return {
+            'compiler_includes': ICI.get_compiler_includes(
+                iisk.compiler, iisk.language, iisk.compiler_flags),
+            'compiler_standard': ICI.get_compiler_standard(
+                iisk.compiler, iisk.language),
+            'target': ICI.get_compiler_target(iisk.compiler)
+        }
+
+    @staticmethod
+    def collect(iisks, jobs=1, cache: Optional[CompilerInfoCache] = None):
+        """
+        Detect the implicit compiler information for the given keys which are
+        not known yet. The information is taken from the given persistent
+        cache if possible, the missing ones are detected in parallel on the
+        given number of threads and added to the cache.
+        """
+        ICI = ImplicitCompilerInfo
+
+        missing = []
+        for iisk in dict.fromkeys(iisks):
+            if iisk in ICI.compiler_info:
+                continue
+
+            info = cache.get(iisk) if cache else None
+            if info is not None:
+                ICI.compiler_info[iisk] = info
+            else:
+                missing.append(iisk)
+
+        if not missing:
+            return
+
+        LOG.info("Detecting implicit compiler information for %d compiler "
+                 "configuration(s)...", len(missing))
+
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            for iisk, info in zip(missing, executor.map(
+                    ICI.query_compiler_info, missing)):
+                ICI.compiler_info[iisk] = info
+                if cache:
+                    cache.put(iisk, info)
+
     @staticmethod
     def set(details, compiler_info_file=None):
         """Detect and set the impicit compiler information.
@@ -569,28 +640,15 @@ class ImplicitCompilerInfo:
         If compiler_info_file is available the implicit compiler
         information will be loaded and set from it.
         """
-        def compiler_info_key(details):
-            extra_opts = tuple(sorted(filter_compiler_includes_extra_args(
-                details['analyzer_options'])))
-
-            return ICI.ImplicitInfoSpecifierKey(
-                details['compiler'], details['lang'], extra_opts)
-
         ICI = ImplicitCompilerInfo
-        iisk = compiler_info_key(details)
+        iisk = ICI.compiler_info_key(details)
 
         if compiler_info_file and os.path.exists(compiler_info_file):
             # Compiler info file exists, load it.
             ICI.load_compiler_info(compiler_info_file)
         else:
             if iisk not in ICI.compiler_info:
-                ICI.compiler_info[iisk] = {
-                    'compiler_includes': ICI.get_compiler_includes(
-                        iisk.compiler, iisk.language, iisk.compiler_flags),
-                    'compiler_standard': ICI.get_compiler_standard(
-                        iisk.compiler, iisk.language),
-                    'target': ICI.get_compiler_target(iisk.compiler)
-                }
+                ICI.compiler_info[iisk] = ICI.query_compiler_info(iisk)
 
         for k, v in ICI.compiler_info.get(iisk, {}).items():
             if not details.get(k):
@@ -678,9 +736,13 @@ def __is_not_include_fixed(dirname):
     return os.path.basename(os.path.normpath(dirname)) != 'include-fixed'
 
 
+@lru_cache(maxsize=None)
 def __contains_no_intrinsic_headers(dirname):
     """
     Returns True if the given directory doesn't contain any intrinsic headers.
+    The result is cached, because the same include directories occur in most
+    of the build actions. The cache is cleared before parsing a compilation
+    database, so it is valid during one parsing.
     """
     if not os.path.exists(dirname):
         return True
@@ -946,6 +1008,29 @@ def parse_options(compilation_db_entry,
     analyzer_clang_version -- version information about the clang which is
                               used to execute the analysis
     """
+    details, use_compiler_info = __parse_compilation_db_entry(
+        compilation_db_entry, compiler_info_file, get_clangsa_version_func,
+        analyzer_clang_version)
+
+    if use_compiler_info:
+        ImplicitCompilerInfo.set(details, compiler_info_file)
+
+    __contains_no_intrinsic_headers.cache_clear()
+    return __create_build_action(details, keep_gcc_include_fixed,
+                                 keep_gcc_intrin)
+
+
+def __parse_compilation_db_entry(compilation_db_entry,
+                                 compiler_info_file,
+                                 get_clangsa_version_func,
+                                 analyzer_clang_version):
+    """
+    Parse a compilation database entry into the details of a build action.
+
+    Returns the details and whether the implicit compiler information should
+    be set in them by ImplicitCompilerInfo.set(). See parse_options() for the
+    description of the parameters.
+    """
     details = {
         'analyzer_options': [],
         'compiler_includes': [],
@@ -1012,7 +1097,10 @@ def parse_options(compilation_db_entry,
         ImplicitCompilerInfo.compiler_versions.get(
             details['compiler'], False)
 
-    if not compiler_version_info and get_clangsa_version_func:
+    # The version of non-clang compilers is also cached (as None or False),
+    # so the compiler is executed only once per worker process.
+    if details['compiler'] not in ImplicitCompilerInfo.compiler_versions \
+            and get_clangsa_version_func:
 
         # did not find in the cache yet
         try:
@@ -1091,11 +1179,20 @@ def parse_options(compilation_db_entry,
     # Store the compiler built in include paths and defines.
     # If clang compiler is used for compilation and analysis, or language is
     # not recognized, do not collect the implicit include paths.
-    if ((not toolchain and not using_same_clang_to_compile_and_analyze) or
-            (compiler_info_file and os.path.exists(compiler_info_file))) and \
-            details['lang']:
-        ImplicitCompilerInfo.set(details, compiler_info_file)
+    use_compiler_info = bool(
+        ((not toolchain and not using_same_clang_to_compile_and_analyze) or
+         (compiler_info_file and os.path.exists(compiler_info_file))) and
+        details['lang'])
+
+    return details, use_compiler_info
+
 
+def __create_build_action(details, keep_gcc_include_fixed, keep_gcc_intrin):
+    """
+    Create a build action from the given details after filtering the GCC
+    specific implicit include paths. See parse_options() for the description
+    of the parameters.
+    """
     if not keep_gcc_include_fixed:
         details['compiler_includes'] = list(filter(
             __is_not_include_fixed,
@@ -1156,7 +1253,6 @@ def extend_compilation_database_entries(compilation_database):
     command contains a response file we read those files and replace the
     response file with the options from the file.
     """
-    entries = []
     for entry in compilation_database:
         if 'command' in entry and '@' in entry['command']:
             cmd = []
@@ -1184,12 +1280,78 @@ def extend_compilation_database_entries(compilation_database):
                 for source_file in source_files:
                     new_entry = dict(entry)
                     new_entry['file'] = source_file
-                    entries.append(new_entry)
+                    yield new_entry
                 continue
 
-        entries.append(entry)
+        yield entry
+
+
+def __parse_compilation_db_chunk(compilation_db_chunk,
+                                 compiler_info_file,
+                                 analyzer_clang_version):
+    """
+    Parse a chunk of compilation database entries. This function is executed
+    by the worker processes of parse_unique_log().
+
+    Returns a list of (details, use_compiler_info, file) tuples in the order
+    of the entries, where file is the "file" attribute of the entry. See
+    __parse_compilation_db_entry() for the details.
+    """
+    parsed_entries = []
+    for entry in extend_compilation_database_entries(compilation_db_chunk):
+        details, use_compiler_info = __parse_compilation_db_entry(
+            entry, compiler_info_file, clangsa_version.get,
+            analyzer_clang_version)
+        parsed_entries.append((details, use_compiler_info, entry['file']))
+
+    return parsed_entries
+
+
+def __parse_compilation_db(compilation_database,
+                           compiler_info_file,
+                           analyzer_clang_version,
+                           jobs):
+    """
+    Parse the given compilation database in chunks and yield the parsed
+    chunks in the order of the entries.
+
+    The compilation database can be any iterable of entries (e.g. a file
+    which is read entry by entry), it is consumed chunk by chunk so it doesn't
+    have to be kept in memory. If there are more chunks and jobs, these are
+    parsed by a process pool. At most two chunks per job are queued, so the
+    input is not read much faster than the results are consumed.
+    """
+    db_chunks = (list(c) for c in chunks(compilation_database,
+                                         PARSE_CHUNK_SIZE))
+
+    first_chunk = next(db_chunks, None)
+    if first_chunk is None:
+        return
+
+    second_chunk = next(db_chunks, None)
+    if jobs <= 1 or second_chunk is None:
+        yield __parse_compilation_db_chunk(
+            first_chunk, compiler_info_file, analyzer_clang_version)
+
+        if second_chunk is not None:
+            for db_chunk in itertools.chain([second_chunk], db_chunks):
+                yield __parse_compilation_db_chunk(
+                    db_chunk, compiler_info_file, analyzer_clang_version)
+        return
+
+    with multiprocess.Pool(jobs) as pool:
+        pending = deque()
+        for db_chunk in itertools.chain([first_chunk, second_chunk],
+                                        db_chunks):
+            pending.append(pool.apply_async(
+                __parse_compilation_db_chunk,
+                (db_chunk, compiler_info_file, analyzer_clang_version)))
 
-    return entries
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().get()
+
+        while pending:
+            yield pending.popleft().get()
 
 
 class CompileCommandEncoder(json.JSONEncoder):
@@ -1211,6 +1373,24 @@ class CompileActionUniqueingType(Enum):
     # recognizing symlink and remove duplication
 
 
+def __collect_compiler_info(parsed_chunk, collect_compiler_info, jobs,
+                            compiler_info_cache):
+    """
+    Detect the implicit compiler information in advance for every compiler
+    configuration of the parsed chunk of the compilation database. These are
+    detected in parallel, so ImplicitCompilerInfo.set() doesn't need to run
+    the compilers one by one. Returns the parsed chunk.
+    """
+    if collect_compiler_info:
+        ImplicitCompilerInfo.collect(
+            [ImplicitCompilerInfo.compiler_info_key(details)
+             for details, use_compiler_info, _ in parsed_chunk
+             if use_compiler_info],
+            jobs, compiler_info_cache)
+
+    return parsed_chunk
+
+
 def parse_unique_log(compilation_database,
                      report_dir,
                      compile_uniqueing="none",
@@ -1220,7 +1400,9 @@ def parse_unique_log(compilation_database,
                      analysis_skip_handlers=None,
                      pre_analysis_skip_handlers=None,
                      ctu_or_stats_enabled=False,
-                     analyzer_clang_version=None):
+                     analyzer_clang_version=None,
+                     compiler_info_cache_file=None,
+                     jobs=1):
     """
     This function reads up the compilation_database
     and returns with a list of build actions that is
@@ -1234,7 +1416,8 @@ def parse_unique_log(compilation_database,
     This function also dumps auto-detected the compiler info
     into <report_dir>/compiler_info.json.
 
-    compilation_database -- A compilation database as a list of dict objects.
+    compilation_database -- A compilation database as a list (or any other
+                            iterable) of dict objects.
                             These object should contain "file", "dictionary"
                             and "command" keys. The "command" may be replaced
                             by "arguments" which is a split command. Older
@@ -1271,7 +1454,14 @@ def parse_unique_log(compilation_database,
                             influences the behavior which files are skipped.
     analyzer_clang_version -- version information about the clang which is
                               used to execute the analysis
+    compiler_info_cache_file -- Persistent cache of the implicit compiler
+                                information. It is not used if
+                                compiler_info_file exists.
+    jobs -- Number of processes which parse the compilation database and
+            number of threads which detect the implicit compiler information.
     """
+    __contains_no_intrinsic_headers.cache_clear()
+
     try:
         uniqued_build_actions = {}
         uniqueing_re = None
@@ -1290,14 +1480,31 @@ def parse_unique_log(compilation_database,
 
         skipped_cmp_cmd_count = 0
 
-        for entry in extend_compilation_database_entries(compilation_database):
-            # Parse compilation db entry into an action object
-            action = parse_options(entry,
-                                   compiler_info_file,
-                                   keep_gcc_include_fixed,
-                                   keep_gcc_intrin,
-                                   clangsa.version.get,
-                                   analyzer_clang_version)
+        collect_compiler_info = \
+            not compiler_info_file or not os.path.exists(compiler_info_file)
+
+        compiler_info_cache = None
+        if collect_compiler_info and compiler_info_cache_file:
+            compiler_info_cache = CompilerInfoCache(compiler_info_cache_file)
+
+        # The entries are parsed in parallel, but the build actions are
+        # created, skipped and uniqued here in the order of the compilation
+        # database, so the result is the same as parsing them one by one.
+        parsed_entries = itertools.chain.from_iterable(
+            __collect_compiler_info(parsed_chunk, collect_compiler_info,
+                                    jobs, compiler_info_cache)
+            for parsed_chunk in __parse_compilation_db(
+                compilation_database, compiler_info_file,
+                analyzer_clang_version, jobs))
+
+        for details, use_compiler_info, entry_file in parsed_entries:
+            # Create an action object from the parsed compilation db entry.
+            if use_compiler_info:
+                ImplicitCompilerInfo.set(details, compiler_info_file)
+
+            action = __create_build_action(details,
+                                           keep_gcc_include_fixed,
+                                           keep_gcc_intrin)
 
             # Skip parsing the compilaton commands if it should be skipped
             # at both analysis phases (pre analysis and analysis).
@@ -1339,7 +1546,7 @@ def parse_unique_log(compilation_database,
                         uniqued_build_actions[action.source].output:
                     uniqued_build_actions[action.source] = action
             elif build_action_uniqueing == CompileActionUniqueingType.SYMLINK:
-                real_path = os.path.realpath(entry['file'])
+                real_path = os.path.realpath(entry_file)
                 if real_path not in uniqued_build_actions:
                     uniqued_build_actions[real_path] = action
             elif build_action_uniqueing ==\
@@ -1362,6 +1569,9 @@ def parse_unique_log(compilation_database,
                               compile_uniqueing)
                     sys.exit(1)
 
+        if compiler_info_cache:
+            compiler_info_cache.save()
+
         ImplicitCompilerInfo.dump_compiler_info(
             os.path.join(report_dir, "compiler_info.json"))
 
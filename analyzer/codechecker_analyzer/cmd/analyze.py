@@ -20,9 +20,10 @@ from pathlib import Path
 
 from tu_collector import tu_collector
 
-from codechecker_analyzer import analyzer, analyzer_context, \
-    compilation_database
-from codechecker_analyzer.analyzers import analyzer_types, clangsa
+from codechecker_analyzer import analysis_manager, analysis_schedule, \
+    analyzer, analyzer_context, compilation_database, dependency_index
+from codechecker_analyzer.analyzers import analyzer_cache, analyzer_types, \
+    clangsa
 from codechecker_analyzer.arg import \
     OrderedCheckersAction, OrderedConfigAction, existing_abspath, \
     analyzer_config, checker_config, AnalyzerConfig, CheckerConfig
@@ -33,7 +34,7 @@ from codechecker_common import arg, logger, cmd_config, review_status_handler
 from codechecker_common.compatibility.multiprocessing import cpu_count
 from codechecker_common.skiplist_handler import SkipListHandler, \
     SkipListHandlers
-from codechecker_common.util import load_json
+from codechecker_common.util import get_cache_dir, load_json
 
 LOG = logger.get_logger('system')
 
@@ -52,6 +53,10 @@ EPILOG_ENV_VAR = """
                            is set you can configure the plugin directory of the
                            Clang Static Analyzer by using this environment
                            variable.
+  CC_CACHE_DIR             Directory of the caches which are shared between
+                           CodeChecker invocations, like the cache of the
+                           implicit compiler information. (default:
+                           $XDG_CACHE_HOME/codechecker or ~/.cache/codechecker)
 """
 
 EPILOG_ISSUE_HASHES = """
@@ -159,10 +164,12 @@ def add_arguments_to_parser(parser):
 
     parser.add_argument('input',
                         type=existing_abspath,
+                        nargs='?',
                         help="The input of the analysis can be either a "
                              "compilation database JSON file, a path to a "
                              "source file or a path to a directory containing "
-                             "source files.")
+                             "source files. It is required unless "
+                             "'--queue-worker' is given.")
 
     parser.add_argument('-j', '--jobs',
                         type=int,
@@ -173,6 +180,39 @@ def add_arguments_to_parser(parser):
                              "threads mean faster analysis at the cost of "
                              "using more memory.")
 
+    parser.add_argument('--schedule',
+                        dest="schedule",
+                        required=False,
+                        choices=analysis_schedule.SCHEDULES,
+                        default=analysis_schedule.SCHEDULE_COMPILE_DB,
+                        help="The order in which the analysis of the "
+                             "translation units is started. "
+                             "'compile-db' keeps the order of the "
+                             "compilation database. 'lpt' starts the "
+                             "longest analyses first, so a few long "
+                             "analyses don't keep the analysis running at "
+                             "the end while the other threads are idle. The "
+                             "expected analysis times come from the previous "
+                             "analyses in the output directory, unknown "
+                             "translation units are estimated by the size "
+                             "of their source file.")
+
+    parser.add_argument('--max-memory',
+                        type=int,
+                        dest="max_memory",
+                        metavar='SIZE_MIB',
+                        required=False,
+                        default=argparse.SUPPRESS,
+                        help="Memory budget of the analyzer processes in "
+                             "MiB. An analysis is started only when its "
+                             "expected peak memory usage fits in the budget "
+                             "together with the running analyses, and it is "
+                             "available in the system. The expected peak "
+                             "memory usage comes from the previous analyses "
+                             "in the output directory. The memory usage of "
+                             "the analyzers is measured only if this option "
+                             "is given.")
+
     skip_mode = parser.add_argument_group("file filter arguments")
     skip_mode.add_argument('-i', '--ignore', '--skip',
                            dest="skipfile",
@@ -205,6 +245,40 @@ def add_arguments_to_parser(parser):
                                 "Example: '/path/to/main.cpp', 'lib/*.cpp', "
                                 "*/test*'.")
 
+    skip_mode.add_argument('--changed-files',
+                           dest="changed_files",
+                           metavar='CHANGED_FILES',
+                           type=existing_abspath,
+                           required=False,
+                           default=argparse.SUPPRESS,
+                           help="Analyze only the translation units which "
+                                "are affected by the changed files listed in "
+                                "the given file: the changed source files "
+                                "and the source files which include a "
+                                "changed header. The file contains a path in "
+                                "every line or it is a unified diff, e.g. "
+                                "the output of 'git diff'. Relative paths "
+                                "are resolved from the current directory. "
+                                "The header dependencies come from the "
+                                "dependency index of the output directory, "
+                                "which is updated by this analysis (see "
+                                "'--dependency-index'). Source files which "
+                                "are not in the index are analyzed too.")
+
+    skip_mode.add_argument('--dependency-index',
+                           dest="dependency_index",
+                           action='store_true',
+                           required=False,
+                           default=argparse.SUPPRESS,
+                           help="Collect the header dependencies of the "
+                                "analyzed translation units into the "
+                                "dependency index of the output directory, "
+                                "which is used by '--changed-files'. Once the "
+                                "index exists, every analysis keeps it up to "
+                                "date. Collecting the dependencies "
+                                "preprocesses every translation unit once "
+                                "more.")
+
     parser.add_argument('--review-status-config',
                         dest="review_status_config",
                         required=False,
@@ -228,6 +302,21 @@ def add_arguments_to_parser(parser):
                              "specified file rather than invoke the compiler "
                              "executable.")
 
+    parser.add_argument('--no-compiler-info-cache',
+                        dest="no_compiler_info_cache",
+                        required=False,
+                        action='store_true',
+                        default=argparse.SUPPRESS,
+                        help="Invoke the compiler executables to detect "
+                             "their includes and target instead of using "
+                             "the results cached by previous CodeChecker "
+                             "invocations. The cache is stored in the "
+                             "'$CC_CACHE_DIR' directory (default: "
+                             "'~/.cache/codechecker') and it is invalidated "
+                             "automatically when a compiler binary or the "
+                             "CPATH, C_INCLUDE_PATH, CPLUS_INCLUDE_PATH "
+                             "environment variables change.")
+
     parser.add_argument('--keep-gcc-include-fixed',
                         dest="keep_gcc_include_fixed",
                         required=False,
@@ -372,6 +461,42 @@ def add_arguments_to_parser(parser):
                         help="Annotate the run analysis with a custom name in "
                              "the created metadata file.")
 
+    queue_opts = parser.add_argument_group(
+        "distributed analysis arguments",
+        """
+The analysis can be distributed among several hosts which share the output
+directory, e.g. on a network filesystem. The coordinator publishes the build
+actions in a work queue in the output directory and the workers analyze them.
+The coordinator collects the results and finishes the analysis like a local
+analysis. A build action which was claimed by a crashed worker is analyzed
+again by an other worker.""")
+
+    queue_modes = queue_opts.add_mutually_exclusive_group()
+    queue_modes.add_argument('--serve-queue',
+                             dest="serve_queue",
+                             action='store_true',
+                             default=argparse.SUPPRESS,
+                             help="Publish the build actions in the work "
+                                  "queue of the output directory instead of "
+                                  "analyzing them, and wait until the queue "
+                                  "workers analyze all of them.")
+
+    queue_modes.add_argument('--queue-worker',
+                             dest="queue_worker",
+                             action='store_true',
+                             default=argparse.SUPPRESS,
+                             help="Analyze the build actions which are "
+                                  "published in the work queue of the output "
+                                  "directory by an other CodeChecker "
+                                  "analyze process with '--serve-queue'. "
+                                  "'-j' worker processes are started. The "
+                                  "analysis configuration is taken from the "
+                                  "coordinator, so the other arguments "
+                                  "except '--max-memory' are ignored. The "
+                                  "worker waits for the queue to be "
+                                  "published and exits when every build "
+                                  "action of it is analyzed.")
+
     analyzer_opts = parser.add_argument_group("analyzer arguments")
 
     analyzer_opts.add_argument('--analyzers',
@@ -409,6 +534,47 @@ def add_arguments_to_parser(parser):
                                     "report directory. When this flag is "
                                     "used, 'failed' directory remains empty.")
 
+    analyzer_opts.add_argument('--result-cache',
+                               dest='result_cache_dir',
+                               metavar='RESULT_CACHE_DIR',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Directory of a result cache which can be "
+                                    "shared between analyses. If a "
+                                    "translation unit, the analyzer binary, "
+                                    "the analyzer command and the enabled "
+                                    "checkers are the same as in a previous "
+                                    "analysis then the analyzer is not "
+                                    "executed, but its output is restored "
+                                    "from the cache. CTU and statistics "
+                                    "based analyses are not cached.")
+
+    analyzer_opts.add_argument('--result-cache-size',
+                               type=int,
+                               dest='result_cache_size',
+                               metavar='SIZE_MIB',
+                               default=10240,
+                               required=False,
+                               help="Maximum size of the result cache in "
+                                    "MiB. The least recently used entries "
+                                    "are evicted after the analysis if the "
+                                    "cache is larger than this limit.")
+
+    analyzer_opts.add_argument('--no-analyzer-cache',
+                               dest='no_analyzer_cache',
+                               action='store_true',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Run the analyzer binaries to query "
+                                    "their checkers, configuration options "
+                                    "and versions instead of using the "
+                                    "results cached by previous CodeChecker "
+                                    "invocations. The cache is stored in the "
+                                    "'$CC_CACHE_DIR' directory (default: "
+                                    "'~/.cache/codechecker') and it is "
+                                    "invalidated automatically when an "
+                                    "analyzer binary changes.")
+
     cmd_config.add_option(analyzer_opts)
 
     analyzer_opts.add_argument('--cppcheckargs',
@@ -433,6 +599,24 @@ def add_arguments_to_parser(parser):
                                help="File containing argument which will be "
                                     "forwarded verbatim for Clang-Tidy.")
 
+    analyzer_opts.add_argument('--tidy-batch-size',
+                               type=int,
+                               dest='tidy_batch_size',
+                               metavar='N',
+                               default=1,
+                               required=False,
+                               help="Analyze at most N translation units in "
+                                    "one Clang-Tidy process. Only the build "
+                                    "actions which differ only in their "
+                                    "source files are analyzed together. This "
+                                    "speeds up the analysis of projects with "
+                                    "many small source files by saving the "
+                                    "startup of the Clang-Tidy processes. If "
+                                    "a batch fails, its failing source files "
+                                    "are analyzed again one by one. The "
+                                    "timeout of a batch is the --timeout "
+                                    "multiplied by its size.")
+
     analyzer_opts.add_argument('--tidy-config',
                                dest='tidy_config',
                                required=False,
@@ -955,25 +1139,42 @@ def get_affected_file_paths(
     return file_paths
 
 
+def __create_source_skip_handler(source_file_paths, option):
+    """
+    Creates a skip handler where all source files will be skipped except the
+    given source files and all the header files.
+    """
+    skip_files = [f'+{f}' for f in source_file_paths]
+    skip_files.extend(['+/*.h', '+/*.H', '+/*.tcc'])
+    skip_files.append('-*')
+    content = "\n".join(skip_files)
+    LOG.debug("Skip handler is created for the '%s' option with the "
+              "following filters:\n%s", option, content)
+
+    return SkipListHandler(content)
+
+
 def __get_skip_handlers(args, compile_commands) -> SkipListHandlers:
     """
     Initialize and return a list of skiplist handlers if
     there is a skip list file in the arguments or files options is provided.
     """
     skip_handlers = SkipListHandlers()
-    if 'files' in args:
-        source_file_paths = get_affected_file_paths(
-            args.files, compile_commands)
-
-        # Creates a skip file where all source files will be skipped except
-        # the given source files and all the header files.
-        skip_files = [f'+{f}' for f in source_file_paths]
-        skip_files.extend(['+/*.h', '+/*.H', '+/*.tcc'])
-        skip_files.append('-*')
-        content = "\n".join(skip_files)
-        skip_handlers.append(SkipListHandler(content))
-        LOG.debug("Skip handler is created for the '--file' option with the "
-                  "following filters:\n%s", content)
+    try:
+        if 'files' in args:
+            source_file_paths = get_affected_file_paths(
+                args.files, compile_commands)
+            skip_handlers.append(
+                __create_source_skip_handler(source_file_paths, '--file'))
+        if 'changed_files' in args:
+            source_file_paths = dependency_index.get_affected_sources(
+                args.changed_files, args.output_path, compile_commands)
+            skip_handlers.append(
+                __create_source_skip_handler(sorted(source_file_paths),
+                                             '--changed-files'))
+    except (ValueError, KeyError, TypeError) as ex:
+        LOG.error("The compile database is not valid: %s", ex)
+        sys.exit(1)
     if 'skipfile' in args:
         with open(args.skipfile, encoding="utf-8", errors="ignore") as f:
             content = f.read()
@@ -1065,6 +1266,11 @@ def main(args):
     """
     logger.setup_logger(args.verbose if 'verbose' in args else None)
 
+    if 'no_analyzer_cache' in args:
+        analyzer_cache.disable()
+    else:
+        analyzer_cache.save_at_exit()
+
     # Validate analyzer and checker config (if any)
     config_validator = {
         'analyzer_config': is_analyzer_config_valid,
@@ -1105,6 +1311,17 @@ def main(args):
                   args.output_path)
         sys.exit(1)
 
+    if 'queue_worker' in args:
+        analysis_manager.run_queue_worker(
+            args.output_path, args.jobs,
+            args.max_memory * 1024 * 1024 if 'max_memory' in args else None)
+        return 0
+
+    if args.input is None:
+        LOG.error("The input of the analysis is required unless "
+                  "'--queue-worker' is given.")
+        sys.exit(1)
+
     if 'enable_all' in args:
         LOG.info("'--enable-all' was supplied for this analysis.")
     if 'disable_all' in args:
@@ -1171,10 +1388,6 @@ def main(args):
 
     context = analyzer_context.get_context()
 
-    # Number of all the compilation commands in the parsed log files,
-    # logged by the logger.
-    all_cmp_cmd_count = len(compile_commands)
-
     # We clear the output directory in the following cases.
     ctu_dir = os.path.join(args.output_path, 'ctu-dir')
     if 'ctu_phases' in args and args.ctu_phases[0] and \
@@ -1207,8 +1420,14 @@ def main(args):
     if analyzer_clang_binary:
         analyzer_clang_version = clangsa.version.get(analyzer_clang_binary)
 
+    # The compilation database is written into the report directory while
+    # it is parsed, so it is read only once.
+    # WARN: store command will search for this file!!!!
+    compile_cmd_json = os.path.join(args.output_path, 'compile_cmd.json')
+
     actions, skipped_cmp_cmd_count = log_parser.parse_unique_log(
-        compile_commands,
+        compilation_database.tee_compilation_database(compile_commands,
+                                                      compile_cmd_json),
         args.output_path,
         args.compile_uniqueing,
         compiler_info_file,
@@ -1217,7 +1436,16 @@ def main(args):
         skip_handlers,
         pre_analysis_skip_handlers,
         ctu_or_stats_enabled,
-        analyzer_clang_version)
+        analyzer_clang_version,
+        None if 'no_compiler_info_cache' in args
+        else os.path.join(get_cache_dir(), 'compiler_info.json'),
+        args.jobs)
+
+    # Number of all the compilation commands in the parsed log files,
+    # logged by the logger. This is known without reading the compilation
+    # database again after it has been parsed or iterated by the skip
+    # handlers.
+    all_cmp_cmd_count = len(compile_commands)
 
     if not actions:
         LOG.warning("No analysis is required.")
@@ -1299,11 +1527,6 @@ def main(args):
               encoding="utf-8", errors="ignore") as metafile:
         json.dump(metadata, metafile)
 
-    # WARN: store command will search for this file!!!!
-    compile_cmd_json = os.path.join(args.output_path, 'compile_cmd.json')
-    with open(compile_cmd_json, 'w', encoding="utf-8", errors="ignore") as f:
-        json.dump(compile_commands, f, indent=2)
-
     try:
         # pylint: disable=no-name-in-module
         from codechecker_analyzer import analyzer_statistics
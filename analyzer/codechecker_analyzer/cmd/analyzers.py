@@ -17,7 +17,7 @@ import subprocess
 from codechecker_report_converter import twodim
 
 from codechecker_analyzer import analyzer_context
-from codechecker_analyzer.analyzers import analyzer_types
+from codechecker_analyzer.analyzers import analyzer_cache, analyzer_types
 
 from codechecker_common import logger
 from codechecker_common.output import USER_FORMATS
@@ -95,6 +95,20 @@ def add_arguments_to_parser(parser):
                         choices=USER_FORMATS,
                         help="Specify the format of the output list.")
 
+    parser.add_argument('--no-analyzer-cache',
+                        dest='no_analyzer_cache',
+                        action='store_true',
+                        default=argparse.SUPPRESS,
+                        required=False,
+                        help="Run the analyzer binaries to query their "
+                             "checkers, configuration options and versions "
+                             "instead of using the results cached by "
+                             "previous CodeChecker invocations. The cache is "
+                             "stored in the '$CC_CACHE_DIR' directory "
+                             "(default: '~/.cache/codechecker') and it is "
+                             "invalidated automatically when an analyzer "
+                             "binary changes.")
+
     logger.add_verbose_arguments(parser)
     parser.set_defaults(func=main)
 
@@ -111,6 +125,11 @@ def main(args):
 
     logger.setup_logger(args.verbose if 'verbose' in args else None, stream)
 
+    if 'no_analyzer_cache' in args:
+        analyzer_cache.disable()
+    else:
+        analyzer_cache.save_at_exit()
+
     context = analyzer_context.get_context()
     _, errored = \
         analyzer_types.check_supported_analyzers(
@@ -17,6 +17,7 @@ import shutil
 import sys
 import tempfile
 
+from codechecker_analyzer import analysis_schedule
 from codechecker_analyzer.analyzers import analyzer_types
 from codechecker_analyzer.arg import \
     OrderedCheckersAction, OrderedConfigAction, \
@@ -129,6 +130,21 @@ def add_arguments_to_parser(parser):
                              "analyzers' output will not be printed to the "
                              "standard output.")
 
+    parser.add_argument('--no-compiler-info-cache',
+                        dest="no_compiler_info_cache",
+                        required=False,
+                        action='store_true',
+                        default=argparse.SUPPRESS,
+                        help="Invoke the compiler executables to detect "
+                             "their includes and target instead of using "
+                             "the results cached by previous CodeChecker "
+                             "invocations. The cache is stored in the "
+                             "'$CC_CACHE_DIR' directory (default: "
+                             "'~/.cache/codechecker') and it is invalidated "
+                             "automatically when a compiler binary or the "
+                             "CPATH, C_INCLUDE_PATH, CPLUS_INCLUDE_PATH "
+                             "environment variables change.")
+
     parser.add_argument('--keep-gcc-include-fixed',
                         dest="keep_gcc_include_fixed",
                         required=False,
@@ -199,6 +215,42 @@ used to generate a log file on the fly.""")
                                     "More threads mean faster analysis at "
                                     "the cost of using more memory.")
 
+    analyzer_opts.add_argument('--schedule',
+                               dest="schedule",
+                               required=False,
+                               choices=analysis_schedule.SCHEDULES,
+                               default=analysis_schedule.SCHEDULE_COMPILE_DB,
+                               help="The order in which the analysis of the "
+                                    "translation units is started. "
+                                    "'compile-db' keeps the order of the "
+                                    "compilation database. 'lpt' starts the "
+                                    "longest analyses first, so a few long "
+                                    "analyses don't keep the analysis "
+                                    "running at the end while the other "
+                                    "threads are idle. The expected analysis "
+                                    "times come from the previous analyses "
+                                    "in the output directory, unknown "
+                                    "translation units are estimated by the "
+                                    "size of their source file.")
+
+    analyzer_opts.add_argument('--max-memory',
+                               type=int,
+                               dest="max_memory",
+                               metavar='SIZE_MIB',
+                               required=False,
+                               default=argparse.SUPPRESS,
+                               help="Memory budget of the analyzer "
+                                    "processes in MiB. An analysis is "
+                                    "started only when its expected peak "
+                                    "memory usage fits in the budget "
+                                    "together with the running analyses, "
+                                    "and it is available in the system. The "
+                                    "expected peak memory usage comes from "
+                                    "the previous analyses in the output "
+                                    "directory. The memory usage of the "
+                                    "analyzers is measured only if this "
+                                    "option is given.")
+
     analyzer_opts.add_argument('-c', '--clean',
                                dest="clean",
                                required=False,
@@ -307,6 +359,40 @@ used to generate a log file on the fly.""")
                                 "Example: '/path/to/main.cpp', 'lib/*.cpp', "
                                 "*/test*'.")
 
+    skip_mode.add_argument('--changed-files',
+                           dest="changed_files",
+                           metavar='CHANGED_FILES',
+                           type=existing_abspath,
+                           required=False,
+                           default=argparse.SUPPRESS,
+                           help="Analyze only the translation units which "
+                                "are affected by the changed files listed in "
+                                "the given file: the changed source files "
+                                "and the source files which include a "
+                                "changed header. The file contains a path in "
+                                "every line or it is a unified diff, e.g. "
+                                "the output of 'git diff'. Relative paths "
+                                "are resolved from the current directory. "
+                                "The header dependencies come from the "
+                                "dependency index of the output directory, "
+                                "which is updated by this analysis (see "
+                                "'--dependency-index'). Source files which "
+                                "are not in the index are analyzed too.")
+
+    skip_mode.add_argument('--dependency-index',
+                           dest="dependency_index",
+                           action='store_true',
+                           required=False,
+                           default=argparse.SUPPRESS,
+                           help="Collect the header dependencies of the "
+                                "analyzed translation units into the "
+                                "dependency index of the output directory, "
+                                "which is used by '--changed-files'. Once the "
+                                "index exists, every analysis keeps it up to "
+                                "date. Collecting the dependencies "
+                                "preprocesses every translation unit once "
+                                "more.")
+
     analyzer_opts.add_argument('--analyzers',
                                nargs='+',
                                dest='analyzers',
@@ -342,6 +428,47 @@ used to generate a log file on the fly.""")
                                     "report directory. When this flag is "
                                     "used, 'failed' directory remains empty.")
 
+    analyzer_opts.add_argument('--result-cache',
+                               dest='result_cache_dir',
+                               metavar='RESULT_CACHE_DIR',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Directory of a result cache which can be "
+                                    "shared between analyses. If a "
+                                    "translation unit, the analyzer binary, "
+                                    "the analyzer command and the enabled "
+                                    "checkers are the same as in a previous "
+                                    "analysis then the analyzer is not "
+                                    "executed, but its output is restored "
+                                    "from the cache. CTU and statistics "
+                                    "based analyses are not cached.")
+
+    analyzer_opts.add_argument('--result-cache-size',
+                               type=int,
+                               dest='result_cache_size',
+                               metavar='SIZE_MIB',
+                               default=10240,
+                               required=False,
+                               help="Maximum size of the result cache in "
+                                    "MiB. The least recently used entries "
+                                    "are evicted after the analysis if the "
+                                    "cache is larger than this limit.")
+
+    analyzer_opts.add_argument('--no-analyzer-cache',
+                               dest='no_analyzer_cache',
+                               action='store_true',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Run the analyzer binaries to query "
+                                    "their checkers, configuration options "
+                                    "and versions instead of using the "
+                                    "results cached by previous CodeChecker "
+                                    "invocations. The cache is stored in the "
+                                    "'$CC_CACHE_DIR' directory (default: "
+                                    "'~/.cache/codechecker') and it is "
+                                    "invalidated automatically when an "
+                                    "analyzer binary changes.")
+
     cmd_config.add_option(analyzer_opts)
 
     # TODO: One day, get rid of these. See Issue #36, #427.
@@ -368,6 +495,24 @@ used to generate a log file on the fly.""")
                                     "forwarded verbatim for the Clang-Tidy "
                                     "analyzer.")
 
+    analyzer_opts.add_argument('--tidy-batch-size',
+                               type=int,
+                               dest='tidy_batch_size',
+                               metavar='N',
+                               default=1,
+                               required=False,
+                               help="Analyze at most N translation units in "
+                                    "one Clang-Tidy process. Only the build "
+                                    "actions which differ only in their "
+                                    "source files are analyzed together. This "
+                                    "speeds up the analysis of projects with "
+                                    "many small source files by saving the "
+                                    "startup of the Clang-Tidy processes. If "
+                                    "a batch fails, its failing source files "
+                                    "are analyzed again one by one. The "
+                                    "timeout of a batch is the --timeout "
+                                    "multiplied by its size.")
+
     analyzer_opts.add_argument('--tidy-config',
                                dest='tidy_config',
                                required=False,
@@ -912,18 +1057,27 @@ def main(args):
         # We can't set these keys to None because it would result in an error
         # after the call.
         args_to_update = ['quiet',
+                          'schedule',
+                          'max_memory',
                           'skipfile',
                           'drop_skipped_reports',
                           'files',
+                          'changed_files',
+                          'dependency_index',
+                          'no_compiler_info_cache',
                           'analyzers',
                           'add_compiler_defaults',
                           'cppcheck_args_cfg_file',
                           'clangsa_args_cfg_file',
                           'tidy_args_cfg_file',
+                          'tidy_batch_size',
                           'analyzer_config',
                           'checker_config',
                           'capture_analysis_output',
                           'generate_reproducer',
+                          'result_cache_dir',
+                          'result_cache_size',
+                          'no_analyzer_cache',
                           'config_file',
                           'ctu_ast_mode',
                           'ctu_phases',
@@ -968,6 +1122,7 @@ def main(args):
         __update_if_key_exists(args, parse_args, 'verbose')
         __update_if_key_exists(args, parse_args, 'skipfile')
         __update_if_key_exists(args, parse_args, 'suppress')
+        __update_if_key_exists(args, parse_args, 'jobs')
 
         import codechecker_analyzer.cmd.parse as parse_module
         LOG.debug("Calling PARSE with args:")
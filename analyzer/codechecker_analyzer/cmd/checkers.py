@@ -20,7 +20,7 @@ from typing import Dict, Iterable, List, Tuple
 from codechecker_report_converter import twodim
 
 from codechecker_analyzer import analyzer_context
-from codechecker_analyzer.analyzers import analyzer_types
+from codechecker_analyzer.analyzers import analyzer_cache, analyzer_types
 from codechecker_analyzer.analyzers.config_handler import CheckerState
 
 from codechecker_common import arg, logger
@@ -177,6 +177,20 @@ def add_arguments_to_parser(parser):
                         choices=USER_FORMATS + ['custom'],
                         help="The format to list the applicable checkers as.")
 
+    parser.add_argument('--no-analyzer-cache',
+                        dest='no_analyzer_cache',
+                        action='store_true',
+                        default=argparse.SUPPRESS,
+                        required=False,
+                        help="Run the analyzer binaries to query their "
+                             "checkers, configuration options and versions "
+                             "instead of using the results cached by "
+                             "previous CodeChecker invocations. The cache is "
+                             "stored in the '$CC_CACHE_DIR' directory "
+                             "(default: '~/.cache/codechecker') and it is "
+                             "invalidated automatically when an analyzer "
+                             "binary changes.")
+
     logger.add_verbose_arguments(parser)
     parser.set_defaults(func=main)
 
@@ -578,6 +592,11 @@ def main(args):
     logger.setup_logger(args.verbose if 'verbose' in args else None,
                         None if args.output_format == 'table' else 'stderr')
 
+    if 'no_analyzer_cache' in args:
+        analyzer_cache.disable()
+    else:
+        analyzer_cache.save_at_exit()
+
     cl = analyzer_context.get_context().checker_labels
 
     if 'profile' in args and not args.profile:
@@ -18,6 +18,7 @@ import sys
 import tempfile
 import yaml
 
+from codechecker_report_converter.stat_cache import get_stat_cache
 from codechecker_report_converter.util import get_last_mod_time
 
 from codechecker_analyzer import analyzer_context
@@ -294,6 +295,9 @@ def apply_fixits(inputs, checker_names, file_paths, interactive, reports):
             out_dir],
             env=replacer_env).communicate()
 
+        # The modification time of the fixed source files is changed.
+        get_stat_cache().invalidate()
+
     not_existing_files = set()
     existing_files = set()
     modified_files = set()
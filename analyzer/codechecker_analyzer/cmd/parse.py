@@ -12,13 +12,18 @@ human-readable format.
 
 
 import argparse
+import collections
 import os
+import pickle
 import sys
-from typing import Dict, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set
 import fnmatch
 
+import multiprocess
+
+from codechecker_report_converter import source_cache, stat_cache
 from codechecker_report_converter.util import dump_json_output
-from codechecker_report_converter.report import report_file, \
+from codechecker_report_converter.report import Report, report_file, \
     reports as reports_helper
 from codechecker_report_converter.report.output import baseline, codeclimate, \
     gerrit, json as report_to_json, plaintext
@@ -30,6 +35,7 @@ from codechecker_report_converter.report.statistics import Statistics
 from codechecker_analyzer import analyzer_context, suppress_handler
 
 from codechecker_common import arg, logger, cmd_config
+from codechecker_common.compatibility.multiprocessing import cpu_count
 from codechecker_common.review_status_handler import ReviewStatusHandler
 from codechecker_common.skiplist_handler import SkipListHandler, \
     SkipListHandlers
@@ -49,6 +55,22 @@ def init_logger(level, stream=None, logger_name='system'):
 
 EXPORT_TYPES = ['html', 'json', 'codeclimate', 'gerrit', 'baseline']
 
+# Reports of an analyzer result file which are not skipped by the skip
+# handlers with their review statuses set, see parse_result_file().
+ParsedResultFile = collections.namedtuple(
+    'ParsedResultFile', ['reports', 'source_comments', 'warnings', 'error'])
+
+ParseContext = collections.namedtuple(
+    'ParseContext', ['checker_labels', 'skip_handlers', 'file_cache',
+                     'use_report_cache'])
+
+# Context of the processes which parse the result files, see init_worker().
+PARSE_CONTEXT = None
+
+# Review status handlers of the parser processes by review status config
+# files.
+REVIEW_STATUS_HANDLERS = {}
+
 EPILOG_ENV_VAR = """
   CC_CHANGED_FILES       Path of changed files json from Gerrit. Use it when
                          generating gerrit output.
@@ -114,6 +136,29 @@ def add_arguments_to_parser(parser):
 
     cmd_config.add_option(parser)
 
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        dest="jobs",
+                        required=False,
+                        default=cpu_count(),
+                        help="Number of processes which parse the analyzer "
+                             "result files and write the pages of the HTML "
+                             "export. The reports are printed and exported "
+                             "in the same order as by a single process.")
+
+    parser.add_argument('--report-cache',
+                        dest="report_cache",
+                        action="store_true",
+                        required=False,
+                        default=argparse.SUPPRESS,
+                        help="Read the reports from cache files next to the "
+                             "analyzer result files instead of parsing them "
+                             "and write the missing cache files. The cache "
+                             "file of a result file ('<result file>.cache') "
+                             "is created when it is parsed first and it is "
+                             "invalidated automatically when the result file "
+                             "or a source file of its reports changes.")
+
     parser.add_argument('-t', '--type', '--input-format',
                         dest="input_format",
                         required=False,
@@ -263,6 +308,91 @@ def get_metadata(dir_path: str) -> Optional[Dict]:
     return None
 
 
+def init_worker(
+    checker_labels,
+    skip_handlers: SkipListHandlers,
+    use_report_cache: bool = False
+):
+    """ Initialize a process which parses analyzer result files. """
+    global PARSE_CONTEXT
+    PARSE_CONTEXT = ParseContext(checker_labels, skip_handlers, {},
+                                 use_report_cache)
+    REVIEW_STATUS_HANDLERS.clear()
+
+
+def __get_review_status_handler(
+    review_status_cfg: Optional[str]
+) -> ReviewStatusHandler:
+    """
+    Return the review status handler of the current process which uses the
+    given review status config file.
+    """
+    handler = REVIEW_STATUS_HANDLERS.get(review_status_cfg)
+    if handler is None:
+        handler = ReviewStatusHandler()
+        if review_status_cfg:
+            handler.set_review_status_config(review_status_cfg)
+        REVIEW_STATUS_HANDLERS[review_status_cfg] = handler
+
+    return handler
+
+
+def parse_result_file(task) -> ParsedResultFile:
+    """
+    Parse the analyzer result file of the given (file path, review status
+    config file) task. The reports which are skipped by the skip handlers are
+    dropped and the review status of the others is determined.
+
+    This is the part of the parsing which doesn't depend on the other result
+    files, so it can run in parallel. Deduplication, suppression and the
+    output is done by the main process in the order of the result files.
+    """
+    file_path, review_status_cfg = task
+
+    review_status_handler = __get_review_status_handler(review_status_cfg)
+    warnings = review_status_handler.source_comment_warnings()
+    warnings_num = len(warnings)
+
+    reports = report_file.get_reports(
+        file_path, PARSE_CONTEXT.checker_labels, PARSE_CONTEXT.file_cache,
+        use_cache=PARSE_CONTEXT.use_report_cache)
+
+    # Skipped reports shouldn't check source code comments because they
+    # potentially raise an exception.
+    reports = reports_helper.skip(
+        reports, skip_handlers=PARSE_CONTEXT.skip_handlers)
+
+    try:
+        for report in reports:
+            report.review_status = \
+                review_status_handler.get_review_status(report)
+    except ValueError as err:
+        return ParsedResultFile([], [], [], str(err))
+
+    return ParsedResultFile(
+        reports,
+        [review_status_handler.source_comment(r) for r in reports],
+        warnings[warnings_num:],
+        None)
+
+
+def parse_result_file_pickled(task) -> bytes:
+    """
+    Return the result of parse_result_file() pickled by the standard pickle
+    module. The pool of the multiprocess package uses dill, which is an order
+    of magnitude slower to serialize the reports.
+    """
+    return pickle.dumps(parse_result_file(task), pickle.HIGHEST_PROTOCOL)
+
+
+def __get_chunk_size(jobs: int, result_file_num: int) -> int:
+    """
+    Return the number of result files which are given to a parser process at
+    once. Smaller chunks keep the output streaming, larger ones spare IPC.
+    """
+    return max(1, min(64, result_file_num // (jobs * 4)))
+
+
 def main(args):
     """
     Entry point for parsing some analysis results and printing them to the
@@ -387,9 +517,7 @@ def main(args):
     trim_path_prefixes = args.trim_path_prefix if \
         'trim_path_prefix' in args else None
 
-    all_reports = []
     statistics = Statistics()
-    file_cache = {}  # For memory effiency.
     changed_files: Set[str] = set()
     processed_path_hashes = set()
     processed_file_paths = set()
@@ -400,17 +528,23 @@ def main(args):
     if export == 'html':
         html_builder = report_to_html.HtmlBuilder(
             context.path_plist_to_html_dist,
-            context.checker_labels)
+            context.checker_labels,
+            args.jobs if 'jobs' in args else 1)
 
+    # The review status config of a report directory is used for the
+    # following report directories too which don't have one.
+    result_files = []
+    review_status_cfg = None
     for dir_path, file_paths in report_file.analyzer_result_files(args.input):
-        review_status_cfg = os.path.join(dir_path, 'review_status.yaml')
-        if os.path.lexists(review_status_cfg):
+        dir_review_status_cfg = os.path.join(dir_path, 'review_status.yaml')
+        if os.path.lexists(dir_review_status_cfg):
             try:
                 review_status_handler.set_review_status_config(
-                    review_status_cfg)
+                    dir_review_status_cfg)
             except ValueError as err:
                 LOG.error(err)
                 sys.exit(1)
+            review_status_cfg = dir_review_status_cfg
 
         metadata = get_metadata(dir_path)
 
@@ -429,27 +563,54 @@ def main(args):
                 else []
             file_paths = specifed_file_paths or file_paths
 
-        for file_path in file_paths:
-            reports = report_file.get_reports(
-                file_path, context.checker_labels, file_cache)
+        result_files.extend((file_path, metadata, review_status_cfg)
+                            for file_path in file_paths)
+
+    tasks = [(file_path, cfg) for file_path, _, cfg in result_files]
+    jobs = max(1, min(args.jobs if 'jobs' in args else 1, len(tasks)))
+
+    use_report_cache = 'report_cache' in args
+
+    pool = None
+    if jobs > 1:
+        pool = multiprocess.Pool(
+            jobs,
+            initializer=init_worker,
+            initargs=(context.checker_labels, skip_handlers,
+                      use_report_cache))
+        parsed_files = map(pickle.loads, pool.imap(
+            parse_result_file_pickled, tasks,
+            __get_chunk_size(jobs, len(tasks))))
+    else:
+        init_worker(context.checker_labels, skip_handlers, use_report_cache)
+        parsed_files = map(parse_result_file, tasks)
+
+    source_comment_warnings: List[str] = []
+
+    def parsed_reports() -> Iterator[Report]:
+        """
+        Yield the reports of the parsed result files which are not skipped,
+        suppressed, filtered or deduplicated. The reports are printed in the
+        meantime, so they don't have to be kept in memory.
+        """
+        for (file_path, metadata, _), parsed_file in \
+                zip(result_files, parsed_files):
+            if parsed_file.error:
+                LOG.error(parsed_file.error)
+                sys.exit(1)
 
-            for report in reports:
-                try:
-                    # TODO: skip_handler is used later in reports_helper.skip()
-                    # too. However, skipped reports shouldn't check source code
-                    # comments because they potentially raise an exception.
-                    # Skipped files shouldn't raise an exception, also, "skip"
-                    # shouldn't be checked twice.
-                    if not report.skip(skip_handlers):
-                        report.review_status = \
-                            review_status_handler.get_review_status(report)
-                except ValueError as err:
-                    LOG.error(err)
-                    sys.exit(1)
+            # Only the plain text output prints the source code comments.
+            if not export:
+                for report, source_comment in zip(
+                        parsed_file.reports, parsed_file.source_comments):
+                    if source_comment:
+                        review_status_handler.set_source_comment(
+                            report, source_comment)
+            source_comment_warnings.extend(parsed_file.warnings)
 
             reports = reports_helper.skip(
-                reports, processed_path_hashes, skip_handlers, suppr_handler,
-                src_comment_status_filter)
+                parsed_file.reports, processed_path_hashes, None,
+                suppr_handler, src_comment_status_filter)
 
             statistics.num_of_analyzer_result_files += 1
             for report in reports:
@@ -461,8 +622,6 @@ def main(args):
                 if trim_path_prefixes:
                     report.trim_path_prefixes(trim_path_prefixes)
 
-            all_reports.extend(reports)
-
             # Print reports continously.
             if not export:
                 file_report_map = plaintext.get_file_report_map(
@@ -476,27 +635,46 @@ def main(args):
                     file_path, reports, output_dir_path,
                     html_builder)
 
-    for warning in review_status_handler.source_comment_warnings():
+            yield from reports
+
+    # The exporters consume the reports while the result files are parsed.
+    report_hashes = None
+    try:
+        if export == 'json':
+            report_to_json.write(parsed_reports(),
+                                 get_output_file_path("reports.json"))
+        elif export == 'codeclimate':
+            codeclimate.write(parsed_reports(),
+                              get_output_file_path("reports.json"))
+        elif export == 'gerrit':
+            data = gerrit.convert(parsed_reports())
+            dump_json_output(data, get_output_file_path("reports.json"))
+        elif export == 'baseline':
+            report_hashes = baseline.convert(parsed_reports())
+        else:
+            for _ in parsed_reports():
+                pass
+    finally:
+        if pool:
+            pool.terminate()
+            pool.join()
+
+    for warning in source_comment_warnings:
         LOG.warning(warning)
 
+    # The parser processes have their own source and stat caches, these are
+    # not counted.
+    source_cache.log_statistics()
+    stat_cache.log_statistics()
+
     if export is None:  # Plain text output
         statistics.write()
     elif export == 'html':
         html_builder.finish(output_dir_path, statistics)
-    elif export == 'json':
-        data = report_to_json.convert(all_reports)
-        dump_json_output(data, get_output_file_path("reports.json"))
-    elif export == 'codeclimate':
-        data = codeclimate.convert(all_reports)
-        dump_json_output(data, get_output_file_path("reports.json"))
-    elif export == 'gerrit':
-        data = gerrit.convert(all_reports)
-        dump_json_output(data, get_output_file_path("reports.json"))
     elif export == 'baseline':
-        data = baseline.convert(all_reports)
         output_path = get_output_file_path("reports.baseline")
         if output_path:
-            baseline.write(output_path, data)
+            baseline.write(output_path, report_hashes)
 
     reports_helper.dump_changed_files(changed_files)
 
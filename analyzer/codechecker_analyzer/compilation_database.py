@@ -10,9 +10,12 @@ Utilities for compilation database handling.
 """
 
 
+import json
 import os
+import re
 import shlex
-from typing import Callable, Dict, List, Optional
+import uuid
+from typing import Callable, Dict, Iterator, List, Optional, Union
 
 from codechecker_common.util import load_json
 
@@ -30,6 +33,152 @@ C_CPP_OBJC_OBJCPP_EXTS = [
 # tools rely on this file name, and CMake exports this too.
 COMPILATION_DATABASE = "compile_commands.json"
 
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def iter_json_array(path: str, buffer_size: int = 1 << 20) -> Iterator:
+    """
+    Yield the elements of the JSON array in the given file one by one. The
+    file is read in buffer_size chunks, so the whole file is never kept in
+    memory. ValueError is raised if the file doesn't contain a JSON array.
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        buf = ''
+        pos = 0
+        eof = False
+
+        def read_more():
+            nonlocal buf, pos, eof
+            data = f.read(buffer_size)
+            buf = buf[pos:] + data
+            pos = 0
+            eof = not data
+
+        # The character which is expected next: '[' at the beginning, a value
+        # or ']' after '[', ',' or ']' after a value and a value after ','.
+        expected = '['
+        while True:
+            pos = _JSON_WHITESPACE.match(buf, pos).end()
+            if pos == len(buf):
+                if eof:
+                    raise ValueError(f"Unexpected end of JSON file: {path}")
+                read_more()
+                continue
+
+            char = buf[pos]
+            if expected == '[':
+                if char != '[':
+                    raise ValueError(f"JSON file is not an array: {path}")
+                pos += 1
+                expected = 'value or ]'
+            elif expected in ('value or ]', ', or ]') and char == ']':
+                return
+            elif expected == ', or ]':
+                if char != ',':
+                    raise ValueError(f"Invalid JSON array in file: {path}")
+                pos += 1
+                expected = 'value'
+            else:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except ValueError:
+                    if eof:
+                        raise
+                    read_more()
+                    continue
+
+                # A value at the end of the buffer may be incomplete (e.g. a
+                # number), so it is decoded again with more data.
+                if end == len(buf) and not eof:
+                    read_more()
+                    continue
+
+                pos = end
+                expected = ', or ]'
+                yield value
+
+
+class CompilationDatabaseFile:
+    """
+    Compilation database JSON file which is read entry by entry whenever it
+    is iterated, so the whole database is never kept in memory. The entries
+    are transformed by change_args_to_command_in_comp_db().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__len = None
+
+    def __iter__(self) -> Iterator[Dict]:
+        count = 0
+        for entry in iter_json_array(self.path):
+            change_args_to_command_in_comp_db([entry])
+            count += 1
+            yield entry
+
+        self.__len = count
+
+    def __len__(self) -> int:
+        if self.__len is None:
+            self.__len = sum(1 for _ in iter_json_array(self.path))
+        return self.__len
+
+
+def is_json_array_file(path: str) -> bool:
+    """ Check whether the given file starts like a JSON array. """
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read(4096).lstrip().startswith('[')
+    except OSError:
+        return False
+
+
+def tee_compilation_database(
+    compile_commands: Union[List[Dict], CompilationDatabaseFile],
+    path: str
+) -> Iterator[Dict]:
+    """
+    Yield the given compilation database entries and write them to a JSON
+    file meanwhile, so the entries are not read again for writing them. The
+    output is the same as the output of json.dump() with indent=2.
+
+    The entries are written to a temporary file which replaces the given file
+    when the iteration is finished, so the entries can be read from the same
+    file which is written.
+    """
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding="utf-8", errors="ignore") as f:
+            f.write('[')
+            separator = '\n'
+            for entry in compile_commands:
+                f.write(separator)
+                f.write('  ' +
+                        json.dumps(entry, indent=2).replace('\n', '\n  '))
+                separator = ',\n'
+                yield entry
+
+            f.write('\n]' if separator != '\n' else ']')
+
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def dump_compilation_database(
+    compile_commands: Union[List[Dict], CompilationDatabaseFile],
+    path: str
+):
+    """
+    Write the given compilation database entries to a JSON file one by one.
+    The output is the same as the output of json.dump() with indent=2.
+    """
+    for _ in tee_compilation_database(compile_commands, path):
+        pass
+
 
 def find_closest_compilation_database(path: str) -> Optional[str]:
     """
@@ -137,13 +286,15 @@ def find_build_actions_for_file(file_path: str) -> List[Dict]:
         load_json(comp_db)))
 
 
-def gather_compilation_database(analysis_input: str) -> Optional[List[Dict]]:
+def gather_compilation_database(
+    analysis_input: str
+) -> Optional[Union[List[Dict], CompilationDatabaseFile]]:
     """
     Return a compilation database that describes the build of the given
     analysis_input:
 
     - If analysis_input is a compilation database JSON file then its entries
-      return.
+      return. These are read from the file on demand, entry by entry.
     - If analysis_input is a C/C++/Obj-C source file then the corresponding
       build command is found from the compilation database. Only the innermost
       compilation database is checked (see find_closest_compilation_database()
@@ -172,14 +323,14 @@ def gather_compilation_database(analysis_input: str) -> Optional[List[Dict]]:
 
     # Case 1: analysis_input is a compilation database JSON file.
 
-    build_actions = load_json(analysis_input, display_warning=False)
+    if os.path.isfile(analysis_input) and is_json_array_file(analysis_input):
+        return CompilationDatabaseFile(analysis_input)
 
-    if build_actions is not None:
-        pass
+    build_actions = None
 
     # Case 2: analysis_input is a C/C++/Obj-C source file.
 
-    elif is_c_lang_source_file(analysis_input):
+    if is_c_lang_source_file(analysis_input):
         build_actions = find_build_actions_for_file(analysis_input)
 
     # Case 3: analysis_input is a directory.
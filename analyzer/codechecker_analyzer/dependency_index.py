@@ -0,0 +1,236 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Header dependency index of the analyzed translation units.
+
+The index maps every file which is included by a translation unit (and the
+source file of the translation unit itself) to the source files of the
+translation units which include it. It is stored in the report directory.
+Collecting the dependencies preprocesses the translation unit once more, so
+the index is built only on request, but once it exists, it is updated by
+every analysis for the analyzed translation units. It can be used to select
+the translation units which are affected by a change without collecting the
+dependencies of every translation unit again.
+"""
+
+
+import json
+import os
+import re
+
+from typing import Dict, Iterable, List, Set
+
+from tu_collector import tu_collector
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+INDEX_FILE = 'dependency_index.json'
+INDEX_VERSION = 1
+
+# Header of a hunk in a unified diff with the number of old and new lines.
+DIFF_HUNK = re.compile(r'^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@')
+
+
+def has_index(output_path: str) -> bool:
+    """ Return True if the given report directory has a dependency index. """
+    return os.path.isfile(os.path.join(output_path, INDEX_FILE))
+
+
+def collect_dependencies(action) -> List[str]:
+    """
+    Return the real paths of the files which build up the translation unit
+    of the given build action. An empty list is returned if the dependencies
+    can't be collected completely.
+    """
+    dependencies, error = tu_collector.get_dependent_headers(
+        action.original_command, action.directory)
+
+    if error:
+        LOG.debug("Failed to collect the dependencies of %s: %s",
+                  action.source, error)
+        return []
+
+    return sorted({os.path.realpath(d) for d in dependencies})
+
+
+def read_changed_files(path: str) -> Set[str]:
+    """
+    Return the real paths of the changed files listed in the given file. The
+    file contains a path in every line or it is a unified diff, for example
+    the output of 'git diff'. In the latter case the old and the new paths of
+    the changed files are returned. Relative paths are resolved from the
+    current working directory.
+    """
+    with open(path, encoding='utf-8', errors='ignore') as f:
+        lines = f.read().splitlines()
+
+    if not any(line.startswith(('diff ', '--- ', '+++ ')) for line in lines):
+        return {os.path.realpath(line.strip())
+                for line in lines if line.strip()}
+
+    files = []
+
+    # Number of the old and new lines left from the current hunk. The lines
+    # of a hunk may look like file headers, so they are skipped.
+    old_left, new_left = 0, 0
+    for line in lines:
+        if old_left > 0 or new_left > 0:
+            if line.startswith('-'):
+                old_left -= 1
+            elif line.startswith('+'):
+                new_left -= 1
+            elif not line.startswith('\\'):
+                old_left -= 1
+                new_left -= 1
+            continue
+
+        hunk = DIFF_HUNK.match(line)
+        if hunk:
+            old_left = int(hunk.group(1) or 1)
+            new_left = int(hunk.group(2) or 1)
+        elif line.startswith(('--- ', '+++ ')):
+            # File headers: '--- a/old_path' and '+++ b/new_path'.
+            name = line[4:].split('\t')[0].strip()
+            if name != '/dev/null':
+                files.append(name[2:] if name.startswith(('a/', 'b/'))
+                             else name)
+        elif line.startswith(('rename from ', 'rename to ')):
+            files.append(line.split(' ', 2)[2].strip())
+
+    return {os.path.realpath(f) for f in files}
+
+
+class DependencyIndex:
+    """
+    Reverse header dependency index which is stored in the given report
+    directory.
+    """
+
+    def __init__(self, output_path: str):
+        self.index_file = os.path.join(output_path, INDEX_FILE)
+        self.__headers = self.__load()
+
+        # Forward index of the translation units for updating them.
+        self.__sources = {}
+        for header, sources in self.__headers.items():
+            for source in sources:
+                self.__sources.setdefault(source, set()).add(header)
+
+    def __load(self) -> Dict[str, Set[str]]:
+        if not os.path.exists(self.index_file):
+            return {}
+
+        try:
+            with open(self.index_file,
+                      encoding='utf-8', errors='ignore') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as err:
+            LOG.warning("Failed to load dependency index from '%s': %s",
+                        self.index_file, err)
+            return {}
+
+        if not isinstance(data, dict) or \
+                data.get('version') != INDEX_VERSION:
+            return {}
+
+        return {header: set(sources)
+                for header, sources in data.get('headers', {}).items()}
+
+    def save(self):
+        """ Write the index to the report directory. """
+        tmp_file = self.index_file + '.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8', errors='ignore') as f:
+                json.dump({'version': INDEX_VERSION,
+                           'headers': {header: sorted(sources)
+                                       for header, sources
+                                       in self.__headers.items()}}, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError as err:
+            LOG.warning("Failed to save dependency index to '%s': %s",
+                        self.index_file, err)
+
+    def update(self, source: str, dependencies: Iterable[str]):
+        """
+        Replace the dependencies of the given source file. If no dependencies
+        are given, the source file is removed from the index.
+        """
+        for header in self.__sources.pop(source, ()):
+            sources = self.__headers[header]
+            sources.discard(source)
+            if not sources:
+                del self.__headers[header]
+
+        dependencies = set(dependencies)
+        if not dependencies:
+            return
+
+        self.__sources[source] = dependencies
+        for header in dependencies:
+            self.__headers.setdefault(header, set()).add(source)
+
+    def get_sources(self) -> Set[str]:
+        """ Return the source files which are in the index. """
+        return set(self.__sources)
+
+    def get_dependent_sources(self, path: str) -> Set[str]:
+        """ Return the source files which include the given file. """
+        return set(self.__headers.get(path, ()))
+
+    def get_affected_sources(self, changed_files: Set[str],
+                             sources: Iterable[str]) -> Set[str]:
+        """
+        Return the source files from the given ones which are affected by the
+        changed files (given by real path). A source file is affected if it
+        has changed, if it includes a changed file or if it isn't in the index
+        so its dependencies are unknown.
+        """
+        indexed = self.get_sources()
+
+        affected = set()
+        for changed_file in changed_files:
+            affected |= self.get_dependent_sources(changed_file)
+
+        sources = set(sources)
+        for source in sources:
+            if source not in indexed or \
+                    os.path.realpath(source) in changed_files:
+                affected.add(source)
+
+        return affected & sources
+
+
+def get_affected_sources(changed_files_path: str, output_path: str,
+                         compile_commands) -> Set[str]:
+    """
+    Return the source files of the compilation database which are affected
+    by the changed files listed in the given file, based on the dependency
+    index of the given report directory.
+    """
+    changed_files = read_changed_files(changed_files_path)
+    LOG.debug("Changed files: %s", ', '.join(sorted(changed_files)))
+
+    sources = set()
+    for entry in compile_commands:
+        source = entry['file']
+        if not os.path.isabs(source):
+            source = os.path.realpath(
+                os.path.join(os.path.abspath(entry['directory']), source))
+        sources.add(source)
+
+    index = DependencyIndex(output_path)
+    affected = index.get_affected_sources(changed_files, sources)
+
+    unknown = sources - index.get_sources()
+    LOG.info("%d of %d source files are affected by %d changed files "
+             "(%d of them are not in the dependency index yet).",
+             len(affected), len(sources), len(changed_files), len(unknown))
+
+    return affected
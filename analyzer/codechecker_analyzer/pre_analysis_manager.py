@@ -146,7 +146,7 @@ def pre_analyze(params):
 
 
 def run_pre_analysis(actions, clangsa_config,
-                     jobs, skip_handlers, ctu_data, statistics_data, manager):
+                     jobs, skip_handlers, ctu_data, statistics_data):
     """
     Run multiple pre analysis jobs before the actual analysis.
     """
@@ -159,7 +159,6 @@ def run_pre_analysis(actions, clangsa_config,
     def signal_handler(signum, _):
         try:
             pool.terminate()
-            manager.shutdown()
         finally:
             sys.exit(128 + signum)
 
@@ -190,10 +189,6 @@ def run_pre_analysis(actions, clangsa_config,
                             ctu_data,
                             statistics_data)
                            for build_action in actions]
-        # FIXME: Ensure all shared data structures are wrapped in manager
-        #        proxy objects before passing them to other processes via
-        #        map_async.
-        #        Note that even deep-copying is known to be insufficient.
         result = pool.map_async(pre_analyze, collect_actions)
         pool.close()
     except Exception:
@@ -0,0 +1,354 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Content-addressed cache of analysis results.
+
+An entry of the cache is identified by the hash of the preprocessed
+translation unit, the version of the analyzer binary, the analyzer command
+and the set of enabled checkers. If none of these changed since a previous
+analysis, the raw output of the analyzer (standard output, standard error and
+the analyzer result file) is restored from the cache instead of running the
+analyzer again.
+"""
+
+
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import time
+import uuid
+
+from typing import Dict, Iterable, List, Optional
+
+from codechecker_common.logger import get_logger
+
+from .analyzers.clangsa.analyzer import ClangSA
+from .analyzers.clangtidy.analyzer import ClangTidy
+from .analyzers.config_handler import CheckerState
+from .analyzers.cppcheck.analyzer import Cppcheck
+from .analyzers.gcc.analyzer import Gcc
+
+LOG = get_logger('analyzer')
+
+# Increase this number if the layout or the key of the cache entries changes
+# so the old entries are not used anymore.
+CACHE_VERSION = "1"
+
+# Analyzers whose whole output is captured by the result handler after the
+# post analysis step. Other analyzers (e.g. Infer) leave their results in
+# separate directories, so they can't be restored from the cache.
+CACHEABLE_ANALYZERS = frozenset([ClangSA.ANALYZER_NAME,
+                                 ClangTidy.ANALYZER_NAME,
+                                 Cppcheck.ANALYZER_NAME,
+                                 Gcc.ANALYZER_NAME])
+
+WORKSPACE_PLACEHOLDER = "<CODECHECKER_WORKSPACE>"
+
+# Compiler flags which should be removed from a build command before
+# preprocessing it, because they change the output of the compiler.
+# The value tells whether the flag has a separate argument.
+_IGNORED_PREPROCESS_FLAGS = {
+    '-o': True,
+    '-c': False,
+    '-M': False,
+    '-MM': False,
+    '-MD': False,
+    '-MMD': False,
+    '-MG': False,
+    '-MP': False,
+    '-MV': False,
+    '-MF': True,
+    '-MT': True,
+    '-MQ': True,
+    '-MJ': True}
+
+_RESULT_FILE = "result"
+_STDOUT_FILE = "stdout"
+_STDERR_FILE = "stderr"
+_METADATA_FILE = "metadata.json"
+
+
+def get_preprocess_command(original_command: str) -> List[str]:
+    """
+    Transform the given build command to a command which writes the
+    preprocessed translation unit to the standard output.
+    """
+    args = shlex.split(original_command)
+
+    cmd = []
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+            continue
+
+        has_separate_arg = _IGNORED_PREPROCESS_FLAGS.get(arg)
+        if has_separate_arg is not None:
+            skip_next = has_separate_arg
+            continue
+
+        if arg.startswith('-o') or arg.startswith('-MF') or \
+                arg.startswith('-MT') or arg.startswith('-MQ') or \
+                arg.startswith('-MJ'):
+            continue
+
+        cmd.append(arg)
+
+    cmd.append('-E')
+    return cmd
+
+
+def get_preprocessed_tu_hash(original_command: str,
+                             directory: str) -> Optional[str]:
+    """
+    Preprocess the translation unit of the given build command and return the
+    SHA-256 hash of the preprocessed output. None is returned if preprocessing
+    failed.
+    """
+    cmd = get_preprocess_command(original_command)
+    LOG.debug_analyzer("Preprocessing for result cache: %s",
+                       ' '.join(shlex.quote(c) for c in cmd))
+
+    tu_hash = hashlib.sha256()
+    try:
+        with subprocess.Popen(cmd,
+                              cwd=directory,
+                              stdin=subprocess.DEVNULL,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL) as proc:
+            for chunk in iter(lambda: proc.stdout.read(1 << 16), b''):
+                tu_hash.update(chunk)
+            proc.wait()
+    except OSError as err:
+        LOG.debug("Failed to preprocess translation unit: %s", err)
+        return None
+
+    if proc.returncode != 0:
+        LOG.debug("Failed to preprocess translation unit (return code %d): "
+                  "%s", proc.returncode, original_command)
+        return None
+
+    return tu_hash.hexdigest()
+
+
+def compute_key(tu_hash: str,
+                analyzer_type: str,
+                analyzer_version: Optional[str],
+                analyzer_cmd: List[str],
+                enabled_checkers: Iterable[str],
+                workspace: str) -> str:
+    """
+    Compute the key of a cache entry.
+
+    The workspace (report directory) path is masked in the analyzer command,
+    so the same entry can be used from different report directories.
+    """
+    key = hashlib.sha256()
+
+    def add(value: str):
+        key.update(value.encode('utf-8', errors='ignore'))
+        key.update(b'\0')
+
+    add(CACHE_VERSION)
+    add(analyzer_type)
+    add(analyzer_version or '')
+    add(tu_hash)
+
+    add(str(len(analyzer_cmd)))
+    for arg in analyzer_cmd:
+        add(arg.replace(workspace, WORKSPACE_PLACEHOLDER))
+
+    for checker in sorted(enabled_checkers):
+        add(checker)
+
+    return key.hexdigest()
+
+
+class ResultCache:
+    """
+    Analysis result cache stored in a local directory. The size of the cache
+    is bounded: least recently used entries are evicted by evict().
+    """
+
+    def __init__(self, cache_dir: str, max_size: int,
+                 analyzer_versions: Dict[str, Optional[str]]):
+        """
+        cache_dir -- Directory of the cache entries.
+        max_size -- Maximum size of the cache in bytes.
+        analyzer_versions -- Version of the analyzer binaries by analyzer
+                             name.
+        """
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        self.analyzer_versions = analyzer_versions
+
+        self.__tmp_dir = os.path.join(self.cache_dir, 'tmp')
+        os.makedirs(self.__tmp_dir, exist_ok=True)
+
+    def __entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get_key(self, source_analyzer, rh,
+                analyzer_cmd: List[str]) -> Optional[str]:
+        """
+        Return the cache key of the analysis which is described by the given
+        source analyzer and result handler. None is returned if the analysis
+        can't be cached.
+        """
+        action = rh.buildaction
+        if action.analyzer_type not in CACHEABLE_ANALYZERS:
+            return None
+
+        tu_hash = get_preprocessed_tu_hash(action.original_command,
+                                           action.directory)
+        if not tu_hash:
+            return None
+
+        enabled_checkers = [
+            name for name, (state, _)
+            in source_analyzer.config_handler.checks().items()
+            if state == CheckerState.ENABLED]
+
+        return compute_key(tu_hash,
+                           action.analyzer_type,
+                           self.analyzer_versions.get(action.analyzer_type),
+                           analyzer_cmd,
+                           enabled_checkers,
+                           rh.workspace)
+
+    def restore(self, key: str, rh, analyzer_cmd: List[str]) -> bool:
+        """
+        Fill the result handler with the analyzer output from the cache entry
+        of the given key and write the analyzer result file. Returns False if
+        there is no usable entry for the key.
+        """
+        entry_dir = self.__entry_dir(key)
+        try:
+            with open(os.path.join(entry_dir, _METADATA_FILE),
+                      encoding='utf-8', errors='ignore') as f:
+                metadata = json.load(f)
+
+            with open(os.path.join(entry_dir, _STDOUT_FILE),
+                      encoding='utf-8', errors='ignore') as f:
+                stdout = f.read()
+
+            with open(os.path.join(entry_dir, _STDERR_FILE),
+                      encoding='utf-8', errors='ignore') as f:
+                stderr = f.read()
+
+            result_file = os.path.join(entry_dir, _RESULT_FILE)
+            if metadata.get('has_result_file'):
+                shutil.copyfile(result_file, rh.analyzer_result_file)
+            elif os.path.exists(rh.analyzer_result_file):
+                os.remove(rh.analyzer_result_file)
+
+            # Refresh the modification time of the entry, this is used by the
+            # LRU eviction.
+            os.utime(entry_dir)
+        except (OSError, ValueError) as err:
+            LOG.debug("Failed to restore result cache entry %s: %s",
+                      key, err)
+            return False
+
+        rh.analyzer_cmd = analyzer_cmd
+        rh.analyzer_returncode = metadata.get('returncode', 0)
+        rh.analyzer_stdout = stdout
+        rh.analyzer_stderr = stderr
+
+        LOG.debug("Analysis result of '%s' with %s is restored from the "
+                  "result cache.", rh.analyzed_source_file,
+                  rh.buildaction.analyzer_type)
+        return True
+
+    def store(self, key: str, rh):
+        """
+        Store the output of the analyzer from the result handler under the
+        given key. Only successful analyses should be stored.
+        """
+        entry_dir = self.__entry_dir(key)
+        if os.path.isdir(entry_dir):
+            return
+
+        tmp_entry_dir = os.path.join(self.__tmp_dir, uuid.uuid4().hex)
+        try:
+            os.makedirs(tmp_entry_dir)
+
+            has_result_file = os.path.exists(rh.analyzer_result_file)
+            if has_result_file:
+                shutil.copyfile(rh.analyzer_result_file,
+                                os.path.join(tmp_entry_dir, _RESULT_FILE))
+
+            with open(os.path.join(tmp_entry_dir, _STDOUT_FILE), 'w',
+                      encoding='utf-8', errors='ignore') as f:
+                f.write(rh.analyzer_stdout)
+
+            with open(os.path.join(tmp_entry_dir, _STDERR_FILE), 'w',
+                      encoding='utf-8', errors='ignore') as f:
+                f.write(rh.analyzer_stderr)
+
+            with open(os.path.join(tmp_entry_dir, _METADATA_FILE), 'w',
+                      encoding='utf-8', errors='ignore') as f:
+                json.dump({
+                    'analyzer_type': rh.buildaction.analyzer_type,
+                    'source': rh.analyzed_source_file,
+                    'returncode': rh.analyzer_returncode,
+                    'has_result_file': has_result_file,
+                    'timestamp': time.time()}, f)
+
+            os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+
+            # The rename is atomic, so concurrent analysis processes never see
+            # partially written entries. If another process stored the same
+            # entry in the meantime, the rename fails and ours is dropped.
+            os.rename(tmp_entry_dir, entry_dir)
+        except OSError as err:
+            LOG.debug("Failed to store result cache entry %s: %s", key, err)
+        finally:
+            shutil.rmtree(tmp_entry_dir, ignore_errors=True)
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the size of the cache
+        fits the size limit.
+        """
+        entries = []
+        total_size = 0
+        for prefix in os.listdir(self.cache_dir):
+            prefix_dir = os.path.join(self.cache_dir, prefix)
+            if prefix == 'tmp' or not os.path.isdir(prefix_dir):
+                continue
+
+            for key in os.listdir(prefix_dir):
+                entry_dir = os.path.join(prefix_dir, key)
+                try:
+                    size = sum(
+                        os.path.getsize(os.path.join(entry_dir, f))
+                        for f in os.listdir(entry_dir))
+                    mtime = os.path.getmtime(entry_dir)
+                except OSError:
+                    continue
+
+                entries.append((mtime, size, entry_dir))
+                total_size += size
+
+        if total_size <= self.max_size:
+            return
+
+        removed = 0
+        for _, size, entry_dir in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+            removed += 1
+
+        LOG.debug("%d entries were evicted from the result cache.", removed)
@@ -0,0 +1,88 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the memory-aware admission control of the analyses. """
+
+
+import time
+import unittest
+
+import multiprocess
+
+from codechecker_analyzer import analysis_admission
+
+
+class BuildAction:
+    def __init__(self, source, analyzer_type='clangsa'):
+        self.source = source
+        self.analyzer_type = analyzer_type
+
+
+def analyze(admission, peak_rss, running, max_running):
+    """ Fake analysis which records the number of concurrent analyses. """
+    with admission.admit(peak_rss):
+        with running.get_lock():
+            running.value += 1
+            max_running.value = max(max_running.value, running.value)
+
+        time.sleep(0.5)
+
+        with running.get_lock():
+            running.value -= 1
+
+
+class AnalysisAdmissionTest(unittest.TestCase):
+    """ Test estimating the memory usage and admitting the analyses. """
+
+    def test_estimate(self):
+        """ Unknown translation units get the average of the analyzer. """
+        a = BuildAction('/a.c')
+        b = BuildAction('/b.c')
+        c = BuildAction('/c.c', 'clang-tidy')
+        history = {'clangsa': {
+            a.source: {'duration': 1.0, 'peak_rss': 100, 'size': 1},
+            '/x.c': {'duration': 1.0, 'peak_rss': 300, 'size': 1}}}
+
+        self.assertEqual(
+            analysis_admission.estimate_peak_rss([a, b, c], history),
+            {('clangsa', '/a.c'): 100,
+             ('clangsa', '/b.c'): 200,
+             ('clang-tidy', '/c.c'): 200})
+
+        self.assertEqual(
+            analysis_admission.estimate_peak_rss([a], {}),
+            {('clangsa', '/a.c'): analysis_admission.DEFAULT_PEAK_RSS})
+
+    def __max_running(self, budget, peaks):
+        admission = analysis_admission.MemoryAdmission(budget)
+        running = multiprocess.Value('i', 0)
+        max_running = multiprocess.Value('i', 0)
+
+        processes = [multiprocess.Process(
+            target=analyze, args=(admission, peak, running, max_running))
+            for peak in peaks]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        return max_running.value
+
+    def test_budget(self):
+        """ Analyses run at the same time only if they fit in the budget. """
+        self.assertEqual(self.__max_running(100, [60, 60, 60]), 1)
+        self.assertEqual(self.__max_running(100, [30, 30, 30]), 3)
+
+        # An analysis larger than the budget is admitted alone.
+        self.assertEqual(self.__max_running(100, [200]), 1)
+
+    def test_no_budget(self):
+        """ There is no admission control without a memory budget. """
+        self.assertIsNone(analysis_admission.create_memory_admission(None))
+        self.assertEqual(
+            analysis_admission.create_memory_admission(100).budget, 100)
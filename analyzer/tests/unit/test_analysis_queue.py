@@ -0,0 +1,151 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the work queue of the distributed analysis. """
+
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import multiprocess
+
+from codechecker_analyzer import analysis_queue
+
+
+def work(output_path, crash=False):
+    """
+    Queue worker which squares the numbers in the queue. If crash is True,
+    the worker exits after claiming the first number without completing it.
+    """
+    queue = None
+    while queue is None or queue.load_context() is None:
+        time.sleep(0.05)
+        queue = analysis_queue.get_current_queue(output_path)
+
+    while not queue.is_done():
+        name = queue.claim()
+        if name is None:
+            time.sleep(0.05)
+            continue
+
+        if crash:
+            os._exit(1)
+
+        number = queue.get_action(name)
+        queue.complete(name, number * number)
+
+
+class AnalysisQueueTest(unittest.TestCase):
+    """ Test publishing, claiming and completing build actions. """
+
+    def setUp(self):
+        self.output_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_path)
+
+    def test_claim(self):
+        """ Actions are claimed in order and only once. """
+        queue = analysis_queue.create_queue(self.output_path)
+        queue.publish({'jobs': 2}, [10, 20])
+
+        worker_queue = analysis_queue.get_current_queue(self.output_path)
+        self.assertEqual(worker_queue.load_context(),
+                         {'context': {'jobs': 2}, 'action_num': 2})
+
+        other_queue = analysis_queue.get_current_queue(self.output_path)
+
+        first = worker_queue.claim()
+        self.assertEqual(worker_queue.get_action(first), 10)
+
+        # The first action was listed by the other worker too.
+        second = other_queue.claim()
+        self.assertEqual(other_queue.get_action(second), 20)
+
+        self.assertIsNone(worker_queue.claim())
+        self.assertIsNone(other_queue.claim())
+
+        worker_queue.complete(first, 'a')
+        other_queue.complete(second, 'b')
+
+        results = {}
+        queue.collect_results(results)
+        self.assertEqual(results, {0: 'a', 1: 'b'})
+
+        self.assertFalse(worker_queue.is_done())
+        queue.finish()
+        self.assertTrue(worker_queue.is_done())
+
+    def test_lease_expiry(self):
+        """ Actions of workers which don't renew their lease are requeued. """
+        queue = analysis_queue.create_queue(self.output_path)
+        queue.publish(None, [10])
+
+        worker_queue = analysis_queue.get_current_queue(self.output_path)
+        name = worker_queue.claim()
+
+        # The lease is seen first, then it is renewed.
+        self.assertEqual(queue.expire_leases(10, 100), 0)
+        self.assertTrue(worker_queue.renew(name))
+        os.utime(os.path.join(worker_queue.running_dir, name), (1, 1))
+        self.assertEqual(queue.expire_leases(10, 105), 0)
+
+        # Not renewed for 10 seconds.
+        self.assertEqual(queue.expire_leases(10, 115), 1)
+        self.assertFalse(worker_queue.renew(name))
+
+        other_queue = analysis_queue.get_current_queue(self.output_path)
+        self.assertEqual(other_queue.claim(), name)
+        self.assertIsNone(worker_queue.claim())
+
+    def test_new_queue(self):
+        """ Workers of the previous queue stop if a new one is created. """
+        queue = analysis_queue.create_queue(self.output_path)
+        queue.publish(None, [10])
+        worker_queue = analysis_queue.get_current_queue(self.output_path)
+
+        analysis_queue.create_queue(self.output_path)
+        self.assertTrue(worker_queue.is_done())
+        self.assertIsNone(worker_queue.claim())
+
+    def test_workers(self):
+        """ Several worker processes analyze the queue, one of them dies. """
+        crashing = multiprocess.Process(target=work,
+                                        args=(self.output_path, True))
+        crashing.start()
+
+        queue = analysis_queue.create_queue(self.output_path)
+        numbers = list(range(50))
+        queue.publish(None, numbers)
+
+        crashing.join()
+
+        workers = [multiprocess.Process(target=work,
+                                        args=(self.output_path,))
+                   for _ in range(3)]
+        for worker in workers:
+            worker.start()
+
+        results = {}
+        expired = 0
+        start = time.time()
+        while len(results) < len(numbers) and time.time() - start < 30:
+            time.sleep(0.05)
+            queue.collect_results(results)
+            expired += queue.expire_leases(0.5, time.time())
+        queue.finish()
+
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(crashing.exitcode, 1)
+        self.assertEqual(expired, 1)
+        self.assertEqual(results, {n: n * n for n in numbers})
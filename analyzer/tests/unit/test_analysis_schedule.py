@@ -0,0 +1,95 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the scheduling of the analysis actions. """
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_analyzer import analysis_schedule
+
+
+class BuildAction:
+    def __init__(self, source, analyzer_type='clangsa'):
+        self.source = source
+        self.analyzer_type = analyzer_type
+
+
+class AnalysisScheduleTest(unittest.TestCase):
+    """ Test ordering the actions and predicting the analysis time. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __source(self, name, size):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('x' * size)
+        return path
+
+    def test_history(self):
+        """ The history is saved and loaded from the report directory. """
+        self.assertEqual(analysis_schedule.load_history(self.tmp_dir), {})
+
+        history = {'clangsa': {'/a.c': {'duration': 1.5,
+                                        'peak_rss': 1024,
+                                        'size': 10}}}
+        analysis_schedule.save_history(self.tmp_dir, history)
+
+        self.assertEqual(analysis_schedule.load_history(self.tmp_dir),
+                         history)
+
+    def test_lpt_order(self):
+        """ Longest analyses are started first. """
+        a = BuildAction(self.__source('a.c', 10))
+        b = BuildAction(self.__source('b.c', 10))
+        c = BuildAction(self.__source('c.c', 400))
+        history = {'clangsa': {
+            a.source: {'duration': 1.0, 'peak_rss': 0, 'size': 10},
+            b.source: {'duration': 8.0, 'peak_rss': 0, 'size': 10}}}
+
+        # c.c is unknown, its size and the average speed of the analyzer
+        # in the history gives 400 * 9.0 / 20 = 180 seconds.
+        self.assertEqual(
+            analysis_schedule.estimate_durations([a, b, c], history),
+            [1.0, 8.0, 180.0])
+
+        actions, makespan, compile_db_makespan = \
+            analysis_schedule.schedule_actions(
+                [a, b, c], analysis_schedule.SCHEDULE_LPT, history, 2)
+
+        self.assertEqual(actions, [c, b, a])
+        self.assertEqual(makespan, 180.0)
+        self.assertEqual(compile_db_makespan, 181.0)
+
+        actions, makespan, compile_db_makespan = \
+            analysis_schedule.schedule_actions(
+                [a, b, c], analysis_schedule.SCHEDULE_COMPILE_DB, history, 2)
+
+        self.assertEqual(actions, [a, b, c])
+        self.assertEqual(makespan, 181.0)
+
+    def test_no_history(self):
+        """ Without history the actions are ordered by source size. """
+        a = BuildAction(self.__source('a.c', 10))
+        b = BuildAction(self.__source('b.c', 30))
+        c = BuildAction(self.__source('c.c', 20))
+
+        actions, makespan, compile_db_makespan = \
+            analysis_schedule.schedule_actions(
+                [a, b, c], analysis_schedule.SCHEDULE_LPT, {}, 2)
+
+        self.assertEqual(actions, [b, c, a])
+        self.assertIsNone(makespan)
+        self.assertIsNone(compile_db_makespan)
@@ -0,0 +1,125 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the persistent cache of the analyzer capability queries. """
+
+
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+import unittest
+
+from unittest import mock
+
+from codechecker_analyzer.analyzers import analyzer_cache
+
+
+class AnalyzerCacheTest(unittest.TestCase):
+    """ Test caching and invalidating the output of analyzer commands. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.old_cache_dir = os.environ.get('CC_CACHE_DIR')
+        os.environ['CC_CACHE_DIR'] = os.path.join(self.tmp_dir, 'cache')
+
+        # Analyzer which counts its runs and prints its arguments.
+        self.runs_file = os.path.join(self.tmp_dir, 'runs')
+        self.analyzer = os.path.join(self.tmp_dir, 'analyzer')
+        self.__write(self.analyzer,
+                     f'#!/bin/sh\necho x >> {self.runs_file}\n'
+                     '[ "$1" = fail ] && exit 1\necho "$@"\n')
+        os.chmod(self.analyzer, os.stat(self.analyzer).st_mode | stat.S_IEXEC)
+
+        self.plugin = os.path.join(self.tmp_dir, 'plugin.so')
+        self.__write(self.plugin, 'plugin')
+
+        analyzer_cache.ENABLED = True
+        analyzer_cache.CACHE = None
+
+    def tearDown(self):
+        analyzer_cache.ENABLED = True
+        analyzer_cache.CACHE = None
+        if self.old_cache_dir is None:
+            del os.environ['CC_CACHE_DIR']
+        else:
+            os.environ['CC_CACHE_DIR'] = self.old_cache_dir
+        shutil.rmtree(self.tmp_dir)
+
+    @staticmethod
+    def __write(path, content):
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(content)
+
+    def __runs(self):
+        if not os.path.exists(self.runs_file):
+            return 0
+        with open(self.runs_file, encoding='utf-8') as f:
+            return len(f.readlines())
+
+    def __query(self, *args, environ=None):
+        return analyzer_cache.check_output([self.analyzer, *args], environ)
+
+    def test_cached_between_processes(self):
+        """ The output is stored on disk and reused by a new process. """
+        self.assertEqual(self.__query('-load', self.plugin),
+                         f'-load {self.plugin}\n')
+        self.assertEqual(self.__runs(), 1)
+
+        # The cache file is written only when the main process exits.
+        self.assertFalse(os.path.exists(os.environ['CC_CACHE_DIR']))
+        analyzer_cache.save()
+
+        analyzer_cache.CACHE = None
+        self.assertEqual(self.__query('-load', self.plugin),
+                         f'-load {self.plugin}\n')
+        self.assertEqual(self.__runs(), 1)
+
+        # Other arguments are queried separately.
+        self.__query('--version')
+        self.assertEqual(self.__runs(), 2)
+
+    def test_invalidation(self):
+        """ Changing the binary or a plugin invalidates the entry. """
+        self.__query('-load', self.plugin)
+
+        self.__write(self.plugin, ' v2')
+        self.__query('-load', self.plugin)
+        self.assertEqual(self.__runs(), 2)
+
+        self.__write(self.analyzer, '\n')
+        self.__query('-load', self.plugin)
+        self.assertEqual(self.__runs(), 3)
+
+        self.__query('-load', self.plugin)
+        self.assertEqual(self.__runs(), 3)
+
+    def test_environment(self):
+        """ The paths of the environment are part of the key. """
+        self.__query('--version')
+        with mock.patch.dict(os.environ, {'CPATH': '/opt/include'}):
+            self.__query('--version')
+            self.__query('--version')
+        self.assertEqual(self.__runs(), 2)
+
+        self.__query('--version', environ={'PATH': '/bin:/usr/bin'})
+        self.assertEqual(self.__runs(), 3)
+
+    def test_failure_and_disable(self):
+        """ Failed commands are not cached and the cache can be disabled. """
+        for _ in range(2):
+            with self.assertRaises(subprocess.CalledProcessError):
+                self.__query('fail')
+        self.assertEqual(self.__runs(), 2)
+
+        analyzer_cache.disable()
+        self.__query('--version')
+        self.__query('--version')
+        self.assertEqual(self.__runs(), 4)
+        self.assertFalse(os.path.exists(os.environ['CC_CACHE_DIR']))
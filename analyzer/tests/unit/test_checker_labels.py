@@ -11,10 +11,40 @@
 
 import json
 import os
+import pickle
 import tempfile
 import unittest
 
-from codechecker_common.checker_labels import CheckerLabels
+from codechecker_common.checker_labels import CheckerLabels, split_label_kv
+
+
+REPO_LABELS_DIR = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'config', 'labels')
+
+
+def labels_of_checker_linear(labels_dir, checker, analyzer=None):
+    """
+    Labels of the checker from the label files: the first checker of the
+    label file which is a prefix of the checker name is used if the checker
+    name is not found.
+    """
+    labels = set()
+    for file_name in os.listdir(os.path.join(labels_dir, 'analyzers')):
+        with open(os.path.join(labels_dir, 'analyzers', file_name),
+                  encoding='utf-8') as f:
+            data = json.load(f)
+
+        if analyzer is not None and data['analyzer'] != analyzer:
+            continue
+
+        checkers = data['labels']
+        if checker not in checkers:
+            checker = next((c for c in checkers if checker.startswith(c)),
+                           checker)
+
+        labels.update(map(split_label_kv, checkers.get(checker, [])))
+
+    return labels
 
 
 class TestCheckerLabels(unittest.TestCase):
@@ -225,3 +255,72 @@ class TestCheckerLabels(unittest.TestCase):
                 'bugprone-undelegated-constructor',
                 'google-objc-global-variable-declaration',
                 'cert-err34-c']))
+
+    def test_checker_name_prefixes(self):
+        """
+        The labels of the first checker which is a prefix of the checker name
+        are used.
+        """
+        labels = {
+            "analyzer": "prefixes",
+            "labels": {
+                "clang-diagnostic": ["severity:MEDIUM"],
+                "clang-diagnostic-unused": ["severity:LOW"],
+                "clang": ["severity:HIGH"],
+                "clang-diagnostic-unused-argument": ["severity:CRITICAL"]
+            }
+        }
+
+        with open(os.path.join(self.labels_dir.name, 'analyzers',
+                               'prefixes.json'), 'w', encoding='utf-8') as f:
+            json.dump(labels, f)
+
+        cl = CheckerLabels(self.labels_dir.name)
+
+        for checker, severity in [
+                ('clang-diagnostic-unused-argument', 'CRITICAL'),
+                ('clang-diagnostic-unused-variable', 'MEDIUM'),
+                ('clang-diagnostic', 'MEDIUM'),
+                ('clang-analyzer', 'HIGH'),
+                ('clan', 'UNSPECIFIED'),
+                ('', 'UNSPECIFIED')]:
+            self.assertEqual(cl.severity(checker, 'prefixes'), severity)
+            self.assertEqual(cl.severity(checker, 'prefixes'), severity)
+
+    def test_same_labels(self):
+        """ The indexed labels of the checkers are the same. """
+        cl = CheckerLabels(REPO_LABELS_DIR)
+
+        checkers = ['clang-diagnostic-unused-argument', 'unknown.Checker',
+                    'core.DivideZero', 'core.DivideZero.Suffix']
+        for analyzer in cl.get_analyzers():
+            for checker in cl.checkers(analyzer)[::20]:
+                checkers.extend([checker, checker + '-suffix', checker[:-1]])
+
+        for checker in checkers:
+            for analyzer in [None, 'clangsa', 'clang-tidy']:
+                expected = labels_of_checker_linear(
+                    REPO_LABELS_DIR, checker, analyzer)
+                self.assertEqual(
+                    set(cl.labels_of_checker(checker, analyzer)), expected,
+                    (checker, analyzer))
+
+    def test_memoized_results(self):
+        """ The memoized results are not changed by the callers. """
+        cl = CheckerLabels(self.labels_dir.name)
+
+        cl.labels_of_checker('globalChecker').append(('profile', 'x'))
+        self.assertEqual(
+            sorted(cl.labels_of_checker('globalChecker')),
+            [('profile', 'security'), ('severity', 'HIGH')])
+
+        security = cl.checkers_by_labels(iter(['profile:security']))
+        self.assertIn('cert-err34-c', security)
+        cl.checkers_by_labels(['profile:security']).clear()
+        self.assertEqual(cl.checkers_by_labels(['profile:security']),
+                         security)
+
+        unpickled = pickle.loads(pickle.dumps(cl))
+        self.assertEqual(unpickled.severity('cert-err34-c-suffix'), 'LOW')
+        self.assertEqual(unpickled.checkers_by_labels(['profile:security']),
+                         security)
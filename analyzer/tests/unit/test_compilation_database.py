@@ -172,3 +172,79 @@ class TestCompilationDatabase(unittest.TestCase):
             os.path.join(TestCompilationDatabase.project_dir, "non_existing"))
 
         self.assertIsNone(comp_db)
+
+    def test_iter_json_array(self):
+        """
+        The JSON array elements are read one by one, even if they are split
+        between the read buffers.
+        """
+        content = [{"directory": "/tmp", "command": "gcc -DX=\"[,]\" a.c",
+                    "file": "a.c"}, 12345, "str]ing", [1, [2]], None]
+
+        json_file = os.path.join(self.project_dir, "array.json")
+        with open(json_file, "w", encoding="utf-8", errors="ignore") as f:
+            f.write(json.dumps(content, indent=4))
+
+        for buffer_size in [1, 3, 7, 1 << 20]:
+            self.assertEqual(
+                list(compilation_database.iter_json_array(
+                    json_file, buffer_size)),
+                content)
+
+        with open(json_file, "w", encoding="utf-8", errors="ignore") as f:
+            f.write('[{"file": "a.c"}, {"file": ')
+
+        with self.assertRaises(ValueError):
+            list(compilation_database.iter_json_array(json_file, 4))
+
+    def test_tee_same_file(self):
+        """
+        A compilation database file can be written to the same file while it
+        is read.
+        """
+        comp_db_file = os.path.join(self.project_dir, "same.json")
+        shutil.copy(TestCompilationDatabase.comp_db_outer, comp_db_file)
+
+        comp_db = compilation_database.gather_compilation_database(
+            comp_db_file)
+        entries = list(compilation_database.tee_compilation_database(
+            comp_db, comp_db_file))
+
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(list(compilation_database.CompilationDatabaseFile(
+            comp_db_file)), entries)
+        self.assertEqual(
+            [f for f in os.listdir(self.project_dir) if f.endswith('.tmp')],
+            [])
+
+    def test_compilation_database_file(self):
+        """
+        A compilation database file is read entry by entry and it is written
+        the same way as json.dump() does.
+        """
+        comp_db = compilation_database.gather_compilation_database(
+            TestCompilationDatabase.comp_db_outer)
+
+        self.assertIsInstance(comp_db,
+                              compilation_database.CompilationDatabaseFile)
+        self.assertEqual(len(comp_db), 2)
+
+        entries = list(comp_db)
+        self.assertEqual(entries[0]["command"], "gcc outer.c")
+
+        for content in [entries, []]:
+            dump_file = os.path.join(self.project_dir, "dump.json")
+            compilation_database.dump_compilation_database(content,
+                                                           dump_file)
+
+            with open(dump_file, encoding="utf-8", errors="ignore") as f:
+                self.assertEqual(f.read(), json.dumps(content, indent=2))
+
+            os.remove(dump_file)
+            self.assertEqual(
+                list(compilation_database.tee_compilation_database(
+                    content, dump_file)),
+                content)
+
+            with open(dump_file, encoding="utf-8", errors="ignore") as f:
+                self.assertEqual(f.read(), json.dumps(content, indent=2))
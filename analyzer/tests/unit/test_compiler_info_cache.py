@@ -0,0 +1,106 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the persistent cache of the implicit compiler information. """
+
+
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from unittest import mock
+
+from codechecker_analyzer.buildlog.compiler_info_cache import \
+    CompilerInfoCache
+from codechecker_analyzer.buildlog.log_parser import ImplicitCompilerInfo
+
+
+class CompilerInfoCacheTest(unittest.TestCase):
+    """ Test storing and invalidating cached compiler information. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.tmp_dir, 'cache',
+                                       'compiler_info.json')
+
+        # Compiler which prints nothing, so every query gives empty results.
+        self.compiler = os.path.join(self.tmp_dir, 'gcc')
+        with open(self.compiler, 'w', encoding='utf-8') as f:
+            f.write('#!/bin/sh\nexit 0\n')
+        os.chmod(self.compiler, os.stat(self.compiler).st_mode | stat.S_IEXEC)
+
+        self.key = ImplicitCompilerInfo.ImplicitInfoSpecifierKey(
+            self.compiler, 'c++', ('-m32',))
+        self.info = {'compiler_includes': ['/usr/include'],
+                     'compiler_standard': '-std=gnu++14',
+                     'target': 'x86_64-linux-gnu'}
+
+        ImplicitCompilerInfo.compiler_info = {}
+
+    def tearDown(self):
+        ImplicitCompilerInfo.compiler_info = {}
+        shutil.rmtree(self.tmp_dir)
+
+    def test_store_and_load(self):
+        """ Entries are kept between cache instances. """
+        cache = CompilerInfoCache(self.cache_file)
+        self.assertIsNone(cache.get(self.key))
+
+        cache.put(self.key, self.info)
+        cache.save()
+
+        cache = CompilerInfoCache(self.cache_file)
+        self.assertEqual(cache.get(self.key), self.info)
+
+    def test_changed_compiler(self):
+        """ Entries are invalid if the compiler binary has changed. """
+        cache = CompilerInfoCache(self.cache_file)
+        cache.put(self.key, self.info)
+        cache.save()
+
+        with open(self.compiler, 'a', encoding='utf-8') as f:
+            f.write('# new version\n')
+
+        cache = CompilerInfoCache(self.cache_file)
+        self.assertIsNone(cache.get(self.key))
+
+    def test_changed_include_path_env(self):
+        """ Entries are invalid if the include path variables change. """
+        with mock.patch.dict(os.environ, {'CPATH': '/opt/include'}):
+            cache = CompilerInfoCache(self.cache_file)
+            cache.put(self.key, self.info)
+            cache.save()
+
+            cache = CompilerInfoCache(self.cache_file)
+            self.assertEqual(cache.get(self.key), self.info)
+
+        with mock.patch.dict(os.environ, {'CPATH': '/usr/local/include'}):
+            cache = CompilerInfoCache(self.cache_file)
+            self.assertIsNone(cache.get(self.key))
+
+    def test_collect(self):
+        """ Cached information is used and the missing is detected. """
+        cache = CompilerInfoCache(self.cache_file)
+        cache.put(self.key, self.info)
+
+        other_key = ImplicitCompilerInfo.ImplicitInfoSpecifierKey(
+            self.compiler, 'c', ())
+        ImplicitCompilerInfo.collect([self.key, other_key, self.key], 2,
+                                     cache)
+
+        self.assertEqual(ImplicitCompilerInfo.compiler_info[self.key],
+                         self.info)
+
+        detected = {'compiler_includes': [],
+                    'compiler_standard': '',
+                    'target': ''}
+        self.assertEqual(ImplicitCompilerInfo.compiler_info[other_key],
+                         detected)
+        self.assertEqual(cache.get(other_key), detected)
@@ -0,0 +1,121 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the header dependency index of the translation units. """
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_analyzer import dependency_index
+from codechecker_analyzer.buildlog import log_parser
+
+
+GIT_DIFF = """diff --git a/include/a.h b/include/a.h
+index 1111111..2222222 100644
+--- a/include/a.h
++++ b/include/a.h
+@@ -1,2 +1,2 @@
+--- removed line starting with two dashes
++++ added line starting with two pluses
+diff --git a/old.c b/old.c
+deleted file mode 100644
+--- a/old.c
++++ /dev/null
+@@ -1 +0,0 @@
+-int x;
+diff --git a/b.h b/c.h
+similarity index 100%
+rename from b.h
+rename to c.h
+"""
+
+
+class DependencyIndexTest(unittest.TestCase):
+    """ Test updating the index and selecting the affected sources. """
+
+    def setUp(self):
+        self.tmp_dir = os.path.realpath(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __path(self, name):
+        return os.path.join(self.tmp_dir, name)
+
+    def __write(self, name, content):
+        with open(self.__path(name), 'w', encoding='utf-8') as f:
+            f.write(content)
+        return self.__path(name)
+
+    def test_changed_files(self):
+        """ Changed files are read from a file list or a diff. """
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.tmp_dir)
+
+            changed = dependency_index.read_changed_files(
+                self.__write('files.txt', 'a.c\n\n/x/b.h\n'))
+            self.assertEqual(changed, {self.__path('a.c'), '/x/b.h'})
+
+            changed = dependency_index.read_changed_files(
+                self.__write('diff.patch', GIT_DIFF))
+            self.assertEqual(changed, {self.__path('include/a.h'),
+                                       self.__path('old.c'),
+                                       self.__path('b.h'),
+                                       self.__path('c.h')})
+        finally:
+            os.chdir(cwd)
+
+    def test_affected_sources(self):
+        """ Sources are affected by their headers and by themselves. """
+        index = dependency_index.DependencyIndex(self.tmp_dir)
+        index.update('/p/a.c', ['/p/a.c', '/p/common.h', '/p/a.h'])
+        index.update('/p/b.c', ['/p/b.c', '/p/common.h'])
+        self.assertFalse(dependency_index.has_index(self.tmp_dir))
+        index.save()
+        self.assertTrue(dependency_index.has_index(self.tmp_dir))
+
+        index = dependency_index.DependencyIndex(self.tmp_dir)
+        sources = ['/p/a.c', '/p/b.c', '/p/new.c']
+
+        # Unknown sources are always affected.
+        self.assertEqual(index.get_affected_sources({'/p/a.h'}, sources),
+                         {'/p/a.c', '/p/new.c'})
+        self.assertEqual(
+            index.get_affected_sources({'/p/common.h'}, sources),
+            {'/p/a.c', '/p/b.c', '/p/new.c'})
+        self.assertEqual(index.get_affected_sources({'/p/b.c'}, sources),
+                         {'/p/b.c', '/p/new.c'})
+
+        # The dependencies of the reanalyzed sources are replaced.
+        index.update('/p/a.c', ['/p/a.c', '/p/a.h'])
+        self.assertEqual(index.get_dependent_sources('/p/common.h'),
+                         {'/p/b.c'})
+
+        index.update('/p/b.c', [])
+        self.assertEqual(index.get_sources(), {'/p/a.c'})
+        self.assertEqual(index.get_dependent_sources('/p/common.h'), set())
+
+    @unittest.skipUnless(shutil.which('gcc'), "gcc is required")
+    def test_collect_dependencies(self):
+        """ The files of a translation unit are collected by the compiler. """
+        os.makedirs(self.__path('include'))
+        header = self.__write('include/a.h', 'int f(void);\n')
+        source = self.__write('main.c', '#include "a.h"\nint x;\n')
+
+        action = log_parser.parse_options({
+            'directory': self.tmp_dir,
+            'command': 'gcc -Iinclude -c main.c -o main.o',
+            'file': 'main.c'})
+
+        dependencies = dependency_index.collect_dependencies(action)
+        self.assertIn(source, dependencies)
+        self.assertIn(header, dependencies)
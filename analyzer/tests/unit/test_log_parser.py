@@ -662,3 +662,38 @@ class LogParserTest(unittest.TestCase):
 
         self.assertEqual(len(build_actions), 3)
         self.assertEqual(build_action.source, file_c_symdir)
+
+    def test_parallel_parsing(self):
+        """
+        Parsing the compilation database in parallel chunks gives the same
+        build actions in the same order as parsing it serially.
+        """
+        compilation_cmd = []
+        for i in range(20):
+            source = os.path.join(self.tmp_dir, f"file_{i % 7}.cpp")
+            compilation_cmd.append({
+                "directory": self.tmp_dir,
+                "command": f"g++ -DNUM={i} -c {source} -o out_{i % 3}.o",
+                "file": source})
+
+        chunk_size = log_parser.PARSE_CHUNK_SIZE
+        try:
+            log_parser.PARSE_CHUNK_SIZE = 3
+
+            for uniqueing in ["none", "alpha", "symlink"]:
+                serial_actions, serial_skipped = \
+                    log_parser.parse_unique_log(
+                        iter(compilation_cmd), self.__this_dir, uniqueing,
+                        jobs=1)
+
+                parallel_actions, parallel_skipped = \
+                    log_parser.parse_unique_log(
+                        iter(compilation_cmd), self.__this_dir, uniqueing,
+                        jobs=3)
+
+                self.assertEqual(
+                    [a.original_command for a in serial_actions],
+                    [a.original_command for a in parallel_actions])
+                self.assertEqual(serial_skipped, parallel_skipped)
+        finally:
+            log_parser.PARSE_CHUNK_SIZE = chunk_size
@@ -0,0 +1,136 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test parsing the analyzer result files in parallel. """
+
+
+import argparse
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from codechecker_report_converter.report import BugPathEvent, File, \
+    Report, report_file
+from codechecker_report_converter.report.hash import get_report_hash, \
+    HashType
+from codechecker_report_converter.stat_cache import get_stat_cache
+
+from codechecker_analyzer.cmd import parse
+from codechecker_common.skiplist_handler import SkipListHandler, \
+    SkipListHandlers
+
+
+class ParseJobsTest(unittest.TestCase):
+    """ Test that the number of parser processes doesn't change the output. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.reports_dir = os.path.join(self.tmp_dir, 'reports')
+        os.makedirs(self.reports_dir)
+
+        header = self.__write_source('common.h', ['int f();\n'] * 5)
+        for i in range(8):
+            lines = [f'int x{j} = {j};\n' for j in range(10)]
+            if i % 3 == 0:
+                lines[1] = '// codechecker_suppress [core.X] fp\n'
+            if i % 2 == 0:
+                lines[4] = '// codechecker_confirmed [core.Y] yes\n'
+            source = self.__write_source(f'main{i}.c', lines)
+
+            # The reports in the header are the same in every result file,
+            # so they are deduplicated.
+            reports = [self.__create_report(source, 3, 'core.X'),
+                       self.__create_report(source, 6, 'core.Y'),
+                       self.__create_report(header, 2, 'core.X')]
+            report_file.create(
+                os.path.join(self.reports_dir, f'main{i}.c_clangsa.plist'),
+                reports)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __write_source(self, file_name, lines):
+        path = os.path.join(self.tmp_dir, file_name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+
+        # Source files newer than the result files are considered as changed.
+        os.utime(path, (1, 1))
+        get_stat_cache().invalidate(path)
+        return path
+
+    @staticmethod
+    def __create_report(path, line, checker_name):
+        file = File(path)
+        report = Report(file, line, 1, f'{checker_name} message', checker_name,
+                        analyzer_name='clangsa',
+                        bug_path_events=[BugPathEvent('e', file, line, 1)])
+        report.report_hash = get_report_hash(report, HashType.PATH_SENSITIVE)
+        return report
+
+    def __export(self, jobs, export):
+        output_path = os.path.join(self.tmp_dir, f'{jobs}.{export}')
+        args = argparse.Namespace(input=[self.reports_dir],
+                                  input_format='plist',
+                                  review_status=['confirmed', 'unreviewed'],
+                                  export=export,
+                                  output_path=output_path,
+                                  jobs=jobs)
+
+        # The checker labels are not needed, other tests may replace them.
+        context = SimpleNamespace(checker_labels=None)
+        with mock.patch.object(parse.analyzer_context, 'get_context',
+                               return_value=context), \
+                self.assertRaises(SystemExit) as exit_status:
+            parse.main(args)
+        self.assertEqual(exit_status.exception.code, 2)
+
+        with open(output_path, encoding='utf-8') as f:
+            return f.read()
+
+    def test_same_export(self):
+        """ The exported reports are the same with any number of jobs. """
+        for export in ['json', 'baseline']:
+            self.assertEqual(self.__export(1, export),
+                             self.__export(3, export))
+
+    def test_parse_result_file(self):
+        """ Skipped reports are dropped and review statuses are set. """
+        skip_handlers = SkipListHandlers()
+        skip_handlers.append(SkipListHandler('-*/common.h'))
+        parse.init_worker(None, skip_handlers)
+
+        parsed_file = parse.parse_result_file(
+            (os.path.join(self.reports_dir, 'main0.c_clangsa.plist'), None))
+
+        self.assertIsNone(parsed_file.error)
+        self.assertEqual(
+            [(r.checker_name, r.review_status.status)
+             for r in parsed_file.reports],
+            [('core.X', 'false_positive'), ('core.Y', 'confirmed')])
+        self.assertEqual(
+            [c.line.strip() for c in parsed_file.source_comments],
+            ['// codechecker_suppress [core.X] fp',
+             '// codechecker_confirmed [core.Y] yes'])
+
+    def test_ambiguous_source_comment(self):
+        """ An ambiguous source code comment is reported as an error. """
+        self.__write_source('main1.c',
+                            ['// codechecker_suppress [core.X] a\n',
+                             '// codechecker_confirmed [core.X] b\n'] +
+                            ['int x;\n'] * 8)
+        parse.init_worker(None, SkipListHandlers())
+
+        parsed_file = parse.parse_result_file(
+            (os.path.join(self.reports_dir, 'main1.c_clangsa.plist'), None))
+
+        self.assertEqual(parsed_file.reports, [])
+        self.assertIn('Multiple source code comments', parsed_file.error)
@@ -0,0 +1,128 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the analysis result cache. """
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_analyzer import result_cache
+from codechecker_analyzer.result_cache import ResultCache
+
+
+class BuildAction:
+    directory = '/tmp'
+    analyzer_type = 'clang-tidy'
+    original_command = 'g++ -c main.cpp -o main.o'
+
+
+class FakeResultHandler:
+    """ Result handler which only holds the analyzer output. """
+
+    def __init__(self, workspace):
+        self.buildaction = BuildAction()
+        self.workspace = workspace
+        self.analyzed_source_file = 'main.cpp'
+        self.analyzer_result_file = os.path.join(workspace, 'main.plist')
+        self.analyzer_cmd = []
+        self.analyzer_returncode = 1
+        self.analyzer_stdout = ''
+        self.analyzer_stderr = ''
+
+
+class ResultCacheTest(unittest.TestCase):
+    """ Test storing, restoring and evicting cache entries. """
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.workspace = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+        shutil.rmtree(self.workspace)
+
+    def test_preprocess_command(self):
+        """ Output and dependency file flags are removed. """
+        cmd = result_cache.get_preprocess_command(
+            'g++ -c main.cpp -o main.o -MD -MF main.d -MTtarget -DVAR=1')
+
+        self.assertEqual(cmd, ['g++', 'main.cpp', '-DVAR=1', '-E'])
+
+    def test_key(self):
+        """ The key depends on every input but the workspace. """
+        key = result_cache.compute_key(
+            'tu', 'clangsa', '18.1.0',
+            ['clang', '-o', '/ws1/main.plist'], ['core.DivideZero'], '/ws1')
+
+        self.assertEqual(key, result_cache.compute_key(
+            'tu', 'clangsa', '18.1.0',
+            ['clang', '-o', '/ws2/main.plist'], ['core.DivideZero'], '/ws2'))
+
+        self.assertNotEqual(key, result_cache.compute_key(
+            'tu2', 'clangsa', '18.1.0',
+            ['clang', '-o', '/ws1/main.plist'], ['core.DivideZero'], '/ws1'))
+
+        self.assertNotEqual(key, result_cache.compute_key(
+            'tu', 'clangsa', '19.1.0',
+            ['clang', '-o', '/ws1/main.plist'], ['core.DivideZero'], '/ws1'))
+
+        self.assertNotEqual(key, result_cache.compute_key(
+            'tu', 'clangsa', '18.1.0',
+            ['clang', '-O2', '-o', '/ws1/main.plist'], ['core.DivideZero'],
+            '/ws1'))
+
+        self.assertNotEqual(key, result_cache.compute_key(
+            'tu', 'clangsa', '18.1.0',
+            ['clang', '-o', '/ws1/main.plist'], [], '/ws1'))
+
+    def test_store_and_restore(self):
+        """ The stored analyzer output is restored into the workspace. """
+        cache = ResultCache(self.cache_dir, 1024 * 1024, {})
+
+        rh = FakeResultHandler(self.workspace)
+        self.assertFalse(cache.restore('abcd', rh, ['clang-tidy']))
+
+        rh.analyzer_returncode = 0
+        rh.analyzer_stdout = 'stdout'
+        rh.analyzer_stderr = 'stderr'
+        with open(rh.analyzer_result_file, 'w', encoding='utf-8') as f:
+            f.write('result')
+        cache.store('abcd', rh)
+
+        os.remove(rh.analyzer_result_file)
+        restored_rh = FakeResultHandler(self.workspace)
+        self.assertTrue(cache.restore('abcd', restored_rh, ['clang-tidy']))
+
+        self.assertEqual(restored_rh.analyzer_returncode, 0)
+        self.assertEqual(restored_rh.analyzer_stdout, 'stdout')
+        self.assertEqual(restored_rh.analyzer_stderr, 'stderr')
+        self.assertEqual(restored_rh.analyzer_cmd, ['clang-tidy'])
+        with open(restored_rh.analyzer_result_file, encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'result')
+
+    def test_evict(self):
+        """ Least recently used entries are evicted first. """
+        cache = ResultCache(self.cache_dir, 2500, {})
+
+        rh = FakeResultHandler(self.workspace)
+        rh.analyzer_returncode = 0
+        rh.analyzer_stdout = 'x' * 1000
+
+        for i, key in enumerate(['aa01', 'bb02', 'cc03']):
+            cache.store(key, rh)
+            entry_dir = os.path.join(self.cache_dir, key[:2], key)
+            os.utime(entry_dir, (i, i))
+
+        cache.evict()
+
+        self.assertFalse(cache.restore('aa01', rh, []))
+        self.assertTrue(cache.restore('bb02', rh, []))
+        self.assertTrue(cache.restore('cc03', rh, []))
@@ -7,13 +7,39 @@
 # -------------------------------------------------------------------------
 
 
+import fnmatch
 import os
+import pickle
 import unittest
 
+import yaml
+
 from codechecker_common.review_status_handler import ReviewStatusHandler
+from codechecker_report_converter.report import File, Report
 from libtest import env
 
 
+def review_status_linear(rules, report):
+    """ Check the rules of the config file in order. """
+    for rule in rules:
+        filters = rule['filters']
+        if 'filepath' in filters and not fnmatch.fnmatch(
+                report.file.original_path, filters['filepath']):
+            continue
+
+        if 'checker_name' in filters and \
+                report.checker_name != filters['checker_name']:
+            continue
+
+        if 'report_hash' in filters and \
+                not report.report_hash.startswith(filters['report_hash']):
+            continue
+
+        return rule['actions']['review_status']
+
+    return None
+
+
 class ReviewStatusHandlerTest(unittest.TestCase):
     """
     Test the build command escaping and execution.
@@ -255,6 +281,65 @@ $version: 1
                 "should contain the key 'rules' with a non-empty list of"):
             self.rshandler.set_review_status_config(rscfg_file)
 
+    def test_first_matching_rule(self):
+        """ The first matching rule of the config file is used. """
+        rules = [
+            {'filters': {'report_hash': 'ab12'},
+             'actions': {'review_status': 'confirmed'}},
+            {'filters': {'report_hash': 'ab'},
+             'actions': {'review_status': 'intentional'}},
+            {'filters': {'filepath': '/src/*/test_*.c',
+                         'checker_name': 'core.DivideZero'},
+             'actions': {'review_status': 'false_positive'}},
+            {'filters': {'filepath': '/src/lib/a.c'},
+             'actions': {'review_status': 'confirmed'}},
+            {'filters': {'report_hash': 'cd34',
+                         'checker_name': 'core.NullDereference'},
+             'actions': {'review_status': 'false_positive'}},
+            {'filters': {'checker_name': 'core.DivideZero'},
+             'actions': {'review_status': 'intentional'}},
+            {'filters': {'filepath': '/src/*'},
+             'actions': {'review_status': 'false_positive'}},
+            {'filters': {'filepath': '/src/lib/a.c',
+                         'report_hash': ''},
+             'actions': {'review_status': 'intentional'}},
+            {'filters': {'filepath': '*.h'},
+             'actions': {'review_status': 'confirmed'}}]
+
+        # Many rules with full report hashes, like the generated files.
+        rules.extend(
+            {'filters': {'report_hash': f'{i:032x}'},
+             'actions': {'review_status': 'false_positive'}}
+            for i in range(1000))
+
+        paths = ['/src/lib/a.c', '/src/lib/test_a.c', '/src/a.h', '/a.h',
+                 '/other/a.c', '/src']
+        checkers = ['core.DivideZero', 'core.NullDereference', 'other']
+        hashes = ['ab12ef', 'ab', 'a', 'cd34ef', 'ef', '', f'{10:032x}',
+                  f'{10:032x}0']
+
+        for rotate in [0, 3, 7]:
+            rotated = rules[rotate:] + rules[:rotate]
+            rscfg_file = self.__put_in_review_status_cfg_file(
+                yaml.dump({'$version': 1, 'rules': rotated}))
+            self.rshandler.set_review_status_config(rscfg_file)
+            unpickled = pickle.loads(pickle.dumps(self.rshandler))
+
+            for path in paths:
+                for checker in checkers:
+                    for report_hash in hashes:
+                        report = Report(File(path), 1, 1, 'message', checker,
+                                        report_hash=report_hash)
+                        expected = review_status_linear(rotated, report)
+
+                        for handler in [self.rshandler, unpickled]:
+                            review_status = \
+                                handler.get_review_status_from_config(report)
+                            self.assertEqual(
+                                review_status.status if review_status
+                                else None, expected,
+                                (rotate, path, checker, report_hash))
+
     # TODO: I'm not sure if we can check this. The yaml parser accepts this and
     # later there is no opportunity to check double keys because we have a
     # valid Python object only.
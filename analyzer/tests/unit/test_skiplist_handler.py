@@ -0,0 +1,145 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the compiled matcher of the skip list handler. """
+
+
+import fnmatch
+import os
+import pickle
+import re
+import unittest
+from unittest import mock
+
+from codechecker_common import skiplist_handler
+from codechecker_common.skiplist_handler import SkipListHandler, \
+    SkipListHandlers
+
+
+SKIP_LINES = [
+    '+/dir/check.this.file',
+    '-/dir/*',
+    '-/skip/all/source/in/directory*',
+    '+/project/lib/keep.c',
+    '-/project/lib',
+    '-/project/lib/other.c',
+    '+/project/*/test_*.c',
+    '-*/generated/*',
+    '-/project/src/mod?.c',
+    '-/project/src/[ab]*.h',
+    '+/project/src/',
+    '-/project/src/',
+    '+*.cpp',
+    '-/project/',
+    '- /with/whitespace/  ',
+    '-./relative/../path']
+
+PATHS = [
+    '/dir/check.this.file', '/dir/check.this.file2', '/dir/other.c',
+    '/dirx/a.c', '/skip/all/source/in/directory/a.c',
+    '/skip/all/source/in/directory2', '/project/lib/keep.c',
+    '/project/lib/keep.cpp', '/project/lib/other.c', '/project/libx.c',
+    '/project/app/test_main.c', '/project/app/main.c',
+    '/project/generated/a.c', '/project/src/mod1.c', '/project/src/mod12.c',
+    '/project/src/a.h', '/project/src/c.h', '/project/src/main.c',
+    '/project/main.cpp', '/project/main.c', '/other/main.c', '/',
+    '/with/whitespace/a.c', 'path/a.c', 'relative/a.c', '']
+
+
+def should_skip_linear(skip_lines, path):
+    """ Try the regular expression of every skip line in order. """
+    for line in skip_lines:
+        pattern = os.path.normpath(line[1:].strip()) + '*'
+        if re.match(fnmatch.translate(pattern), path):
+            return line[0] == '-'
+    return False
+
+
+class SkipListHandlerTest(unittest.TestCase):
+    """ The first matching skip line decides whether a file is skipped. """
+
+    def __assert_same(self, skip_lines):
+        handler = SkipListHandler('\n'.join(skip_lines))
+        for path in PATHS:
+            self.assertEqual(handler.should_skip(path),
+                             should_skip_linear(skip_lines, path),
+                             (skip_lines, path))
+
+    def test_first_match(self):
+        """ Plain and wildcard lines are matched in order. """
+        self.__assert_same(SKIP_LINES)
+        self.__assert_same(list(reversed(SKIP_LINES)))
+
+        for i in range(len(SKIP_LINES)):
+            self.__assert_same(SKIP_LINES[i:] + SKIP_LINES[:i])
+
+    def test_examples(self):
+        """ The examples of the skip file format. """
+        handler = SkipListHandler(
+            '# Comment\n'
+            '-/skip/all/source/in/directory*\n'
+            '-/do/not/check/this.file\n'
+            '+/dir/check.this.file\n'
+            '-/dir/*\n'
+            'malformed\n')
+
+        self.assertTrue(handler.should_skip('/skip/all/source/in/directory'))
+        self.assertTrue(handler.should_skip('/do/not/check/this.file'))
+        self.assertFalse(handler.should_skip('/dir/check.this.file'))
+        self.assertTrue(handler.should_skip('/dir/other.file'))
+        self.assertFalse(handler.should_skip('/other/file'))
+        self.assertEqual(len(handler.skip_file_lines), 5)
+
+    def test_overwrite_skip_content(self):
+        """ The memoized decisions are dropped with the old lines. """
+        handler = SkipListHandler('-/dir/*')
+        self.assertTrue(handler.should_skip('/dir/a.c'))
+
+        handler.overwrite_skip_content(['+/dir/a.c', '-*'])
+        self.assertFalse(handler.should_skip('/dir/a.c'))
+        self.assertTrue(handler.should_skip('/dir/b.c'))
+
+    def test_memo(self):
+        """ The decisions are memoized up to a limit. """
+        handler = SkipListHandler('-/dir/*')
+        with mock.patch.object(skiplist_handler, 'MAX_MEMO_SIZE', 2), \
+                mock.patch.object(skiplist_handler._SkipMatcher,
+                                  'should_skip', return_value=True) as match:
+            for path in ['/dir/a.c', '/dir/b.c', '/dir/a.c', '/dir/c.c',
+                         '/dir/c.c']:
+                self.assertTrue(handler.should_skip(path))
+
+            self.assertEqual(match.call_count, 3)
+
+    def test_pickle(self):
+        """ The pickled handlers make the same decisions. """
+        handlers = SkipListHandlers([SkipListHandler('\n'.join(SKIP_LINES)),
+                                     SkipListHandler('-/other/*')])
+        handlers.should_skip('/project/main.c')
+
+        unpickled = pickle.loads(pickle.dumps(handlers))
+        self.assertEqual(unpickled[0].skip_file_lines,
+                         handlers[0].skip_file_lines)
+
+        for path in PATHS:
+            self.assertEqual(unpickled.should_skip(path),
+                             handlers.should_skip(path), path)
+
+    def test_many_lines(self):
+        """ Thousands of plain and wildcard lines can be compiled. """
+        skip_lines = []
+        for i in range(2000):
+            skip_lines.append(f'-/project/module_{i}/' if i % 2 else
+                              f'+/project/*/module_{i}/*.c')
+
+        handler = SkipListHandler('\n'.join(skip_lines))
+        for i in range(0, 2000, 97):
+            for path in [f'/project/module_{i}/a.c', f'/project/module_{i}',
+                         f'/project/x/module_{i}/a.c']:
+                self.assertEqual(handler.should_skip(path),
+                                 should_skip_linear(skip_lines, path), path)
@@ -12,10 +12,15 @@
 
 
 import os
+import shutil
+import tempfile
 import unittest
 
+from codechecker_report_converter.source_cache import SourceCache
+
 from codechecker_common.source_code_comment_handler import \
-    SourceCodeComment, SourceCodeCommentHandler
+    SourceCodeComment, SourceCodeCommentHandler, SourceCodeCommentIndex, \
+    SpellException
 
 
 class SourceCodeCommentTestCase(unittest.TestCase):
@@ -770,3 +775,73 @@ class SourceCodeCommentTestCase(unittest.TestCase):
         current_line_comments = sc_handler.filter_source_line_comments(
             self.__tmp_srcfile_3, bug_line, 'my.dummy')
         self.assertEqual(len(current_line_comments), 0)
+
+
+class SourceCodeCommentIndexTestCase(unittest.TestCase):
+    """The comment index returns the same comments as the handler."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    @staticmethod
+    def __get_comments(sc_handler, fp, line):
+        try:
+            return sc_handler.get_source_line_comments(fp, line)
+        except SpellException as ex:
+            return str(ex)
+
+    def __assert_same_comments(self, file_path):
+        sc_handler = SourceCodeCommentHandler()
+        source_file = SourceCache().get(file_path)
+        index = SourceCodeCommentIndex(source_file)
+
+        with open(file_path, encoding='utf-8', errors='ignore') as f:
+            line_count = len(f.readlines())
+            for line in range(0, line_count + 3):
+                expected = self.__get_comments(sc_handler, f, line)
+                self.assertEqual(
+                    self.__get_comments(sc_handler, index, line), expected)
+
+                # The cached comments are returned again.
+                self.assertEqual(
+                    self.__get_comments(sc_handler, index, line), expected)
+
+    def test_same_comments(self):
+        """Every line of the test files has the same comments."""
+        test_src_dir = os.path.join(
+            os.path.dirname(__file__), 'source_code_comment_test_files')
+        for file_name in ['test_file_1', 'test_file_2', 'test_file_3']:
+            self.__assert_same_comments(os.path.join(test_src_dir, file_name))
+
+    def test_same_comments_edge_cases(self):
+        """Misspelled, multi-line and unterminated C style comments."""
+        file_path = os.path.join(self.tmp_dir, 'main.c')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write('// codechecker_suppress [all] first line\n'
+                    'int a;\n'
+                    '// codechecker_suppresss [my.checker] misspelled\n'
+                    'int b;\n'
+                    '/* codechecker_confirmed [my.checker] multi\n'
+                    ' * line\n'
+                    ' */\n'
+                    'int c;\n'
+                    'int d; /* codechecker_intentional [all] after code */\n'
+                    'int e;\n'
+                    'code */\n'
+                    'int f;\n'
+                    '/**/ // codechecker_false_positive [all] both\n')
+
+        self.__assert_same_comments(file_path)
+
+    def test_no_comments(self):
+        """The file is not indexed if it has no CodeChecker comments."""
+        file_path = os.path.join(self.tmp_dir, 'main.c')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write('// comment\nint a;\n')
+
+        index = SourceCodeCommentIndex(SourceCache().get(file_path))
+        self.assertFalse(index.has_comments)
+        self.assertEqual(index.get_source_line_comments(2), [])
@@ -0,0 +1,178 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the batched clang-tidy analysis. """
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import yaml
+
+from codechecker_analyzer.analyzers.clangtidy import batch
+from codechecker_analyzer.buildlog.build_action import BuildAction
+
+
+TIDY_OUTPUT = """\
+/src/a.c:3:5: warning: narrowing conversion [bugprone-narrowing]
+    3 |     int x = 1.5;
+      |         ^
+/src/include/h.h:1:1: warning: header problem [misc-header]
+    1 | int f();
+      | ^
+/src/b.c:2:1: warning: first in b [misc-b]
+    2 | int y;
+      | ^
+/src/b.c:1:1: note: declared here
+/src/a.c:7:1: warning: second in a [misc-a]
+"""
+
+
+TIDY_FIXITS = """\
+---
+MainSourceFile: '/src/a.c'
+Diagnostics:
+  - DiagnosticName: bugprone-narrowing
+    DiagnosticMessage:
+      Message: narrowing conversion
+      FilePath: '/src/a.c'
+      FileOffset: 20
+      Replacements: []
+  - DiagnosticName: misc-header
+    DiagnosticMessage:
+      Message: header problem
+      FilePath: '/src/include/h.h'
+      FileOffset: 0
+      Replacements:
+        - FilePath: '/src/include/h.h'
+          Offset: 0
+          Length: 3
+          ReplacementText: 'long'
+  - DiagnosticName: misc-b
+    DiagnosticMessage:
+      Message: first in b
+      FilePath: '/src/b.c'
+      FileOffset: 7
+      Replacements: []
+...
+"""
+
+
+def create_action(source, analyzer_type='clang-tidy', options=None):
+    return BuildAction(
+        analyzer_options=options or ['-DFOO'],
+        compiler_includes=[],
+        compiler_standard='',
+        analyzer_type=analyzer_type,
+        original_command=f'gcc -c {source}',
+        directory='/src',
+        output='',
+        lang='c',
+        target='',
+        source=source,
+        arch='',
+        action_type=BuildAction.COMPILE)
+
+
+class TidyBatchTest(unittest.TestCase):
+    """ Test grouping the build actions and splitting the output. """
+
+    def test_create_batches(self):
+        """ Compatible clang-tidy build actions are batched in order. """
+        actions = [create_action(f'/src/{i}.c') for i in range(5)]
+        other = create_action('/src/x.c', options=['-DBAR'])
+        clangsa = create_action('/src/0.c', 'clangsa')
+        duplicate = create_action('/src/0.c')
+
+        items = batch.create_batches(
+            [actions[0], clangsa, actions[1], other, actions[2], duplicate,
+             actions[3], actions[4]], 'clang-tidy', 4, 1)
+
+        # A source file is analyzed only once in a batch.
+        self.assertEqual(items, [
+            [actions[0], actions[1], actions[2]], clangsa, other,
+            [duplicate, actions[3], actions[4]]])
+
+    def test_batch_size_by_jobs(self):
+        """ Every job gets a batch if there are few build actions. """
+        actions = [create_action(f'/src/{i}.c') for i in range(4)]
+
+        self.assertEqual(batch.create_batches(actions, 'clang-tidy', 8, 2),
+                         [actions[:2], actions[2:]])
+
+        self.assertEqual(batch.create_batches(actions, 'clang-tidy', 8, 4),
+                         actions)
+
+        self.assertEqual(batch.create_batches(actions, 'clang-tidy', 1, 1),
+                         actions)
+
+    def test_split_output(self):
+        """ Diagnostics go to their source, header ones to the first. """
+        outputs = batch.split_output(TIDY_OUTPUT,
+                                     ['/src/a.c', 'b.c', '/src/c.c'], '/src')
+
+        self.assertEqual(outputs['/src/a.c'], """\
+/src/a.c:3:5: warning: narrowing conversion [bugprone-narrowing]
+    3 |     int x = 1.5;
+      |         ^
+/src/include/h.h:1:1: warning: header problem [misc-header]
+    1 | int f();
+      | ^
+/src/a.c:7:1: warning: second in a [misc-a]
+""")
+        self.assertEqual(outputs['b.c'], """\
+/src/b.c:2:1: warning: first in b [misc-b]
+    2 | int y;
+      | ^
+/src/b.c:1:1: note: declared here
+""")
+        self.assertEqual(outputs['/src/c.c'], '')
+
+    def test_failed_sources(self):
+        """ Sources which couldn't be compiled are found in stderr. """
+        stderr = "2 warnings generated.\n" \
+                 "Error while processing /src/b.c.\n" \
+                 "Error while processing /other/d.c.\n"
+
+        self.assertEqual(
+            batch.get_failed_sources(stderr, ['/src/a.c', 'b.c'], '/src'),
+            {'b.c'})
+
+    def test_split_fixits(self):
+        """ Fixits go to their source, header ones to the first. """
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            fixit_files = {source: os.path.join(tmp_dir, f"{i}.yaml")
+                           for i, source
+                           in enumerate(['/src/a.c', 'b.c', '/src/c.c'])}
+            with open(fixit_files['/src/a.c'], 'w',
+                      encoding='utf-8') as f:
+                f.write(TIDY_FIXITS)
+
+            batch.split_fixits(fixit_files['/src/a.c'], fixit_files, '/src')
+
+            fixits = {}
+            for source, fixit_file in fixit_files.items():
+                with open(fixit_file, encoding='utf-8') as f:
+                    fixits[source] = yaml.safe_load(f)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+        self.assertEqual(
+            [d['DiagnosticName'] for d in fixits['/src/a.c']['Diagnostics']],
+            ['bugprone-narrowing', 'misc-header'])
+        self.assertEqual(
+            [d['DiagnosticName'] for d in fixits['b.c']['Diagnostics']],
+            ['misc-b'])
+        self.assertEqual(fixits['b.c']['MainSourceFile'], '/src/b.c')
+        self.assertEqual(fixits['/src/c.c']['Diagnostics'], [])
+        self.assertEqual(
+            fixits['/src/a.c']['Diagnostics'][1]['DiagnosticMessage']
+            ['Replacements'][0]['ReplacementText'], 'long')
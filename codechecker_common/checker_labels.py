@@ -10,7 +10,7 @@ import os
 from typing import Any, cast, DefaultDict, Dict, Iterable, List, Optional, \
     Set, Tuple, Union
 
-from codechecker_common.util import load_json
+from codechecker_common.util import load_json, PrefixTrie
 
 
 def split_label_kv(key_value: str) -> Tuple[str, str]:
@@ -63,6 +63,38 @@ class CheckerLabels:
         self.__data = self.__union_label_files(label_json_files)
         self.__check_json_format(self.__data)
 
+        self.__init_indexes()
+
+    def __init_indexes(self):
+        """
+        The label lookups are called for every report, so the checker name
+        prefixes are indexed and the results are memoized.
+        """
+        # Prefix index of the checker names of every analyzer, built on the
+        # first lookup of an unknown checker name.
+        self.__prefix_indexes: Dict[str, PrefixTrie] = {}
+
+        self.__labels_memo: Dict[Tuple[str, Optional[str]],
+                                 Tuple[Tuple[str, str], ...]] = {}
+        self.__severity_memo: Dict[Tuple[str, Optional[str]], str] = {}
+        self.__checkers_by_labels_memo: Dict[
+            Tuple[Tuple[str, ...], Optional[str]], Tuple[str, ...]] = {}
+
+    def __getstate__(self):
+        # The indexes and the memoized results are built again in the
+        # processes which get the checker labels.
+        state = self.__dict__.copy()
+        for key in ['_CheckerLabels__prefix_indexes',
+                    '_CheckerLabels__labels_memo',
+                    '_CheckerLabels__severity_memo',
+                    '_CheckerLabels__checkers_by_labels_memo']:
+            del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__init_indexes()
+
     def __union_label_files(
         self,
         label_files: Iterable[str]
@@ -171,18 +203,25 @@ class CheckerLabels:
         analyzer -- An optional analyzer name of which checkers are searched.
                     By default all analyzers are searched.
         """
-        collection = []
+        filter_labels = tuple(filter_labels)
+        memo_key = (filter_labels, analyzer)
 
-        label_set = set(map(split_label_kv, filter_labels))
+        collection = self.__checkers_by_labels_memo.get(memo_key)
+        if collection is None:
+            label_set = set(map(split_label_kv, filter_labels))
 
-        for _, checkers in self.__get_analyzer_data(analyzer):
-            for checker, labels in checkers.items():
-                labels = set(map(split_label_kv, labels))
+            checker_names = []
+            for _, checkers in self.__get_analyzer_data(analyzer):
+                for checker, labels in checkers.items():
+                    labels = set(map(split_label_kv, labels))
 
-                if labels.intersection(label_set):
-                    collection.append(checker)
+                    if labels.intersection(label_set):
+                        checker_names.append(checker)
 
-        return collection
+            collection = tuple(checker_names)
+            self.__checkers_by_labels_memo[memo_key] = collection
+
+        return list(collection)
 
     def label_of_checker(
         self,
@@ -220,7 +259,15 @@ class CheckerLabels:
         Shorthand for the following call:
         checker_labels.label_of_checker(checker, 'severity', analyzer)
         """
-        return cast(str, self.label_of_checker(checker, 'severity', analyzer))
+        memo_key = (checker, analyzer)
+
+        severity = self.__severity_memo.get(memo_key)
+        if severity is None:
+            severity = cast(
+                str, self.label_of_checker(checker, 'severity', analyzer))
+            self.__severity_memo[memo_key] = severity
+
+        return severity
 
     def labels_of_checker(
         self,
@@ -233,22 +280,49 @@ class CheckerLabels:
         then its prefixes are also searched. For example "clang-diagnostic" in
         the config file matches "clang-diagnostic-unused-argument".
         """
+        memo_key = (checker, analyzer)
+
+        memo = self.__labels_memo.get(memo_key)
+        if memo is not None:
+            return list(memo)
+
         labels: List[Tuple[str, str]] = []
 
-        for _, checkers in self.__get_analyzer_data(analyzer):
+        for a, checkers in self.__get_analyzer_data(analyzer):
             c: Optional[str] = checker
 
             if c not in checkers:
-                c = next(filter(
-                    lambda c: checker.startswith(cast(str, c)),
-                    iter(checkers.keys())), None)
+                # The first checker of the label file which is a prefix of
+                # the checker name.
+                c = self.__get_prefix_index(a, checkers).first_match(checker)
 
             labels.extend(map(split_label_kv, checkers.get(c, [])))
 
         # TODO set() is used for uniqueing results in case a checker name is
         # provided by multiple analyzers. This will be unnecessary when we
         # cover this case properly.
-        return list(set(labels))
+        memo = tuple(set(labels))
+        self.__labels_memo[memo_key] = memo
+
+        return list(memo)
+
+    def __get_prefix_index(
+        self,
+        analyzer: str,
+        checkers: Dict[str, List[str]]
+    ) -> PrefixTrie:
+        """
+        Return the prefix index of the given checkers of the given analyzer.
+        """
+        prefix_index = self.__prefix_indexes.get(analyzer)
+        if prefix_index is None:
+            prefix_index = PrefixTrie()
+            for checker in checkers:
+                prefix_index.add(checker, checker)
+
+            self.__prefix_indexes[analyzer] = prefix_index
+
+        return prefix_index
 
     def get_description(self, label: str) -> Optional[Dict[str, str]]:
         """
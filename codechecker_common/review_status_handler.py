@@ -9,19 +9,137 @@
 
 import fnmatch
 import os
-from typing import List, Optional
+import re
+import weakref
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Optional, Tuple
 import yaml
 
+# The safe YAML loader of libyaml is much faster on the config files which are
+# generated with thousands of rules.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 from codechecker_report_converter.report import Report, SourceReviewStatus
+from codechecker_report_converter.source_cache import get_source_cache
 from codechecker_common.logger import get_logger
 from codechecker_common.source_code_comment_handler import \
-    SourceCodeCommentHandler, SpellException, contains_codechecker_comment, \
-    SourceCodeComment, SourceCodeComments
+    SourceCodeCommentHandler, SourceCodeCommentIndex, SpellException, \
+    contains_codechecker_comment, SourceCodeComment, SourceCodeComments
 from codechecker_common.util import path_for_fake_root
 
 
 LOG = get_logger('system')
 
+# File path filters without these characters match only the same path.
+WILDCARD_CHARS = re.compile(r'[*?[]')
+
+
+class _RuleIndex:
+    """
+    Find the first rule of the review status config file which matches a
+    report.
+
+    Every rule is indexed by only one of its filters and the other filters
+    are checked on the candidates:
+      - the rules with a report hash filter by the hash prefix,
+      - the other rules with a checker name filter by the checker name,
+      - the rules with only a file path filter by a compiled matcher: the
+        plain paths are looked up in a dictionary and the patterns with
+        wildcards are combined into one regular expression.
+    """
+
+    def __init__(self, rules: List[Tuple[int, dict]], match_rule):
+        """
+        rules -- (position, rule) pairs of the indexed rules in the order of
+                 the config file.
+        match_rule -- Function which returns whether a rule matches a report.
+        """
+        self.__match_rule = match_rule
+        self.__rules = dict(rules)
+
+        self.__hash_prefixes: DefaultDict[str, List[int]] = defaultdict(list)
+        self.__checkers: DefaultDict[str, List[int]] = defaultdict(list)
+        self.__paths: Dict[str, int] = {}
+
+        # Rules which can't be indexed, e.g. rules without filters or with
+        # filters which are not strings. These are checked on every report.
+        self.__others: List[int] = []
+
+        patterns = []
+        for position, rule in rules:
+            filters = rule['filters']
+            report_hash = filters.get('report_hash')
+            checker_name = filters.get('checker_name')
+            filepath = filters.get('filepath')
+
+            if 'report_hash' in filters:
+                if isinstance(report_hash, str):
+                    self.__hash_prefixes[report_hash].append(position)
+                else:
+                    self.__others.append(position)
+            elif isinstance(checker_name, str):
+                self.__checkers[checker_name].append(position)
+            elif 'checker_name' in filters:
+                # This filter doesn't match any report.
+                continue
+            elif isinstance(filepath, str):
+                if WILDCARD_CHARS.search(filepath):
+                    # The alternatives are tried in order, so the first
+                    # matching rule wins.
+                    patterns.append(f"(?P<r{position}>"
+                                    f"{fnmatch.translate(filepath)})")
+                else:
+                    self.__paths.setdefault(filepath, position)
+            else:
+                self.__others.append(position)
+
+        # Lengths of the hash prefixes, from the shortest.
+        self.__hash_prefix_lengths = sorted(
+            set(map(len, self.__hash_prefixes)))
+
+        self.__patterns = re.compile('|'.join(patterns)) if patterns else None
+
+    def __first_path_rule(self, path: str) -> Optional[int]:
+        """ Position of the first rule with a matching file path filter. """
+        first = self.__paths.get(path)
+
+        if self.__patterns:
+            match = self.__patterns.match(path)
+            if match:
+                position = int(match.lastgroup[1:])
+                if first is None or position < first:
+                    first = position
+
+        return first
+
+    def first_match(self, report: Report) -> Optional[dict]:
+        """ Return the first rule which matches the report. """
+        candidates = list(self.__checkers.get(report.checker_name, []))
+        candidates.extend(self.__others)
+
+        report_hash = report.report_hash or ''
+        for length in self.__hash_prefix_lengths:
+            if length > len(report_hash):
+                break
+
+            candidates.extend(
+                self.__hash_prefixes.get(report_hash[:length], []))
+
+        first = self.__first_path_rule(report.file.original_path)
+
+        for position in sorted(candidates):
+            if first is not None and first < position:
+                break
+
+            if self.__match_rule(report, self.__rules[position]):
+                first = position
+                break
+
+        return self.__rules[first] if first is not None else None
+
 
 class ReviewStatusHandler:
     """
@@ -66,6 +184,27 @@ class ReviewStatusHandler:
         self.__source_commets = {}
         self.__data = None
 
+        # Indexes of the review status and the ignore rules of the config
+        # file, built on the first lookup.
+        self.__rule_indexes: Optional[Tuple[_RuleIndex, _RuleIndex]] = None
+
+        # Source code comment indexes of the source files. An index is dropped
+        # when its source file is evicted from the source cache or changed.
+        self.__comment_indexes: weakref.WeakKeyDictionary = \
+            weakref.WeakKeyDictionary()
+
+    def __getstate__(self):
+        # The source code comment indexes are not sent to other processes and
+        # the rule indexes are built again.
+        state = self.__dict__.copy()
+        del state['_ReviewStatusHandler__comment_indexes']
+        state['_ReviewStatusHandler__rule_indexes'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__comment_indexes = weakref.WeakKeyDictionary()
+
     def __parse_codechecker_review_comment(
         self,
         source_file_name: str,
@@ -76,15 +215,21 @@ class ReviewStatusHandler:
         position.  Returns an empty list if there are no comments.
         """
         src_comment_data = []
-        with open(source_file_name, encoding='utf-8', errors='ignore') as f:
-            if contains_codechecker_comment(f):
-                sc_handler = SourceCodeCommentHandler()
-                try:
-                    src_comment_data = sc_handler.filter_source_line_comments(
-                        f, report_line, checker_name)
-                except SpellException as ex:
-                    self.__source_comment_warnings.append(
-                        f"{source_file_name} contains {ex}")
+        source_file = get_source_cache().get(source_file_name)
+
+        comment_index = self.__comment_indexes.get(source_file)
+        if comment_index is None:
+            comment_index = SourceCodeCommentIndex(source_file)
+            self.__comment_indexes[source_file] = comment_index
+
+        if contains_codechecker_comment(comment_index):
+            sc_handler = SourceCodeCommentHandler()
+            try:
+                src_comment_data = sc_handler.filter_source_line_comments(
+                    comment_index, report_line, checker_name)
+            except SpellException as ex:
+                self.__source_comment_warnings.append(
+                    f"{source_file_name} contains {ex}")
 
         return src_comment_data
 
@@ -190,6 +335,27 @@ class ReviewStatusHandler:
 
         return True
 
+    def __get_rule_indexes(self) -> Tuple[_RuleIndex, _RuleIndex]:
+        """
+        Return the index of the rules which set a review status and the index
+        of the rules which ignore the reports.
+        """
+        if self.__rule_indexes is None:
+            status_rules = []
+            ignore_rules = []
+            for position, rule in enumerate(self.__data['rules']):
+                if rule['actions'].get('ignore'):
+                    ignore_rules.append((position, rule))
+                elif any(filt in rule['filters'] for filt in
+                         ['filepath', 'checker_name', 'report_hash']):
+                    status_rules.append((position, rule))
+
+            self.__rule_indexes = (
+                _RuleIndex(status_rules, self.__report_matches_rule),
+                _RuleIndex(ignore_rules, self.__report_matches_rule))
+
+        return self.__rule_indexes
+
     def get_review_status(self, report: Report) -> SourceReviewStatus:
         """
         Return the review status of the report based on source code comments.
@@ -233,13 +399,14 @@ class ReviewStatusHandler:
             # TODO: Validate format.
             #  - Can filepath be a list?
             try:
-                self.__data = yaml.safe_load(f)
+                self.__data = yaml.load(f, Loader=SafeLoader)
             except yaml.YAMLError as err:
                 # pylint: disable=raise-missing-from
                 raise ValueError(
                     f"Invalid YAML format in {self.__review_status_yaml}:\n"
                     f"{err}")
 
+        self.__rule_indexes = None
         self.__validate_review_status_yaml_data()
 
     def should_ignore(self, report: Report) -> bool:
@@ -256,12 +423,8 @@ class ReviewStatusHandler:
         if self.__data is None:
             return False
 
-        for rule in self.__data['rules']:
-            if self.__report_matches_rule(report, rule) and \
-                    rule['actions'].get('ignore'):
-                return True
-
-        return False
+        _, ignore_rules = self.__get_rule_indexes()
+        return ignore_rules.first_match(report) is not None
 
     def get_review_status_from_config(
         self,
@@ -277,22 +440,18 @@ class ReviewStatusHandler:
             "set_review_status_config()."
 
         # TODO: Document "in_source".
-        for rule in self.__data['rules']:
-            if not self.__report_matches_rule(report, rule) or \
-                    rule['actions'].get('ignore'):
-                continue
+        status_rules, _ = self.__get_rule_indexes()
+        rule = status_rules.first_match(report)
+        if rule is None:
+            return None
 
-            if any(filt in rule['filters'] for filt in
-                   ['filepath', 'checker_name', 'report_hash']):
-                return SourceReviewStatus(
-                    status=rule['actions']['review_status'],
-                    message=rule['actions']['reason']
-                    .encode(encoding='utf-8', errors='ignore')
-                    if 'reason' in rule['actions'] else b'',
-                    bug_hash=report.report_hash,
-                    in_source=True)
-
-        return None
+        return SourceReviewStatus(
+            status=rule['actions']['review_status'],
+            message=rule['actions']['reason']
+            .encode(encoding='utf-8', errors='ignore')
+            if 'reason' in rule['actions'] else b'',
+            bug_hash=report.report_hash,
+            in_source=True)
 
     def get_review_status_from_source(
         self,
@@ -371,3 +530,15 @@ class ReviewStatusHandler:
         read and parsed only once for each report.
         """
         return self.__source_commets.get(report)
+
+    def set_source_comment(
+        self,
+        report: Report,
+        source_comment: SourceCodeComment
+    ):
+        """
+        Set the source comment of the given report. This is used when the
+        review status of the report was determined by another handler, e.g.
+        in another process.
+        """
+        self.__source_commets[report] = source_comment
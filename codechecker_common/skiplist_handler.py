@@ -11,10 +11,60 @@ import fnmatch
 import re
 import os
 
+from typing import Dict, List
+
 from codechecker_common.logger import get_logger
+from codechecker_common.util import PrefixTrie
 
 LOG = get_logger('system')
 
+# Maximum number of memoized skip decisions of a skip list handler.
+MAX_MEMO_SIZE = 100000
+
+# Skip lines without these characters match the paths with a given prefix.
+WILDCARD_CHARS = re.compile(r'[*?[]')
+
+
+class _SkipMatcher:
+    """
+    Find the first matching skip line of a path. Plain paths are looked up in
+    a prefix trie, the patterns with wildcards are combined into one regular
+    expression.
+    """
+
+    def __init__(self, skip_lines: List[str]):
+        """
+        The lines should be checked for validity before compiling them.
+        """
+        self.__skip = [line[0] == '-' for line in skip_lines]
+        self.__prefixes = PrefixTrie()
+
+        patterns = []
+        for index, skip_line in enumerate(skip_lines):
+            norm_skip_path = os.path.normpath(skip_line[1:].strip())
+            if WILDCARD_CHARS.search(norm_skip_path):
+                # The alternatives are tried in order, so the first matching
+                # line wins.
+                patterns.append(f"(?P<l{index}>"
+                                f"{fnmatch.translate(norm_skip_path + '*')})")
+            else:
+                self.__prefixes.add(norm_skip_path, index)
+
+        self.__patterns = re.compile('|'.join(patterns)) if patterns else None
+
+    def should_skip(self, path: str) -> bool:
+        """ True if the first matching skip line is a skip line. """
+        first = self.__prefixes.first_match(path)
+
+        if self.__patterns:
+            match = self.__patterns.match(path)
+            if match:
+                index = int(match.lastgroup[1:])
+                if first is None or index < first:
+                    first = index
+
+        return first is not None and self.__skip[first]
+
 
 class SkipListHandler:
     """
@@ -24,13 +74,15 @@ class SkipListHandler:
     -/do/not/check/this.file
     +/dir/check.this.file
     -/dir/*
+
+    The first matching line decides whether a file is skipped. The decisions
+    are memoized, because the same files are checked several times.
     """
 
     def __init__(self, skip_file_content=""):
         """
         Process the lines of the skip file.
         """
-        self.__skip = []
         if not skip_file_content:
             skip_file_content = ""
 
@@ -39,22 +91,17 @@ class SkipListHandler:
                                   if line.strip() and
                                   not line.strip().startswith('#')]
 
-        valid_lines = self.__check_line_format(self.__skip_file_lines)
-        self.__gen_regex(valid_lines)
+        self.overwrite_skip_content(self.__skip_file_lines)
 
-    def __gen_regex(self, skip_lines):
-        """
-        Generate a regular expression from the given skip lines
-        and collect them for later match.
+    def __getstate__(self):
+        # The matcher is compiled again from the skip lines instead of
+        # pickling the prefix trie and the memoized decisions.
+        return {'skip_file_lines': self.__skip_file_lines,
+                'skip_lines': self.__skip_lines}
 
-        The lines should be checked for validity before generating
-        the regular expressions.
-        """
-        for skip_line in skip_lines:
-            norm_skip_path = os.path.normpath(skip_line[1:].strip())
-            rexpr = re.compile(
-                fnmatch.translate(norm_skip_path + '*'))
-            self.__skip.append((skip_line, rexpr))
+    def __setstate__(self, state):
+        self.__skip_file_lines = state['skip_file_lines']
+        self.overwrite_skip_content(state['skip_lines'])
 
     def __check_line_format(self, skip_lines):
         """
@@ -80,26 +127,30 @@ class SkipListHandler:
 
     def overwrite_skip_content(self, skip_lines):
         """
-        Cleans out the already collected skip regular expressions
-        and rebuilds the list from the given skip_lines.
+        Cleans out the already compiled skip lines and compiles the given
+        skip_lines.
         """
-        self.__skip = []
-        valid_lines = self.__check_line_format(skip_lines)
-        self.__gen_regex(valid_lines)
+        self.__skip_lines = self.__check_line_format(skip_lines)
+        self.__matcher = _SkipMatcher(self.__skip_lines)
+        self.__memo: Dict[str, bool] = {}
 
     def should_skip(self, source):
         """
         Check if the given source should be skipped.
         Should the analyzer skip the given source file?
         """
-        if not self.__skip:
+        if not self.__skip_lines:
             return False
 
-        for line, rexpr in self.__skip:
-            if rexpr.match(source):
-                sign = line[0]
-                return sign == '-'
-        return False
+        skip = self.__memo.get(source)
+        if skip is None:
+            if len(self.__memo) >= MAX_MEMO_SIZE:
+                self.__memo.clear()
+
+            skip = self.__matcher.should_skip(source)
+            self.__memo[source] = skip
+
+        return skip
 
 
 class SkipListHandlers(list):
@@ -12,8 +12,12 @@ Source code comment handling.
 import json
 import logging
 import re
+import weakref
 
-from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple
+from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple, \
+    Union
+
+from codechecker_report_converter.source_cache import SourceFile
 
 from . import util
 
@@ -30,7 +34,15 @@ def contains_codechecker_comment(fp):
     codechecker review comments.
     The position in the object is restored where it was after the
     scanning.
+    'fp' is a file object, a source file of the source cache or a source code
+    comment index.
     """
+    if isinstance(fp, SourceCodeCommentIndex):
+        return fp.has_comments
+
+    if isinstance(fp, SourceFile):
+        return fp.contains("codechecker_")
+
     pos_before_read = fp.tell()
     if pos_before_read != 0:
         fp.seek(0)
@@ -85,6 +97,9 @@ class SourceCodeComment:
 
 SourceCodeComments = List[SourceCodeComment]
 
+# File object, source file of the source cache or source code comment index.
+SourceCodeFile = Union[TextIO, SourceFile, 'SourceCodeCommentIndex']
+
 
 class SourceCodeCommentHandler:
     """
@@ -96,6 +111,30 @@ class SourceCodeCommentHandler:
         'codechecker_intentional',
         'codechecker_confirmed']
 
+    @staticmethod
+    def __get_line(fp: Union[TextIO, SourceFile], line_no: int) -> str:
+        """
+        Return the given line of a file object or of a source file of the
+        source cache. The latter doesn't read the file from the beginning.
+        """
+        if isinstance(fp, SourceFile):
+            return fp.get_line(line_no)
+
+        return util.get_linef(fp, line_no)
+
+    @staticmethod
+    def is_comment_line(source_line: str) -> bool:
+        """
+        Check if the line is a comment or contains the start or the end of a
+        C style comment. Source code comments of a bug line are searched only
+        if the previous line is a comment line.
+        """
+        cstyle_start, cstyle_end = \
+            SourceCodeCommentHandler.__check_if_cstyle_comment(source_line)
+
+        return cstyle_start or cstyle_end or \
+            SourceCodeCommentHandler.__check_if_comment(source_line)
+
     @staticmethod
     def __check_if_comment(source_line: str) -> bool:
         """
@@ -183,7 +222,11 @@ class SourceCodeCommentHandler:
 
         return SourceCodeComment(checkers_names, message, review_status)
 
-    def has_source_line_comments(self, fp: TextIO, line: int) -> bool:
+    def has_source_line_comments(
+        self,
+        fp: SourceCodeFile,
+        line: int
+    ) -> bool:
         """
         Return True if there is any source code comment or False if not,
         for a given line.
@@ -198,7 +241,7 @@ class SourceCodeCommentHandler:
 
     def scan_source_line_comments(
         self,
-        fp: TextIO,
+        fp: SourceCodeFile,
         line_numbers: Iterable[int]
     ) -> Tuple[List[Tuple[int, SourceCodeComments]], List[str]]:
         """collect all the source line review comments if exists
@@ -209,6 +252,9 @@ class SourceCodeCommentHandler:
         """
         comments: List[Tuple[int, SourceCodeComments]] = []
         misspelled_comments: List[str] = []
+        if isinstance(fp, SourceFile):
+            fp = SourceCodeCommentIndex(fp)
+
         if not contains_codechecker_comment(fp):
             return comments, misspelled_comments
 
@@ -222,7 +268,7 @@ class SourceCodeCommentHandler:
 
     def get_source_line_comments(
         self,
-        fp: TextIO,
+        fp: SourceCodeFile,
         bug_line: int
     ) -> SourceCodeComments:
         """ Returns the preprocessed source code comments for a bug line.
@@ -230,6 +276,9 @@ class SourceCodeCommentHandler:
         raise: SpellException in case there is a spell error in the
                codechecker review comment keyword
         """
+        if isinstance(fp, SourceCodeCommentIndex):
+            return fp.get_source_line_comments(bug_line)
+
         previous_line_num = bug_line - 1
 
         # No more line.
@@ -244,7 +293,8 @@ class SourceCodeCommentHandler:
         cstyle_end_found = False
 
         while True:
-            source_line = util.get_linef(fp, previous_line_num)
+            source_line = SourceCodeCommentHandler.__get_line(
+                fp, previous_line_num)
 
             # cpp style comment
             is_comment = \
@@ -313,7 +363,7 @@ class SourceCodeCommentHandler:
 
     def filter_source_line_comments(
         self,
-        fp: TextIO,
+        fp: SourceCodeFile,
         bug_line: int,
         checker_name: str
     ) -> SourceCodeComments:
@@ -367,3 +417,56 @@ class SourceCodeCommentHandler:
                       "checker '%s': %s", checker_name,
                       checker_name_comments[0])
         return checker_name_comments
+
+
+class SourceCodeCommentIndex:
+    """
+    Source code comments of the lines of a source file.
+
+    The comment lines of the source file are collected in one pass when the
+    index is created. Source code comments can belong only to the lines
+    directly after a comment line, so the other lines are looked up without
+    reading the file. The comments of a line are parsed by
+    SourceCodeCommentHandler at the first lookup and they are cached, so the
+    result is the same as the one of the handler.
+
+    The index refers to the source file weakly, so the source file has to be
+    kept alive by the caller while the index is used.
+    """
+
+    def __init__(self, source_file: SourceFile):
+        self.__source_file = weakref.ref(source_file)
+        self.__handler = SourceCodeCommentHandler()
+        self.__comment_lines: Set[int] = set()
+        self.__comments: Dict[int, Union[SourceCodeComments,
+                                         SpellException]] = {}
+
+        self.has_comments = source_file.contains("codechecker_")
+        if self.has_comments:
+            self.__comment_lines.update(
+                line_num for line_num in range(1, source_file.line_count + 1)
+                if SourceCodeCommentHandler.is_comment_line(
+                    source_file.get_line(line_num)))
+
+    def get_source_line_comments(self, bug_line: int) -> SourceCodeComments:
+        """ Returns the preprocessed source code comments for a bug line.
+
+        raise: SpellException in case there is a spell error in the
+               codechecker review comment keyword
+        """
+        if bug_line - 1 not in self.__comment_lines:
+            return []
+
+        comments = self.__comments.get(bug_line)
+        if comments is None:
+            try:
+                comments = self.__handler.get_source_line_comments(
+                    self.__source_file(), bug_line)
+            except SpellException as ex:
+                comments = ex
+            self.__comments[bug_line] = comments
+
+        if isinstance(comments, SpellException):
+            raise comments
+
+        return comments
@@ -11,7 +11,7 @@ Util module.
 import itertools
 import json
 import os
-from typing import TextIO
+from typing import Any, Dict, TextIO
 
 import portalocker
 
@@ -112,3 +112,58 @@ def path_for_fake_root(full_path: str, root_path: str = '/') -> str:
 def strtobool(value: str) -> bool:
     """Parse a string value to a boolean."""
     return value.lower() in ('y', 'yes', 't', 'true', 'on', '1')
+
+
+def get_cache_dir():
+    """
+    Return the directory of the persistent caches of CodeChecker which are
+    shared between CodeChecker invocations. It can be set by the CC_CACHE_DIR
+    environment variable.
+    """
+    cache_dir = os.environ.get('CC_CACHE_DIR')
+    if cache_dir:
+        return cache_dir
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'codechecker')
+
+
+class PrefixTrie:
+    """
+    Character trie of string prefixes with a value for every prefix. If more
+    prefixes of a string are added, the value of the firstly added one is
+    found.
+    """
+
+    def __init__(self):
+        self.__root: Dict = {}
+        self.__count = 0
+
+    def add(self, prefix: str, value: Any):
+        """ Add the given prefix with its value if it's not added yet. """
+        node = self.__root
+        for char in prefix:
+            node = node.setdefault(char, {})
+
+        if None not in node:
+            node[None] = (self.__count, value)
+            self.__count += 1
+
+    def first_match(self, string: str, default: Any = None) -> Any:
+        """
+        Return the value of the firstly added prefix of the given string or
+        the default value if none of the prefixes match.
+        """
+        node = self.__root
+        first = node.get(None)
+        for char in string:
+            node = node.get(char)
+            if node is None:
+                break
+
+            entry = node.get(None)
+            if entry is not None and (first is None or entry[0] < first[0]):
+                first = entry
+
+        return first[1] if first else default
@@ -0,0 +1,209 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Measure the per-action orchestration overhead of the analysis workers.
+
+The analysis is executed by analysis_manager.start_workers() with a fake
+analyzer whose binary exits immediately, so the measured time is dominated by
+the work CodeChecker does around the analyzer processes.
+
+Two data sharing modes can be compared:
+  - proxy: the build action and analyzer configuration maps are SyncManager
+           proxies, like in the previous implementation, so the workers do
+           IPC round trips to the manager process for every action.
+  - inherited: plain dictionaries which are handed over to the workers once
+               by the pool initializer (inherited when forking).
+
+The script has to be run with the CodeChecker package on the Python path:
+  PYTHONPATH=build/CodeChecker/lib/python3 \\
+  CC_DATA_FILES_DIR=build/CodeChecker \\
+  python3 scripts/benchmark/analysis_orchestration.py -n 50000
+"""
+
+
+import argparse
+import collections
+import logging
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+
+from multiprocess.managers import SyncManager
+
+from codechecker_analyzer import analysis_manager
+from codechecker_analyzer.analyzers import analyzer_types
+from codechecker_analyzer.analyzers.analyzer_base import SourceAnalyzer
+from codechecker_analyzer.analyzers.config_handler import \
+    AnalyzerConfigHandler, CheckerState
+from codechecker_analyzer.analyzers.result_handler_base import ResultHandler
+from codechecker_analyzer.buildlog.build_action import BuildAction
+from codechecker_common.review_status_handler import ReviewStatusHandler
+from codechecker_common.skiplist_handler import SkipListHandlers
+
+
+FAKE_ANALYZER_NAME = 'fake'
+
+CompileCmdCount = collections.namedtuple('CompileCmdCount',
+                                         'analyze, skipped')
+
+
+class FakeAnalyzer(SourceAnalyzer):  # pylint: disable=abstract-method
+    """ Analyzer which runs a binary that exits immediately. """
+
+    ANALYZER_NAME = FAKE_ANALYZER_NAME
+    BINARY = None
+
+    def construct_analyzer_cmd(self, result_handler):
+        return [FakeAnalyzer.BINARY, result_handler.analyzed_source_file]
+
+    @classmethod
+    def get_binary_version(cls, details=False):
+        return '1.0'
+
+    def get_analyzer_mentioned_files(self, output):
+        return set()
+
+    def construct_result_handler(self, buildaction, report_output,
+                                 skiplist_handler):
+        return ResultHandler(buildaction, report_output)
+
+
+def create_fake_binary(directory):
+    """ Create an analyzer binary which does nothing. """
+    binary = os.path.join(directory, 'fake-analyzer')
+    with open(binary, 'w', encoding='utf-8') as f:
+        f.write('#!/bin/sh\nexit 0\n')
+    os.chmod(binary, os.stat(binary).st_mode | stat.S_IEXEC)
+    return binary
+
+
+def create_config_handler(checker_num):
+    """
+    Create a config handler with as many checkers as a real analyzer has, so
+    copying it has a realistic cost.
+    """
+    config_handler = AnalyzerConfigHandler()
+    for i in range(checker_num):
+        config_handler.add_checker(f'fake-checker-{i}',
+                                   f'Description of fake checker {i}.',
+                                   CheckerState.ENABLED)
+    return config_handler
+
+
+def create_actions(directory, action_num):
+    """ Create build actions for the fake analyzer. """
+    actions = []
+    for i in range(action_num):
+        source = os.path.join(directory, f'source_{i}.c')
+        actions.append(BuildAction(
+            analyzer_options=['-DFOO=1', '-I/usr/include/foo'],
+            compiler_includes=[],
+            compiler_standard='',
+            analyzer_type=FAKE_ANALYZER_NAME,
+            original_command=f'gcc -c {source} -o source_{i}.o',
+            directory=directory,
+            output='',
+            lang='c',
+            target='x86_64-linux-gnu',
+            source=source,
+            arch='',
+            action_type=BuildAction.COMPILE))
+    return actions
+
+
+def run(mode, actions, config_handler, jobs, output_path):
+    """ Run the analysis and return its wall clock time in seconds. """
+    actions_map = {(a.source, a.target): a for a in actions}
+    config_map = {FAKE_ANALYZER_NAME: config_handler}
+
+    manager = None
+    if mode == 'proxy':
+        manager = SyncManager()
+        manager.start()
+        actions_map = manager.dict(actions_map)
+        config_map = manager.dict(config_map)
+
+    metadata_tool = {
+        'result_source_files': {},
+        'analyzers': {
+            FAKE_ANALYZER_NAME: {
+                'analyzer_statistics': {
+                    'failed': 0,
+                    'failed_sources': [],
+                    'successful': 0,
+                    'successful_sources': []}}}}
+
+    try:
+        start = time.time()
+        analysis_manager.start_workers(
+            actions_map, actions, config_map, jobs, output_path,
+            SkipListHandlers(), None, ReviewStatusHandler(output_path),
+            metadata_tool, True, False, False, None, False, None,
+            CompileCmdCount(len(actions), 0))
+        duration = time.time() - start
+    finally:
+        if manager:
+            manager.shutdown()
+
+    statistics = \
+        metadata_tool['analyzers'][FAKE_ANALYZER_NAME]['analyzer_statistics']
+    if statistics['successful'] != len(actions):
+        print(f"WARNING: only {statistics['successful']} of {len(actions)} "
+              "actions were analyzed successfully!", file=sys.stderr)
+
+    return duration
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the per-action orchestration overhead of "
+                    "'CodeChecker analyze' using a fake analyzer.")
+    parser.add_argument('-n', '--actions', type=int, default=50000,
+                        help="Number of build actions to analyze.")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="Number of analysis worker processes.")
+    parser.add_argument('--checkers', type=int, default=1500,
+                        help="Number of checkers of the fake analyzer.")
+    parser.add_argument('--mode', nargs='+',
+                        choices=['proxy', 'inherited'],
+                        default=['proxy', 'inherited'],
+                        help="Data sharing modes to measure.")
+    args = parser.parse_args()
+
+    # Progress and summary messages would dominate the measurement.
+    logging.getLogger('analyzer').setLevel(logging.WARNING)
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        FakeAnalyzer.BINARY = create_fake_binary(work_dir)
+        analyzer_types.supported_analyzers[FAKE_ANALYZER_NAME] = FakeAnalyzer
+
+        actions = create_actions(work_dir, args.actions)
+        config_handler = create_config_handler(args.checkers)
+
+        print(f"{'mode':<10} {'actions':>8} {'jobs':>5} {'wall (s)':>10} "
+              f"{'per action (ms)':>16}")
+        for mode in args.mode:
+            output_path = os.path.join(work_dir, f'reports_{mode}')
+            os.makedirs(output_path)
+
+            duration = run(mode, actions, config_handler, args.jobs,
+                           output_path)
+
+            per_action = duration * 1000 / len(actions)
+            print(f"{mode:<10} {len(actions):>8} {args.jobs:>5} "
+                  f"{duration:>10.2f} {per_action:>16.3f}")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    main()
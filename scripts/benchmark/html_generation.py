@@ -0,0 +1,151 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Measure the time and the output size of generating the HTML files of reports
+with different number of jobs.
+
+Synthetic source files are generated: every source file includes a large
+header which is shared by every source file, and every source file has a
+report page with reports in the source file and in the header. The report
+pages, the index and the statistics pages are generated by the HTML builder of
+the report converter with every given number of jobs.
+
+The script has to be run with the CodeChecker package on the Python path:
+  PYTHONPATH=build/CodeChecker/lib/python3 \\
+  python3 scripts/benchmark/html_generation.py -n 500 --jobs 1 2 4
+"""
+
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+
+def create_reports(directory, file_num, report_num, header_lines):
+    """
+    Create the source files and the reports of the synthetic project.
+    Returns the reports of every source file.
+    """
+    # pylint: disable=import-outside-toplevel
+    from codechecker_report_converter.report import BugPathEvent, File, \
+        Report
+
+    header = File(os.path.join(directory, 'common.h'))
+    with open(header.path, 'w', encoding='utf-8') as f:
+        f.write('int common(int value);\n' * header_lines)
+
+    file_reports = {}
+    for i in range(file_num):
+        source = File(os.path.join(directory, f'source_{i}.cpp'))
+        with open(source.path, 'w', encoding='utf-8') as f:
+            f.write('#include "common.h"\n')
+            f.write(''.join(f'int f{j}() {{ return common({j}) / 0; }}\n'
+                            for j in range(report_num)))
+
+        # The result files have to be newer than the source files.
+        with open(f'{source.path}.plist', 'w', encoding='utf-8') as f:
+            f.write('')
+
+        reports = []
+        for j in range(report_num):
+            report_file = header if j % 2 else source
+            line = j % header_lines + 1 if j % 2 else j + 2
+            reports.append(Report(
+                report_file, line, 1, f"Problem {j} of {i}",
+                'core.DivideZero', report_hash=f'{i:016x}{j:016x}',
+                analyzer_name='clangsa',
+                analyzer_result_file_path=f'{source.path}.plist',
+                bug_path_events=[
+                    BugPathEvent("Call", source, j + 2, 16),
+                    BugPathEvent(f"Problem {j}", report_file, line, 1)]))
+
+        file_reports[source.path] = reports
+
+    return file_reports
+
+
+def get_dir_size(directory):
+    """ Total size of the files in the given directory in bytes. """
+    return sum(os.path.getsize(os.path.join(dir_path, file_name))
+               for dir_path, _, file_names in os.walk(directory)
+               for file_name in file_names)
+
+
+def generate(layout_dir, output_dir, file_reports, jobs):
+    """
+    Generate the HTML files of the given reports. Returns the duration.
+    """
+    # pylint: disable=import-outside-toplevel
+    from codechecker_report_converter.report.output.html.html import \
+        HtmlBuilder
+
+    start = time.time()
+    html_builder = HtmlBuilder(layout_dir, jobs=jobs)
+    for file_path, reports in file_reports.items():
+        html_builder.create(os.path.join(
+            output_dir, f"{os.path.basename(file_path)}.html"), reports)
+
+    html_builder.create_index_html(output_dir)
+    html_builder.create_statistics_html(output_dir)
+
+    return time.time() - start
+
+
+def main():
+    # pylint: disable=import-outside-toplevel
+    from codechecker_report_converter.report.output.html import html
+
+    parser = argparse.ArgumentParser(
+        description="Measure the time and the output size of generating "
+                    "the HTML files of reports with different number of "
+                    "jobs.")
+    parser.add_argument('-n', '--files', type=int, default=500,
+                        help="Number of source files with a report page.")
+    parser.add_argument('-r', '--reports', type=int, default=20,
+                        help="Number of reports of a source file.")
+    parser.add_argument('--header-lines', type=int, default=20000,
+                        help="Number of lines of the shared header.")
+    parser.add_argument('-l', '--layout',
+                        default=os.path.join(
+                            os.path.dirname(html.__file__), 'static'),
+                        help="Directory which contains dependency HTML, CSS "
+                             "and JavaScript files of the HTML output.")
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4],
+                        help="Numbers of jobs to measure.")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        file_reports = create_reports(work_dir, args.files, args.reports,
+                                      args.header_lines)
+
+        print(f"{args.files} source files with {args.reports} reports each, "
+              f"shared header of {args.header_lines} lines")
+        print(f"{'jobs':>5} {'time (s)':>9} {'output (MiB)':>13} "
+              f"{'files':>6}")
+
+        for jobs in args.jobs:
+            output_dir = os.path.join(work_dir, f'html_{jobs}')
+            os.makedirs(output_dir)
+
+            duration = generate(args.layout, output_dir, file_reports, jobs)
+            size = get_dir_size(output_dir) / 1024 / 1024
+            file_num = sum(len(file_names)
+                           for _, _, file_names in os.walk(output_dir))
+
+            print(f"{jobs:>5} {duration:>9.2f} {size:>13.1f} {file_num:>6}")
+
+            shutil.rmtree(output_dir)
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    main()
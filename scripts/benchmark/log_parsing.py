@@ -0,0 +1,148 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Measure the time and the memory usage of parsing a compilation database.
+
+A synthetic compilation database is generated and parsed by
+log_parser.parse_unique_log() in the following modes:
+  - load: the whole JSON file is loaded into memory and parsed by a single
+          process, like in the previous implementation.
+  - stream: the JSON file is read entry by entry and parsed by a process pool
+            of the given number of jobs.
+
+Every mode is measured in a separate process, so the peak memory usage
+(maximum resident set size) of the modes don't affect each other.
+
+The script has to be run with the CodeChecker package on the Python path:
+  PYTHONPATH=build/CodeChecker/lib/python3 \\
+  CC_DATA_FILES_DIR=build/CodeChecker \\
+  python3 scripts/benchmark/log_parsing.py -n 1000000
+"""
+
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def create_compilation_database(path, entry_num):
+    """ Write a compilation database with the given number of entries. """
+    flags = ' '.join([
+        '-O2', '-g', '-Wall', '-Wextra', '-fPIC', '-pthread', '-std=c++17',
+        '-DNDEBUG', '-D_GNU_SOURCE', '-DVERSION=\\"1.2.3\\"',
+        '-I/usr/include/project', '-I/usr/include/project/generated',
+        '-isystem', '/usr/include/third_party', '-MD', '-MF'])
+
+    with open(path, 'w', encoding='utf-8', errors='ignore') as f:
+        f.write('[')
+        for i in range(entry_num):
+            directory = f'/project/module_{i % 1000}'
+            source = f'{directory}/source_{i}.cpp'
+            f.write(',\n' if i else '\n')
+            json.dump({
+                'directory': directory,
+                'command': f'g++ {flags} source_{i}.d -c {source} '
+                           f'-o source_{i}.o',
+                'file': source}, f)
+        f.write('\n]\n')
+
+
+def max_rss_mib():
+    """ Peak resident set size of this process and its children in MiB. """
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return (self_rss + children_rss) / 1024
+
+
+def measure(mode, compilation_database, jobs):
+    """
+    Parse the compilation database in the given mode and print the results
+    as JSON. This is executed in a separate process for every mode.
+    """
+    # pylint: disable=import-outside-toplevel
+    from codechecker_analyzer import compilation_database as comp_db
+    from codechecker_analyzer.buildlog import log_parser
+    from codechecker_common.util import load_json
+
+    report_dir = tempfile.mkdtemp()
+    try:
+        start = time.time()
+        if mode == 'load':
+            compile_commands = load_json(compilation_database)
+            comp_db.change_args_to_command_in_comp_db(compile_commands)
+            jobs = 1
+        else:
+            compile_commands = comp_db.CompilationDatabaseFile(
+                compilation_database)
+
+        actions, _ = log_parser.parse_unique_log(
+            compile_commands, report_dir, jobs=jobs)
+        duration = time.time() - start
+    finally:
+        shutil.rmtree(report_dir)
+
+    print(json.dumps({'mode': mode,
+                      'jobs': jobs,
+                      'actions': len(actions),
+                      'duration': duration,
+                      'max_rss': max_rss_mib()}))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the time and memory usage of parsing a "
+                    "compilation database.")
+    parser.add_argument('-n', '--entries', type=int, default=1000000,
+                        help="Number of compilation database entries.")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="Number of parser processes in stream mode.")
+    parser.add_argument('--mode', nargs='+', choices=['load', 'stream'],
+                        default=['load', 'stream'],
+                        help="Parsing modes to measure.")
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    parser.add_argument('--compilation-database', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.compilation_database, args.jobs)
+        return
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        compilation_database = os.path.join(work_dir, 'compile_commands.json')
+        create_compilation_database(compilation_database, args.entries)
+        size = os.path.getsize(compilation_database) / 1024 / 1024
+
+        print(f"Compilation database: {args.entries} entries, "
+              f"{size:.1f} MiB")
+        print(f"{'mode':<8} {'jobs':>5} {'actions':>8} {'time (s)':>9} "
+              f"{'max RSS (MiB)':>14}")
+
+        for mode in args.mode:
+            output = subprocess.check_output(
+                [sys.executable, __file__, '--measure', mode,
+                 '--compilation-database', compilation_database,
+                 '-j', str(args.jobs)],
+                stderr=subprocess.DEVNULL)
+
+            result = json.loads(output.decode().strip().splitlines()[-1])
+            print(f"{result['mode']:<8} {result['jobs']:>5} "
+                  f"{result['actions']:>8} {result['duration']:>9.2f} "
+                  f"{result['max_rss']:>14.1f}")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    main()
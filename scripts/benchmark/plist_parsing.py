@@ -0,0 +1,169 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Measure the time and the memory usage of reading the reports of a plist file
+with long bug paths, like the ones of cross translation unit analysis.
+
+A synthetic plist file is generated and its reports are read by the plist
+parser of the report converter in the following modes:
+  - tree: the plist object of the whole file is built first, then the
+          reports are created from it, like in the previous implementation.
+  - stream: the reports are created diagnostic by diagnostic while the file
+            is parsed.
+
+Every mode is measured in a separate process, so the peak memory usage
+(maximum resident set size) of the modes don't affect each other.
+
+The script has to be run with the CodeChecker package on the Python path:
+  PYTHONPATH=build/CodeChecker/lib/python3 \\
+  python3 scripts/benchmark/plist_parsing.py -n 2000 -p 500
+"""
+
+
+import argparse
+import json
+import os
+import plistlib
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
+
+
+def location(line, col, file_index):
+    """ Plist location of the given position. """
+    return {'line': line, 'col': col, 'file': file_index}
+
+
+def create_plist(path, diag_num, path_length, file_num):
+    """
+    Write a plist file with the given number of diagnostics, every one of
+    them with a bug path of the given length.
+    """
+    diagnostics = []
+    for i in range(diag_num):
+        bug_path = []
+        for j in range(path_length):
+            file_index = (i + j) % file_num
+            line = j + 1
+            if j % 2:
+                bug_path.append({
+                    'kind': 'control',
+                    'edges': [{
+                        'start': [location(line, 3, file_index),
+                                  location(line, 8, file_index)],
+                        'end': [location(line + 1, 3, file_index),
+                                location(line + 1, 8, file_index)]}]})
+            else:
+                bug_path.append({
+                    'kind': 'event',
+                    'location': location(line, 5, file_index),
+                    'ranges': [[location(line, 5, file_index),
+                                location(line, 12, file_index)]],
+                    'depth': j % 4,
+                    'extended_message': f"Event {j} of report {i}",
+                    'message': f"Event {j} of report {i}"})
+
+        diagnostics.append({
+            'description': f"Problem {i}",
+            'category': 'Logic error',
+            'type': 'Problem',
+            'check_name': 'core.DivideZero',
+            'issue_hash_content_of_line_in_context': f'{i:032x}',
+            'location': location(path_length, 5, i % file_num),
+            'path': bug_path})
+
+    with open(path, 'wb') as f:
+        plistlib.dump({
+            'diagnostics': diagnostics,
+            'files': [f'/project/source_{i}.cpp' for i in range(file_num)],
+            'metadata': {'analyzer': {'name': 'clangsa'}}}, f)
+
+
+def max_rss_mib():
+    """ Peak resident set size of this process in MiB. """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(mode, plist_file):
+    """
+    Read the reports of the plist file in the given mode and print the
+    results as JSON. This is executed in a separate process for every mode.
+    """
+    # pylint: disable=import-outside-toplevel
+    from codechecker_report_converter.report.parser import plist
+
+    start = time.time()
+    if mode == 'tree':
+        # The parser falls back to the plist object of the whole file.
+        with mock.patch.object(plist, 'iter_parse',
+                               side_effect=NotImplementedError):
+            reports = plist.Parser().get_reports(plist_file)
+    else:
+        reports = plist.Parser().get_reports(plist_file)
+    duration = time.time() - start
+
+    print(json.dumps({'mode': mode,
+                      'reports': len(reports),
+                      'events': sum(len(r.bug_path_events) for r in reports),
+                      'duration': duration,
+                      'max_rss': max_rss_mib()}))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the time and memory usage of reading the "
+                    "reports of a plist file with long bug paths.")
+    parser.add_argument('-n', '--diagnostics', type=int, default=2000,
+                        help="Number of diagnostics in the plist file.")
+    parser.add_argument('-p', '--path-length', type=int, default=500,
+                        help="Number of bug path elements of a diagnostic.")
+    parser.add_argument('-f', '--files', type=int, default=20,
+                        help="Number of files referenced by the bug paths.")
+    parser.add_argument('--mode', nargs='+', choices=['tree', 'stream'],
+                        default=['tree', 'stream'],
+                        help="Parsing modes to measure.")
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    parser.add_argument('--plist-file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.plist_file)
+        return
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        plist_file = os.path.join(work_dir, 'reports.plist')
+        create_plist(plist_file, args.diagnostics, args.path_length,
+                     args.files)
+        size = os.path.getsize(plist_file) / 1024 / 1024
+
+        print(f"Plist file: {args.diagnostics} diagnostics, "
+              f"{args.path_length} bug path elements each, {size:.1f} MiB")
+        print(f"{'mode':<8} {'reports':>8} {'events':>9} {'time (s)':>9} "
+              f"{'max RSS (MiB)':>14}")
+
+        for mode in args.mode:
+            output = subprocess.check_output(
+                [sys.executable, __file__, '--measure', mode,
+                 '--plist-file', plist_file],
+                stderr=subprocess.DEVNULL)
+
+            result = json.loads(output.decode().strip().splitlines()[-1])
+            print(f"{result['mode']:<8} {result['reports']:>8} "
+                  f"{result['events']:>9} {result['duration']:>9.2f} "
+                  f"{result['max_rss']:>14.1f}")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    main()
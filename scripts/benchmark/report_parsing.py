@@ -0,0 +1,188 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Measure the time and the memory usage of 'CodeChecker parse' with different
+number of jobs.
+
+A synthetic report directory is generated: every analyzer result file
+belongs to a source file and contains reports in the source file and in a
+header which is shared by every source file, so the deduplication of the
+reports is measured too. Some of the reports have source code comments.
+
+The report directory is parsed by the 'parse' command with every given
+number of jobs in a separate process, so the peak memory usage (maximum
+resident set size) of the runs don't affect each other. The reports are
+printed to the standard output, which is discarded, or exported to a file.
+
+The script has to be run with the CodeChecker package on the Python path:
+  PYTHONPATH=build/CodeChecker/lib/python3 \\
+  CC_DATA_FILES_DIR=build/CodeChecker \\
+  python3 scripts/benchmark/report_parsing.py -n 20000 --jobs 1 2 4 8
+"""
+
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def create_report_dir(directory, file_num, report_num):
+    """
+    Create the source files and the analyzer result files of the synthetic
+    report directory. Returns the path of the report directory.
+    """
+    # pylint: disable=import-outside-toplevel
+    from codechecker_report_converter.report import BugPathEvent, File, \
+        Report, report_file
+    from codechecker_report_converter.report.hash import get_report_hash, \
+        HashType
+
+    source_dir = os.path.join(directory, 'src')
+    report_dir = os.path.join(directory, 'reports')
+    os.makedirs(source_dir)
+    os.makedirs(report_dir)
+
+    header = os.path.join(source_dir, 'common.h')
+    with open(header, 'w', encoding='utf-8') as f:
+        f.write('int common(int value);\n' * report_num)
+
+    for i in range(file_num):
+        source = os.path.join(source_dir, f'source_{i}.c')
+        with open(source, 'w', encoding='utf-8') as f:
+            for line in range(1, report_num * 2 + 1):
+                if line % 4 == 1:
+                    f.write('// codechecker_confirmed [core.Checker] ok\n')
+                else:
+                    f.write(f'int value_{line} = {line};\n')
+
+        reports = []
+        for line in range(2, report_num * 2 + 1, 2):
+            for path in (source, header):
+                file = File(path)
+                report_line = line if path == source else line // 2
+                report = Report(
+                    file, report_line, 1, f"Problem at line {report_line}",
+                    'core.Checker', analyzer_name='clangsa',
+                    bug_path_events=[
+                        BugPathEvent("Event", file, report_line - 1, 1),
+                        BugPathEvent("Problem", file, report_line, 1)])
+                report.report_hash = get_report_hash(
+                    report, HashType.PATH_SENSITIVE)
+                reports.append(report)
+
+        report_file.create(
+            os.path.join(report_dir, f'source_{i}.c_clangsa_{i}.plist'),
+            reports)
+
+    return report_dir
+
+
+def max_rss_mib():
+    """ Peak resident set size of this process and its children in MiB. """
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(self_rss, children_rss) / 1024
+
+
+def measure(report_dir, jobs, export):
+    """
+    Parse the report directory with the 'parse' command and print the results
+    as JSON. This is executed in a separate process for every number of jobs.
+    """
+    # pylint: disable=import-outside-toplevel
+    from codechecker_analyzer.cmd import parse
+
+    parser = argparse.ArgumentParser()
+    parse.add_arguments_to_parser(parser)
+
+    output_dir = tempfile.mkdtemp()
+    parse_args = [report_dir, '-j', str(jobs)]
+    if export:
+        output_file = 'reports.baseline' if export == 'baseline' \
+            else 'reports.json'
+        parse_args.extend(['-e', export, '-o',
+                           os.path.join(output_dir, output_file)])
+
+    args = parser.parse_args(parse_args)
+
+    # The printed reports are discarded on the file descriptor level,
+    # because the output stream is bound when the modules are imported.
+    stdout_fd = os.dup(sys.stdout.fileno())
+    start = time.time()
+    try:
+        with open(os.devnull, 'w', encoding='utf-8') as devnull:
+            os.dup2(devnull.fileno(), sys.stdout.fileno())
+            args.func(args)
+    except SystemExit:
+        pass
+    finally:
+        sys.stdout.flush()
+        os.dup2(stdout_fd, sys.stdout.fileno())
+    duration = time.time() - start
+    shutil.rmtree(output_dir)
+
+    print(json.dumps({'jobs': jobs,
+                      'duration': duration,
+                      'max_rss': max_rss_mib()}))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the time and memory usage of parsing a report "
+                    "directory with different number of jobs.")
+    parser.add_argument('-n', '--files', type=int, default=20000,
+                        help="Number of analyzer result files.")
+    parser.add_argument('-r', '--reports', type=int, default=10,
+                        help="Number of reports in a result file.")
+    parser.add_argument('-j', '--jobs', type=int, nargs='+',
+                        default=[1, os.cpu_count()],
+                        help="Numbers of jobs to measure.")
+    parser.add_argument('-e', '--export',
+                        choices=['json', 'codeclimate', 'baseline'],
+                        help="Export the reports instead of printing them.")
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.jobs[0], args.export)
+        return
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        report_dir = create_report_dir(work_dir, args.files, args.reports)
+
+        print(f"Report directory: {args.files} result files, "
+              f"{args.files * args.reports * 2} reports")
+        print(f"{'jobs':>5} {'time (s)':>9} {'files/s':>9} "
+              f"{'max RSS (MiB)':>14}")
+
+        for jobs in args.jobs:
+            command = [sys.executable, __file__, '--measure', report_dir,
+                       '-j', str(jobs)]
+            if args.export:
+                command.extend(['-e', args.export])
+
+            output = subprocess.check_output(command,
+                                             stderr=subprocess.DEVNULL)
+
+            result = json.loads(output.decode().strip().splitlines()[-1])
+            print(f"{result['jobs']:>5} {result['duration']:>9.2f} "
+                  f"{args.files / result['duration']:>9.1f} "
+                  f"{result['max_rss']:>14.1f}")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Measure the time of finding the review status of reports in a large
+review_status.yaml config file, like the ones which are generated with one
+rule per triaged report hash.
+
+A synthetic config file is generated with report hash rules and a few checker
+name and file path rules. The review status of synthetic reports is searched
+in the following modes:
+  - linear: the filters of every rule are checked in order, like in the
+            previous implementation.
+  - indexed: the review status handler is used.
+
+The script has to be run with the CodeChecker package on the Python path:
+  PYTHONPATH=build/CodeChecker/lib/python3 \\
+  python3 scripts/benchmark/review_status_rules.py -r 30000 -n 20000
+"""
+
+
+import argparse
+import fnmatch
+import os
+import random
+import tempfile
+import time
+
+import yaml
+
+
+def create_rules(rule_num):
+    """ Report hash rules and a few checker name and file path rules. """
+    rules = []
+    for i in range(rule_num):
+        if i % 1000 == 0:
+            filters = {'checker_name': f'checker_{i}'}
+        elif i % 1000 == 1:
+            filters = {'filepath': f'/project/generated_{i}/*'}
+        else:
+            filters = {'report_hash': f'{i:032x}'}
+
+        rules.append({'filters': filters,
+                      'actions': {'review_status': 'false_positive',
+                                  'reason': 'Triaged.'}})
+    return rules
+
+
+def create_reports(report_num, rule_num):
+    """ Reports, some of them have a hash of a rule. """
+    # pylint: disable=import-outside-toplevel
+    from codechecker_report_converter.report import File, Report
+
+    rnd = random.Random(0)
+    reports = []
+    for i in range(report_num):
+        report_hash = f'{rnd.randrange(rule_num * 2):032x}'
+        reports.append(Report(File(f'/project/src_{i % 100}/main.c'), i, 1,
+                              'message', f'checker_{i % 50}',
+                              report_hash=report_hash))
+    return reports
+
+
+def linear_review_status(rules, report):
+    """ The rule matching of the previous implementation. """
+    for rule in rules:
+        filters = rule['filters']
+        if 'filepath' in filters and not fnmatch.fnmatch(
+                report.file.original_path, filters['filepath']):
+            continue
+
+        if 'checker_name' in filters and \
+                report.checker_name != filters['checker_name']:
+            continue
+
+        if 'report_hash' in filters and \
+                not report.report_hash.startswith(filters['report_hash']):
+            continue
+
+        return rule['actions']['review_status']
+
+    return None
+
+
+def main():
+    # pylint: disable=import-outside-toplevel
+    from codechecker_common.review_status_handler import ReviewStatusHandler
+
+    parser = argparse.ArgumentParser(
+        description="Measure the time of finding the review status of "
+                    "reports in a large review status config file.")
+    parser.add_argument('-r', '--rules', type=int, default=30000,
+                        help="Number of rules in the config file.")
+    parser.add_argument('-n', '--reports', type=int, default=20000,
+                        help="Number of reports.")
+    parser.add_argument('--mode', nargs='+', choices=['linear', 'indexed'],
+                        default=['linear', 'indexed'],
+                        help="Matching modes to measure.")
+    args = parser.parse_args()
+
+    rules = create_rules(args.rules)
+    reports = create_reports(args.reports, args.rules)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_file = os.path.join(tmp_dir, 'review_status.yaml')
+        with open(config_file, 'w', encoding='utf-8') as f:
+            yaml.dump({'$version': 1, 'rules': rules}, f)
+
+        print(f"Config file: {args.rules} rules; {args.reports} reports")
+        print(f"{'mode':<8} {'load (s)':>8} {'match (s)':>9} {'reviewed':>8}")
+
+        expected = None
+        for mode in args.mode:
+            start = time.time()
+            handler = ReviewStatusHandler()
+            handler.set_review_status_config(config_file)
+            load = time.time() - start
+
+            start = time.time()
+            if mode == 'linear':
+                statuses = [linear_review_status(rules, report)
+                            for report in reports]
+            else:
+                statuses = []
+                for report in reports:
+                    status = handler.get_review_status_from_config(report)
+                    statuses.append(status.status if status else None)
+            match = time.time() - start
+
+            if expected is None:
+                expected = statuses
+            elif statuses != expected:
+                print(f"The review statuses of the {mode} mode are "
+                      f"different!")
+
+            reviewed = sum(status is not None for status in statuses)
+            print(f"{mode:<8} {load:>8.2f} {match:>9.2f} {reviewed:>8}")
+
+
+if __name__ == '__main__':
+    main()
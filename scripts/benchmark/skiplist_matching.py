@@ -0,0 +1,134 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Measure the time of deciding whether files are skipped by a large skip file,
+like the ones which are generated from code ownership data.
+
+A synthetic skip file is generated with plain directory lines and lines with
+wildcards. The files of a synthetic project are checked against it several
+times, like the files of the reports and the bug paths, in the following
+modes:
+  - linear: the regular expression of every skip line is tried in order,
+            like in the previous implementation.
+  - compiled: the compiled matcher of the skip list handler is used without
+              the memoized decisions.
+  - memoized: the skip list handler is used.
+
+The script has to be run with the CodeChecker package on the Python path:
+  PYTHONPATH=build/CodeChecker/lib/python3 \\
+  python3 scripts/benchmark/skiplist_matching.py -l 2000 -f 20000
+"""
+
+
+import argparse
+import fnmatch
+import os
+import random
+import re
+import time
+
+
+def create_skip_lines(line_num, wildcard_ratio):
+    """ Skip lines of directories and of patterns with wildcards. """
+    rnd = random.Random(0)
+    lines = []
+    for i in range(line_num):
+        sign = '+' if i % 5 == 0 else '-'
+        if rnd.random() < wildcard_ratio:
+            lines.append(f'{sign}*/component_{i}/*_test.cpp')
+        else:
+            lines.append(f'{sign}/project/team_{i % 50}/component_{i}/')
+    return lines
+
+
+def create_paths(file_num, line_num):
+    """ Paths of the project files, some of them are not in any component. """
+    rnd = random.Random(1)
+    paths = []
+    for i in range(file_num):
+        component = rnd.randrange(line_num * 2)
+        name = f'file_{i}_test.cpp' if i % 3 == 0 else f'file_{i}.cpp'
+        paths.append(f'/project/team_{component % 50}/component_{component}/'
+                     f'src/{name}')
+    return paths
+
+
+def linear_matcher(skip_lines):
+    """ The skip decision function of the previous implementation. """
+    skip = []
+    for skip_line in skip_lines:
+        norm_skip_path = os.path.normpath(skip_line[1:].strip())
+        skip.append((skip_line,
+                     re.compile(fnmatch.translate(norm_skip_path + '*'))))
+
+    def should_skip(source):
+        for line, rexpr in skip:
+            if rexpr.match(source):
+                return line[0] == '-'
+        return False
+
+    return should_skip
+
+
+def main():
+    # pylint: disable=import-outside-toplevel
+    from codechecker_common import skiplist_handler
+
+    parser = argparse.ArgumentParser(
+        description="Measure the time of deciding whether files are skipped "
+                    "by a large skip file.")
+    parser.add_argument('-l', '--lines', type=int, default=2000,
+                        help="Number of lines in the skip file.")
+    parser.add_argument('-w', '--wildcards', type=float, default=0.1,
+                        help="Ratio of the skip lines with wildcards.")
+    parser.add_argument('-f', '--files', type=int, default=20000,
+                        help="Number of different files which are checked.")
+    parser.add_argument('-r', '--repeat', type=int, default=10,
+                        help="Number of times every file is checked.")
+    parser.add_argument('--mode', nargs='+',
+                        choices=['linear', 'compiled', 'memoized'],
+                        default=['linear', 'compiled', 'memoized'],
+                        help="Matching modes to measure.")
+    args = parser.parse_args()
+
+    skip_lines = create_skip_lines(args.lines, args.wildcards)
+    paths = create_paths(args.files, args.lines)
+
+    print(f"Skip file: {args.lines} lines, {args.wildcards:.0%} with "
+          f"wildcards; {args.files} files checked {args.repeat} times")
+    print(f"{'mode':<9} {'build (s)':>9} {'check (s)':>9} {'skipped':>8}")
+
+    expected = None
+    for mode in args.mode:
+        start = time.time()
+        if mode == 'linear':
+            should_skip = linear_matcher(skip_lines)
+        elif mode == 'compiled':
+            should_skip = skiplist_handler._SkipMatcher(
+                skip_lines).should_skip
+        else:
+            should_skip = skiplist_handler.SkipListHandler(
+                '\n'.join(skip_lines)).should_skip
+        build = time.time() - start
+
+        start = time.time()
+        skipped = [should_skip(path) for _ in range(args.repeat)
+                   for path in paths]
+        check = time.time() - start
+
+        if expected is None:
+            expected = skipped
+        elif skipped != expected:
+            print(f"The decisions of the {mode} mode are different!")
+
+        print(f"{mode:<9} {build:>9.2f} {check:>9.2f} "
+              f"{sum(skipped[:len(paths)]):>8}")
+
+
+if __name__ == '__main__':
+    main()
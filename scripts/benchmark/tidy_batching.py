@@ -0,0 +1,151 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Measure the throughput of the clang-tidy analysis of many small source files
+with different batch sizes (see 'CodeChecker analyze --tidy-batch-size').
+
+A synthetic project is generated: every source file contains a few small
+functions and includes the same header. The project is analyzed by the
+'CodeChecker analyze' command with clang-tidy only, once for every batch
+size, and the analysis time and the number of reports are printed. The number
+of reports should be the same for every batch size.
+
+The script needs the CodeChecker command and clang-tidy:
+  PATH=build/CodeChecker/bin:$PATH \\
+  python3 scripts/benchmark/tidy_batching.py -n 2000 --batch-sizes 1 8 32
+"""
+
+
+import argparse
+import glob
+import json
+import os
+import plistlib
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+HEADER = """\
+#ifndef COMMON_H
+#define COMMON_H
+struct point { int x; int y; };
+int distance(const struct point *a, const struct point *b);
+#endif
+"""
+
+SOURCE = """\
+#include "common.h"
+
+int distance_{i}(const struct point *a, const struct point *b)
+{{
+  int dx = a->x - b->x;
+  int dy = a->y - b->y;
+  return dx * dx + dy * dy;
+}}
+
+int narrowing_{i}(double value)
+{{
+  int result = value;
+  return result;
+}}
+"""
+
+
+def create_project(directory, file_num):
+    """
+    Create the sources and the compilation database of the synthetic
+    project. Returns the path of the compilation database.
+    """
+    with open(os.path.join(directory, 'common.h'), 'w',
+              encoding='utf-8') as f:
+        f.write(HEADER)
+
+    commands = []
+    for i in range(file_num):
+        source = f'source_{i}.c'
+        with open(os.path.join(directory, source), 'w',
+                  encoding='utf-8') as f:
+            f.write(SOURCE.format(i=i))
+
+        commands.append({
+            'directory': directory,
+            'command': f'gcc -c -O2 -Wall {source} -o source_{i}.o',
+            'file': source})
+
+    compile_commands = os.path.join(directory, 'compile_commands.json')
+    with open(compile_commands, 'w', encoding='utf-8') as f:
+        json.dump(commands, f)
+
+    return compile_commands
+
+
+def count_reports(output_path):
+    """ Return the number of reports in the result files. """
+    reports = 0
+    for plist_file in glob.glob(os.path.join(output_path, '*.plist')):
+        with open(plist_file, 'rb') as f:
+            reports += len(plistlib.load(f).get('diagnostics', []))
+    return reports
+
+
+def run(codechecker, compile_commands, output_path, jobs, batch_size):
+    """ Analyze the project and return the analysis time in seconds. """
+    command = [codechecker, 'analyze', compile_commands,
+               '-o', output_path, '-j', str(jobs),
+               '--analyzers', 'clang-tidy',
+               '--enable', 'bugprone-narrowing-conversions',
+               '--tidy-batch-size', str(batch_size)]
+
+    start = time.time()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of batched clang-tidy "
+                    "analysis on a synthetic project of small files.")
+    parser.add_argument('-n', '--files', type=int, default=2000,
+                        help="Number of source files of the project.")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="Number of analysis worker processes.")
+    parser.add_argument('--batch-sizes', type=int, nargs='+',
+                        default=[1, 8, 32],
+                        help="Batch sizes to measure. Batch size 1 is the "
+                             "analysis without batching.")
+    parser.add_argument('--codechecker', default='CodeChecker',
+                        help="The CodeChecker command.")
+    args = parser.parse_args()
+
+    if not shutil.which(args.codechecker):
+        print(f"'{args.codechecker}' is not found.", file=sys.stderr)
+        sys.exit(1)
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        compile_commands = create_project(work_dir, args.files)
+
+        print(f"{'batch size':>10} {'files':>7} {'jobs':>5} {'wall (s)':>10} "
+              f"{'files/s':>9} {'reports':>8}")
+        for batch_size in args.batch_sizes:
+            output_path = os.path.join(work_dir, f'reports_{batch_size}')
+            duration = run(args.codechecker, compile_commands, output_path,
+                           args.jobs, batch_size)
+
+            print(f"{batch_size:>10} {args.files:>7} {args.jobs:>5} "
+                  f"{duration:>10.2f} {args.files / duration:>9.1f} "
+                  f"{count_reports(output_path):>8}")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    main()
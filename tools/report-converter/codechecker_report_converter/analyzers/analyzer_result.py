@@ -9,19 +9,35 @@
 import json
 import logging
 import os
+import pickle
+import shutil
+import tempfile
 
-from abc import ABCMeta, abstractmethod
+from abc import ABCMeta
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import hashlib
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from codechecker_report_converter.report import Report, report_file
 from codechecker_report_converter.report.hash import get_report_hash, HashType
 from codechecker_report_converter.report.parser.base import AnalyzerInfo
 
+from .parser import BaseParser
+
 
 LOG = logging.getLogger('report-converter')
 
+# Number of reports which are parsed from an analyzer result file before they
+# are saved to the temporary directory of the transformation.
+REPORT_BATCH_SIZE = 1000
+
+
+def get_source_file_hash(report: Report) -> str:
+    """ Hash of the source file path which is used in output file names. """
+    file_path = os.path.normpath(report.file.original_path)
+    return hashlib.md5(file_path.encode(errors='ignore')).hexdigest()
+
 
 class AnalyzerResultBase(metaclass=ABCMeta):
     """ Base class to transform analyzer result. """
@@ -41,11 +57,17 @@ class AnalyzerResultBase(metaclass=ABCMeta):
         output_dir_path: str,
         export_type: str,
         file_name: str = "{source_file}_{analyzer}_{file_hash}",
-        metadata: Optional[Dict[str, str]] = None
+        metadata: Optional[Dict[str, str]] = None,
+        jobs: int = 1
     ) -> bool:
         """
         Converts the given analyzer result to the output directory in the given
         output type.
+
+        The analyzer result files are parsed by the given number of processes.
+        The parsed reports are saved to a temporary directory by source files,
+        so only the reports of one source file are kept in memory when the
+        output file of it is written.
         """
         parser = report_file.get_parser(f".{export_type}")
         if not parser:
@@ -53,42 +75,135 @@ class AnalyzerResultBase(metaclass=ABCMeta):
                       export_type)
             return False
 
-        all_reports = []
+        tmp_dir = tempfile.mkdtemp(prefix='report-converter-')
+        try:
+            file_paths = [os.path.abspath(file_path) for file_path
+                          in analyzer_result_file_paths]
+            tasks = [(file_path, os.path.join(tmp_dir, str(index)))
+                     for index, file_path in enumerate(file_paths)]
+
+            if jobs <= 1 or len(tasks) <= 1:
+                source_files = [self._parse_result_file(*task)
+                                for task in tasks]
+            else:
+                with ProcessPoolExecutor(min(jobs, len(tasks))) as executor:
+                    source_files = list(executor.map(
+                        self._parse_result_file, *zip(*tasks)))
+
+            # The reports of a source file are written in the order of the
+            # analyzer result files.
+            result_dirs: Dict[str, List[str]] = defaultdict(list)
+            for (_, result_dir), file_hashes in zip(tasks, source_files):
+                for file_hash in file_hashes:
+                    result_dirs[file_hash].append(result_dir)
+
+            for file_hash, dirs in result_dirs.items():
+                self._write(
+                    self.__load_reports(dirs, file_hash), output_dir_path,
+                    parser, export_type, file_name)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        if metadata:
+            self._save_metadata(metadata, output_dir_path)
+        else:
+            LOG.warning("Use '--meta' option to provide extra information "
+                        "to the CodeChecker server such as analyzer version "
+                        "and analysis command when storing the results to it. "
+                        "For more information see the --help.")
+
+        return bool(result_dirs)
 
-        for file_path in analyzer_result_file_paths:
-            file_path = os.path.abspath(file_path)
-            reports = self.get_reports(file_path)
-            if not reports:
-                LOG.info("No '%s' results can be found in '%s'.",
-                         self.TOOL_NAME, file_path)
+    def _parse_result_file(self, file_path: str, result_dir: str) -> List[str]:
+        """
+        Parse the given analyzer result file and save the reports to the
+        given directory in batches, to a separate file for every source file.
+        Returns the hashes of the source files which have reports.
+        """
+        file_hashes: List[str] = []
 
+        def save(reports: List[Report]):
             self._post_process_result(reports)
 
+            file_reports: Dict[str, List[Report]] = defaultdict(list)
             for report in reports:
                 report.analyzer_result_file_path = file_path
 
                 if not report.checker_name:
                     report.checker_name = self.TOOL_NAME
 
-            all_reports.extend(reports)
+                file_reports[get_source_file_hash(report)].append(report)
 
-        self._write(
-            all_reports, output_dir_path, parser, export_type, file_name)
+            os.makedirs(result_dir, exist_ok=True)
+            for file_hash, source_reports in file_reports.items():
+                if file_hash not in file_hashes:
+                    file_hashes.append(file_hash)
 
-        if metadata:
-            self._save_metadata(metadata, output_dir_path)
-        else:
-            LOG.warning("Use '--meta' option to provide extra information "
-                        "to the CodeChecker server such as analyzer version "
-                        "and analysis command when storing the results to it. "
-                        "For more information see the --help.")
+                with open(os.path.join(result_dir, file_hash), 'ab') as f:
+                    pickle.dump(source_reports, f)
+
+        reports: List[Report] = []
+        for report in self.iter_reports(file_path):
+            reports.append(report)
+            if len(reports) >= REPORT_BATCH_SIZE:
+                save(reports)
+                reports = []
+
+        if reports:
+            save(reports)
+
+        if not file_hashes:
+            LOG.info("No '%s' results can be found in '%s'.",
+                     self.TOOL_NAME, file_path)
+
+        return file_hashes
 
-        return bool(all_reports)
+    @staticmethod
+    def __load_reports(result_dirs: List[str], file_hash: str) -> List[Report]:
+        """
+        Load the saved reports of the given source file from the given
+        directories.
+        """
+        reports: List[Report] = []
+        for result_dir in result_dirs:
+            with open(os.path.join(result_dir, file_hash), 'rb') as f:
+                while True:
+                    try:
+                        reports.extend(pickle.load(f))
+                    except EOFError:
+                        break
+
+        return reports
+
+    def _create_parser(self, file_path: str) -> Optional[BaseParser]:
+        """
+        Return the parser of the given analyzer result. Analyzers which don't
+        have a parser should override get_reports() instead.
+        """
+        # pylint: disable=unused-argument
+        return None
 
-    @abstractmethod
     def get_reports(self, file_path: str) -> List[Report]:
         """ Get reports from the given analyzer result. """
-        raise NotImplementedError("Subclasses should implement this!")
+        # pylint: disable=assignment-from-none
+        parser = self._create_parser(file_path)
+        if parser is None:
+            raise NotImplementedError("Subclasses should implement this!")
+
+        return parser.get_reports(file_path)
+
+    def iter_reports(self, file_path: str) -> Iterator[Report]:
+        """
+        Iterate over the reports of the given analyzer result. The reports
+        are parsed incrementally by the parser of the analyzer, without a
+        parser every report of the file is parsed first.
+        """
+        # pylint: disable=assignment-from-none
+        parser = self._create_parser(file_path)
+        if parser is None:
+            return iter(self.get_reports(file_path))
+
+        return parser.iter_reports(file_path)
 
     def _save_metadata(self, metadata, output_dir):
         """ Save metadata.json file to the output directory which will be used
@@ -154,8 +269,7 @@ class AnalyzerResultBase(metaclass=ABCMeta):
         analyzer_info = AnalyzerInfo(name=self.TOOL_NAME)
         for file_path, file_reports in file_to_report.items():
             source_file = os.path.basename(file_path)
-            file_hash = hashlib.md5(file_path.encode(errors='ignore')) \
-                .hexdigest()
+            file_hash = get_source_file_hash(file_reports[0])
 
             out_file_name = file_name \
                 .replace("{source_file}", source_file) \
@@ -6,11 +6,8 @@
 #
 # -------------------------------------------------------------------------
 
-from typing import List
-
-from codechecker_report_converter.report import Report
-
 from ..analyzer_result import AnalyzerResultBase
+from ..parser import BaseParser
 from .parser import Parser
 
 
@@ -21,6 +18,6 @@ class AnalyzerResult(AnalyzerResultBase):
     NAME = 'Kernel-Doc'
     URL = 'https://github.com/torvalds/linux/blob/master/scripts/kernel-doc'
 
-    def get_reports(self, file_path: str) -> List[Report]:
-        """ Get reports from the given analyzer result. """
-        return Parser(file_path).get_reports(file_path)
+    def _create_parser(self, file_path: str) -> BaseParser:
+        """ Return the parser of the given analyzer result. """
+        return Parser(file_path)
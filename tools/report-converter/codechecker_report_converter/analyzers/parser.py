@@ -10,7 +10,7 @@ import logging
 import os
 
 from abc import ABCMeta, abstractmethod
-from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 from codechecker_report_converter.report import File, Report
 
@@ -35,13 +35,33 @@ class BaseParser(metaclass=ABCMeta):
 
     def get_reports(self, file_path: str) -> List[Report]:
         """ Parse the given output. """
-        lines = self._get_analyzer_result_file_content(file_path)
-        if not lines:
-            return self.reports
-
-        return self.get_reports_from_iter(lines)
+        self.reports.extend(self.iter_reports(file_path))
+        return self.reports
 
     def get_reports_from_iter(self, lines: Iterable[str]) -> List[Report]:
+        """ Parse the given output lines. """
+        self.reports.extend(self.iter_reports_from_iter(lines))
+        return self.reports
+
+    def iter_reports(self, file_path: str) -> Iterator[Report]:
+        """
+        Parse the given output. The file is read line by line and the reports
+        are generated as soon as they are parsed, so the content of the whole
+        file is never kept in memory.
+        """
+        if not os.path.exists(file_path):
+            LOG.error("Result file does not exists: %s", file_path)
+            return
+
+        if os.path.isdir(file_path):
+            LOG.error("Directory is given instead of a file: %s", file_path)
+            return
+
+        with open(file_path, 'r', encoding='utf-8',
+                  errors='replace') as analyzer_result:
+            yield from self.iter_reports_from_iter(analyzer_result)
+
+    def iter_reports_from_iter(self, lines: Iterable[str]) -> Iterator[Report]:
         """ Parse the given output lines. """
         it = iter(lines)
         try:
@@ -49,30 +69,10 @@ class BaseParser(metaclass=ABCMeta):
             while True:
                 reports, next_line = self._parse_line(it, next_line)
                 if reports:
-                    self.reports.extend(reports)
+                    yield from reports
         except StopIteration:
             pass
 
-        return self.reports
-
-    def _get_analyzer_result_file_content(
-        self,
-        result_file_path: str
-    ) -> Optional[List[str]]:
-        """ Return the content of the given file. """
-        if not os.path.exists(result_file_path):
-            LOG.error("Result file does not exists: %s", result_file_path)
-            return None
-
-        if os.path.isdir(result_file_path):
-            LOG.error("Directory is given instead of a file: %s",
-                      result_file_path)
-            return None
-
-        with open(result_file_path, 'r', encoding='utf-8',
-                  errors='replace') as analyzer_result:
-            return analyzer_result.readlines()
-
     @abstractmethod
     def _parse_line(
         self,
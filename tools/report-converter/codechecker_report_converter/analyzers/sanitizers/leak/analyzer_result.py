@@ -7,11 +7,8 @@
 # -------------------------------------------------------------------------
 
 
-from typing import List
-
-from codechecker_report_converter.report import Report
-
 from ...analyzer_result import AnalyzerResultBase
+from ...parser import BaseParser
 from .parser import Parser
 
 
@@ -22,6 +19,6 @@ class AnalyzerResult(AnalyzerResultBase):
     NAME = 'LeakSanitizer'
     URL = 'https://clang.llvm.org/docs/LeakSanitizer.html'
 
-    def get_reports(self, file_path: str) -> List[Report]:
-        """ Get reports from the given analyzer result. """
-        return Parser().get_reports(file_path)
+    def _create_parser(self, file_path: str) -> BaseParser:
+        """ Return the parser of the given analyzer result. """
+        return Parser()
@@ -12,6 +12,7 @@ import argparse
 import glob
 import importlib
 import logging
+import multiprocessing
 import os
 import shutil
 import sys
@@ -83,7 +84,8 @@ def transform_output(
     file_name: str,
     export_type: str,
     clean: bool = False,
-    metadata: Optional[Dict[str, str]] = None
+    metadata: Optional[Dict[str, str]] = None,
+    jobs: int = 1
 ):
     """ Creates .plist files from the given output to the given output dir. """
     if clean and os.path.isdir(output_dir):
@@ -96,7 +98,7 @@ def transform_output(
 
     parser = supported_converters[parser_type]()
     parser.transform(
-        analyzer_results, output_dir, export_type, file_name, metadata)
+        analyzer_results, output_dir, export_type, file_name, metadata, jobs)
 
 
 def process_metadata(metadata) -> Tuple[Dict[str, str], Dict[str, str]]:
@@ -236,6 +238,14 @@ def __add_arguments_to_parser(parser):
                              "the absolute file path where the bug was "
                              "found. ")
 
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        dest="jobs",
+                        required=False,
+                        default=multiprocessing.cpu_count(),
+                        help="Number of processes which parse the code "
+                             "analyzer output result files.")
+
     parser.add_argument('-c', '--clean',
                         dest="clean",
                         required=False,
@@ -282,7 +292,7 @@ Supported analyzers:
 
     return transform_output(
         args.input, args.type, args.output_dir, args.filename, args.export,
-        args.clean, valid_metadata_values)
+        args.clean, valid_metadata_values, args.jobs)
 
 
 if __name__ == "__main__":
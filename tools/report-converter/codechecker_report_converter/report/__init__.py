@@ -17,6 +17,7 @@ import os
 from typing import Callable, Dict, List, Optional, Protocol, Set, Tuple
 
 from .. import util
+from ..source_cache import get_source_cache
 
 
 LOG = logging.getLogger('report-converter')
@@ -45,6 +46,7 @@ class File:
         self.__path = file_path
         self.__original_path = file_path
         self.__content = content
+        self.__lines: Optional[List[str]] = None
         self.__name: Optional[str] = None
 
     @property
@@ -78,9 +80,8 @@ class File:
     def content(self) -> str:
         """ Get file content. """
         if self.__content is None:
-            with open(self.original_path, 'r',
-                      encoding='utf-8', errors='replace') as f:
-                self.__content = f.read()
+            self.__content = get_source_cache().get(
+                self.original_path).get_content(errors='replace')
 
         return self.__content
 
@@ -98,7 +99,10 @@ class File:
         if self.__content is None:
             return util.get_line(self.original_path, line)
 
-        return self.__content.splitlines(keepends=True)[line - 1]
+        if self.__lines is None:
+            self.__lines = self.__content.splitlines(keepends=True)
+
+        return self.__lines[line - 1]
 
     def trim(self, path_prefixes: Optional[List[str]] = None) -> str:
         """ Removes the longest matching leading path from the file paths. """
@@ -448,10 +452,7 @@ class Report:
             self.__changed_files.add(self.analyzer_result_file_path)
 
         for file_path in self.original_files:
-            if not os.path.exists(file_path):
-                self.__changed_files.add(file_path)
-                continue
-
+            # It's None for missing files too.
             f_mtime = util.get_last_mod_time(file_path)
 
             if not f_mtime:
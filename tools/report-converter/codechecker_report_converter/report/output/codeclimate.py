@@ -7,9 +7,12 @@
 # -------------------------------------------------------------------------
 """Codeclimate output helpers."""
 
-from typing import Dict, List
+import sys
+
+from typing import Dict, Iterable, List, Optional
 
 from codechecker_report_converter.report import Report
+from codechecker_report_converter.util import dump_json_array, json_output
 
 
 def convert(reports: List[Report]) -> List[Dict]:
@@ -28,6 +31,21 @@ def convert(reports: List[Report]) -> List[Dict]:
     return codeclimate_reports
 
 
+def write(
+    reports: Iterable[Report],
+    output_file_path: Optional[str] = None,
+    out=sys.stdout
+):
+    """Write the given reports in Code Climate format.
+
+    The reports are converted and written one by one to the given output file
+    or to the given output if no file is given. The output is the same as the
+    output of dump_json_output() on convert().
+    """
+    with json_output(output_file_path, out) as f:
+        dump_json_array((__to_codeclimate(report) for report in reports), f)
+
+
 __codeclimate_severity_map = {
     'CRITICAL': 'critical',
     'HIGH': 'major',
@@ -12,7 +12,7 @@ import logging
 import os
 import re
 
-from typing import Dict, List, Union
+from typing import Dict, Iterable, List, Union
 
 from codechecker_report_converter.report import Report
 
@@ -20,11 +20,13 @@ from codechecker_report_converter.report import Report
 LOG = logging.getLogger('report-converter')
 
 
-def convert(reports: List[Report]) -> Dict:
+def convert(reports: Iterable[Report]) -> Dict:
     """Convert reports to gerrit review format.
 
     Process the required environment variables and convert the reports
-    to the required gerrit json format.
+    to the required gerrit json format. The reports are iterated only once,
+    so they can be generated while converting: only the review comments are
+    kept in memory.
     """
     repo_dir = os.environ.get('CC_REPO_DIR')
     report_url = os.environ.get('CC_REPORT_URL')
@@ -58,7 +60,7 @@ def mandatory_env_var_is_set():
     return no_missing_env_var
 
 
-def __convert_reports(reports: List[Report],
+def __convert_reports(reports: Iterable[Report],
                       repo_dir: Union[str, None],
                       report_url: Union[str, None],
                       changed_files: List[str],
@@ -8,6 +8,7 @@
 # -------------------------------------------------------------------------
 
 import argparse
+import multiprocessing
 import os
 import sys
 
@@ -45,6 +46,14 @@ def __add_arguments_to_parser(parser: argparse.ArgumentParser):
                         help="Directory which contains dependency HTML, CSS "
                              "and JavaScript files.")
 
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        dest="jobs",
+                        required=False,
+                        default=multiprocessing.cpu_count(),
+                        help="Number of processes which write the HTML "
+                             "files.")
+
 
 def main():
     """ Report to HTML main command line. """
@@ -64,7 +73,7 @@ def main():
     # Source files which modification time changed since the last analysis.
     changed_source_files = set()
 
-    html_builder = HtmlBuilder(args.layout_dir)
+    html_builder = HtmlBuilder(args.layout_dir, jobs=args.jobs)
     for input_path in args.input:
         changed_files = parse(input_path, args.output_dir, args.layout_dir,
                               html_builder)
@@ -6,6 +6,8 @@
 #
 # -------------------------------------------------------------------------
 
+from concurrent.futures import Future, ProcessPoolExecutor
+import hashlib
 import html
 import io
 import json
@@ -14,9 +16,9 @@ import os
 import shutil
 import sys
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from string import Template
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from codechecker_report_converter.report import BugPathEvent, \
     InvalidFileContentMsg, File, MacroExpansion, Report, report_file, \
@@ -84,11 +86,20 @@ HTMLReports = List[HTMLReport]
 class FileSource(TypedDict):
     id: str
     filePath: str
-    content: str
+    # Path of the script which adds the content of the file to a report page
+    # relative to the output directory.
+    asset: str
 
 
 FileSources = Dict[str, FileSource]
 
+# Directory of the source file assets in the output directory. Every source
+# file is written once and it is loaded by the report pages which refer to it.
+SOURCES_DIR = 'sources'
+
+# Maximum number of report pages per process which are waiting to be written.
+MAX_PENDING_PAGES_PER_JOB = 4
+
 
 class HtmlReportLink(TypedDict):
     report: HTMLReport
@@ -101,20 +112,108 @@ def get_file_content(file_path: str) -> str:
         return f.read()
 
 
+class _PageWriter:
+    """ Write the report pages and the source file assets. """
+
+    def __init__(self, layout: Template, tag_contents: Dict[str, str]):
+        self.__layout = layout
+        self.__tag_contents = tag_contents
+
+    @staticmethod
+    def __write_source_file(
+        output_dir: str,
+        file_source: FileSource,
+        file: File
+    ):
+        """ Write the script which adds the given file to a report page. """
+        try:
+            file_content = file.content
+        except Exception:
+            file_content = InvalidFileContentMsg
+
+        data = json.dumps({
+            'id': file_source['id'],
+            'filePath': file_source['filePath'],
+            'content': html.escape(file_content)})
+
+        with open(os.path.join(output_dir, file_source['asset']), 'w',
+                  encoding='utf-8', errors='replace') as f:
+            f.write(f"addSourceFile({data});\n")
+
+    def write(
+        self,
+        output_file_path: str,
+        html_reports: HTMLReports,
+        assets: List[str],
+        new_files: List[Tuple[FileSource, File]]
+    ):
+        """
+        Write the report page of the given reports which loads the given
+        source file assets. The source files which are not written yet are
+        written to the output directory of the page.
+        """
+        output_dir = os.path.dirname(output_file_path)
+        for file_source, file in new_files:
+            self.__write_source_file(output_dir, file_source, file)
+
+        content = self.__layout.substitute(
+            self.__tag_contents,
+            report_data=json.dumps({'files': {}, 'reports': html_reports}),
+            source_files='\n'.join(
+                f'<script type="text/javascript" src="{asset}"></script>'
+                for asset in assets))
+
+        with open(output_file_path, 'w+',
+                  encoding='utf-8', errors='replace') as f:
+            f.write(content)
+
+
+# Page writer of the processes which write the report pages, see
+# init_page_writer().
+PAGE_WRITER: Optional[_PageWriter] = None
+
+
+def init_page_writer(page_writer: _PageWriter):
+    """ Initialize a process which writes report pages. """
+    global PAGE_WRITER
+    PAGE_WRITER = page_writer
+
+
+def write_page(task):
+    """
+    Write the report page of the given (output file path, html reports, source
+    file assets, new source files) task in a page writer process.
+    """
+    PAGE_WRITER.write(*task)
+
+
 class HtmlBuilder:
     """
     Helper class to create html file from a report data.
+
+    The report pages are written by the given number of processes. The
+    content of every source file is written only once to the 'sources'
+    directory of the output, and the report pages load the source files of
+    their reports from there.
     """
     def __init__(
         self,
         layout_dir: str,
-        checker_labels: Optional[CheckerLabels] = None
+        checker_labels: Optional[CheckerLabels] = None,
+        jobs: int = 1
     ):
         self._checker_labels = checker_labels
         self.layout_dir = layout_dir
+        self.jobs = jobs
         self.generated_html_reports: Dict[str, HTMLReports] = {}
         self.files: FileSources = {}
 
+        # Source files which are not written to the output directory yet.
+        self.__new_files: List[Tuple[FileSource, File]] = []
+
+        self.__executor: Optional[ProcessPoolExecutor] = None
+        self.__pending_pages: Deque[Future] = deque()
+
         css_dir = os.path.join(self.layout_dir, 'css')
         js_dir = os.path.join(self.layout_dir, 'js')
         codemirror_dir = os.path.join(
@@ -154,6 +253,9 @@ class HtmlBuilder:
         for tag, filepath in self._layout_tag_files.items():
             self._tag_contents[tag] = get_file_content(filepath)
 
+        self.__page_writer = _PageWriter(self._layout,
+                                         dict(self._tag_contents))
+
     def get_severity(self, checker_name: str) -> str:
         """ Returns severity level for the given checker name. """
         return self._checker_labels.severity(checker_name) \
@@ -162,20 +264,17 @@ class HtmlBuilder:
     def _add_source_file(self, file: File) -> FileSource:
         """
         Updates file source data by file id if the given file hasn't been
-        processed.
+        processed. The content of the file is written by the next report page.
         """
         if file.id in self.files:
             return self.files[file.id]
 
-        try:
-            file_content = file.content
-        except Exception:
-            file_content = InvalidFileContentMsg
-
+        file_hash = hashlib.sha1(str(file.id).encode('utf-8')).hexdigest()
         self.files[file.id] = {
             'id': file.id, 'filePath': file.path,
-            'content': html.escape(file_content)
+            'asset': f"{SOURCES_DIR}/{file_hash}.js"
         }
+        self.__new_files.append((self.files[file.id], file))
 
         return self.files[file.id]
 
@@ -279,28 +378,51 @@ class HtmlBuilder:
 
         self.generated_html_reports[output_file_path] = html_reports
 
-        substitute_data = self._tag_contents
-        substitute_data.update({
-            'report_data': json.dumps({
-                'files': files,
-                'reports': html_reports
-            })
-        })
+        if self.__new_files:
+            os.makedirs(os.path.join(os.path.dirname(output_file_path),
+                                     SOURCES_DIR), exist_ok=True)
 
-        content = self._layout.substitute(substitute_data)
+        task = (output_file_path, html_reports,
+                sorted(f['asset'] for f in files.values()), self.__new_files)
+        self.__new_files = []
 
-        with open(output_file_path, 'w+',
-                  encoding='utf-8', errors='replace') as f:
-            f.write(content)
+        if self.jobs <= 1:
+            self.__page_writer.write(*task)
+            return html_reports, changed_files
+
+        if not self.__executor:
+            self.__executor = ProcessPoolExecutor(
+                self.jobs, initializer=init_page_writer,
+                initargs=(self.__page_writer,))
+
+        # Wait for the oldest pages, so the pending pages don't have to be
+        # kept in memory.
+        while len(self.__pending_pages) >= \
+                self.jobs * MAX_PENDING_PAGES_PER_JOB:
+            self.__pending_pages.popleft().result()
+
+        self.__pending_pages.append(self.__executor.submit(write_page, task))
 
         return html_reports, changed_files
 
+    def wait_for_pages(self):
+        """ Wait until every report page is written. """
+        try:
+            while self.__pending_pages:
+                self.__pending_pages.popleft().result()
+        finally:
+            if self.__executor:
+                self.__executor.shutdown()
+                self.__executor = None
+
     def create_index_html(self, output_dir: str):
         """
         Creates an index.html file which lists all available bugs which was
         found in the processed plist files. This also creates a link for each
         bug to the created html file where the bug can be found.
         """
+        self.wait_for_pages()
+
         # Sort reports based on file path levels.
         html_report_links: List[HtmlReportLink] = []
         for html_file, reports in self.generated_html_reports.items():
@@ -335,6 +457,8 @@ class HtmlBuilder:
         Creates a statistics.html file which contains statistics information
         from the HTML generation process.
         """
+        self.wait_for_pages()
+
         def severity_order(severity: str) -> int:
             """
             This function determines in which order severities should be
@@ -7,17 +7,38 @@
 # -------------------------------------------------------------------------
 """ JSON output helpers. """
 
-from typing import Dict, List
+import sys
+
+from typing import Dict, Iterable, List, Optional
 
 from codechecker_report_converter.report import Report
+from codechecker_report_converter.util import dump_json_array, json_output
+
+
+VERSION = 1
 
 
 def convert(reports: List[Report]) -> Dict:
     """ Convert the given reports to JSON format. """
-    version = 1
-
     json_reports = []
     for report in reports:
         json_reports.append(report.to_json())
 
-    return {"version": version, "reports": json_reports}
+    return {"version": VERSION, "reports": json_reports}
+
+
+def write(
+    reports: Iterable[Report],
+    output_file_path: Optional[str] = None,
+    out=sys.stdout
+):
+    """
+    Write the given reports in JSON format to the given output file or to the
+    given output if no file is given. The reports are converted and written
+    one by one, so they can be generated while writing. The output is the
+    same as the output of dump_json_output() on convert().
+    """
+    with json_output(output_file_path, out) as f:
+        f.write(f'{{"version": {VERSION}, "reports": ')
+        dump_json_array((report.to_json() for report in reports), f)
+        f.write('}')
@@ -77,6 +77,11 @@ class AnalyzerInfo:
 
 class BaseParser(metaclass=ABCMeta):
     """ Base class to manage analyzer result file. """
+
+    # True if the severity of the reports is set by get_severity() from the
+    # checker labels instead of the analyzer result file.
+    severity_from_checker_labels = False
+
     def __init__(
         self,
         checker_labels: Optional[CheckerLabels] = None,
@@ -10,6 +10,7 @@ Parse the plist output of an analyzer
 """
 
 import importlib
+import itertools
 import logging
 import os
 import plistlib
@@ -17,10 +18,11 @@ import traceback
 import sys
 
 from plistlib import _PlistParser  # type: ignore
-from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 from xml.parsers.expat import ExpatError
 import lxml
+from lxml.etree import Element, iterparse  # pylint: disable=no-name-in-module
 
 from codechecker_report_converter.report import \
     BugPathEvent, BugPathPosition, \
@@ -171,6 +173,164 @@ def parse(fp: BinaryIO):
     return None
 
 
+class _UnsupportedPlist(Exception):
+    """ The plist file can't be read by iter_parse(). """
+
+
+def __iter_dict_items(elem) -> Iterator[Tuple[str, Any]]:
+    """ Yield the keys and the value elements of a plist dict element. """
+    key = None
+
+    # Comments and processing instructions are skipped.
+    for child in elem.iterchildren(Element):
+        if child.tag == 'key':
+            if key is not None or len(child):
+                raise _UnsupportedPlist(f"Unexpected key at line "
+                                        f"{child.sourceline}.")
+            key = child.text or ''
+        elif key is None:
+            raise _UnsupportedPlist(f"Unexpected element at line "
+                                    f"{child.sourceline}.")
+        else:
+            yield key, child
+            key = None
+
+    if key is not None:
+        raise _UnsupportedPlist(f"Missing value for key '{key}' at line "
+                                f"{elem.sourceline}.")
+
+
+def __get_plist_value(elem) -> PlistItem:
+    """
+    Convert a plist element to the same object as the plistlib parser does.
+    """
+    tag = elem.tag
+    if tag == 'dict':
+        return {key: __get_plist_value(value)
+                for key, value in __iter_dict_items(elem)}
+
+    if tag == 'array':
+        return [__get_plist_value(child)
+                for child in elem.iterchildren(Element)]
+
+    if len(elem):
+        raise _UnsupportedPlist(f"Unexpected child element of '{tag}' at "
+                                f"line {elem.sourceline}.")
+
+    text = elem.text or ''
+    if tag == 'integer':
+        if text.startswith('0x') or text.startswith('0X'):
+            return int(text, 16)
+        return int(text)
+
+    if tag == 'string':
+        return text
+
+    if tag == 'real':
+        return float(text)
+
+    if tag == 'true':
+        return True
+
+    if tag == 'false':
+        return False
+
+    raise _UnsupportedPlist(f"Unsupported element '{tag}' at line "
+                            f"{elem.sourceline}.")
+
+
+def __is_root_dict(elem) -> bool:
+    """ True if the given element is the root dict of the plist. """
+    if elem is None or elem.tag != 'dict':
+        return False
+
+    parent = elem.getparent()
+    return parent is None or \
+        (parent.tag == 'plist' and parent.getparent() is None)
+
+
+def __is_diagnostics(elem) -> bool:
+    """ True if the given element is the diagnostics array of the plist. """
+    if elem.tag != 'array' or not __is_root_dict(elem.getparent()):
+        return False
+
+    key = elem.getprevious()
+    return key is not None and key.tag == 'key' and \
+        key.text == 'diagnostics'
+
+
+def __check_diagnostic(elem):
+    """ Diagnostics which are not dicts are not supported by iter_parse(). """
+    if isinstance(elem.tag, str) and elem.tag != 'dict':
+        raise _UnsupportedPlist(f"Unexpected diagnostic at line "
+                                f"{elem.sourceline}.")
+
+
+def iter_parse(
+    fp: BinaryIO,
+    plist: Dict[str, PlistItem]
+) -> Iterator[Dict[str, PlistItem]]:
+    """
+    Read a .plist file and yield its diagnostics one by one. The other items
+    of the root dictionary are added to the given 'plist' dictionary after
+    the last diagnostic.
+
+    Unlike parse(), this function builds the object of only one diagnostic
+    at a time. The elements of a diagnostic are dropped after it is
+    converted. The objects are the same as the ones built by parse(). If
+    the file is invalid, or has an element this function doesn't handle, an
+    exception is raised. In that case the file can still be read by parse().
+    """
+    # Only the end of dict elements are processed in Python.
+    context = iterparse(fp, events=('end',), tag='dict')
+
+    diagnostics = None
+    for _, elem in context:
+        parent = elem.getparent()
+        if parent is None:
+            continue
+
+        if diagnostics is None:
+            if not __is_diagnostics(parent):
+                continue
+            diagnostics = parent
+        elif parent is not diagnostics:
+            continue
+
+        # Drop the elements of the previous diagnostic.
+        while elem.getprevious() is not None:
+            __check_diagnostic(elem.getprevious())
+            del diagnostics[0]
+
+        yield __get_plist_value(elem)
+        elem.clear()
+
+    root = context.root
+    if root.tag == 'plist':
+        children = list(root.iterchildren(Element))
+        root = children[0] if len(children) == 1 else None
+
+    if not __is_root_dict(root):
+        raise _UnsupportedPlist("The root object of the plist is not a "
+                                "dictionary.")
+
+    for key, value in __iter_dict_items(root):
+        if key == 'diagnostics':
+            if value is diagnostics:
+                for child in diagnostics:
+                    __check_diagnostic(child)
+                continue
+
+            # Diagnostics without any dict elements.
+            if diagnostics is None and __get_plist_value(value) == []:
+                continue
+
+            raise _UnsupportedPlist(f"Unexpected diagnostics at line "
+                                    f"{value.sourceline}.")
+
+        plist[key] = __get_plist_value(value)
+
+
 def get_file_index_map(
     plist: Any,
     source_dir_path: str,
@@ -187,18 +347,102 @@ def get_file_index_map(
     return file_index_map
 
 
+class _FileIndex:
+    """
+    Index of a file of the plist. The diagnostics are before the files in
+    the plist, so the files of the reports are set after all the diagnostics
+    are read.
+    """
+    __slots__ = ('index',)
+
+    def __init__(self, index: int):
+        self.index = index
+
+
+class _FileIndexMap(dict):
+    """ File index map which returns the file indexes themselves. """
+    def __missing__(self, index: int) -> _FileIndex:
+        file_index = _FileIndex(index)
+        self[index] = file_index
+        return file_index
+
+
 class Parser(BaseParser):
+    severity_from_checker_labels = True
+
     def get_reports(
         self,
         analyzer_result_file_path: str,
         source_dir_path: Optional[str] = None
     ) -> List[Report]:
         """ Get reports from the given analyzer result file. """
-        reports: List[Report] = []
-
         if not source_dir_path:
             source_dir_path = os.path.dirname(analyzer_result_file_path)
 
+        try:
+            return self.__get_reports_from_stream(
+                analyzer_result_file_path, source_dir_path)
+        except Exception as ex:
+            # The plist object of the whole file is built which handles the
+            # plist files the stream parser doesn't and reports the errors.
+            LOG.debug("Failed to read the diagnostics of '%s' one by one: %s",
+                      analyzer_result_file_path, ex)
+
+        return self.__get_reports_from_plist(
+            analyzer_result_file_path, source_dir_path)
+
+    def __get_reports_from_stream(
+        self,
+        analyzer_result_file_path: str,
+        source_dir_path: str
+    ) -> List[Report]:
+        """
+        Get reports from the given analyzer result file without building the
+        plist object of the whole file.
+        """
+        plist: Dict[str, PlistItem] = {}
+        file_indexes = _FileIndexMap()
+
+        with open(analyzer_result_file_path, 'rb') as fp:
+            reports = [self.__create_report(
+                analyzer_result_file_path, diag, file_indexes, None)
+                for diag in iter_parse(fp, plist)]
+
+        metadata = plist.get('metadata')
+        files = get_file_index_map(plist, source_dir_path, self._file_cache)
+
+        for report in reports:
+            self.__set_files(report, files)
+            report.analyzer_name = self.__get_analyzer_name(
+                report.checker_name, metadata)
+
+        # The hashes are generated only if every report is valid, so their
+        # errors are not logged again if the file is read as a whole.
+        for report in reports:
+            if report.report_hash is None:
+                report.report_hash = get_report_hash(
+                    report, HashType.PATH_SENSITIVE)
+
+        return reports
+
+    @staticmethod
+    def __set_files(report: Report, files: Dict[int, File]):
+        """ Replace the file indexes of the report with the files. """
+        report.file = files[report.file.index]
+        for item in itertools.chain(report.bug_path_events,
+                                    report.bug_path_positions,
+                                    report.notes,
+                                    report.macro_expansions):
+            item.file = files[item.file.index]
+
+    def __get_reports_from_plist(
+        self,
+        analyzer_result_file_path: str,
+        source_dir_path: str
+    ) -> List[Report]:
+        """ Get reports from the plist object of the given file. """
+        reports: List[Report] = []
+
         try:
             with open(analyzer_result_file_path, 'rb') as fp:
                 plist = parse(fp)
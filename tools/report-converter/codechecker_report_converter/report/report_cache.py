@@ -0,0 +1,437 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Binary cache files of the reports of the analyzer result files.
+
+Parsing the plist and SARIF files is the most expensive part of reading the
+reports, and the same result files are read by several commands (parse,
+store, cmd diff). The reports of an analyzer result file can be saved in a
+cache file next to it and the next read of the unchanged result file doesn't
+have to parse XML or JSON.
+
+The cache file contains a header, a string table and a stream of integers:
+  - The header holds the format version and the modification time and the
+    size of the analyzer result file when it was parsed.
+  - Every string (file paths, checker names, messages, etc.) is stored once
+    in the string table and it is referenced by its index.
+  - The reports are encoded in the integer stream: string references, line
+    and column numbers and the number of the bug path elements.
+
+A cache file is used only if the analyzer result file, the source directory
+of the relative paths and the files referenced by the reports are unchanged.
+The latter is needed because the parsers compute the missing report hashes
+from the content of the source files. The severity of the reports depends on
+the checker labels, so it is not saved but it is set again by the parser.
+"""
+
+from array import array
+import itertools
+import logging
+import os
+import struct
+import sys
+import uuid
+
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from codechecker_report_converter.report import BugPathEvent, \
+    BugPathPosition, File, get_or_create_file, MacroExpansion, Range, Report
+
+
+LOG = logging.getLogger('report-converter')
+
+# Increase this number if the layout of the cache files or the output of the
+# parsers change so the old cache files are not used anymore.
+CACHE_VERSION = 1
+
+# Extension of the cache files. The cache file of 'x.plist' is 'x.plist.cache'
+# so it is not an analyzer result file itself.
+CACHE_EXTENSION = '.cache'
+
+MAGIC = b'CCRC'
+
+# Magic, version, modification time and size of the analyzer result file,
+# number of strings and number of integers.
+HEADER = struct.Struct('<4sHqqII')
+
+# Integer which represents a None value (missing string, line, etc.).
+NONE = -2 ** 63
+
+Fingerprint = Tuple[int, int]
+
+
+class _Encoder:
+    """ Encode reports into a string table and an integer stream. """
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.ints = array('q')
+        self.__string_index: Dict[str, int] = {}
+
+    def add_int(self, value: Optional[int]):
+        """ Add an optional integer to the stream. """
+        if value is None:
+            self.ints.append(NONE)
+        elif isinstance(value, int):
+            self.ints.append(value)
+        else:
+            raise TypeError(f"Unsupported integer value: {value!r}")
+
+    def add_str(self, value: Optional[str]):
+        """ Add a reference of an optional string to the stream. """
+        if value is None:
+            self.ints.append(NONE)
+            return
+
+        if not isinstance(value, str):
+            raise TypeError(f"Unsupported string value: {value!r}")
+
+        index = self.__string_index.get(value)
+        if index is None:
+            index = self.__string_index[value] = len(self.strings)
+            self.strings.append(value)
+        self.ints.append(index)
+
+    def add_range(self, file_range: Optional[Range]):
+        """ Add an optional range to the stream. """
+        if file_range is None:
+            self.ints.append(0)
+            return
+
+        self.ints.append(1)
+        self.add_int(file_range.start_line)
+        self.add_int(file_range.start_col)
+        self.add_int(file_range.end_line)
+        self.add_int(file_range.end_col)
+
+    def add_event(self, event: BugPathEvent):
+        """ Add a bug path event or a note to the stream. """
+        self.add_str(event.message)
+        self.add_str(event.file.original_path)
+        self.add_int(event.line)
+        self.add_int(event.column)
+        self.add_range(event.range)
+
+    def add_report(self, report: Report, with_severity: bool):
+        """ Add a report to the stream. """
+        self.add_str(report.file.original_path)
+        self.add_int(report.line)
+        self.add_int(report.column)
+        self.add_str(report.message)
+        self.add_str(report.checker_name)
+        self.add_str(report.severity if with_severity else None)
+        self.add_str(report.report_hash)
+        self.add_str(report.analyzer_name)
+        self.add_str(report.category)
+        self.add_str(report.type)
+        self.add_str(None if report.static_message == report.message
+                     else report.static_message)
+
+        self.add_int(len(report.bug_path_events))
+        for event in report.bug_path_events:
+            self.add_event(event)
+
+        self.add_int(len(report.bug_path_positions))
+        for position in report.bug_path_positions:
+            self.add_str(position.file.original_path)
+            self.add_range(position.range)
+
+        self.add_int(len(report.notes))
+        for note in report.notes:
+            self.add_event(note)
+
+        self.add_int(len(report.macro_expansions))
+        for macro in report.macro_expansions:
+            self.add_str(macro.name)
+            self.add_event(macro)
+
+        if report.annotations is None:
+            self.add_int(None)
+        else:
+            self.add_int(len(report.annotations))
+            for key, value in report.annotations.items():
+                self.add_str(key)
+                self.add_str(value)
+
+
+class _Decoder:
+    """ Decode reports from a string table and an integer stream. """
+
+    def __init__(
+        self,
+        strings: List[str],
+        ints: array,
+        file_cache: Dict[str, File]
+    ):
+        self.__strings = strings
+        self.__ints: Iterator[int] = iter(ints)
+        self.__file_cache = file_cache
+
+    def get_int(self) -> Optional[int]:
+        """ Get the next optional integer of the stream. """
+        value = next(self.__ints)
+        return None if value == NONE else value
+
+    def get_str(self) -> Optional[str]:
+        """ Get the next optional string of the stream. """
+        index = next(self.__ints)
+        return None if index == NONE else self.__strings[index]
+
+    def get_file(self) -> File:
+        """ Get the file of the next string of the stream. """
+        return get_or_create_file(self.__strings[next(self.__ints)],
+                                  self.__file_cache)
+
+    def get_range(self) -> Optional[Range]:
+        """ Get the next optional range of the stream. """
+        if not next(self.__ints):
+            return None
+
+        return Range(self.get_int(), self.get_int(), self.get_int(),
+                     self.get_int())
+
+    def get_event(self) -> BugPathEvent:
+        """ Get the next bug path event or note of the stream. """
+        message = self.get_str()
+        return BugPathEvent(message, self.get_file(), self.get_int(),
+                            self.get_int(), self.get_range())
+
+    def get_macro_expansion(self) -> MacroExpansion:
+        """ Get the next macro expansion of the stream. """
+        name = self.get_str()
+        event = self.get_event()
+        return MacroExpansion(event.message, name, event.file, event.line,
+                              event.column, event.range)
+
+    def get_report(
+        self,
+        analyzer_result_file_path: str,
+        get_severity: Optional[Callable[[str], Optional[str]]]
+    ) -> Report:
+        """ Get the next report of the stream. """
+        file = self.get_file()
+        line = self.get_int()
+        column = self.get_int()
+        message = self.get_str()
+        checker_name = self.get_str()
+        severity = self.get_str()
+        report_hash = self.get_str()
+        analyzer_name = self.get_str()
+        category = self.get_str()
+        report_type = self.get_str()
+        static_message = self.get_str()
+
+        bug_path_events = [self.get_event() for _ in range(self.get_int())]
+
+        bug_path_positions = [
+            BugPathPosition(self.get_file(), self.get_range())
+            for _ in range(self.get_int())]
+
+        notes = [self.get_event() for _ in range(self.get_int())]
+
+        macro_expansions = [self.get_macro_expansion()
+                            for _ in range(self.get_int())]
+
+        annotations = None
+        annotation_num = self.get_int()
+        if annotation_num is not None:
+            annotations = {}
+            for _ in range(annotation_num):
+                key = self.get_str()
+                annotations[key] = self.get_str()
+
+        if get_severity:
+            severity = get_severity(checker_name)
+
+        return Report(
+            file, line, column, message, checker_name,
+            severity=severity,
+            report_hash=report_hash,
+            analyzer_name=analyzer_name,
+            category=category,
+            type=report_type,
+            analyzer_result_file_path=analyzer_result_file_path,
+            bug_path_events=bug_path_events,
+            bug_path_positions=bug_path_positions,
+            notes=notes,
+            macro_expansions=macro_expansions,
+            annotations=annotations,
+            static_message=static_message)
+
+    def get_fingerprints(self) -> Iterator[Tuple[str, Fingerprint]]:
+        """ Get the fingerprints of the files at the end of the stream. """
+        for _ in range(self.get_int()):
+            yield self.get_str(), (self.get_int(), self.get_int())
+
+
+def get_cache_file_path(analyzer_result_file_path: str) -> str:
+    """ Path of the cache file of the given analyzer result file. """
+    return analyzer_result_file_path + CACHE_EXTENSION
+
+
+def is_cache_file(file_path: str) -> bool:
+    """ True if the given file is a report cache file. """
+    return file_path.endswith(CACHE_EXTENSION)
+
+
+def get_fingerprint(file_path: str) -> Optional[Fingerprint]:
+    """
+    Modification time and size of the given file or None if the file is
+    missing.
+    """
+    try:
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def __to_bytes(values: array) -> bytes:
+    """ Little endian representation of the given array. """
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def __from_bytes(typecode: str, data: bytes) -> array:
+    """ Array of the given little endian representation. """
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def store(
+    analyzer_result_file_path: str,
+    fingerprint: Fingerprint,
+    source_dir_path: str,
+    reports: List[Report],
+    with_severity: bool
+):
+    """
+    Save the reports of the analyzer result file in its cache file.
+
+    The fingerprint is the modification time and the size of the analyzer
+    result file before it was parsed. The severity of the reports is saved
+    only if it doesn't come from the checker labels. Failing to write the
+    cache file is not an error, the result file is parsed again next time.
+    """
+    encoder = _Encoder()
+    try:
+        encoder.add_str(source_dir_path)
+
+        encoder.add_int(len(reports))
+        for report in reports:
+            encoder.add_report(report, with_severity)
+
+        file_paths = sorted({f for r in reports for f in r.original_files})
+        encoder.add_int(len(file_paths))
+        for file_path in file_paths:
+            file_fingerprint = get_fingerprint(file_path) or (None, None)
+            encoder.add_str(file_path)
+            encoder.add_int(file_fingerprint[0])
+            encoder.add_int(file_fingerprint[1])
+    except TypeError as ex:
+        LOG.debug("Failed to encode the reports of %s: %s",
+                  analyzer_result_file_path, ex)
+        return
+
+    lengths = array('I', map(len, encoder.strings))
+    data = b''.join([
+        HEADER.pack(MAGIC, CACHE_VERSION, fingerprint[0], fingerprint[1],
+                    len(lengths), len(encoder.ints)),
+        __to_bytes(lengths),
+        __to_bytes(encoder.ints),
+        ''.join(encoder.strings).encode('utf-8', 'surrogatepass')])
+
+    cache_file_path = get_cache_file_path(analyzer_result_file_path)
+
+    # The cache file is replaced atomically, so a parallel reader never sees
+    # a partially written file.
+    tmp_file_path = f"{cache_file_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_file_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file_path, cache_file_path)
+    except OSError as ex:
+        LOG.debug("Failed to write report cache file %s: %s",
+                  cache_file_path, ex)
+        try:
+            os.remove(tmp_file_path)
+        except OSError:
+            pass
+
+
+def load(
+    analyzer_result_file_path: str,
+    fingerprint: Fingerprint,
+    source_dir_path: str,
+    file_cache: Dict[str, File],
+    get_severity: Optional[Callable[[str], Optional[str]]] = None
+) -> Optional[List[Report]]:
+    """
+    Get the reports of the analyzer result file from its cache file. None
+    returns if there is no valid cache file for the given fingerprint of the
+    analyzer result file, source directory and the current referenced files.
+
+    If get_severity is given, the severity of the reports is set by it
+    instead of the saved one.
+    """
+    cache_file_path = get_cache_file_path(analyzer_result_file_path)
+    try:
+        with open(cache_file_path, 'rb') as f:
+            header = f.read(HEADER.size)
+            if len(header) != HEADER.size:
+                return None
+
+            magic, version, mtime, size, string_num, int_num = \
+                HEADER.unpack(header)
+            if magic != MAGIC or version != CACHE_VERSION or \
+                    (mtime, size) != fingerprint:
+                return None
+
+            data = f.read()
+    except OSError:
+        return None
+
+    try:
+        lengths_size = string_num * array('I').itemsize
+        ints_size = int_num * array('q').itemsize
+
+        lengths = __from_bytes('I', data[:lengths_size])
+        ints = __from_bytes('q', data[lengths_size:lengths_size + ints_size])
+        content = data[lengths_size + ints_size:].decode(
+            'utf-8', 'surrogatepass')
+
+        offsets = list(itertools.accumulate(lengths, initial=0))
+        if len(ints) != int_num or offsets[-1] != len(content):
+            raise ValueError("Truncated cache file")
+
+        strings = [content[begin:end]
+                   for begin, end in zip(offsets, offsets[1:])]
+
+        decoder = _Decoder(strings, ints, file_cache)
+        if decoder.get_str() != source_dir_path:
+            return None
+
+        reports = [decoder.get_report(analyzer_result_file_path, get_severity)
+                   for _ in range(decoder.get_int())]
+
+        for file_path, file_fingerprint in decoder.get_fingerprints():
+            if (get_fingerprint(file_path) or (None, None)) != \
+                    file_fingerprint:
+                LOG.debug("Report cache file %s is outdated, %s is changed.",
+                          cache_file_path, file_path)
+                return None
+    except (IndexError, StopIteration, TypeError, ValueError) as ex:
+        LOG.debug("Invalid report cache file %s: %s", cache_file_path, ex)
+        return None
+
+    return reports
@@ -11,7 +11,7 @@ import os
 
 from typing import Dict, Iterator, List, Optional, Tuple
 
-from codechecker_report_converter.report import File, Report
+from codechecker_report_converter.report import File, Report, report_cache
 from codechecker_report_converter.report.checker_labels import CheckerLabels
 from codechecker_report_converter.report.hash import HashType
 from codechecker_report_converter.report.parser import plist, sarif
@@ -54,11 +54,54 @@ def get_reports(
     analyzer_result_file_path: str,
     checker_labels: Optional[CheckerLabels] = None,
     file_cache: Optional[Dict[str, File]] = None,
-    source_dir_path: Optional[str] = None
+    source_dir_path: Optional[str] = None,
+    use_cache: bool = False
 ) -> List[Report]:
-    """ Get reports from the given report file. """
+    """
+    Get reports from the given report file.
+
+    If use_cache is True, the reports are read from the cache file of the
+    analyzer result file if it is up to date. Otherwise the reports are saved
+    in the cache file after parsing the analyzer result file.
+    """
+    if file_cache is None:
+        file_cache = {}
+
     parser = get_parser(analyzer_result_file_path, checker_labels, file_cache)
 
+    if parser and use_cache:
+        if not source_dir_path:
+            source_dir_path = os.path.dirname(analyzer_result_file_path)
+
+        fingerprint = report_cache.get_fingerprint(analyzer_result_file_path)
+        if fingerprint is None:
+            return parser.get_reports(
+                analyzer_result_file_path, source_dir_path)
+
+        # Relative file paths of the result file are resolved in the source
+        # directory, so its absolute path is part of the cache key.
+        abs_source_dir_path = os.path.abspath(source_dir_path)
+
+        get_severity = parser.get_severity \
+            if parser.severity_from_checker_labels else None
+        reports = report_cache.load(
+            analyzer_result_file_path, fingerprint, abs_source_dir_path,
+            file_cache, get_severity)
+        if reports is not None:
+            return reports
+
+        reports = parser.get_reports(
+            analyzer_result_file_path, source_dir_path)
+
+        # Empty results are not saved, so the errors of invalid analyzer
+        # result files are reported every time.
+        if reports:
+            report_cache.store(analyzer_result_file_path, fingerprint,
+                               abs_source_dir_path, reports,
+                               not parser.severity_from_checker_labels)
+
+        return reports
+
     if parser:
         return parser.get_reports(analyzer_result_file_path, source_dir_path)
 
@@ -0,0 +1,210 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Process-wide cache of source files with a line offset index.
+
+Source lines are needed for every report several times (report hash, source
+line of the output, review status comments above the report). Reading the
+file for every lookup is quadratic in the number of reports of a file, so the
+files are read once and the offsets of their lines are indexed.
+
+The lines are returned as if the file was read in text mode with UTF-8
+encoding and universal newlines, so the report hashes don't depend on the
+cache. The cache is bounded by the size of the cached files and the least
+recently used files are evicted. Big files are memory mapped instead of being
+read into memory.
+"""
+
+from array import array
+from collections import OrderedDict
+import logging
+import mmap
+import re
+import threading
+
+from typing import Dict, Optional, Union
+
+from codechecker_report_converter.stat_cache import get_stat_cache
+
+
+LOG = logging.getLogger('report-converter')
+
+# Maximum size of the cached files in bytes.
+MAX_CACHE_SIZE = 256 * 1024 * 1024
+
+# Files at least of this size are memory mapped.
+MMAP_MIN_SIZE = 16 * 1024 * 1024
+
+LINE_END = re.compile(rb'\r\n?|\n')
+
+
+class SourceFile:
+    """ Content of a source file and the offsets of its lines. """
+
+    def __init__(self, path: str, data: Union[bytes, mmap.mmap]):
+        self.path = path
+        self.__data = data
+
+        # Start offset of every line and the end of the file.
+        self.__offsets = array('q', [0])
+        self.__offsets.extend(m.end() for m in LINE_END.finditer(data))
+        if self.__offsets[-1] != len(data):
+            self.__offsets.append(len(data))
+
+    @property
+    def size(self) -> int:
+        """ Memory used by the content and the line index in bytes. """
+        return len(self.__data) + \
+            len(self.__offsets) * self.__offsets.itemsize
+
+    @property
+    def line_count(self) -> int:
+        """ Number of lines in the file. """
+        return len(self.__offsets) - 1
+
+    def get_line(self, line_no: int, errors: str = 'ignore') -> str:
+        """
+        Return the given line with its line ending. Empty string returns if
+        the line doesn't exist.
+        """
+        if line_no < 1 or line_no > self.line_count:
+            return ''
+
+        line = self.__data[self.__offsets[line_no - 1]:
+                           self.__offsets[line_no]].decode('utf-8', errors)
+
+        if line.endswith('\r\n'):
+            return line[:-2] + '\n'
+        if line.endswith('\r'):
+            return line[:-1] + '\n'
+        return line
+
+    def get_content(self, errors: str = 'replace') -> str:
+        """ Return the content of the file with universal newlines. """
+        content = self.__data[:].decode('utf-8', errors)
+        return content.replace('\r\n', '\n').replace('\r', '\n')
+
+    def contains(self, text: str) -> bool:
+        """ True if the given text can be found in the file. """
+        return self.__data.find(text.encode('utf-8')) != -1
+
+
+class SourceCache:
+    """
+    Least recently used source files. A cached file is read again if its
+    modification time or size is changed. The status of the files is taken
+    from the stat cache, so it has to be invalidated when a file is changed
+    in the process.
+    """
+
+    def __init__(self, max_size: int = MAX_CACHE_SIZE):
+        self.max_size = max_size
+        self.__files: OrderedDict = OrderedDict()
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def __read(path: str, size: int) -> Union[bytes, mmap.mmap]:
+        with open(path, 'rb') as f:
+            if size >= MMAP_MIN_SIZE:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return f.read()
+
+    def get(self, path: str) -> SourceFile:
+        """
+        Return the given source file. OSError is raised if the file can't be
+        read.
+        """
+        stat = get_stat_cache().stat(path)
+        if stat is None:
+            raise FileNotFoundError(f"No such file: '{path}'")
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+        with self.__lock:
+            entry = self.__files.get(path)
+            if entry and entry[0] == fingerprint:
+                self.__files.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+
+        source_file = SourceFile(path, self.__read(path, stat.st_size))
+
+        with self.__lock:
+            self.misses += 1
+
+            old_entry = self.__files.pop(path, None)
+            if old_entry:
+                self.__size -= old_entry[1].size
+
+            if source_file.size <= self.max_size:
+                self.__files[path] = (fingerprint, source_file)
+                self.__size += source_file.size
+
+            while self.__size > self.max_size:
+                _, (_, evicted) = self.__files.popitem(last=False)
+                self.__size -= evicted.size
+                self.evictions += 1
+
+        return source_file
+
+    def clear(self):
+        """ Remove every file from the cache and reset the statistics. """
+        with self.__lock:
+            self.__files.clear()
+            self.__size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """ Return the hit rate counters of the cache. """
+        with self.__lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'files': len(self.__files),
+                'size': self.__size}
+
+
+# Process-wide source cache, see get_source_cache().
+SOURCE_CACHE: Optional[SourceCache] = None
+
+
+def get_source_cache() -> SourceCache:
+    """ Return the source cache of the current process. """
+    global SOURCE_CACHE
+    if SOURCE_CACHE is None:
+        SOURCE_CACHE = SourceCache()
+    return SOURCE_CACHE
+
+
+def get_line(file_path: str, line_no: int, errors: str = 'ignore') -> str:
+    """
+    Return the given line from the file. If line_no is larger than the number
+    of lines in the file then empty string returns. If the file can't be
+    read, the function also returns empty string.
+    """
+    try:
+        return get_source_cache().get(file_path).get_line(line_no, errors)
+    except OSError:
+        LOG.error("Failed to open file %s", file_path)
+        return ''
+
+
+def log_statistics():
+    """ Log the hit rate of the source cache of the current process. """
+    stats = get_source_cache().statistics()
+    LOG.debug("Source cache: %d hits, %d misses (%.1f%% hit rate), %d "
+              "evictions, %d files, %d bytes.", stats['hits'],
+              stats['misses'], stats['hit_rate'] * 100, stats['evictions'],
+              stats['files'], stats['size'])
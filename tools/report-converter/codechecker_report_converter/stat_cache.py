@@ -0,0 +1,108 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Process-wide cache of file status information.
+
+The modification time of the source files referenced by the reports is
+compared to the modification time of the analyzer result files to find the
+reports of changed files. A few headers are referenced by most of the
+reports, so the status of the same files would be queried millions of times,
+which is slow on network file systems.
+
+The status of a file is queried only once, missing files are cached too. The
+cache has to be invalidated when a file is known to be changed in the process.
+"""
+
+import logging
+import os
+import threading
+
+from typing import Dict, Optional, Union
+
+
+LOG = logging.getLogger('report-converter')
+
+
+class StatCache:
+    """ Status of the files queried by os.stat(). """
+
+    def __init__(self):
+        self.__stats: Dict[str, Optional[os.stat_result]] = {}
+        self.__lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def stat(self, path: str) -> Optional[os.stat_result]:
+        """
+        Return the status of the given file or None if it doesn't exist or
+        it can't be accessed.
+        """
+        with self.__lock:
+            if path in self.__stats:
+                self.hits += 1
+                return self.__stats[path]
+
+        try:
+            stat: Optional[os.stat_result] = os.stat(path)
+        except OSError as err:
+            LOG.debug("File is missing: %s", err)
+            stat = None
+
+        with self.__lock:
+            self.misses += 1
+            self.__stats[path] = stat
+
+        return stat
+
+    def invalidate(self, path: Optional[str] = None):
+        """
+        Remove the status of the given file from the cache, or the status of
+        every file if no file is given.
+        """
+        with self.__lock:
+            if path is None:
+                self.__stats.clear()
+            else:
+                self.__stats.pop(path, None)
+
+    def clear(self):
+        """ Remove every file from the cache and reset the statistics. """
+        with self.__lock:
+            self.__stats.clear()
+            self.hits = self.misses = 0
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """ Return the number of saved os.stat() calls. """
+        with self.__lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'files': len(self.__stats)}
+
+
+# Process-wide stat cache, see get_stat_cache().
+STAT_CACHE: Optional[StatCache] = None
+
+
+def get_stat_cache() -> StatCache:
+    """ Return the stat cache of the current process. """
+    global STAT_CACHE
+    if STAT_CACHE is None:
+        STAT_CACHE = StatCache()
+    return STAT_CACHE
+
+
+def log_statistics():
+    """ Log the saved os.stat() calls of the current process. """
+    stats = get_stat_cache().statistics()
+    LOG.debug("Stat cache: %d stat calls saved, %d stat calls (%.1f%% hit "
+              "rate), %d files.", stats['hits'], stats['misses'],
+              stats['hit_rate'] * 100, stats['files'])
@@ -9,23 +9,29 @@
 import json
 import logging
 import os
+import shutil
 import sys
+import tempfile
 import fnmatch
 import re
 
-from typing import Dict, List, Optional, TextIO
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from . import source_cache
+from .stat_cache import get_stat_cache
 
 
 LOG = logging.getLogger('report-converter')
 
 
 def get_last_mod_time(file_path: str) -> Optional[float]:
-    """ Return the last modification time of a file. """
-    try:
-        return os.stat(file_path).st_mtime
-    except OSError as err:
-        LOG.debug("File is missing: %s", err)
-        return None
+    """
+    Return the last modification time of a file. The modification time is
+    queried once and cached, see stat_cache.
+    """
+    stat = get_stat_cache().stat(file_path)
+    return stat.st_mtime if stat else None
 
 
 def get_linef(fp: TextIO, line_no: int) -> str:
@@ -52,14 +58,12 @@ def get_line(file_path: str, line_no: int, errors: str = 'ignore') -> str:
     on the platform settings. By default locale.getpreferredencoding() is used
     which depends on the platform.
 
+    The lines are read from the source cache, so the file is read only once
+    for the reports of the same file.
+
     Changing the encoding error handling can influence the hash content!
     """
-    try:
-        with open(file_path, mode='r', encoding='utf-8', errors=errors) as f:
-            return get_linef(f, line_no)
-    except IOError:
-        LOG.error("Failed to open file %s", file_path)
-        return ''
+    return source_cache.get_line(file_path, line_no, errors)
 
 
 def trim_path_prefixes(path: str, prefixes: Optional[List[str]]) -> str:
@@ -120,3 +124,52 @@ def dump_json_output(
         out.write(f"{data_str}\n")
 
     return data_str
+
+
+@contextmanager
+def json_output(
+    output_file_path: Optional[str] = None,
+    out=sys.stdout
+) -> Iterator[TextIO]:
+    """
+    Return a stream to write JSON data to the given output file or to the
+    given output if no file is given, like dump_json_output() does.
+
+    The output file is created and the output is printed only if the writing
+    finished successfully, so no partial JSON document is left behind if an
+    error occurs in the meantime.
+    """
+    if output_file_path:
+        tmp_file_path = f"{output_file_path}.tmp"
+        try:
+            with open(tmp_file_path, mode='w',
+                      encoding='utf-8', errors="ignore") as f:
+                yield f
+            os.replace(tmp_file_path, output_file_path)
+        finally:
+            if os.path.exists(tmp_file_path):
+                os.remove(tmp_file_path)
+
+        LOG.info('JSON report file was created: %s', output_file_path)
+    else:
+        # The output is buffered in a temporary file instead of the memory.
+        with tempfile.TemporaryFile(mode='w+', encoding='utf-8',
+                                    errors="ignore") as f:
+            yield f
+            f.seek(0)
+            shutil.copyfileobj(f, out)
+        out.write("\n")
+
+
+def dump_json_array(items: Iterable[Any], out: TextIO):
+    """
+    Write the given items as a JSON array to the given output one by one, so
+    the items don't have to be kept in memory. The output is the same as the
+    output of json.dumps() on the list of the items.
+    """
+    out.write('[')
+    for index, item in enumerate(items):
+        if index:
+            out.write(', ')
+        out.write(json.dumps(item))
+    out.write(']')
@@ -0,0 +1,104 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test that the analyzer result files are read line by line and the
+transformation gives the same result independently of the number of jobs and
+the size of the report batches.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_report_converter.analyzers import analyzer_result as base
+from codechecker_report_converter.analyzers.clang_tidy import \
+    analyzer_result, parser
+from codechecker_report_converter.report.parser import plist
+
+
+TEST_DIR = os.path.join(os.path.dirname(__file__), 'tidy_output_test_files')
+
+RESULT_FILES = ['tidy1.out', 'tidy2.out', 'tidy3.out', 'tidy3-clang17.out']
+
+
+class AnalyzerResultTestCase(unittest.TestCase):
+    """ Test the transformation of multiple analyzer result files. """
+
+    def setUp(self):
+        self.old_pwd = os.getcwd()
+        os.chdir(TEST_DIR)
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        os.chdir(self.old_pwd)
+        shutil.rmtree(self.tmp_dir)
+
+    def __transform(self, output_dir_name, jobs=1):
+        """ Transform the result files and return the output files. """
+        output_dir = os.path.join(self.tmp_dir, output_dir_name)
+        os.makedirs(output_dir)
+
+        ret = analyzer_result.AnalyzerResult().transform(
+            RESULT_FILES, output_dir, plist.EXTENSION, jobs=jobs)
+        self.assertTrue(ret)
+
+        output_files = {}
+        for file_name in os.listdir(output_dir):
+            with open(os.path.join(output_dir, file_name), 'rb') as f:
+                output_files[file_name] = f.read()
+
+        return output_files
+
+    def test_stream_lines(self):
+        """ Reports are generated before the whole output is read. """
+        with open('tidy1.out', encoding='utf-8') as f:
+            lines = f.readlines()
+
+        read_lines = []
+
+        def read():
+            for line in lines:
+                read_lines.append(line)
+                yield line
+
+        reports = parser.Parser().iter_reports_from_iter(read())
+        self.assertEqual(next(reports).checker_name,
+                         'clang-analyzer-core.DivideZero')
+        self.assertLess(len(read_lines), len(lines))
+
+        self.assertEqual(next(reports).checker_name,
+                         'clang-diagnostic-division-by-zero')
+        self.assertEqual(len(read_lines), len(lines))
+
+    def test_same_reports(self):
+        """ The reports of the result file are read line by line. """
+        for file_name in RESULT_FILES:
+            file_path = os.path.join(TEST_DIR, file_name)
+            with open(file_path, encoding='utf-8') as f:
+                expected = parser.Parser().get_reports_from_iter(
+                    f.readlines())
+
+            reports = list(parser.Parser().iter_reports(file_path))
+            self.assertEqual([r.to_json() for r in reports],
+                             [r.to_json() for r in expected])
+
+    def test_jobs(self):
+        """ The output files are the same with multiple jobs. """
+        expected = self.__transform('jobs_1')
+        self.assertGreater(len(expected), 1)
+        self.assertEqual(self.__transform('jobs_2', jobs=2), expected)
+
+    def test_report_batches(self):
+        """ The output files are the same with small report batches. """
+        expected = self.__transform('batch_default')
+        with mock.patch.object(base, 'REPORT_BATCH_SIZE', 1):
+            self.assertEqual(self.__transform('batch_1'), expected)
@@ -71,18 +71,24 @@ class PlistToHtmlTest(unittest.TestCase):
         print("Removing: " + TEST_WORKSPACE)
         shutil.rmtree(TEST_WORKSPACE)
 
-    def __test_html_builder(self, proj: str) -> str:
+    def __test_html_builder(
+        self,
+        proj: str,
+        jobs: int = 1,
+        output_dir_name: str = 'html'
+    ) -> str:
         """
         Test building html file from the given proj's plist file.
         """
-        html_builder = report_to_html.HtmlBuilder(self.layout_dir)
+        html_builder = report_to_html.HtmlBuilder(self.layout_dir, jobs=jobs)
 
         proj_dir = os.path.join(self.test_workspace, 'test_files', proj)
-        output_dir = os.path.join(proj_dir, 'html')
+        output_dir = os.path.join(proj_dir, output_dir_name)
         if not os.path.exists(output_dir):
             os.mkdir(output_dir)
 
         processed_path_hashes = set()
+        output_paths = {}
         for file_path in glob.glob(os.path.join(proj_dir, f"*.plist")):
             file_name = os.path.basename(file_path)
             output_path = os.path.join(output_dir, f"{file_name}.html")
@@ -94,15 +100,16 @@ class PlistToHtmlTest(unittest.TestCase):
             report_to_html.convert(
                 file_path, reports, output_dir, html_builder)
 
-            html_file_exists = os.path.exists(output_path)
-            if reports:
-                self.assertTrue(html_file_exists)
-            else:
-                self.assertFalse(html_file_exists)
+            output_paths[output_path] = bool(reports)
 
         html_builder.create_index_html(output_dir)
         html_builder.create_statistics_html(output_dir)
 
+        # The report pages may be written by other processes until the index
+        # page is created.
+        for output_path, has_reports in output_paths.items():
+            self.assertEqual(os.path.exists(output_path), has_reports)
+
         index_html = os.path.join(output_dir, 'index.html')
         self.assertTrue(os.path.exists(index_html))
 
@@ -193,3 +200,55 @@ class PlistToHtmlTest(unittest.TestCase):
             # The links should be relative so the static HTML folder is
             # portable.
             self.assertNotIn('"link": "/', content)
+
+    def test_shared_source_files(self):
+        """
+        The source files are written once and loaded by the report pages.
+        """
+        output_dir = self.__test_html_builder('inclusion', 1, 'html_shared')
+
+        sources_dir = os.path.join(output_dir, report_to_html.SOURCES_DIR)
+        source_files = sorted(os.listdir(sources_dir))
+
+        # The a.cpp and the f.h files are referenced by the reports of both
+        # plist files.
+        self.assertEqual(len(source_files), 2)
+
+        assets = set()
+        for html_file in glob.glob(os.path.join(output_dir, "*.plist.html")):
+            with open(html_file, 'r', encoding="utf-8",
+                      errors="ignore") as f:
+                content = f.read()
+
+            # The source file contents are not embedded into the pages.
+            self.assertNotIn('"content": ', content)
+            assets.update(re.findall(
+                r'src="(sources/[0-9a-f]+\.js)"', content))
+
+        self.assertEqual(
+            assets, {f"{report_to_html.SOURCES_DIR}/{f}"
+                     for f in source_files})
+
+        with open(os.path.join(sources_dir, source_files[0]), 'r',
+                  encoding="utf-8", errors="ignore") as f:
+            self.assertTrue(f.read().startswith('addSourceFile({'))
+
+    def test_html_builder_jobs(self):
+        """ The same html files are written by multiple processes. """
+        expected_dir = self.__test_html_builder('inclusion', 1, 'html_1')
+        output_dir = self.__test_html_builder('inclusion', 2, 'html_2')
+
+        def get_files(root_dir):
+            files = {}
+            for dir_path, _, file_names in os.walk(root_dir):
+                for file_name in file_names:
+                    file_path = os.path.join(dir_path, file_name)
+                    with open(file_path, 'r', encoding="utf-8",
+                              errors="ignore") as f:
+                        files[os.path.relpath(file_path, root_dir)] = \
+                            f.read()
+            return files
+
+        expected = get_files(expected_dir)
+        self.assertIn('statistics.html', expected)
+        self.assertEqual(get_files(output_dir), expected)
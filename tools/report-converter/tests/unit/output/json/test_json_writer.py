@@ -0,0 +1,84 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Tests for writing the JSON based outputs report by report. """
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_report_converter.report import BugPathEvent, File, Report
+from codechecker_report_converter.report.output import codeclimate, \
+    json as report_to_json
+from codechecker_report_converter.util import dump_json_output
+
+
+class TestJsonWriter(unittest.TestCase):
+    """ The written output is the same as the one of the converters. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        main = File('/src/main.cpp')
+        self.reports = [
+            Report(main, 3, 3, 'some description', 'my_checker',
+                   report_hash='hash1', severity='LOW',
+                   bug_path_events=[BugPathEvent('event', main, 3, 3)]),
+            Report(File('/src/lib.cpp'), 5, 1, 'other "quoted"', 'checker',
+                   report_hash='hash2', severity='HIGH')]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __assert_same_output(self, convert, write, reports):
+        expected = io.StringIO()
+        dump_json_output(convert(reports), None, expected)
+
+        # Reports are given one by one by a generator.
+        out = io.StringIO()
+        write((r for r in reports), None, out)
+        self.assertEqual(out.getvalue(), expected.getvalue())
+
+        output_file_path = os.path.join(self.tmp_dir, 'reports.json')
+        write(iter(reports), output_file_path)
+        with open(output_file_path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), expected.getvalue().rstrip('\n'))
+
+    def test_json(self):
+        """ JSON output of reports and of no reports. """
+        self.__assert_same_output(report_to_json.convert,
+                                  report_to_json.write, self.reports)
+        self.__assert_same_output(report_to_json.convert,
+                                  report_to_json.write, [])
+
+    def test_codeclimate(self):
+        """ Code Climate output of reports and of no reports. """
+        self.__assert_same_output(codeclimate.convert,
+                                  codeclimate.write, self.reports)
+        self.__assert_same_output(codeclimate.convert,
+                                  codeclimate.write, [])
+
+    def test_no_partial_output_file(self):
+        """ No output is written if generating the reports fails. """
+        def reports():
+            yield self.reports[0]
+            raise ValueError("Parsing failed.")
+
+        output_file_path = os.path.join(self.tmp_dir, 'reports.json')
+        with self.assertRaises(ValueError):
+            report_to_json.write(reports(), output_file_path)
+
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+        out = io.StringIO()
+        with self.assertRaises(ValueError):
+            report_to_json.write(reports(), None, out)
+
+        self.assertEqual(out.getvalue(), '')
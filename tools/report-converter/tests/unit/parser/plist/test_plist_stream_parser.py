@@ -0,0 +1,133 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test that reading the diagnostics of the plist files one by one gives the same
+result as building the plist object of the whole file.
+"""
+
+
+import glob
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_report_converter.report.parser import plist
+
+
+TEST_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+PLIST_FILES = sorted(glob.glob(os.path.join(TEST_DIR, '**', '*.plist'),
+                               recursive=True))
+
+
+def get_reports_from_plist(file_path):
+    """ Get the reports by building the plist object of the whole file. """
+    with mock.patch.object(plist, 'iter_parse',
+                           side_effect=NotImplementedError):
+        return plist.Parser().get_reports(file_path)
+
+
+class PlistStreamParserTestCase(unittest.TestCase):
+    """ Compare the stream parser with the plist object based parser. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __assert_same_reports(self, file_path):
+        expected = [r.to_json() for r in get_reports_from_plist(file_path)]
+        reports = [r.to_json() for r in plist.Parser().get_reports(file_path)]
+        self.assertEqual(reports, expected, file_path)
+
+    def test_same_plist_objects(self):
+        """ The diagnostics and the other items are the same objects. """
+        self.assertTrue(PLIST_FILES)
+        for file_path in PLIST_FILES:
+            with open(file_path, 'rb') as f:
+                expected = plist.parse(f)
+            if not expected:
+                continue
+
+            other_items = {}
+            with open(file_path, 'rb') as f:
+                diagnostics = list(plist.iter_parse(f, other_items))
+
+            self.assertEqual(diagnostics, expected.pop('diagnostics', []),
+                             file_path)
+            self.assertEqual(other_items, expected, file_path)
+
+    def test_same_reports(self):
+        """ The reports of the test plist files are the same. """
+        for file_path in PLIST_FILES:
+            self.__assert_same_reports(file_path)
+
+    def test_comments_and_entities(self):
+        """ Comments are skipped and entities are resolved. """
+        other_items = {}
+        diagnostics = list(plist.iter_parse(io.BytesIO(
+            b'<?xml version="1.0" encoding="UTF-8"?>\n'
+            b'<plist version="1.0"><!-- comment --><dict>'
+            b'<key>diagnostics</key><array><!-- comment -->'
+            b'<dict><key>line</key><!-- comment --><integer>0x1F</integer>'
+            b'<key>message</key><string>a &amp; b</string></dict>'
+            b'<dict><key>path</key><array/><key>real</key><real>1.5</real>'
+            b'<key>flag</key><true/></dict>'
+            b'</array><key>files</key><array><string>a.c</string></array>'
+            b'</dict></plist>'), other_items))
+
+        self.assertEqual(diagnostics, [
+            {'line': 31, 'message': 'a & b'},
+            {'path': [], 'real': 1.5, 'flag': True}])
+        self.assertEqual(other_items, {'files': ['a.c']})
+
+    def test_fallback(self):
+        """ Unsupported and invalid plist files are read as a whole. """
+        plist_files = {
+            'date.plist':
+                b'<plist><dict><key>diagnostics</key><array><dict>'
+                b'<key>location</key><dict><key>line</key><integer>1'
+                b'</integer><key>col</key><integer>1</integer>'
+                b'<key>file</key><integer>0</integer></dict>'
+                b'<key>date</key><date>2020-01-01T00:00:00Z</date>'
+                b'</dict></array><key>files</key><array><string>a.c'
+                b'</string></array></dict></plist>',
+            'not_dict.plist':
+                b'<plist><dict><key>diagnostics</key><array>'
+                b'<string>diagnostic</string></array></dict></plist>',
+            'truncated.plist':
+                b'<plist><dict><key>diagnostics</key><array><dict>'}
+
+        for file_name, content in plist_files.items():
+            file_path = os.path.join(self.tmp_dir, file_name)
+            with open(file_path, 'wb') as f:
+                f.write(content)
+
+            with self.assertRaises(Exception):
+                with open(file_path, 'rb') as f:
+                    list(plist.iter_parse(f, {}))
+
+            self.__assert_same_reports(file_path)
+
+    def test_invalid_file_index(self):
+        """ A plist file with an invalid file index is read as a whole. """
+        file_path = os.path.join(self.tmp_dir, 'invalid_file_index.plist')
+        with open(file_path, 'wb') as f:
+            f.write(b'<plist><dict><key>diagnostics</key><array><dict>'
+                    b'<key>location</key><dict><key>line</key><integer>1'
+                    b'</integer><key>col</key><integer>1</integer>'
+                    b'<key>file</key><integer>1</integer></dict></dict>'
+                    b'</array><key>files</key><array><string>a.c</string>'
+                    b'</array></dict></plist>')
+
+        self.__assert_same_reports(file_path)
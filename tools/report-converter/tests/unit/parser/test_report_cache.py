@@ -0,0 +1,191 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test that the reports read from the report cache files are the same as the
+parsed ones and the cache files are invalidated when the inputs change.
+"""
+
+
+import glob
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_report_converter.report import File, Report, \
+    report_cache, report_file
+from codechecker_report_converter.report.parser import plist, sarif
+
+
+TEST_DIR = os.path.dirname(__file__)
+
+RESULT_FILES = sorted(
+    glob.glob(os.path.join(TEST_DIR, '**', '*.plist'), recursive=True) +
+    glob.glob(os.path.join(TEST_DIR, '**', '*.sarif'), recursive=True))
+
+
+class CheckerLabels:
+    """ Severity of every checker is given by the checker name. """
+
+    def severity(self, checker_name):
+        return f'SEVERITY_OF_{checker_name}'
+
+
+class ReportCacheTestCase(unittest.TestCase):
+    """ Test the report cache files of the analyzer result files. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __copy(self, file_path, dir_name='reports'):
+        """ Copy the given result file into a temporary directory. """
+        dir_path = os.path.join(self.tmp_dir, dir_name)
+        os.makedirs(dir_path, exist_ok=True)
+        return shutil.copy2(file_path, dir_path)
+
+    def __write_result_file(self, message='Problem'):
+        """ Write a plist file of a report in a temporary source file. """
+        source_file = os.path.join(self.tmp_dir, 'main.c')
+        with open(source_file, 'w', encoding='utf-8') as f:
+            f.write('int main() { return 1 / 0; }\n')
+
+        result_file = os.path.join(self.tmp_dir, 'main.c_clangsa.plist')
+        report_file.create(result_file, [Report(
+            File(source_file), 1, 23, message, 'core.DivideZero',
+            report_hash='0123456789abcdef', analyzer_name='clangsa')])
+        return result_file
+
+    @staticmethod
+    def __get_reports(file_path, source_dir_path=None, use_cache=False):
+        return [r.to_json() for r in report_file.get_reports(
+            file_path, source_dir_path=source_dir_path, use_cache=use_cache)]
+
+    def test_same_reports(self):
+        """ The cached reports of the test files are the same. """
+        self.assertTrue(RESULT_FILES)
+        for i, file_path in enumerate(RESULT_FILES):
+            source_dir_path = os.path.dirname(file_path)
+            copied_file_path = self.__copy(file_path, str(i))
+
+            expected = self.__get_reports(
+                copied_file_path, source_dir_path=source_dir_path)
+            reports = self.__get_reports(
+                copied_file_path, source_dir_path=source_dir_path,
+                use_cache=True)
+            self.assertEqual(reports, expected, file_path)
+
+            if not expected:
+                continue
+
+            self.assertTrue(os.path.isfile(
+                report_cache.get_cache_file_path(copied_file_path)))
+
+            with mock.patch.object(plist.Parser, 'get_reports') as p, \
+                    mock.patch.object(sarif.Parser, 'get_reports') as s:
+                reports = self.__get_reports(
+                    copied_file_path, source_dir_path=source_dir_path,
+                    use_cache=True)
+                p.assert_not_called()
+                s.assert_not_called()
+
+            self.assertEqual(reports, expected, file_path)
+
+    def test_shared_files(self):
+        """ The cached reports use the file objects of the file cache. """
+        result_file = self.__write_result_file()
+        report_file.get_reports(result_file, use_cache=True)
+
+        file_cache = {}
+        reports = report_file.get_reports(result_file, file_cache=file_cache,
+                                          use_cache=True)
+        self.assertIs(reports[0].file, file_cache[reports[0].file.path])
+        self.assertIs(reports[0].bug_path_events[0].file, reports[0].file)
+
+    def test_severity(self):
+        """ The severity of the cached reports comes from checker labels. """
+        result_file = self.__write_result_file()
+        report_file.get_reports(result_file, use_cache=True)
+
+        reports = report_file.get_reports(
+            result_file, CheckerLabels(), use_cache=True)
+        self.assertEqual(reports[0].severity, 'SEVERITY_OF_core.DivideZero')
+
+        reports = report_file.get_reports(result_file, use_cache=True)
+        self.assertIsNone(reports[0].severity)
+
+    def test_changed_result_file(self):
+        """ The reports of a changed result file are parsed again. """
+        result_file = self.__write_result_file('Problem')
+        reports = report_file.get_reports(result_file, use_cache=True)
+        self.assertEqual(reports[0].message, 'Problem')
+
+        self.__write_result_file('Another problem')
+        reports = report_file.get_reports(result_file, use_cache=True)
+        self.assertEqual(reports[0].message, 'Another problem')
+
+        reports = report_file.get_reports(result_file, use_cache=True)
+        self.assertEqual(reports[0].message, 'Another problem')
+
+    def test_changed_source_file(self):
+        """ The reports are parsed again if a source file changes. """
+        result_file = self.__write_result_file()
+        report_file.get_reports(result_file, use_cache=True)
+
+        source_file = os.path.join(self.tmp_dir, 'main.c')
+        with open(source_file, 'a', encoding='utf-8') as f:
+            f.write('\n')
+
+        with mock.patch.object(plist.Parser, 'get_reports',
+                               return_value=[]) as p:
+            report_file.get_reports(result_file, use_cache=True)
+            p.assert_called_once()
+
+    def test_other_source_dir(self):
+        """ The cache file belongs to the source directory of the paths. """
+        result_file = self.__write_result_file()
+        report_file.get_reports(result_file, use_cache=True)
+
+        with mock.patch.object(plist.Parser, 'get_reports',
+                               return_value=[]) as p:
+            report_file.get_reports(result_file, source_dir_path='/',
+                                    use_cache=True)
+            p.assert_called_once()
+
+    def test_invalid_cache_file(self):
+        """ Invalid or truncated cache files are ignored. """
+        result_file = self.__write_result_file()
+        expected = self.__get_reports(result_file)
+        self.__get_reports(result_file, use_cache=True)
+
+        cache_file = report_cache.get_cache_file_path(result_file)
+        with open(cache_file, 'rb') as f:
+            content = f.read()
+
+        for invalid_content in [b'', content[:10], content[:-1],
+                                content[:report_cache.HEADER.size] +
+                                b'\xff' * (len(content) -
+                                           report_cache.HEADER.size)]:
+            with open(cache_file, 'wb') as f:
+                f.write(invalid_content)
+
+            self.assertEqual(
+                self.__get_reports(result_file, use_cache=True), expected)
+
+    def test_not_analyzer_result_file(self):
+        """ Cache files are not collected as analyzer result files. """
+        result_file = self.__write_result_file()
+        report_file.get_reports(result_file, use_cache=True)
+
+        self.assertEqual(
+            list(report_file.analyzer_result_files([self.tmp_dir])),
+            [(self.tmp_dir, [result_file])])
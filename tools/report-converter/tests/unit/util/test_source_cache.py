@@ -0,0 +1,136 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the source cache and its line offset index. """
+
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_report_converter import source_cache
+from codechecker_report_converter.source_cache import SourceCache
+from codechecker_report_converter.stat_cache import get_stat_cache
+
+
+CONTENTS = [
+    b'',
+    b'\n',
+    b'first\nsecond\nthird\n',
+    b'no newline at the end',
+    b'windows\r\nline\r\nendings\r\n',
+    b'old\rmac\rline endings',
+    b'mixed\r\n\r\n\n\rline\n\r\nendings',
+    b'invalid \xff\xfe utf-8\ncharacters \xc3\n',
+    b'form\x0cfeed and \xe2\x80\xa8 separator\nlines\n']
+
+
+class SourceCacheTest(unittest.TestCase):
+    """ The cached lines are the same as the lines read in text mode. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __write(self, file_name, content, mtime=1):
+        path = os.path.join(self.tmp_dir, file_name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def __assert_same_lines(self, cache, path):
+        for errors in ['ignore', 'replace']:
+            with open(path, encoding='utf-8', errors=errors) as f:
+                lines = f.readlines()
+
+            source_file = cache.get(path)
+            self.assertEqual(source_file.line_count, len(lines))
+            self.assertEqual(
+                [source_file.get_line(i, errors)
+                 for i in range(1, len(lines) + 1)], lines)
+            self.assertEqual(source_file.get_line(0), '')
+            self.assertEqual(source_file.get_line(len(lines) + 1), '')
+
+        with open(path, encoding='utf-8', errors='replace') as f:
+            self.assertEqual(source_file.get_content(), f.read())
+
+    def test_same_lines(self):
+        """ Every kind of line ending is handled as in text mode. """
+        cache = SourceCache()
+        for i, content in enumerate(CONTENTS):
+            self.__assert_same_lines(cache, self.__write(f'{i}.c', content))
+
+    def test_same_lines_mmap(self):
+        """ The lines of memory mapped files are the same. """
+        cache = SourceCache()
+        with mock.patch.object(source_cache, 'MMAP_MIN_SIZE', 1):
+            for i, content in enumerate(CONTENTS):
+                self.__assert_same_lines(cache,
+                                         self.__write(f'{i}.c', content))
+
+    def test_contains(self):
+        """ Text can be searched in the source files. """
+        path = self.__write('main.c', b'int x;\n// codechecker_suppress\n')
+        source_file = SourceCache().get(path)
+        self.assertTrue(source_file.contains('codechecker_'))
+        self.assertFalse(source_file.contains('codechecker_confirmed'))
+
+    def test_changed_file(self):
+        """ A source file is read again if it is changed. """
+        cache = SourceCache()
+        path = self.__write('main.c', b'old\n')
+        self.assertEqual(cache.get(path).get_line(1), 'old\n')
+        self.assertEqual(cache.get(path).get_line(1), 'old\n')
+
+        # The change is noticed only after the status of the file is
+        # invalidated.
+        self.__write('main.c', b'new\n', mtime=2)
+        self.assertEqual(cache.get(path).get_line(1), 'old\n')
+
+        get_stat_cache().invalidate(path)
+        self.assertEqual(cache.get(path).get_line(1), 'new\n')
+
+        stats = cache.statistics()
+        self.assertEqual((stats['hits'], stats['misses'], stats['files']),
+                         (2, 2, 1))
+
+    def test_eviction(self):
+        """ The least recently used files are evicted over the size limit. """
+        paths = [self.__write(f'{i}.c', b'x' * 100) for i in range(3)]
+        cache = SourceCache(max_size=250)
+
+        cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[0])
+        cache.get(paths[2])
+
+        stats = cache.statistics()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['files'], 2)
+
+        # The least recently used file was evicted.
+        cache.get(paths[0])
+        self.assertEqual(cache.statistics()['hits'], 2)
+        cache.get(paths[1])
+        self.assertEqual(cache.statistics()['misses'], 4)
+
+    def test_missing_file(self):
+        """ Missing files are not cached. """
+        path = os.path.join(self.tmp_dir, 'missing.c')
+        cache = SourceCache()
+        with self.assertRaises(OSError):
+            cache.get(path)
+
+        with mock.patch.object(source_cache, 'SOURCE_CACHE', cache):
+            self.assertEqual(source_cache.get_line(path, 1), '')
+        self.assertEqual(cache.statistics()['files'], 0)
@@ -0,0 +1,98 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the stat cache and the changed files of the reports. """
+
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_report_converter import util
+from codechecker_report_converter.report import BugPathEvent, File, Report
+from codechecker_report_converter.stat_cache import StatCache, \
+    get_stat_cache
+
+
+class StatCacheTest(unittest.TestCase):
+    """ The status of every file is queried only once. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        get_stat_cache().clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        get_stat_cache().clear()
+
+    def __write(self, file_name, mtime):
+        path = os.path.join(self.tmp_dir, file_name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('int main() { return 0; }\n')
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_stat(self):
+        """ Existing and missing files are cached. """
+        path = self.__write('main.c', 1)
+        missing = os.path.join(self.tmp_dir, 'missing.c')
+
+        cache = StatCache()
+        with mock.patch('os.stat', wraps=os.stat) as stat:
+            for _ in range(3):
+                self.assertEqual(cache.stat(path).st_mtime, 1)
+                self.assertIsNone(cache.stat(missing))
+
+            self.assertEqual(stat.call_count, 2)
+
+        self.assertEqual(cache.statistics(), {
+            'hits': 4, 'misses': 2, 'hit_rate': 4 / 6, 'files': 2})
+
+    def test_invalidate(self):
+        """ The status of the invalidated files is queried again. """
+        path = self.__write('main.c', 1)
+        other = self.__write('other.c', 1)
+
+        cache = StatCache()
+        cache.stat(path)
+        cache.stat(other)
+
+        self.__write('main.c', 2)
+        self.__write('other.c', 2)
+        self.assertEqual(cache.stat(path).st_mtime, 1)
+
+        cache.invalidate(path)
+        self.assertEqual(cache.stat(path).st_mtime, 2)
+        self.assertEqual(cache.stat(other).st_mtime, 1)
+
+        cache.invalidate()
+        self.assertEqual(cache.stat(other).st_mtime, 2)
+
+    def test_changed_files(self):
+        """ The files of many reports are queried once. """
+        source = File(self.__write('main.c', 1))
+        header = File(self.__write('main.h', 3))
+        result_file = self.__write('main.c.plist', 2)
+
+        reports = [
+            Report(source, i, 1, 'message', 'checker',
+                   analyzer_result_file_path=result_file,
+                   bug_path_events=[BugPathEvent('event', header, 1, 1)])
+            for i in range(100)]
+
+        with mock.patch('os.stat', wraps=os.stat) as stat:
+            for report in reports:
+                self.assertEqual(report.changed_files, {header.path})
+
+            self.assertEqual(stat.call_count, 3)
+
+        self.assertEqual(util.get_last_mod_time(source.path), 1)
+        self.assertIsNone(util.get_last_mod_time(
+            os.path.join(self.tmp_dir, 'missing.c')))
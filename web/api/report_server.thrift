@@ -548,6 +548,41 @@ struct Checker {
   2: string checkerId,
 }
 
+// Status of a background store task.
+enum StoreTaskStatus {
+  QUEUED,    // The task waits for a free store worker.
+  RUNNING,   // The run is being stored.
+  COMPLETED, // The run is stored.
+  FAILED,    // The run could not be stored.
+}
+
+// A phase of a background store task, e.g. "Store reports".
+struct StoreTaskPhase {
+  1: string name,       // Description of the phase.
+  2: i64    startedAt,  // Unix (epoch) time.
+  3: i64    finishedAt, // Unix (epoch) time, 0 if the phase is in progress.
+}
+
+// State of a background store task.
+struct StoreTaskInfo {
+  1: string                                 token,      // Identifier of the task.
+  2: StoreTaskStatus                        status,
+  3: string                                 runName,    // Name of the stored run.
+  4: i64                                    enqueuedAt, // Unix (epoch) time.
+  5: list<StoreTaskPhase>                   phases,     // The started phases in order.
+  6: i64                                    runId,      // ID of the stored run if the task is completed.
+  7: codechecker_api_shared.ErrorCode       errorCode,  // Error code if the task failed.
+  8: string                                 message,    // Error message if the task failed.
+  9: list<string>                           extraInfo,  // Additional information about the error.
+}
+
+// State of a chunked upload of a mass store ZIP file.
+struct StoreUploadInfo {
+  1: string uploadId,     // Identifier of the upload in the subsequent calls.
+  2: i64    receivedSize, // Number of bytes which are already received by the server.
+  3: i64    maxChunkSize, // Maximum size of a chunk in bytes.
+}
+
 service codeCheckerDBAccess {
 
   // Gives back all analyzed runs.
@@ -980,6 +1015,49 @@ service codeCheckerDBAccess {
                    7: optional string description)
                    throws (1: codechecker_api_shared.RequestFailed requestError),
 
+  // The following functions upload the ZIP file of massStoreRun() in chunks
+  // and store the run. The ZIP file has to be compressed but it is not base64
+  // encoded.
+  //
+  // This function begins or continues the upload of a ZIP file with the given
+  // sha256 hash and size. If an upload of the same file by the same user was
+  // interrupted, then "receivedSize" of the result tells where the upload has
+  // to be continued.
+  // PERMISSION: PRODUCT_STORE
+  StoreUploadInfo beginStoreUpload(1: string zipHash,
+                                   2: i64    zipSize)
+                                   throws (1: codechecker_api_shared.RequestFailed requestError),
+
+  // Append a chunk of the ZIP file to the upload. The "offset" has to be the
+  // number of bytes which are already received by the server and "chunkHash"
+  // is the sha256 hash of the chunk. Returns the number of received bytes.
+  // PERMISSION: PRODUCT_STORE
+  i64 appendStoreChunk(1: string uploadId,
+                       2: i64    offset,
+                       3: binary chunk,
+                       4: string chunkHash)
+                       throws (1: codechecker_api_shared.RequestFailed requestError),
+
+  // Store the run from the uploaded ZIP file like massStoreRun(). The run is
+  // stored in the background by the store workers of the server. Returns the
+  // token of the store task, see getStoreTaskInfo(). The upload is removed
+  // when the task is finished.
+  // PERMISSION: PRODUCT_STORE
+  string commitStoreUpload(1: string          uploadId,
+                           2: string          runName,
+                           3: string          tag,
+                           4: string          version,
+                           5: bool            force,
+                           6: list<string>    trimPathPrefixes,
+                           7: optional string description)
+                           throws (1: codechecker_api_shared.RequestFailed requestError),
+
+  // Returns the status and the progress of a store task which was started by
+  // commitStoreUpload(). The finished tasks are available for a day.
+  // PERMISSION: PRODUCT_STORE
+  StoreTaskInfo getStoreTaskInfo(1: string token)
+                                 throws (1: codechecker_api_shared.RequestFailed requestError),
+
   // Returns true if analysis statistics information can be sent to the server,
   // otherwise it returns false.
   // PERMISSION: PRODUCT_STORE
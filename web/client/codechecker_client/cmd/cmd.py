@@ -528,6 +528,17 @@ def __register_diff(parser):
                         help="Print the steps the analyzers took in finding "
                              "the reported defect.")
 
+    parser.add_argument('--report-cache',
+                        dest="report_cache",
+                        action="store_true",
+                        required=False,
+                        default=argparse.SUPPRESS,
+                        help="Read the reports of the local report "
+                             "directories from cache files next to the "
+                             "analyzer result files instead of parsing them "
+                             "and write the missing cache files "
+                             "('<result file>.cache').")
+
     __add_filtering_arguments(parser, DEFAULT_FILTER_VALUES, True)
 
     group = parser.add_argument_group(
@@ -17,29 +17,28 @@ import functools
 import hashlib
 import json
 import os
-import signal
 import sys
 import tempfile
+import time
 import uuid
 import zipfile
 import zlib
 import shutil
 
 from collections import defaultdict, namedtuple
-from contextlib import contextmanager
-from datetime import timedelta
-from threading import Timer
-from typing import Dict, Iterable, List, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from codechecker_api.codeCheckerDBAccess_v6.ttypes import StoreLimitKind
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import StoreLimitKind, \
+    StoreTaskStatus
 from codechecker_api_shared.ttypes import RequestFailed, ErrorCode
 
-from codechecker_report_converter import twodim
+from codechecker_report_converter import stat_cache, twodim
 from codechecker_report_converter.report import Report, report_file, \
     reports as reports_helper, statistics as report_statistics
 from codechecker_report_converter.report.hash import HashType, \
     get_report_path_hash
 from codechecker_report_converter.report.parser.base import AnalyzerInfo
+from codechecker_report_converter.source_cache import get_source_cache
 
 try:
     from codechecker_client.blame_info import assemble_blame_info
@@ -52,13 +51,14 @@ except ImportError:
         raise NotImplementedError()
 
 from codechecker_client import client as libclient
+from codechecker_client.content_hash_cache import ContentHashCache
 from codechecker_client import product
 from codechecker_common import arg, logger, cmd_config
 from codechecker_common.checker_labels import CheckerLabels
 from codechecker_common.compatibility.multiprocessing import Pool
 from codechecker_common.source_code_comment_handler import \
     SourceCodeCommentHandler
-from codechecker_common.util import load_json
+from codechecker_common.util import get_cache_dir, load_json
 
 from codechecker_web.shared import webserver_context, host_check
 from codechecker_web.shared.env import get_default_workspace
@@ -66,7 +66,18 @@ from codechecker_web.shared.env import get_default_workspace
 
 LOG = logger.get_logger('system')
 
-MAX_UPLOAD_SIZE = 1 * 1024 * 1024 * 1024  # 1GiB
+# Size of the chunks in which the zip file is compressed and uploaded. The
+# server may limit it further.
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8MiB
+
+# Number of times an interrupted upload is continued.
+UPLOAD_RETRIES = 5
+
+# Name of the content hash cache file in the cache directory.
+CONTENT_HASH_CACHE_FILE_NAME = 'content_hash_cache.json'
+
+# Number of seconds between the queries of the status of the store task.
+STORE_TASK_POLL_INTERVAL = 5
 
 
 AnalyzerResultFileReports = Dict[str, List[Report]]
@@ -148,14 +159,35 @@ def sizeof_fmt(num, suffix='B'):
     return f"{num:.1f}Yi{suffix}"
 
 
-def get_file_content_hash(file_path):
-    """
-    Return the file content hash for a file.
-    """
-    with open(file_path, 'rb') as content:
-        hasher = hashlib.sha256()
-        hasher.update(content.read())
-        return hasher.hexdigest()
+class StorePhaseTimes:
+    """ Wall clock time of the phases of the store. """
+
+    def __init__(self):
+        self.__times: List[Tuple[str, float]] = []
+        self.__current: Optional[Tuple[str, float]] = None
+
+    def start(self, name: str):
+        """ Finish the current phase and start a new one. """
+        self.finish()
+        self.__current = (name, time.time())
+
+    def finish(self):
+        """ Finish the current phase. """
+        if self.__current:
+            name, start = self.__current
+            self.__times.append((name, time.time() - start))
+            self.__current = None
+
+    def log(self):
+        """ Finish the current phase and log the time of every phase. """
+        self.finish()
+        if not self.__times:
+            return
+
+        rows = [[name, f"{seconds:.2f}"] for name, seconds in self.__times]
+        rows.append(["Total", f"{sum(t for _, t in self.__times):.2f}"])
+        LOG.debug("Time of the store phases:\n%s",
+                  twodim.to_table([["Phase", "Time (s)"]] + rows))
 
 
 def get_argparser_ctor_args():
@@ -191,6 +223,11 @@ Environment variables
                    files in the users home directory (e.g. in a CI
                    environment).
 
+  CC_CACHE_DIR     Directory of the caches which are shared between
+                   CodeChecker invocations, like the cache of the content
+                   hashes of the source files. (default:
+                   $XDG_CACHE_HOME/codechecker or ~/.cache/codechecker)
+
 
 The results can be viewed by connecting to such a server in a Web browser or
 via 'CodeChecker cmd'.""",
@@ -285,6 +322,39 @@ def add_arguments_to_parser(parser):
                              "analysis, and only incrementally update defect "
                              "reports for source files that were analysed.)")
 
+    parser.add_argument('--report-cache',
+                        dest="report_cache",
+                        default=argparse.SUPPRESS,
+                        action='store_true',
+                        required=False,
+                        help="Read the reports from cache files next to the "
+                             "analyzer result files instead of parsing them "
+                             "and write the missing cache files "
+                             "('<result file>.cache'). The cache files are "
+                             "never sent to the server.")
+
+    parser.add_argument('--no-content-hash-cache',
+                        dest="no_content_hash_cache",
+                        default=argparse.SUPPRESS,
+                        action='store_true',
+                        required=False,
+                        help="Hash every source file instead of reusing the "
+                             "content hashes of the unchanged files from the "
+                             "previous stores, and don't update the cache "
+                             "file of the content hashes in the "
+                             "'$CC_CACHE_DIR' directory (default: "
+                             "'~/.cache/codechecker').")
+
+    parser.add_argument('--detach',
+                        dest="detach",
+                        default=argparse.SUPPRESS,
+                        action='store_true',
+                        required=False,
+                        help="Don't wait until the server stores the "
+                             "uploaded results. The token of the store task "
+                             "is printed, which can be used to query the "
+                             "status of the store later.")
+
     server_args = parser.add_argument_group(
         "server arguments", """
 Specifies a 'CodeChecker server' instance which will be used to store the
@@ -343,16 +413,14 @@ def scan_for_review_comment(job: Tuple[str, Iterable[int]]):
     """
     file_path, lines = job
     sc_handler = SourceCodeCommentHandler()
-    comments = []
-    with open(file_path, mode='r', encoding='utf-8', errors='ignore') as f:
-        comments, misspelled_comments = sc_handler.scan_source_line_comments(
-            f, lines)
+    comments, misspelled_comments = sc_handler.scan_source_line_comments(
+        get_source_cache().get(file_path), lines)
 
-        if misspelled_comments:
-            LOG.warning("There are misspelled review status comments in %s",
-                        file_path)
-        for mc in misspelled_comments:
-            LOG.warning(mc)
+    if misspelled_comments:
+        LOG.warning("There are misspelled review status comments in %s",
+                    file_path)
+    for mc in misspelled_comments:
+        LOG.warning(mc)
 
     return comments
 
@@ -386,11 +454,13 @@ def filter_source_files_with_comments(
 
 def get_reports(
     analyzer_result_file_path: str,
-    checker_labels: CheckerLabels
+    checker_labels: CheckerLabels,
+    use_report_cache: bool = False
 ) -> List[Report]:
     """ Get reports from the given analyzer result file. """
     reports = report_file.get_reports(
-        analyzer_result_file_path, checker_labels)
+        analyzer_result_file_path, checker_labels,
+        use_cache=use_report_cache)
 
     # CppCheck generates a '0' value for the report hash. In case all of the
     # reports in a result file contain only a hash with '0' value, overwrite
@@ -400,7 +470,8 @@ def get_reports(
             analyzer_result_file_path, HashType.CONTEXT_FREE)
 
         reports = report_file.get_reports(
-            analyzer_result_file_path, checker_labels)
+            analyzer_result_file_path, checker_labels,
+            use_cache=use_report_cache)
 
     return reports
 
@@ -408,14 +479,16 @@ def get_reports(
 def parse_analyzer_result_files(
     analyzer_result_files: Iterable[str],
     checker_labels: CheckerLabels,
-    zip_iter=map
+    zip_iter=map,
+    use_report_cache: bool = False
 ) -> AnalyzerResultFileReports:
     """ Get reports from the given analyzer result files. """
     analyzer_result_file_reports: AnalyzerResultFileReports = defaultdict(list)
 
     for idx, (file_path, reports) in enumerate(zip(
             analyzer_result_files, zip_iter(
-                functools.partial(get_reports, checker_labels=checker_labels),
+                functools.partial(get_reports, checker_labels=checker_labels,
+                                  use_report_cache=use_report_cache),
                 analyzer_result_files))):
         LOG.debug(f"[{idx}/{len(analyzer_result_files)}] "
                   f"Parsed '{file_path}' ...")
@@ -428,7 +501,10 @@ def assemble_zip(inputs,
                  zip_file,
                  client,
                  prod_client,
-                 checker_labels: CheckerLabels):
+                 checker_labels: CheckerLabels,
+                 use_report_cache: bool = False,
+                 phase_times: Optional[StorePhaseTimes] = None,
+                 use_content_hash_cache: bool = True):
     """Collect and compress report and source files, together with files
     contanining analysis related information into a zip file which
     will be sent to the server.
@@ -436,7 +512,19 @@ def assemble_zip(inputs,
     For each report directory, we create a uniqued zipped directory. Each
     report directory to store could have been made with different
     configurations, so we can't merge them all into a single zip.
+
+    If use_report_cache is True, the reports are read from the report cache
+    files of the analyzer result files if possible. The report cache files
+    are not added to the zip.
+
+    If use_content_hash_cache is True, the content hashes of the source files
+    are cached in the cache directory of CodeChecker, see content_hash_cache.
     """
+    if phase_times is None:
+        phase_times = StorePhaseTimes()
+
+    phase_times.start("Processing report files")
+
     files_to_compress: Dict[str, set] = defaultdict(set)
     analyzer_result_file_paths = []
     stats = StorageZipStatistics()
@@ -467,7 +555,8 @@ def assemble_zip(inputs,
 
     with Pool() as executor:
         analyzer_result_file_reports = parse_analyzer_result_files(
-             analyzer_result_file_paths, checker_labels, executor.map)
+             analyzer_result_file_paths, checker_labels, executor.map,
+             use_report_cache)
 
     LOG.info("Processing report files done.")
 
@@ -498,6 +587,8 @@ def assemble_zip(inputs,
             file_paths.update(report.original_files)
             file_report_positions[report.file.original_path].add(report.line)
 
+    stat_cache.log_statistics()
+
     temp_dir = tempfile.mkdtemp('-unique-plists', dir=inputs[0])
     for dirname, analyzer_reports in unique_reports.items():
         for analyzer_name, reports in analyzer_reports.items():
@@ -525,14 +616,23 @@ def assemble_zip(inputs,
     # There can be files with same hash, but different path.
     file_to_hash: Dict[str, str] = {}
 
-    for file_path in file_paths:
-        h = get_file_content_hash(file_path)
+    phase_times.start("Hashing source files")
+    content_hash_cache = ContentHashCache(
+        os.path.join(get_cache_dir(), CONTENT_HASH_CACHE_FILE_NAME)
+        if use_content_hash_cache else None)
 
-        file_to_hash[file_path] = h
+    file_to_hash.update(content_hash_cache.get_hashes(file_paths,
+                                                      parallel=True))
+
+    content_hash_cache.save()
+    content_hash_cache.log_statistics()
+
+    for file_path, h in file_to_hash.items():
         hash_to_file[h] = file_path
 
     file_hashes = list(hash_to_file.keys())
 
+    phase_times.start("Querying missing content hashes")
     LOG.info("Get missing file content hashes from the server...")
     necessary_hashes = client.getMissingContentHashes(file_hashes) \
         if file_hashes else []
@@ -547,6 +647,7 @@ def assemble_zip(inputs,
     LOG.info(
         "Get file content hashes which do not have blame information done.")
 
+    phase_times.start("Collecting review comments")
     LOG.info("Collecting review comments ...")
 
     # Get files which can be found on the server but contains source code
@@ -564,6 +665,7 @@ def assemble_zip(inputs,
 
     LOG.info("Collecting review comments done.")
 
+    phase_times.start("Building report zip file")
     LOG.info("Building report zip file...")
     with zipfile.ZipFile(zip_file, 'a', allowZip64=True) as zipf:
         # Add the files to the zip which will be sent to the server.
@@ -639,22 +741,121 @@ Configured report limit for this product: {p.reportLimit}
 
     zip_size = os.stat(zip_file).st_size
 
+    phase_times.start("Compressing report zip file")
     LOG.info("Compressing report zip file...")
 
-    with open(zip_file, 'rb') as source:
-        compressed = zlib.compress(source.read(), zlib.Z_BEST_COMPRESSION)
-    with open(zip_file, 'wb') as target:
-        target.write(compressed)
+    # The zip file is compressed block by block so it is not held in memory.
+    compressor = zlib.compressobj(zlib.Z_BEST_COMPRESSION)
+    compressed_zip_file = f"{zip_file}.compressed"
+    with open(zip_file, 'rb') as source, \
+            open(compressed_zip_file, 'wb') as target:
+        for block in iter(lambda: source.read(UPLOAD_CHUNK_SIZE), b''):
+            target.write(compressor.compress(block))
+        target.write(compressor.flush())
+    os.replace(compressed_zip_file, zip_file)
 
     compressed_zip_size = os.stat(zip_file).st_size
 
     LOG.info("Compressing report zip file done (%s / %s).",
              sizeof_fmt(zip_size), sizeof_fmt(compressed_zip_size))
+    phase_times.finish()
 
     # We are responsible for deleting these.
     shutil.rmtree(temp_dir)
 
 
+def upload_zip(client, zip_file: str) -> str:
+    """
+    Upload the compressed zip file to the server in chunks and return the
+    identifier of the upload.
+
+    If the connection fails, then the upload is continued from the last chunk
+    which was received by the server.
+    """
+    zip_size = os.stat(zip_file).st_size
+
+    zip_hash = hashlib.sha256()
+    with open(zip_file, 'rb') as zf:
+        for block in iter(lambda: zf.read(UPLOAD_CHUNK_SIZE), b''):
+            zip_hash.update(block)
+
+    retries = 0
+    while True:
+        try:
+            upload = client.beginStoreUpload(zip_hash.hexdigest(), zip_size)
+            chunk_size = min(UPLOAD_CHUNK_SIZE, upload.maxChunkSize)
+
+            offset = upload.receivedSize
+            with open(zip_file, 'rb') as zf:
+                zf.seek(offset)
+                while offset < zip_size:
+                    chunk = zf.read(chunk_size)
+                    offset = client.appendStoreChunk(
+                        upload.uploadId, offset, chunk,
+                        hashlib.sha256(chunk).hexdigest())
+
+                    LOG.debug("Uploaded %s / %s.", sizeof_fmt(offset),
+                              sizeof_fmt(zip_size))
+
+            return upload.uploadId
+        except OSError as oserr:
+            retries += 1
+            if retries > UPLOAD_RETRIES:
+                LOG.error("Connection failed.")
+                LOG.error(oserr.strerror)
+                LOG.error("Check if your CodeChecker server is running.")
+                sys.exit(1)
+
+            LOG.warning("Uploading the results failed: %s. Continuing the "
+                        "upload (%d / %d)...", oserr, retries,
+                        UPLOAD_RETRIES)
+            time.sleep(retries)
+
+
+def wait_for_store_task(client, token: str):
+    """
+    Wait until the server finishes the store task with the given token and
+    log the progress of it. RequestFailed is raised if the store failed.
+
+    Only short status queries are sent, so no connection is kept open while
+    the server stores the results. If a query fails, it is sent again.
+    """
+    retries = 0
+    logged_phases = 0
+    while True:
+        try:
+            task = client.getStoreTaskInfo(token)
+            retries = 0
+        except OSError as oserr:
+            retries += 1
+            if retries > UPLOAD_RETRIES:
+                LOG.error("Connection failed.")
+                LOG.error(oserr.strerror)
+                LOG.error("Check if your CodeChecker server is running.")
+                LOG.error("The results may still be stored by the server, "
+                          "the token of the store task is: %s", token)
+                sys.exit(1)
+
+            LOG.warning("Querying the status of the store failed: %s. "
+                        "Retrying (%d / %d)...", oserr, retries,
+                        UPLOAD_RETRIES)
+            time.sleep(retries)
+            continue
+
+        # The phases which started since the previous query are logged.
+        for phase in (task.phases or [])[logged_phases:]:
+            LOG.info("Storing results to the server: %s...", phase.name)
+            logged_phases += 1
+
+        if task.status == StoreTaskStatus.COMPLETED:
+            return
+
+        if task.status == StoreTaskStatus.FAILED:
+            raise RequestFailed(task.errorCode, task.message, task.extraInfo)
+
+        time.sleep(STORE_TASK_POLL_INTERVAL)
+
+
 def should_be_zipped(input_file: str, input_files: Iterable[str]) -> bool:
     """
     Determine whether a given input file should be included in the zip.
@@ -779,72 +980,6 @@ def storing_analysis_statistics(client, inputs, run_name):
     return None
 
 
-class WatchdogError(Exception):
-    """
-    Custom exception type thrown by '_timeout_watchdog'. This is used instead
-    of the built-in 'TimeoutError' because TimeoutError <: OSError and other
-    handlers in the call chain during a timeout might catch the more generic
-    OSError instead, resulting in not running the appropriate handler.
-    """
-    def __init__(self, timeout: timedelta, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.timeout = timeout
-
-
-@contextmanager
-def _timeout_watchdog(timeout: timedelta, trap: int):
-    """
-    Sets up a context with a 'threading.Timer' which will signal 'trap' the
-    current process if 'timeout' passes. If and only if this 'trap' signal
-    arrives, a 'WatchdogError' is thrown for appropriate handling outside the
-    context.
-
-    The timer is started immediately as this function returns the context.
-
-    This is done in order to prevent the current process from hanging
-    indefinitely in case the stored data is too big and the server spends more
-    time processing it that what the network connection would stay alive for.
-
-    The fact that this works is **NOT GUARANTEED**! In some cases, based on
-    likely the kernel version, its implementation, and the exact network
-    topology, the client may enter an *UNINTERRUPTIBLE* sleep ('D') at which
-    point signals *MAY* not be accurately received. However, manual testing
-    revealbed that resurrection of hung clients is possible even if the process
-    is shown as "uninterruptible" by simply killing it from the outside.
-
-    This is a **TEMPORARY** measure to alleviate hangs until the proper
-    "pollable asynchronous store" feature is implemented, see:
-    http://github.com/Ericsson/codechecker/issues/3672
-    """
-    def _signal_handler(sig: int, _):
-        if sig == trap:
-            signal.signal(trap, signal.SIG_DFL)
-            raise WatchdogError(
-                timeout,
-                f"Timeout watchdog hit {timeout.total_seconds()} "
-                f"seconds ({str(timeout)})")
-
-    pid = os.getpid()
-    timer = Timer(timeout.total_seconds(),
-                  lambda: os.kill(pid, trap))
-    timer.name = "StoreTimeoutWatcher"
-    LOG.debug("Set up timer for %d seconds (%s) for PID %d",
-              timeout.total_seconds(), str(timeout), pid)
-    try:
-        signal.signal(trap, _signal_handler)
-        timer.start()
-        yield timer
-    except Exception as e:
-        LOG.debug("External exception within timeout-sensing context: %s",
-                  str(e))
-        raise e
-    finally:
-        timer.cancel()
-        signal.signal(trap, signal.SIG_DFL)
-        LOG.debug("Timeout timer of %d seconds (%s) for PID %d stopped.",
-                  timeout.total_seconds(), str(timeout), pid)
-
-
 def main(args):
     """
     Store the defect results in the specified input list as bug reports in the
@@ -912,6 +1047,8 @@ def main(args):
     zip_file_handle, zip_file = tempfile.mkstemp(suffix=".zip", dir=temp_dir)
     LOG.debug("Will write mass store ZIP to '%s'...", zip_file)
 
+    phase_times = StorePhaseTimes()
+
     try:
         context = webserver_context.get_context()
 
@@ -921,7 +1058,10 @@ def main(args):
                          zip_file,
                          client,
                          prod_client,
-                         context.checker_labels)
+                         context.checker_labels,
+                         'report_cache' in args,
+                         phase_times,
+                         'no_content_hash_cache' not in args)
         except Exception as ex:
             print(ex)
             import traceback
@@ -930,18 +1070,16 @@ def main(args):
             sys.exit(1)
 
         zip_size = os.stat(zip_file).st_size
-        if zip_size > MAX_UPLOAD_SIZE:
-            LOG.error("The result list to upload is too big (max: %s): %s.",
-                      sizeof_fmt(MAX_UPLOAD_SIZE), sizeof_fmt(zip_size))
-            sys.exit(1)
-
-        b64zip = ""
-        with open(zip_file, 'rb') as zf:
-            b64zip = base64.b64encode(zf.read()).decode("utf-8")
-        if len(b64zip) == 0:
+        if zip_size == 0:
             LOG.info("Zip content is empty, nothing to store!")
             sys.exit(1)
 
+        LOG.info("Uploading results to the server (%s)...",
+                 sizeof_fmt(zip_size))
+        phase_times.start("Uploading")
+        upload_id = upload_zip(client, zip_file)
+        LOG.info("Uploading results to the server done.")
+
         trim_path_prefixes = args.trim_path_prefix if \
             'trim_path_prefix' in args else None
 
@@ -949,61 +1087,28 @@ def main(args):
 
         LOG.info("Storing results to the server...")
 
-        try:
-            with _timeout_watchdog(timedelta(hours=1),
-                                   signal.SIGUSR1):
-                client.massStoreRun(args.name,
-                                    args.tag if 'tag' in args else None,
-                                    str(context.version),
-                                    b64zip,
-                                    'force' in args,
-                                    trim_path_prefixes,
-                                    description)
-        except WatchdogError as we:
-            LOG.warning("%s", str(we))
-
-            # Showing parts of the exception stack is important here.
-            # We **WANT** to see that the timeout happened during a wait on
-            # Thrift reading from the TCP connection (something deep in the
-            # Python library code at "sock.recv_into").
-            import traceback
-            _, _, tb = sys.exc_info()
-            frames = traceback.extract_tb(tb)
-            first, last = frames[0], frames[-2]
-            formatted_frames = traceback.format_list([first, last])
-            fmt_first, fmt_last = formatted_frames[0], formatted_frames[1]
-            LOG.info("Timeout was triggered during:\n%s", fmt_first)
-            LOG.info("Timeout interrupted this low-level operation:\n%s",
-                     fmt_last)
-
-            LOG.error("Timeout!"
-                      "\n\tThe server's reply did not arrive after "
-                      "%d seconds (%s) elapsed since the server-side "
-                      "processing began."
-                      "\n\n\tThis does *NOT* mean that there was an issue "
-                      "with the run you were storing!"
-                      "\n\tThe server might still be processing the results..."
-                      "\n\tHowever, it is more likely that the "
-                      "server had already finished, but the client did not "
-                      "receive a response."
-                      "\n\tUsually, this is caused by the underlying TCP "
-                      "connection failing to signal a low-level disconnect."
-                      "\n\tClients potentially hanging indefinitely in these "
-                      "scenarios is an unfortunate and known issue."
-                      "\n\t\tSee http://github.com/Ericsson/codechecker/"
-                      "issues/3672 for details!"
-                      "\n\n\tThis error here is a temporary measure to ensure "
-                      "an infinite hang is replaced with a well-explained "
-                      "timeout."
-                      "\n\tA more proper solution will be implemented in a "
-                      "subsequent version of CodeChecker.",
-                      we.timeout.total_seconds(), str(we.timeout))
-            sys.exit(1)
+        token = client.commitStoreUpload(upload_id,
+                                         args.name,
+                                         args.tag if 'tag' in args else None,
+                                         str(context.version),
+                                         'force' in args,
+                                         trim_path_prefixes,
+                                         description)
 
         # Storing analysis statistics if the server allows them.
+        phase_times.start("Storing analysis statistics")
         if client.allowsStoringAnalysisStatistics():
             storing_analysis_statistics(client, args.input, args.name)
 
+        if 'detach' in args:
+            LOG.info("The results are stored by the server in the "
+                     "background. Token of the store task: %s", token)
+            print(token)
+            return
+
+        phase_times.start("Storing results on the server")
+        wait_for_store_task(client, token)
+
         LOG.info("Storage finished successfully.")
     except RequestFailed as reqfail:
         if reqfail.errorCode == ErrorCode.SOURCE_FILE:
@@ -1020,6 +1125,7 @@ def main(args):
         LOG.info("Storage failed: %s", str(ex))
         sys.exit(1)
     finally:
+        phase_times.log()
         os.close(zip_file_handle)
         os.remove(zip_file)
         if os.path.exists(temp_dir):
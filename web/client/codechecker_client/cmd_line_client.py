@@ -197,11 +197,14 @@ def get_suppressed_reports(reports: List[Report],
 def get_report_dir_results(
     report_dirs: List[str],
     report_filter: ttypes.ReportFilter,
-    checker_labels: CheckerLabels
+    checker_labels: CheckerLabels,
+    use_report_cache: bool = False
 ) -> List[Report]:
     """Get reports from the given report directories.
 
-    Absolute paths are expected to the given report directories.
+    Absolute paths are expected to the given report directories. If
+    use_report_cache is True, the reports are read from the report cache
+    files of the analyzer result files if possible.
     """
     all_reports = []
 
@@ -221,7 +224,8 @@ def get_report_dir_results(
 
         for file_path in file_paths:
             # Get reports.
-            reports = report_file.get_reports(file_path, checker_labels)
+            reports = report_file.get_reports(
+                file_path, checker_labels, use_cache=use_report_cache)
 
             try:
                 for report in reports:
@@ -862,7 +866,8 @@ def get_diff_local_dir_remote_run(
     output_formats: List[str],
     report_dirs: List[str],
     baseline_files: List[str],
-    remote_run_names: List[str]
+    remote_run_names: List[str],
+    use_report_cache: bool = False
 ) -> Tuple[List[Report], List[str], List[str]]:
     """ Compare a local report directory with a remote run. """
     filtered_reports = []
@@ -870,7 +875,7 @@ def get_diff_local_dir_remote_run(
 
     context = webserver_context.get_context()
     report_dir_results = get_report_dir_results(
-        report_dirs, report_filter, context.checker_labels)
+        report_dirs, report_filter, context.checker_labels, use_report_cache)
 
     suppressed_in_code = \
         get_suppressed_reports(report_dir_results, report_filter.reviewStatus)
@@ -960,7 +965,8 @@ def get_diff_remote_run_local_dir(
     output_formats: List[str],
     remote_run_names: List[str],
     report_dirs: List[str],
-    baseline_files: List[str]
+    baseline_files: List[str],
+    use_report_cache: bool = False
 ) -> Tuple[List[Report], List[str], List[str]]:
     """ Compares a remote run with a local report directory. """
     filtered_reports = []
@@ -968,7 +974,7 @@ def get_diff_remote_run_local_dir(
 
     context = webserver_context.get_context()
     report_dir_results = get_report_dir_results(
-        report_dirs, report_filter, context.checker_labels)
+        report_dirs, report_filter, context.checker_labels, use_report_cache)
     suppressed_in_code = \
         get_suppressed_reports(report_dir_results, report_filter.reviewStatus)
 
@@ -1089,7 +1095,8 @@ def get_diff_local_dirs(
     report_dirs: List[str],
     baseline_files: List[str],
     new_report_dirs: List[str],
-    new_baseline_files: List[str]
+    new_baseline_files: List[str],
+    use_report_cache: bool = False
 ) -> Tuple[List[Report], List[str]]:
     """
     Compares two report directories and returns the filtered results.
@@ -1103,12 +1110,13 @@ def get_diff_local_dirs(
     statuses_str.append('unreviewed')
 
     base_results = get_report_dir_results(
-        report_dirs, report_filter, context.checker_labels)
+        report_dirs, report_filter, context.checker_labels, use_report_cache)
     base_results = [res for res in base_results
                     if res.review_status.status in statuses_str]
 
     new_results = get_report_dir_results(
-        new_report_dirs, report_filter, context.checker_labels)
+        new_report_dirs, report_filter, context.checker_labels,
+        use_report_cache)
     new_results = [res for res in new_results
                    if res.review_status.status in statuses_str]
 
@@ -1218,11 +1226,9 @@ def print_reports(
             print(twodim.to_str(output_format, header, rows))
 
         if output_format == 'json':
-            data = report_to_json.convert(reports)
-
             report_json = os.path.join(output_dir, 'reports.json') \
                 if output_dir else None
-            dump_json_output(data, report_json)
+            report_to_json.write(reports, report_json)
 
         if output_format == 'gerrit':
             data = gerrit.convert(reports)
@@ -1232,12 +1238,10 @@ def print_reports(
             dump_json_output(data, report_json)
 
         if output_format == 'codeclimate':
-            data = codeclimate.convert(reports)
-
             report_json = os.path.join(
                 output_dir, 'codeclimate_issues.json') \
                 if output_dir else None
-            dump_json_output(data, report_json)
+            codeclimate.write(reports, report_json)
 
     if 'html' in output_formats:
         html_builder.finish(output_dir, statistics)
@@ -1348,6 +1352,7 @@ def handle_diff_results(args):
         check_existing_source_components(client, args.component)
 
     print_steps = 'print_steps' in args
+    use_report_cache = 'report_cache' in args
     report_hashes = []
     if (basename_local_dirs or basename_baseline_files) and \
        (newname_local_dirs or newname_baseline_files):
@@ -1357,7 +1362,7 @@ def handle_diff_results(args):
         reports, report_hashes = get_diff_local_dirs(
             report_filter, diff_type,
             basename_local_dirs, basename_baseline_files,
-            newname_local_dirs, newname_baseline_files)
+            newname_local_dirs, newname_baseline_files, use_report_cache)
 
         print_reports(print_steps, reports, report_hashes, output_dir,
                       output_formats)
@@ -1372,7 +1377,7 @@ def handle_diff_results(args):
             get_diff_remote_run_local_dir(
                 client, report_filter, diff_type, output_formats,
                 basename_run_names,
-                newname_local_dirs, newname_baseline_files)
+                newname_local_dirs, newname_baseline_files, use_report_cache)
 
         print_reports(print_steps, reports, report_hashes, output_dir,
                       output_formats)
@@ -1389,7 +1394,7 @@ def handle_diff_results(args):
             get_diff_local_dir_remote_run(
                 client, report_filter, diff_type, output_formats,
                 basename_local_dirs,
-                basename_baseline_files, newname_run_names)
+                basename_baseline_files, newname_run_names, use_report_cache)
 
         print_reports(print_steps, reports, report_hashes, output_dir,
                       output_formats)
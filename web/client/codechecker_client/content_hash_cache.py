@@ -0,0 +1,203 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Persistent cache of the content hashes of the source files.
+
+Every source file referenced by the reports has to be hashed on every store,
+even though most of them are unchanged since the previous store. Reading
+hundreds of thousands of files is slow, especially on network file systems.
+
+The content hash of a file is saved in a cache file together with the size,
+the modification time and the inode of the file when it was hashed. The
+cached hash is used while these are unchanged, the other files are hashed in
+parallel if there are many of them.
+"""
+
+
+import hashlib
+import json
+import mmap
+import os
+import uuid
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from codechecker_common.compatibility.multiprocessing import Pool
+from codechecker_common.logger import get_logger
+
+from codechecker_report_converter.stat_cache import get_stat_cache
+
+
+LOG = get_logger('system')
+
+# Increase this number if the format of the cache file changes so the old
+# cache files are not used anymore.
+CACHE_VERSION = 1
+
+# Maximum number of files in the cache. The files which were not used for
+# the longest time are dropped first.
+MAX_CACHE_SIZE = 2000000
+
+# Number of files which are hashed by a worker process at once. Worker
+# processes are started only if more files have to be hashed.
+HASH_CHUNK_SIZE = 64
+
+# Size, modification time and inode of a file.
+Fingerprint = Tuple[int, int, int]
+
+
+def get_file_content_hash(file_path: str) -> str:
+    """
+    Return the sha256 hash of the content of the given file. The file is
+    mapped into the memory instead of being read into a buffer.
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as content:
+        try:
+            with mmap.mmap(content.fileno(), 0,
+                           access=mmap.ACCESS_READ) as data:
+                hasher.update(data)
+        except ValueError:
+            # Empty files can't be mapped.
+            hasher.update(content.read())
+    return hasher.hexdigest()
+
+
+def get_fingerprint(file_path: str) -> Optional[Fingerprint]:
+    """
+    Return the size, the modification time and the inode of the given file
+    or None if the file is missing.
+    """
+    stat = get_stat_cache().stat(file_path)
+    if stat is None:
+        return None
+
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+class ContentHashCache:
+    """
+    Content hashes of the files which are loaded from and saved to a cache
+    file.
+    """
+
+    def __init__(self, cache_file_path: Optional[str]):
+        """
+        cache_file_path -- The cache file. If it is None, then every file is
+                           hashed and nothing is saved.
+        """
+        self.__cache_file_path = cache_file_path
+
+        # File path -> [size, modification time, inode, content hash].
+        self.__entries: Dict[str, List] = {}
+        self.__used: Dict[str, List] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+        if cache_file_path:
+            self.__load()
+
+    def __load(self):
+        """ Load the entries of the cache file. """
+        try:
+            with open(self.__cache_file_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as ex:
+            LOG.debug("Failed to load content hash cache %s: %s",
+                      self.__cache_file_path, ex)
+            return
+
+        if not isinstance(data, dict) or \
+                data.get('version') != CACHE_VERSION:
+            LOG.debug("Content hash cache %s is outdated.",
+                      self.__cache_file_path)
+            return
+
+        self.__entries = data.get('files', {})
+
+    def get_hashes(
+        self,
+        file_paths: Iterable[str],
+        parallel: bool = False
+    ) -> Dict[str, str]:
+        """
+        Return the content hashes of the given files. The files which are
+        not found in the cache are hashed by worker processes if parallel is
+        True and there are enough of them.
+        """
+        hashes: Dict[str, str] = {}
+        missing: List[Tuple[str, Optional[Fingerprint]]] = []
+
+        for file_path in file_paths:
+            fingerprint = get_fingerprint(file_path)
+            entry = self.__entries.get(file_path)
+            if fingerprint and entry and tuple(entry[:3]) == fingerprint:
+                hashes[file_path] = entry[3]
+                self.__used[file_path] = entry
+            else:
+                missing.append((file_path, fingerprint))
+
+        self.hits += len(hashes)
+        self.misses += len(missing)
+
+        missing_paths = [file_path for file_path, _ in missing]
+        if parallel and len(missing_paths) > HASH_CHUNK_SIZE:
+            with Pool() as executor:
+                content_hashes = executor.map(get_file_content_hash,
+                                              missing_paths,
+                                              chunksize=HASH_CHUNK_SIZE)
+        else:
+            content_hashes = list(map(get_file_content_hash, missing_paths))
+
+        for (file_path, fingerprint), content_hash in zip(missing,
+                                                          content_hashes):
+            hashes[file_path] = content_hash
+            if fingerprint:
+                self.__used[file_path] = [*fingerprint, content_hash]
+
+        return hashes
+
+    def save(self):
+        """
+        Write the cache file. The files which were used are kept and the rest
+        of the old entries while the cache is not full. Failing to write the
+        cache file is not an error, the files are hashed again next time.
+        """
+        if not self.__cache_file_path:
+            return
+
+        # The entries which were used are moved to the end of the dict, so
+        # the least recently used ones are dropped.
+        entries = {k: v for k, v in self.__entries.items()
+                   if k not in self.__used}
+        entries.update(self.__used)
+        if len(entries) > MAX_CACHE_SIZE:
+            entries = dict(list(entries.items())[-MAX_CACHE_SIZE:])
+
+        # The cache file is replaced atomically, so a parallel store never
+        # reads a partially written file.
+        tmp_file_path = f"{self.__cache_file_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.__cache_file_path),
+                        exist_ok=True)
+            with open(tmp_file_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'files': entries}, f)
+            os.replace(tmp_file_path, self.__cache_file_path)
+        except OSError as ex:
+            LOG.debug("Failed to write content hash cache %s: %s",
+                      self.__cache_file_path, ex)
+            try:
+                os.remove(tmp_file_path)
+            except OSError:
+                pass
+
+    def log_statistics(self):
+        """ Log the number of files which didn't have to be hashed. """
+        LOG.debug("Content hash cache: %d files hashed, %d hashes reused.",
+                  self.misses, self.hits)
@@ -181,6 +181,23 @@ class ThriftResultsHelper(BaseClientHelper):
                      trim_path_prefixes, description):
         pass
 
+    @thrift_client_call
+    def beginStoreUpload(self, zip_hash, zip_size):
+        pass
+
+    @thrift_client_call
+    def appendStoreChunk(self, upload_id, offset, chunk, chunk_hash):
+        pass
+
+    @thrift_client_call
+    def commitStoreUpload(self, upload_id, name, tag, version, force,
+                          trim_path_prefixes, description):
+        pass
+
+    @thrift_client_call
+    def getStoreTaskInfo(self, token):
+        pass
+
     @thrift_client_call
     def allowsStoringAnalysisStatistics(self):
         pass
@@ -21,9 +21,17 @@ from codechecker_common.logger import get_logger
 
 LOG = get_logger('system')
 
+# The connection errors of these API calls are handled near the business
+# logic, where the interrupted upload or status query is continued.
+RESUMABLE_FUNCTIONS = ['beginStoreUpload', 'appendStoreChunk',
+                       'getStoreTaskInfo']
+
 
 def truncate_arg(arg, max_len=100):
     """ Truncate the given argument if the length is too large. """
+    if isinstance(arg, bytes):
+        return f"<{len(arg)} bytes>"
+
     if isinstance(arg, str) and len(arg) > max_len:
         return arg[:max_len] + "..."
 
@@ -112,6 +120,9 @@ def thrift_client_call(function):
             LOG.exception("Request failed.")
             sys.exit(1)
         except OSError as oserr:
+            if func_name in RESUMABLE_FUNCTIONS:
+                raise oserr
+
             LOG.error("Connection failed.")
             LOG.error(oserr.strerror)
             LOG.error("Check if your CodeChecker server is running.")
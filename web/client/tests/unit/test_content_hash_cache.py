@@ -0,0 +1,121 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Test the persistent cache of the content hashes of the source files.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_report_converter.stat_cache import get_stat_cache
+
+from codechecker_client import content_hash_cache
+from codechecker_client.content_hash_cache import ContentHashCache, \
+    get_file_content_hash
+
+
+class ContentHashCacheTest(unittest.TestCase):
+    """ The cached hashes are used only for unchanged files. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.tmp_dir, 'ws', 'cache.json')
+        self.files = []
+        for i in range(3):
+            file_path = os.path.join(self.tmp_dir, f'{i}.c')
+            self.__write(file_path, f'int main() {{ return {i}; }}')
+            self.files.append(file_path)
+
+    def tearDown(self):
+        get_stat_cache().clear()
+        shutil.rmtree(self.tmp_dir)
+
+    def __write(self, file_path, content):
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        get_stat_cache().invalidate(file_path)
+
+    def __get_hashes(self, file_paths):
+        cache = ContentHashCache(self.cache_file)
+        hashes = cache.get_hashes(file_paths)
+        cache.save()
+        return cache, hashes
+
+    def test_file_content_hash(self):
+        """ The hash of mapped files is the hash of their content. """
+        empty_file = os.path.join(self.tmp_dir, 'empty.c')
+        self.__write(empty_file, '')
+
+        for file_path in self.files + [empty_file]:
+            with open(file_path, 'rb') as f:
+                self.assertEqual(get_file_content_hash(file_path),
+                                 hashlib.sha256(f.read()).hexdigest())
+
+    def test_reuse(self):
+        """ Only the new and changed files are hashed again. """
+        cache, hashes = self.__get_hashes(self.files[:2])
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+        cache, _ = self.__get_hashes(self.files)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        self.__write(self.files[0], 'int main() { return 42; }')
+        cache, new_hashes = self.__get_hashes(self.files)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        self.assertNotEqual(new_hashes[self.files[0]], hashes[self.files[0]])
+        self.assertEqual(new_hashes[self.files[1]], hashes[self.files[1]])
+        for file_path, content_hash in new_hashes.items():
+            self.assertEqual(content_hash, get_file_content_hash(file_path))
+
+    def test_parallel(self):
+        """ Worker processes are started only for many missing files. """
+        cache = ContentHashCache(self.cache_file)
+        with mock.patch.object(content_hash_cache, 'Pool') as pool:
+            cache.get_hashes(self.files, parallel=True)
+        pool.assert_not_called()
+
+        with mock.patch.object(content_hash_cache, 'HASH_CHUNK_SIZE', 1):
+            hashes = cache.get_hashes(self.files, parallel=True)
+        self.assertEqual(hashes, {file_path: get_file_content_hash(file_path)
+                                  for file_path in self.files})
+
+    def test_invalid_cache_file(self):
+        """ Every file is hashed if the cache file can't be used. """
+        os.makedirs(os.path.dirname(self.cache_file))
+        for content in ['invalid', '[]', '{"version": 0, "files": {}}']:
+            self.__write(self.cache_file, content)
+            cache, _ = self.__get_hashes(self.files)
+            self.assertEqual((cache.hits, cache.misses), (0, 3))
+
+            cache, _ = self.__get_hashes(self.files)
+            self.assertEqual((cache.hits, cache.misses), (3, 0))
+
+    def test_no_cache_file(self):
+        """ Nothing is saved without a cache file. """
+        cache = ContentHashCache(None)
+        cache.get_hashes(self.files)
+        cache.save()
+        self.assertFalse(os.path.exists(os.path.dirname(self.cache_file)))
+
+    def test_max_cache_size(self):
+        """ The least recently used files are dropped from the cache. """
+        self.__get_hashes(self.files)
+
+        with mock.patch.object(content_hash_cache, 'MAX_CACHE_SIZE', 2):
+            self.__get_hashes(self.files[:1])
+
+        cache, _ = self.__get_hashes(self.files)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        cache, _ = self.__get_hashes(self.files[:1])
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
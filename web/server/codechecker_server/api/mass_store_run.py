@@ -49,25 +49,43 @@ from ..database.run_db_model import \
 from ..metadata import checker_is_unavailable, MetadataInfoParser
 
 from .report_server import ThriftRequestHandler
+from .store_task import StoreTask
 from .thrift_enum_helper import report_extended_data_type_str
 
 
 LOG = get_logger('server')
 STORE_TIME_LOG = get_logger('store_time')
 
+# Size of the blocks in which the uploaded zip files are decompressed.
+UNZIP_BLOCK_SIZE = 1024 * 1024
+
 
 class LogTask:
-    def __init__(self, run_name: str, message: str):
+    def __init__(
+        self,
+        run_name: str,
+        message: str,
+        task: Optional[StoreTask] = None
+    ):
+        """
+        The phases of the background store task are updated with the message
+        if a task is given.
+        """
         self.__run_name = run_name
         self.__msg = message
+        self.__task = task
         self.__start_time = time.time()
 
     def __enter__(self, *args):
         LOG.info("[%s] %s...", self.__run_name, self.__msg)
+        if self.__task:
+            self.__task.start_phase(self.__msg)
 
     def __exit__(self, *args):
         LOG.info("[%s] %s. Done. (Duration: %s sec)", self.__run_name,
                  self.__msg, round(time.time() - self.__start_time, 2))
+        if self.__task:
+            self.__task.finish_phase(self.__msg)
 
 
 class RunLocking:
@@ -103,6 +121,22 @@ class RunLocking:
         self.__session = None
 
 
+def __extract_zip(zip_file, output_dir: str) -> int:
+    """
+    Extract the given zip file object to the output directory and return the
+    size of the zip file.
+    """
+    with zipfile.ZipFile(zip_file, 'r', allowZip64=True) as zipf:
+        try:
+            zipf.extractall(output_dir)
+            return os.stat(zip_file.name).st_size
+        except Exception:
+            LOG.error("Failed to extract received ZIP.")
+            import traceback
+            traceback.print_exc()
+            raise
+
+
 def unzip(b64zip: str, output_dir: str) -> int:
     """
     This function unzips the base64 encoded zip file. This zip is extracted
@@ -117,16 +151,30 @@ def unzip(b64zip: str, output_dir: str) -> int:
                   zip_file.name, output_dir)
 
         zip_file.write(zlib.decompress(base64.b64decode(b64zip)))
-        with zipfile.ZipFile(zip_file, 'r', allowZip64=True) as zipf:
-            try:
-                zipf.extractall(output_dir)
-                return os.stat(zip_file.name).st_size
-            except Exception:
-                LOG.error("Failed to extract received ZIP.")
-                import traceback
-                traceback.print_exc()
-                raise
-    return 0
+        return __extract_zip(zip_file, output_dir)
+
+
+def unzip_file(compressed_zip_path: str, output_dir: str) -> int:
+    """
+    This function unzips the compressed zip file which was uploaded in chunks.
+    The file is decompressed block by block, so it is not held in memory. The
+    function returns the size of the extracted decompressed zip file.
+    """
+    if os.stat(compressed_zip_path).st_size == 0:
+        return 0
+
+    with tempfile.NamedTemporaryFile(suffix='.zip') as zip_file:
+        LOG.debug("Unzipping mass storage ZIP '%s' to '%s'...",
+                  compressed_zip_path, output_dir)
+
+        decompressor = zlib.decompressobj()
+        with open(compressed_zip_path, 'rb') as compressed_zip:
+            for block in iter(lambda: compressed_zip.read(UNZIP_BLOCK_SIZE),
+                              b''):
+                zip_file.write(decompressor.decompress(block))
+        zip_file.write(decompressor.flush())
+
+        return __extract_zip(zip_file, output_dir)
 
 
 def get_file_content(file_path: str) -> bytes:
@@ -241,18 +289,26 @@ class MassStoreRun:
         name: str,
         tag: Optional[str],
         version: Optional[str],
-        b64zip: str,
+        b64zip: Optional[str],
         force: bool,
         trim_path_prefix_list: Optional[List[str]],
-        description: Optional[str]
+        description: Optional[str],
+        compressed_zip_path: Optional[str] = None,
+        task: Optional[StoreTask] = None
     ):
-        """ Initialize object. """
+        """
+        Initialize object. The zip file is either given as a base64 encoded
+        string or as the path of the file which was uploaded in chunks. The
+        progress of the background store task is updated if it is given.
+        """
         self.__report_server = report_server
 
         self.__name = name
         self.__tag = tag
         self.__version = version
         self.__b64zip = b64zip
+        self.__compressed_zip_path = compressed_zip_path
+        self.__task = task
         self.__force = force
         self.__trim_path_prefixes = trim_path_prefix_list
         self.__description = description
@@ -1417,8 +1473,13 @@ class MassStoreRun:
                 dir=self.__context.codechecker_workspace
             ) as zip_dir:
                 with LogTask(run_name=self.__name,
+                             task=self.__task,
                              message="Unzip storage file"):
-                    zip_size = unzip(self.__b64zip, zip_dir)
+                    if self.__compressed_zip_path:
+                        zip_size = unzip_file(self.__compressed_zip_path,
+                                              zip_dir)
+                    else:
+                        zip_size = unzip(self.__b64zip, zip_dir)
 
                 if zip_size == 0:
                     raise codechecker_api_shared.ttypes.RequestFailed(
@@ -1437,6 +1498,7 @@ class MassStoreRun:
                 filename_to_hash = load_json(content_hash_file, {})
 
                 with LogTask(run_name=self.__name,
+                             task=self.__task,
                              message="Store source files"):
                     LOG.info("[%s] Storing %d source file(s).", self.__name,
                              len(filename_to_hash.keys()))
@@ -1448,6 +1510,7 @@ class MassStoreRun:
 
                 # Parse all metadata information from the report directory.
                 with LogTask(run_name=self.__name,
+                             task=self.__task,
                              message="Parse 'metadata.json's"):
                     for root_dir_path, _, _ in os.walk(report_dir):
                         metadata_file_path = os.path.join(
@@ -1457,6 +1520,7 @@ class MassStoreRun:
                             MetadataInfoParser(metadata_file_path)
 
                 with LogTask(run_name=self.__name,
+                             task=self.__task,
                              message="Store look-up ID for checkers in "
                                      "'metadata.json'"):
                     checkers_in_metadata = {
@@ -1477,6 +1541,7 @@ class MassStoreRun:
                             session, run_history_time)
 
                         with LogTask(run_name=self.__name,
+                                     task=self.__task,
                                      message="Store reports"):
                             self.__store_reports(
                                 session, report_dir, source_root, run_id,
@@ -1488,6 +1553,7 @@ class MassStoreRun:
 
                     if self.__reports_with_fake_checkers:
                         with LogTask(run_name=self.__name,
+                                     task=self.__task,
                                      message="Get look-up ID for checkers "
                                      "not present in 'metadata.json'"):
                             additional_checkers = self.__get_faked_checkers()
@@ -1503,6 +1569,7 @@ class MassStoreRun:
                         # that could only be done after-the-fact.
                         if self.__reports_with_fake_checkers:
                             with LogTask(run_name=self.__name,
+                                         task=self.__task,
                                          message="Fix-up report-to-checker "
                                          "associations"):
                                 self.__realise_fake_checkers(session)
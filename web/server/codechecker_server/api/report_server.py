@@ -69,6 +69,10 @@ from ..database.run_db_model import \
     Run, RunHistory, RunHistoryAnalysisInfo, RunLock, \
     SourceComponent
 
+from .store_task import StoreTask, create_task_token, get_task_dir, \
+    remove_expired_tasks, run_store_task_in_thread
+from .store_upload import MAX_CHUNK_SIZE, StoreUpload, get_upload_dir, \
+    get_upload_id, remove_expired_uploads
 from .thrift_enum_helper import detection_status_enum, \
     detection_status_str, report_status_enum, \
     review_status_enum, review_status_str, report_extended_data_type_enum
@@ -1377,7 +1381,13 @@ class ThriftRequestHandler:
                  config_database,
                  package_version,
                  client_version,
-                 context):
+                 context,
+                 store_queue=None):
+        """
+        store_queue -- The queue of the store workers. If it is not given,
+                       then the background store tasks are run in the
+                       request.
+        """
 
         if not product:
             raise ValueError("Cannot initialize request handler without "
@@ -1391,6 +1401,7 @@ class ThriftRequestHandler:
         self.__client_version = client_version
         self._Session = Session
         self._context = context
+        self.__store_queue = store_queue
         self.__permission_args = {
             'productID': product.id
         }
@@ -3944,6 +3955,118 @@ class ThriftRequestHandler:
                          trim_path_prefixes, description)
         return m.store()
 
+    def __get_store_upload(self, upload_id):
+        """ Return the chunked upload with the given identifier. """
+        return StoreUpload(
+            get_upload_dir(self._context.codechecker_workspace), upload_id)
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def beginStoreUpload(self, zip_hash, zip_size):
+        self.__require_store()
+
+        remove_expired_uploads(
+            get_upload_dir(self._context.codechecker_workspace))
+
+        upload = self.__get_store_upload(get_upload_id(
+            self._product.endpoint, self._get_username(), zip_hash,
+            zip_size))
+        received_size = upload.begin(
+            self._get_username(), zip_hash, zip_size)
+
+        return ttypes.StoreUploadInfo(
+            uploadId=upload.upload_id,
+            receivedSize=received_size,
+            maxChunkSize=MAX_CHUNK_SIZE)
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def appendStoreChunk(self, upload_id, offset, chunk, chunk_hash):
+        self.__require_store()
+
+        return self.__get_store_upload(upload_id).append(
+            self._get_username(), offset, chunk, chunk_hash)
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def commitStoreUpload(self, upload_id, name, tag, version, force,
+                          trim_path_prefixes, description):
+        self.__require_store()
+
+        task_dir = get_task_dir(self._context.codechecker_workspace)
+        remove_expired_tasks(task_dir)
+
+        task = StoreTask(task_dir, create_task_token(),
+                         self._product.endpoint, self._get_username(), name,
+                         {'tag': tag,
+                          'version': version,
+                          'force': force,
+                          'trim_path_prefixes': trim_path_prefixes,
+                          'description': description,
+                          'client_version': self.__client_version})
+
+        # The upload is checked before the task is queued, so the client gets
+        # the error at once. The uploaded file is moved to the task, so the
+        # same file can be uploaded again while the task is running.
+        self.__get_store_upload(upload_id).move_file(
+            self._get_username(), task.zip_file)
+
+        task.save()
+
+        if self.__store_queue:
+            LOG.info("Queueing store task of run '%s'.", name)
+            self.__store_queue.put(task)
+        else:
+            run_store_task_in_thread(task, self.store_task)
+
+        return task.token
+
+    def store_task(self, task):
+        """
+        Store the run of the given background store task. This is called by
+        the store workers or by the store thread of the request handler
+        process.
+        """
+        from codechecker_server.api.mass_store_run import MassStoreRun
+        try:
+            m = MassStoreRun(self, task.run_name, task.store_args['tag'],
+                             task.store_args['version'], None,
+                             task.store_args['force'],
+                             task.store_args['trim_path_prefixes'],
+                             task.store_args['description'],
+                             compressed_zip_path=task.zip_file,
+                             task=task)
+            return m.store()
+        finally:
+            task.remove_zip_file()
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def getStoreTaskInfo(self, token):
+        self.__require_store()
+
+        task = StoreTask.load(
+            get_task_dir(self._context.codechecker_workspace), token)
+        if not task or task.product_endpoint != self._product.endpoint:
+            raise codechecker_api_shared.ttypes.RequestFailed(
+                codechecker_api_shared.ttypes.ErrorCode.GENERAL,
+                f"Store task {token} doesn't exist or it has expired.")
+
+        return ttypes.StoreTaskInfo(
+            token=task.token,
+            status=getattr(ttypes.StoreTaskStatus, task.status),
+            runName=task.run_name,
+            enqueuedAt=task.enqueued_at,
+            phases=[ttypes.StoreTaskPhase(
+                        name=phase['name'],
+                        startedAt=phase['started_at'],
+                        finishedAt=phase['finished_at'])
+                    for phase in task.phases],
+            runId=task.run_id,
+            errorCode=task.error_code,
+            message=task.message,
+            extraInfo=task.extra_info)
+
     @exc_to_thrift_reqfail
     @timeit
     def allowsStoringAnalysisStatistics(self):
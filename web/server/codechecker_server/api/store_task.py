@@ -0,0 +1,291 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Background store tasks.
+
+The runs of the uploaded ZIP files are stored by dedicated store worker
+processes, so the API request handler processes are not blocked by the long
+running stores. The tasks are sent to the store workers through a queue and
+the status of every task is kept in a file of the server workspace, so the
+status can be queried through any API request handler process.
+
+If the server has no store worker processes, the tasks are run one by one by
+a thread of the API request handler process which received them, so the store
+requests return at once in this case too.
+"""
+
+
+import json
+import os
+import time
+import uuid
+
+from concurrent.futures import ThreadPoolExecutor
+
+from typing import Any, Callable, Dict, List, Optional
+
+import codechecker_api_shared
+
+from codechecker_common.logger import get_logger
+
+
+LOG = get_logger('server')
+
+# Status files of the finished tasks are removed after this many seconds.
+TASK_EXPIRY = 24 * 60 * 60
+
+QUEUED = 'QUEUED'
+RUNNING = 'RUNNING'
+COMPLETED = 'COMPLETED'
+FAILED = 'FAILED'
+
+# Thread of the current process which runs the store tasks if there are no
+# store worker processes, see run_store_task_in_thread().
+EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def get_task_dir(workspace: str) -> str:
+    """ Return the directory of the store task status files. """
+    return os.path.join(workspace, 'store_tasks')
+
+
+def create_task_token() -> str:
+    """ Return a new unique store task token. """
+    return uuid.uuid4().hex
+
+
+def remove_expired_tasks(task_dir: str):
+    """ Remove the status files of the tasks which are finished long ago. """
+    if not os.path.isdir(task_dir):
+        return
+
+    expiry = time.time() - TASK_EXPIRY
+    for file_name in os.listdir(task_dir):
+        file_path = os.path.join(task_dir, file_name)
+        try:
+            if os.stat(file_path).st_mtime < expiry:
+                os.remove(file_path)
+        except OSError as err:
+            LOG.debug("Failed to remove expired store task: %s", err)
+
+
+def fail_unfinished_tasks(task_dir: str):
+    """
+    Set the status of the tasks which were not finished before the server
+    was stopped to failed.
+    """
+    if not os.path.isdir(task_dir):
+        return
+
+    for file_name in os.listdir(task_dir):
+        if not file_name.endswith('.json'):
+            continue
+
+        task = StoreTask.load(task_dir, file_name[:-len('.json')])
+        if task and task.status in [QUEUED, RUNNING]:
+            LOG.warning("Store task of run '%s' was interrupted by a server "
+                        "restart.", task.run_name)
+            task.fail(codechecker_api_shared.ttypes.ErrorCode.GENERAL,
+                      "The server was restarted before the run was stored. "
+                      "Please store the results again.")
+            task.remove_zip_file()
+
+
+class StoreTaskSession:
+    """
+    The session of the user who started a store task, which is used by the
+    request handler in the store workers.
+    """
+
+    def __init__(self, user: str):
+        self.user = user
+
+
+class StoreTask:
+    """
+    A run to be stored by a store worker. The status of the task is saved in
+    the "<token>.json" file of the task directory on every change and the
+    uploaded ZIP file of the run is owned by the task as "<token>.zip".
+    """
+
+    def __init__(
+        self,
+        task_dir: str,
+        token: str,
+        product_endpoint: str,
+        user_name: str,
+        run_name: str,
+        store_args: Optional[Dict[str, Any]] = None
+    ):
+        """
+        store_args -- The arguments of the store which are used by the store
+                      worker. These are not saved in the status file.
+        """
+        self.task_dir = task_dir
+        self.token = token
+        self.product_endpoint = product_endpoint
+        self.user_name = user_name
+        self.run_name = run_name
+        self.store_args = store_args or {}
+
+        self.status = QUEUED
+        self.enqueued_at = int(time.time())
+        self.phases: List[Dict[str, int]] = []
+        self.run_id: Optional[int] = None
+        self.error_code: Optional[int] = None
+        self.message: Optional[str] = None
+        self.extra_info: List[str] = []
+
+    @property
+    def zip_file(self) -> str:
+        """ Path of the uploaded ZIP file of the task. """
+        return os.path.join(self.task_dir, f"{self.token}.zip")
+
+    def remove_zip_file(self):
+        """ Remove the uploaded ZIP file of the task. """
+        try:
+            os.remove(self.zip_file)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def load(task_dir: str, token: str) -> Optional['StoreTask']:
+        """
+        Load the status of the task with the given token. None returns if the
+        task doesn't exist.
+        """
+        try:
+            with open(os.path.join(task_dir, f"{token}.json"),
+                      encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as err:
+            LOG.debug("Failed to load store task: %s", err)
+            return None
+
+        task = StoreTask(task_dir, token, data['product_endpoint'],
+                         data['user_name'], data['run_name'])
+        for key in ['status', 'enqueued_at', 'phases', 'run_id',
+                    'error_code', 'message', 'extra_info']:
+            setattr(task, key, data[key])
+
+        return task
+
+    def save(self):
+        """ Write the status file of the task. """
+        os.makedirs(self.task_dir, exist_ok=True)
+
+        data = {
+            'product_endpoint': self.product_endpoint,
+            'user_name': self.user_name,
+            'run_name': self.run_name,
+            'status': self.status,
+            'enqueued_at': self.enqueued_at,
+            'phases': self.phases,
+            'run_id': self.run_id,
+            'error_code': self.error_code,
+            'message': self.message,
+            'extra_info': self.extra_info}
+
+        # The status file is replaced at once, so the readers never see a
+        # partially written file.
+        status_file = os.path.join(self.task_dir, f"{self.token}.json")
+        tmp_file = f"{status_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_file, status_file)
+
+    def start(self):
+        """ Set the task running. """
+        self.status = RUNNING
+        self.save()
+
+    def start_phase(self, name: str):
+        """ Finish the current phase and start a new one. """
+        now = int(time.time())
+        if self.phases and not self.phases[-1]['finished_at']:
+            self.phases[-1]['finished_at'] = now
+
+        self.phases.append(
+            {'name': name, 'started_at': now, 'finished_at': 0})
+        self.save()
+
+    def finish_phase(self, name: str):
+        """ Finish the phase with the given name. """
+        for phase in reversed(self.phases):
+            if phase['name'] == name and not phase['finished_at']:
+                phase['finished_at'] = int(time.time())
+                self.save()
+                break
+
+    def complete(self, run_id: int):
+        """ Set the task completed. """
+        self.status = COMPLETED
+        self.run_id = run_id
+        self.save()
+
+    def fail(
+        self,
+        error_code: int,
+        message: str,
+        extra_info: Optional[List[str]] = None
+    ):
+        """ Set the task failed. """
+        self.status = FAILED
+        self.error_code = error_code
+        self.message = message
+        self.extra_info = extra_info or []
+        self.save()
+
+
+def run_store_task(task: StoreTask, store: Callable[[StoreTask], int]):
+    """
+    Run the given store function of the task and save the result of it in
+    the status of the task.
+    """
+    LOG.info("Running store task of run '%s'.", task.run_name)
+    task.start()
+
+    try:
+        task.complete(store(task))
+        LOG.info("Store task of run '%s' completed.", task.run_name)
+    except codechecker_api_shared.ttypes.RequestFailed as reqfail:
+        LOG.warning("Store task of run '%s' failed: %s", task.run_name,
+                    reqfail.message)
+        task.fail(reqfail.errorCode, reqfail.message, reqfail.extraInfo)
+    except Exception as ex:
+        LOG.error("Store task of run '%s' failed.", task.run_name)
+        import traceback
+        traceback.print_exc()
+        task.fail(codechecker_api_shared.ttypes.ErrorCode.GENERAL, str(ex))
+
+
+def run_store_task_in_thread(task: StoreTask,
+                             store: Callable[[StoreTask], int]):
+    """
+    Run the given store task by the store thread of the current process and
+    return at once. The tasks of the process are run one after the other.
+    """
+    global EXECUTOR
+    if EXECUTOR is None:
+        EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+    LOG.info("Queueing store task of run '%s'.", task.run_name)
+    EXECUTOR.submit(run_store_task, task, store)
+
+
+def process_store_tasks(queue, store: Callable[[StoreTask], int]):
+    """
+    Store worker process: run the store tasks of the queue until None is
+    received.
+    """
+    while True:
+        task = queue.get()
+        if task is None:
+            break
+
+        run_store_task(task, store)
@@ -0,0 +1,259 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Chunked upload of the mass store ZIP files.
+
+The chunks of an upload are appended to a file in the workspace of the
+server, so the ZIP file is never held in memory. The state of an upload is
+kept only in the files of the upload directory, so an interrupted upload can
+be continued by any worker process of the server.
+"""
+
+
+import hashlib
+import json
+import os
+import re
+import time
+
+import codechecker_api_shared
+
+from codechecker_common.logger import get_logger
+
+
+LOG = get_logger('server')
+
+# Maximum size of an uploaded chunk in bytes.
+MAX_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Uploads which are not continued for this many seconds are removed.
+UPLOAD_EXPIRY = 24 * 60 * 60
+
+# Upload identifiers are sha256 hashes, see get_upload_id().
+UPLOAD_ID_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+# Size of the blocks in which the uploaded files are read.
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+def get_upload_dir(workspace: str) -> str:
+    """ Return the directory of the uploads in the server workspace. """
+    return os.path.join(workspace, 'store_uploads')
+
+
+def get_upload_id(
+    product_endpoint: str,
+    user_name: str,
+    zip_hash: str,
+    zip_size: int
+) -> str:
+    """
+    Return the identifier of the upload of the given file. The same file
+    uploaded again by the same user gets the same identifier, so the upload
+    can be continued.
+    """
+    return hashlib.sha256(
+        f"{product_endpoint}\0{user_name}\0{zip_hash}\0{zip_size}"
+        .encode('utf-8')).hexdigest()
+
+
+def get_file_hash(file_path: str) -> str:
+    """ Return the sha256 hash of the given file. """
+    sha = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(READ_BLOCK_SIZE), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def remove_expired_uploads(upload_dir: str):
+    """ Remove the files of the uploads which are not continued for long. """
+    if not os.path.isdir(upload_dir):
+        return
+
+    expiry = time.time() - UPLOAD_EXPIRY
+    for file_name in os.listdir(upload_dir):
+        file_path = os.path.join(upload_dir, file_name)
+        try:
+            if os.stat(file_path).st_mtime < expiry:
+                LOG.info("Removing expired store upload '%s'.", file_name)
+                os.remove(file_path)
+        except OSError as err:
+            LOG.debug("Failed to remove expired store upload: %s", err)
+
+
+def _request_failed(message: str):
+    return codechecker_api_shared.ttypes.RequestFailed(
+        codechecker_api_shared.ttypes.ErrorCode.GENERAL, message)
+
+
+class StoreUpload:
+    """
+    The chunks of an upload are appended to the "<upload id>.zip.part" file
+    and the "<upload id>.json" file contains the owner, the size and the hash
+    of the whole file.
+    """
+
+    def __init__(self, upload_dir: str, upload_id: str):
+        if not UPLOAD_ID_PATTERN.match(upload_id):
+            raise _request_failed(f"Invalid upload identifier: {upload_id}")
+
+        self.__upload_id = upload_id
+        self.__data_file = os.path.join(upload_dir, f"{upload_id}.zip.part")
+        self.__info_file = os.path.join(upload_dir, f"{upload_id}.json")
+        self.__upload_dir = upload_dir
+
+    @property
+    def upload_id(self) -> str:
+        """ Identifier of the upload. """
+        return self.__upload_id
+
+    @property
+    def received_size(self) -> int:
+        """ Number of bytes which are already received. """
+        try:
+            return os.stat(self.__data_file).st_size
+        except FileNotFoundError:
+            return 0
+
+    def __load_info(self, owner: str) -> dict:
+        """
+        Return the information of the upload. RequestFailed is raised if the
+        upload doesn't exist or it belongs to someone else.
+        """
+        try:
+            with open(self.__info_file, encoding='utf-8') as f:
+                info = json.load(f)
+        except (OSError, ValueError) as err:
+            LOG.debug("Failed to load store upload info: %s", err)
+            raise _request_failed(
+                f"Upload {self.__upload_id} doesn't exist or it has "
+                f"expired. Please start the upload again.") from err
+
+        if info['owner'] != owner:
+            raise _request_failed(
+                f"Upload {self.__upload_id} doesn't exist or it has "
+                f"expired. Please start the upload again.")
+
+        return info
+
+    def begin(self, owner: str, zip_hash: str, zip_size: int) -> int:
+        """
+        Begin the upload or continue it if it was interrupted. Returns the
+        number of bytes which are already received.
+        """
+        if zip_size <= 0:
+            raise _request_failed("The zip file to upload is empty!")
+
+        os.makedirs(self.__upload_dir, exist_ok=True)
+
+        info = {'owner': owner, 'zip_hash': zip_hash, 'zip_size': zip_size}
+        with open(self.__info_file, 'w', encoding='utf-8') as f:
+            json.dump(info, f)
+
+        received_size = self.received_size
+        if received_size > zip_size:
+            LOG.warning("Restarting invalid store upload '%s'.",
+                        self.__upload_id)
+            os.remove(self.__data_file)
+            received_size = 0
+
+        if received_size:
+            LOG.info("Continuing store upload '%s' from %d / %d bytes.",
+                     self.__upload_id, received_size, zip_size)
+
+        return received_size
+
+    def append(
+        self,
+        owner: str,
+        offset: int,
+        chunk: bytes,
+        chunk_hash: str
+    ) -> int:
+        """
+        Append the chunk to the uploaded file. Returns the number of bytes
+        which are received.
+        """
+        info = self.__load_info(owner)
+
+        if len(chunk) > MAX_CHUNK_SIZE:
+            raise _request_failed(
+                f"The chunk is too big (max: {MAX_CHUNK_SIZE} bytes).")
+
+        if hashlib.sha256(chunk).hexdigest() != chunk_hash:
+            raise _request_failed(
+                f"The chunk at offset {offset} of upload {self.__upload_id} "
+                f"is corrupted. Please resend it.")
+
+        received_size = self.received_size
+        if offset != received_size:
+            raise _request_failed(
+                f"Chunk at offset {offset} of upload {self.__upload_id} "
+                f"doesn't continue the received {received_size} bytes.")
+
+        if received_size + len(chunk) > info['zip_size']:
+            raise _request_failed(
+                f"Upload {self.__upload_id} is longer than "
+                f"{info['zip_size']} bytes.")
+
+        with open(self.__data_file, 'ab') as f:
+            f.write(chunk)
+
+        # The upload is not expired while it is continued.
+        os.utime(self.__info_file)
+
+        return received_size + len(chunk)
+
+    def get_file(self, owner: str) -> str:
+        """
+        Return the path of the uploaded file if the whole file is received.
+        """
+        info = self.__load_info(owner)
+
+        received_size = self.received_size
+        if received_size != info['zip_size']:
+            raise _request_failed(
+                f"Upload {self.__upload_id} is incomplete: "
+                f"{received_size} / {info['zip_size']} bytes are received.")
+
+        if get_file_hash(self.__data_file) != info['zip_hash']:
+            raise _request_failed(
+                f"Upload {self.__upload_id} is corrupted. Please store the "
+                f"results again.")
+
+        return self.__data_file
+
+    def move_file(self, owner: str, file_path: str):
+        """
+        Move the uploaded file to the given path if the whole file is
+        received and remove the upload. The same file may be uploaded and
+        committed again while the moved file is still used.
+        """
+        data_file = self.get_file(owner)
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        try:
+            os.replace(data_file, file_path)
+        except FileNotFoundError as err:
+            # Another commit of the same upload moved the file meanwhile.
+            raise _request_failed(
+                f"Upload {self.__upload_id} doesn't exist or it has "
+                f"expired. Please start the upload again.") from err
+
+        # The moved file is not expired until it is used.
+        os.utime(file_path)
+        self.remove()
+
+    def remove(self):
+        """ Remove the files of the upload. """
+        for file_path in [self.__data_file, self.__info_file]:
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
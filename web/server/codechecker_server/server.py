@@ -58,6 +58,8 @@ from .api.authentication import ThriftAuthHandler as AuthHandler_v6
 from .api.config_handler import ThriftConfigHandler as ConfigHandler_v6
 from .api.product_server import ThriftProductHandler as ProductHandler_v6
 from .api.report_server import ThriftRequestHandler as ReportHandler_v6
+from .api.store_task import StoreTaskSession, fail_unfinished_tasks, \
+    get_task_dir, process_store_tasks
 from .api.server_info_handler import \
     ThriftServerInfoHandler as ServerInfoHandler_v6
 from .database import database, db_cleanup
@@ -415,7 +417,8 @@ class RequestHandler(SimpleHTTPRequestHandler):
                             self.server.config_session,
                             version,
                             api_ver,
-                            self.server.context)
+                            self.server.context,
+                            self.server.store_queue)
                         processor = ReportAPI_v6.Processor(acc_handler)
                     else:
                         LOG.debug("This API endpoint does not exist.")
@@ -759,6 +762,9 @@ class CCSimpleHttpServer(HTTPServer):
         self.manager = manager
         self.__products = {}
 
+        # Queue of the background store tasks, see start_store_workers().
+        self.store_queue = None
+
         # Create a database engine for the configuration database.
         LOG.debug("Creating database engine for CONFIG DATABASE...")
         self.__engine = product_db_sql_server.create_engine()
@@ -867,6 +873,54 @@ class CCSimpleHttpServer(HTTPServer):
             LOG.error(str(ex))
             sys.exit(1)
 
+    def start_store_workers(self, worker_num):
+        """
+        Start the given number of store worker processes which store the runs
+        of the background store tasks. Returns the started processes.
+        """
+        fail_unfinished_tasks(get_task_dir(self.context.codechecker_workspace))
+
+        if not worker_num:
+            return []
+
+        self.store_queue = multiprocess.Queue()
+
+        processes = []
+        for _ in range(worker_num):
+            p = multiprocess.Process(target=process_store_tasks,
+                                     args=(self.store_queue, self.store))
+            processes.append(p)
+            p.start()
+
+        return processes
+
+    def store(self, task):
+        """
+        Store the run of the given background store task. This is called in
+        the store worker processes.
+        """
+        product = self.get_product(task.product_endpoint)
+        if not product:
+            raise ValueError(
+                f"The product with the given endpoint "
+                f"'{task.product_endpoint}' does not exist!")
+
+        if product.db_status != DBStatus.OK:
+            status_str = database_status.db_status_msg.get(product.db_status)
+            raise ValueError(
+                f"The database of product '{task.product_endpoint}' is not "
+                f"available: {status_str}")
+
+        handler = ReportHandler_v6(self.manager,
+                                   product.session_factory,
+                                   product,
+                                   StoreTaskSession(task.user_name),
+                                   self.config_session,
+                                   self.version,
+                                   task.store_args['client_version'],
+                                   self.context)
+        return handler.store_task(task)
+
     def add_product(self, orm_product, init_db=False):
         """
         Adds a product to the list of product databases connected to
@@ -1132,6 +1186,11 @@ def start_server(config_directory, package_data, port, config_sql_server,
 
     atexit.register(unregister_handler, os.getpid())
 
+    # The queue of the store workers has to be created before the request
+    # handler processes.
+    processes.extend(
+        http_server.start_store_workers(manager.store_worker_processes))
+
     for _ in range(manager.worker_processes - 1):
         p = multiprocess.Process(target=http_server.serve_forever)
         processes.append(p)
@@ -71,6 +71,26 @@ def get_worker_processes(scfg_dict):
     return worker_processes
 
 
+def get_store_worker_processes(scfg_dict):
+    """
+    Return number of store worker processes from the config dictionary.
+
+    Return 'store_worker_processes' field from the config dictionary or
+    returns the default value if this field is not set or the value is
+    negative. By default the runs are stored by a thread of the request
+    handler processes, so the server doesn't start additional processes.
+    """
+    default = 0
+    store_worker_processes = scfg_dict.get('store_worker_processes', default)
+
+    if store_worker_processes < 0:
+        LOG.warning("Number of store worker processes can not be negative! "
+                    "Default value will be used: %s", default)
+        store_worker_processes = default
+
+    return store_worker_processes
+
+
 class _Session:
     """A session for an authenticated, privileged client connection."""
 
@@ -181,6 +201,8 @@ class SessionManager:
         # handler for the server's stuff should be created, that can properly
         # instantiate SessionManager with the found configuration.
         self.__worker_processes = get_worker_processes(scfg_dict)
+        self.__store_worker_processes = \
+            get_store_worker_processes(scfg_dict)
         self.__max_run_count = scfg_dict.get('max_run_count', None)
         self.__store_config = scfg_dict.get('store', {})
         self.__keepalive_config = scfg_dict.get('keepalive', {})
@@ -323,6 +345,10 @@ class SessionManager:
     def worker_processes(self):
         return self.__worker_processes
 
+    @property
+    def store_worker_processes(self):
+        return self.__store_worker_processes
+
     def get_realm(self):
         return {
             "realm": self.__auth_config.get('realm_name'),
@@ -0,0 +1,172 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the background store tasks. """
+
+
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import unittest
+
+from unittest import mock
+
+from codechecker_api_shared.ttypes import ErrorCode, RequestFailed
+
+from codechecker_server.api import store_task
+from codechecker_server.api.store_task import StoreTask, \
+    fail_unfinished_tasks, process_store_tasks, remove_expired_tasks, \
+    run_store_task, run_store_task_in_thread
+
+
+class StoreTaskTest(unittest.TestCase):
+    """ Test the status of the store tasks. """
+
+    def setUp(self):
+        self.task_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.task_dir)
+
+    def __task(self, token='token'):
+        return StoreTask(self.task_dir, token, 'product', 'user', 'run',
+                         {'tag': 'tag'})
+
+    def test_save_load(self):
+        """ The status is loaded without the store arguments. """
+        task = self.__task()
+        task.save()
+
+        loaded = StoreTask.load(self.task_dir, 'token')
+        self.assertEqual(loaded.status, store_task.QUEUED)
+        self.assertEqual(loaded.product_endpoint, 'product')
+        self.assertEqual(loaded.user_name, 'user')
+        self.assertEqual(loaded.run_name, 'run')
+        self.assertEqual(loaded.enqueued_at, task.enqueued_at)
+        self.assertEqual(loaded.store_args, {})
+
+        self.assertIsNone(StoreTask.load(self.task_dir, 'other'))
+        self.assertEqual(os.listdir(self.task_dir), ['token.json'])
+
+    def test_phases(self):
+        """ Starting a phase finishes the previous one. """
+        task = self.__task()
+        task.start_phase('Unzip')
+        task.start_phase('Parse')
+        task.finish_phase('Parse')
+        task.finish_phase('Unzip')
+
+        phases = StoreTask.load(self.task_dir, 'token').phases
+        self.assertEqual([p['name'] for p in phases], ['Unzip', 'Parse'])
+        self.assertTrue(all(p['finished_at'] for p in phases))
+
+    def test_run_store_task(self):
+        """ The result of the store is saved in the status. """
+        task = self.__task()
+        run_store_task(task, lambda t: 42)
+
+        loaded = StoreTask.load(self.task_dir, 'token')
+        self.assertEqual(loaded.status, store_task.COMPLETED)
+        self.assertEqual(loaded.run_id, 42)
+
+    def test_failed_store(self):
+        """ The error of a failed store is saved in the status. """
+        def store_request_failed(_):
+            raise RequestFailed(ErrorCode.SOURCE_FILE, "Invalid comments",
+                                ['main.c|1|checker'])
+
+        def store_exception(_):
+            raise ValueError("Invalid zip")
+
+        task = self.__task()
+        run_store_task(task, store_request_failed)
+
+        loaded = StoreTask.load(self.task_dir, 'token')
+        self.assertEqual(loaded.status, store_task.FAILED)
+        self.assertEqual(loaded.error_code, ErrorCode.SOURCE_FILE)
+        self.assertEqual(loaded.message, "Invalid comments")
+        self.assertEqual(loaded.extra_info, ['main.c|1|checker'])
+
+        task = self.__task()
+        run_store_task(task, store_exception)
+
+        loaded = StoreTask.load(self.task_dir, 'token')
+        self.assertEqual(loaded.status, store_task.FAILED)
+        self.assertEqual(loaded.error_code, ErrorCode.GENERAL)
+        self.assertEqual(loaded.message, "Invalid zip")
+
+    def test_process_store_tasks(self):
+        """ The store worker runs the tasks until None is received. """
+        task_queue = queue.Queue()
+        for token in ['a', 'b']:
+            task_queue.put(self.__task(token))
+        task_queue.put(None)
+
+        stored = []
+        process_store_tasks(
+            task_queue, lambda t: stored.append(t.token) or len(stored))
+
+        self.assertEqual(stored, ['a', 'b'])
+        self.assertEqual(StoreTask.load(self.task_dir, 'b').run_id, 2)
+
+    def test_run_store_task_in_thread(self):
+        """ The store returns at once and the tasks are run one by one. """
+        started = threading.Event()
+        release = threading.Event()
+
+        def store(task):
+            started.set()
+            release.wait(10)
+            return 1
+
+        tasks = [self.__task('a'), self.__task('b')]
+        for task in tasks:
+            task.save()
+
+        run_store_task_in_thread(tasks[0], store)
+        run_store_task_in_thread(tasks[1], lambda t: 2)
+        self.assertTrue(started.wait(10))
+        self.assertEqual(StoreTask.load(self.task_dir, 'b').status,
+                         store_task.QUEUED)
+
+        release.set()
+        store_task.EXECUTOR.submit(lambda: None).result(10)
+        self.assertEqual(StoreTask.load(self.task_dir, 'a').run_id, 1)
+        self.assertEqual(StoreTask.load(self.task_dir, 'b').run_id, 2)
+
+    def test_fail_unfinished_tasks(self):
+        """ The tasks which were interrupted by a restart are failed. """
+        self.__task('queued').save()
+        self.__task('running').start()
+        run_store_task(self.__task('completed'), lambda t: 1)
+
+        zip_file = self.__task('queued').zip_file
+        with open(zip_file, 'wb'):
+            pass
+
+        fail_unfinished_tasks(self.task_dir)
+        self.assertFalse(os.path.exists(zip_file))
+
+        for token, status in [('queued', store_task.FAILED),
+                              ('running', store_task.FAILED),
+                              ('completed', store_task.COMPLETED)]:
+            self.assertEqual(StoreTask.load(self.task_dir, token).status,
+                             status)
+
+    def test_expired_tasks(self):
+        """ The status files are removed after a while. """
+        self.__task().save()
+
+        remove_expired_tasks(self.task_dir)
+        self.assertEqual(len(os.listdir(self.task_dir)), 1)
+
+        with mock.patch.object(store_task, 'TASK_EXPIRY', -1):
+            remove_expired_tasks(self.task_dir)
+        self.assertEqual(os.listdir(self.task_dir), [])
@@ -0,0 +1,211 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Unit tests for the chunked upload of the mass store ZIP files. """
+
+
+import base64
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+import zlib
+
+from unittest import mock
+
+from codechecker_api_shared.ttypes import RequestFailed
+
+from codechecker_server.api import mass_store_run, store_upload
+from codechecker_server.api.store_upload import StoreUpload, get_upload_id
+
+
+def chunks(data, chunk_size):
+    """ Return the offset, chunk and chunk hash of every chunk. """
+    for offset in range(0, len(data), chunk_size):
+        chunk = data[offset:offset + chunk_size]
+        yield offset, chunk, hashlib.sha256(chunk).hexdigest()
+
+
+class StoreUploadTest(unittest.TestCase):
+    """ Test the spooling of the uploaded chunks. """
+
+    def setUp(self):
+        self.upload_dir = tempfile.mkdtemp()
+
+        zip_content = io.BytesIO()
+        with zipfile.ZipFile(zip_content, 'w') as zipf:
+            zipf.writestr('reports/a/main.c.plist', os.urandom(100000))
+            zipf.writestr('content_hashes.json', '{}')
+
+        self.zip_data = zlib.compress(zip_content.getvalue())
+        self.zip_hash = hashlib.sha256(self.zip_data).hexdigest()
+
+    def tearDown(self):
+        shutil.rmtree(self.upload_dir)
+
+    def __upload(self, owner='user'):
+        upload_id = get_upload_id('product', owner, self.zip_hash,
+                                  len(self.zip_data))
+        return StoreUpload(self.upload_dir, upload_id)
+
+    def test_upload(self):
+        """ The uploaded file is the same as the original one. """
+        upload = self.__upload()
+        self.assertEqual(
+            upload.begin('user', self.zip_hash, len(self.zip_data)), 0)
+
+        for offset, chunk, chunk_hash in chunks(self.zip_data, 1000):
+            self.assertEqual(
+                upload.append('user', offset, chunk, chunk_hash),
+                offset + len(chunk))
+
+        with open(upload.get_file('user'), 'rb') as f:
+            self.assertEqual(f.read(), self.zip_data)
+
+        upload.remove()
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+    def test_move_file(self):
+        """
+        The committed file is moved away, so the same file can be uploaded
+        again meanwhile.
+        """
+        upload = self.__upload()
+        moved_files = []
+        for i in range(2):
+            self.assertEqual(
+                upload.begin('user', self.zip_hash, len(self.zip_data)), 0)
+            for offset, chunk, chunk_hash in chunks(self.zip_data, 10000):
+                upload.append('user', offset, chunk, chunk_hash)
+
+            moved_file = os.path.join(self.upload_dir, 'tasks', f"{i}.zip")
+            upload.move_file('user', moved_file)
+            moved_files.append(moved_file)
+
+        with self.assertRaises(RequestFailed):
+            upload.move_file('user', moved_files[0])
+
+        for moved_file in moved_files:
+            with open(moved_file, 'rb') as f:
+                self.assertEqual(f.read(), self.zip_data)
+        self.assertEqual(os.listdir(self.upload_dir), ['tasks'])
+
+    def test_resume(self):
+        """ An interrupted upload is continued from the received data. """
+        upload = self.__upload()
+        upload.begin('user', self.zip_hash, len(self.zip_data))
+        for offset, chunk, chunk_hash in chunks(self.zip_data[:2500], 1000):
+            upload.append('user', offset, chunk, chunk_hash)
+
+        # The same file is uploaded again.
+        upload = self.__upload()
+        received_size = upload.begin('user', self.zip_hash,
+                                     len(self.zip_data))
+        self.assertEqual(received_size, 2500)
+
+        # A chunk which was already received is rejected.
+        with self.assertRaisesRegex(RequestFailed, "doesn't continue"):
+            upload.append('user', 0, *list(chunks(self.zip_data, 1000))[0][1:])
+
+        for offset, chunk, chunk_hash in chunks(
+                self.zip_data[received_size:], 1000):
+            upload.append('user', received_size + offset, chunk, chunk_hash)
+
+        with open(upload.get_file('user'), 'rb') as f:
+            self.assertEqual(f.read(), self.zip_data)
+
+    def test_invalid_chunks(self):
+        """ Corrupted and too long chunks are rejected. """
+        upload = self.__upload()
+        upload.begin('user', self.zip_hash, 10)
+
+        with self.assertRaisesRegex(RequestFailed, "corrupted"):
+            upload.append('user', 0, b'chunk', 'hash')
+
+        with self.assertRaisesRegex(RequestFailed, "longer than"):
+            upload.append('user', 0, *list(chunks(b'x' * 11, 11))[0][1:])
+
+        with mock.patch.object(store_upload, 'MAX_CHUNK_SIZE', 4):
+            with self.assertRaisesRegex(RequestFailed, "too big"):
+                upload.append('user', 0, *list(chunks(b'chunk', 5))[0][1:])
+
+        self.assertEqual(upload.received_size, 0)
+
+    def test_incomplete_upload(self):
+        """ Incomplete and corrupted uploads can't be stored. """
+        upload = self.__upload()
+        upload.begin('user', self.zip_hash, len(self.zip_data))
+
+        with self.assertRaisesRegex(RequestFailed, "incomplete"):
+            upload.get_file('user')
+
+        data = b'x' * len(self.zip_data)
+        for offset, chunk, chunk_hash in chunks(data, 10000):
+            upload.append('user', offset, chunk, chunk_hash)
+
+        with self.assertRaisesRegex(RequestFailed, "corrupted"):
+            upload.get_file('user')
+
+    def test_owner(self):
+        """ Uploads can be continued only by the same user. """
+        upload = self.__upload()
+        upload.begin('user', self.zip_hash, len(self.zip_data))
+        offset, chunk, chunk_hash = next(chunks(self.zip_data, 1000))
+
+        with self.assertRaisesRegex(RequestFailed, "doesn't exist"):
+            upload.append('other', offset, chunk, chunk_hash)
+
+        with self.assertRaisesRegex(RequestFailed, "doesn't exist"):
+            upload.get_file('other')
+
+        self.assertNotEqual(self.__upload('other').upload_id,
+                            upload.upload_id)
+
+        with self.assertRaisesRegex(RequestFailed, "Invalid upload"):
+            StoreUpload(self.upload_dir, '../../etc/passwd')
+
+    def test_expired_uploads(self):
+        """ The uploads which are not continued for long are removed. """
+        upload = self.__upload()
+        upload.begin('user', self.zip_hash, len(self.zip_data))
+        upload.append('user', *next(chunks(self.zip_data, 1000)))
+
+        store_upload.remove_expired_uploads(self.upload_dir)
+        self.assertEqual(len(os.listdir(self.upload_dir)), 2)
+
+        with mock.patch.object(store_upload, 'UPLOAD_EXPIRY', -1):
+            store_upload.remove_expired_uploads(self.upload_dir)
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+        with self.assertRaisesRegex(RequestFailed, "expired"):
+            upload.append('user', *next(chunks(self.zip_data, 1000)))
+
+    def test_unzip_file(self):
+        """ The uploaded file is extracted like the base64 encoded zip. """
+        upload = self.__upload()
+        upload.begin('user', self.zip_hash, len(self.zip_data))
+        for offset, chunk, chunk_hash in chunks(self.zip_data, 1000):
+            upload.append('user', offset, chunk, chunk_hash)
+
+        b64_dir = os.path.join(self.upload_dir, 'b64')
+        file_dir = os.path.join(self.upload_dir, 'file')
+
+        with mock.patch.object(mass_store_run, 'UNZIP_BLOCK_SIZE', 100):
+            self.assertEqual(
+                mass_store_run.unzip_file(upload.get_file('user'), file_dir),
+                mass_store_run.unzip(
+                    base64.b64encode(self.zip_data).decode('utf-8'),
+                    b64_dir))
+
+        for file_path in ['reports/a/main.c.plist', 'content_hashes.json']:
+            with open(os.path.join(b64_dir, file_path), 'rb') as expected, \
+                    open(os.path.join(file_dir, file_path), 'rb') as f:
+                self.assertEqual(f.read(), expected.read())